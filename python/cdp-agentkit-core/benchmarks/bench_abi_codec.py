@@ -0,0 +1,77 @@
+"""Microbenchmark of calldata encoding throughput.
+
+Compares the previous per-call paths, a web3 contract built per call as `register_basename` did
+and the uncompiled eth-abi path the multicall reader used, with the compiled ABI codec.
+
+Run with `poetry run python benchmarks/bench_abi_codec.py`.
+"""
+
+import timeit
+
+from eth_abi import encode
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types
+from web3 import Web3
+
+from cdp_agentkit_core.actions.abi_codec import encode_call
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+
+ITERATIONS = 2_000
+
+ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+ARGS = {
+    "recipient": ADDRESS,
+    "refundRecipient": ADDRESS,
+    "orderReferrer": ADDRESS,
+    "comment": "",
+    "expectedMarketType": 0,
+    "minOrderSize": "1000000000000000000",
+    "sqrtPriceLimitX96": "0",
+}
+
+
+def web3_contract_per_call() -> str:
+    """Encode as before in register_basename: a new web3 contract on every call."""
+    contract = Web3().eth.contract(abi=WOW_ABI)
+    return contract.encode_abi(
+        "buy", args=[int(v) if isinstance(v, str) and v.isdigit() else v for v in ARGS.values()]
+    )
+
+
+def uncompiled_eth_abi() -> bytes:
+    """Encode as before in the multicall reader: find, hash and convert on every call."""
+    function = next(e for e in WOW_ABI if e.get("type") == "function" and e["name"] == "buy")
+    values = [_to_abi_value(abi_input, ARGS[abi_input["name"]]) for abi_input in function["inputs"]]
+    return function_abi_to_4byte_selector(function) + encode(get_abi_input_types(function), values)
+
+
+def _to_abi_value(abi_param: dict, value):
+    abi_type = abi_param["type"]
+    if abi_type.startswith(("uint", "int")):
+        return int(value)
+    if abi_type == "address":
+        return Web3.to_checksum_address(value)
+    return value
+
+
+def main():
+    """Time every encoding path and print its throughput."""
+    expected = encode_call(WOW_ABI, "buy", ARGS)
+    assert uncompiled_eth_abi() == expected
+    assert web3_contract_per_call() == "0x" + expected.hex()
+
+    timings = {
+        "web3 contract per call": web3_contract_per_call,
+        "uncompiled eth-abi": uncompiled_eth_abi,
+        "compiled codec": lambda: encode_call(WOW_ABI, "buy", ARGS),
+    }
+
+    for name, func in timings.items():
+        seconds = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+        print(
+            f"{name:<24} {seconds / ITERATIONS * 1e6:8.1f} us/call"
+            f"  {ITERATIONS / seconds:10.0f} calls/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
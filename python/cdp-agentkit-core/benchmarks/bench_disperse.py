@@ -0,0 +1,228 @@
+"""Gas and latency benchmark of paying many recipients with Disperse versus one transfer each.
+
+Both paths run the real action code, `disperse` and the per-recipient transfers its fallback
+sends, against a local EVM stand-in. The stand-in charges gas by the EVM fee schedule (intrinsic
+cost, calldata bytes of the real encoded call, cold account access, new accounts and storage
+writes), packs transactions into blocks under a block gas limit, and makes every write pay a CDP
+API round trip. Recipients are either all new accounts, as in a first payout, or all existing
+holders, as in a recurring payroll.
+
+Disperse always wins on latency, since the payout takes a few transactions instead of one per
+recipient. It saves gas on tokens and on ETH to existing accounts, but not on ETH to new accounts:
+a value call to a new account pays the new account charge, which a plain transfer does not.
+
+Times are scaled down tenfold from Base: 200ms blocks and 30ms round trips.
+
+Run with `poetry run python benchmarks/bench_disperse.py`.
+"""
+
+import math
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+from cdp_agentkit_core.actions import asset_cache
+from cdp_agentkit_core.actions.abi_codec import encode_call
+from cdp_agentkit_core.actions.asset_cache import AssetCache, set_asset_cache
+from cdp_agentkit_core.actions.disperse import disperse
+from cdp_agentkit_core.actions.nonce_manager import NonceManager, set_nonce_manager
+
+RECIPIENTS = 100
+BLOCK_TIME_SECONDS = 0.2
+ROUND_TRIP_SECONDS = 0.03
+BLOCK_GAS_LIMIT = 30_000_000
+
+TOKEN_ADDRESS = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+
+# EVM fee schedule (Berlin and later).
+TX_GAS = 21_000
+CALLDATA_ZERO_BYTE_GAS = 4
+CALLDATA_NONZERO_BYTE_GAS = 16
+COLD_ACCOUNT_ACCESS_GAS = 2_600
+WARM_ACCESS_GAS = 100
+CALL_VALUE_GAS = 9_000
+CALL_STIPEND_GAS = 2_300
+NEW_ACCOUNT_GAS = 25_000
+COLD_SLOAD_GAS = 2_100
+SSTORE_SET_GAS = 20_000
+SSTORE_RESET_GAS = 2_900
+LOG3_GAS = 1_756
+# Loop, memory and stack bookkeeping of one iteration or one call frame.
+OVERHEAD_GAS = 600
+
+
+def calldata_gas(data: bytes) -> int:
+    """Get the intrinsic gas of calldata."""
+    zeros = data.count(0)
+    return zeros * CALLDATA_ZERO_BYTE_GAS + (len(data) - zeros) * CALLDATA_NONZERO_BYTE_GAS
+
+
+def token_transfer_gas(sender_warm: bool, new_recipient: bool) -> int:
+    """Get the execution gas of an ERC20 transfer."""
+    sender_balance = SSTORE_RESET_GAS + (0 if sender_warm else COLD_SLOAD_GAS)
+    recipient_balance = (SSTORE_SET_GAS if new_recipient else SSTORE_RESET_GAS) + COLD_SLOAD_GAS
+    return sender_balance + recipient_balance + LOG3_GAS + OVERHEAD_GAS
+
+
+class LocalChain:
+    """Blocks of `BLOCK_TIME_SECONDS` filled in order up to `BLOCK_GAS_LIMIT`."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.gas_used = 0
+        self.transactions = 0
+        self._blocks: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def include(self, gas: int) -> float:
+        """Include a transaction in the next block with room, returning when that block lands."""
+        with self._lock:
+            self.gas_used += gas
+            self.transactions += 1
+            block = math.floor((time.monotonic() - self.started) / BLOCK_TIME_SECONDS) + 1
+            while self._blocks.get(block, 0) + gas > BLOCK_GAS_LIMIT:
+                block += 1
+            self._blocks[block] = self._blocks.get(block, 0) + gas
+            return self.started + block * BLOCK_TIME_SECONDS
+
+
+class LocalTransaction:
+    """A broadcast transaction whose `wait` blocks until its block lands."""
+
+    def __init__(self, lands_at: float):
+        self.lands_at = lands_at
+        self.status = "broadcast"
+        self.transaction_hash = f"0x{id(self):064x}"
+        self.transaction_link = f"http://localhost/tx/{self.transaction_hash}"
+
+    def wait(self):
+        """Wait for the block of the transaction."""
+        time.sleep(max(0.0, self.lands_at - time.monotonic()))
+        self.status = "complete"
+        return self
+
+
+class LocalAsset:
+    """Decimals and contract address of an asset."""
+
+    def __init__(self, decimals: int, contract_address: str | None):
+        self.decimals = decimals
+        self.contract_address = contract_address
+
+    def to_atomic_amount(self, whole_amount: Decimal) -> Decimal:
+        """Convert a whole amount to an atomic amount."""
+        return whole_amount * Decimal(10) ** self.decimals
+
+
+class LocalAddress:
+    """The wallet address the benchmark writes from."""
+
+    address_id = "0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027"
+
+
+class LocalWallet:
+    """A wallet whose writes pay a CDP round trip and land on the local chain."""
+
+    def __init__(self, chain: LocalChain, network_id: str, new_recipients: bool):
+        self.chain = chain
+        self.network_id = network_id
+        self.new_recipients = new_recipients
+        self.default_address = LocalAddress()
+
+    def transfer(self, amount, asset_id, destination, gasless=False):
+        """Send one transfer."""
+        time.sleep(ROUND_TRIP_SECONDS)
+        if asset_id == "eth":
+            gas = TX_GAS
+        else:
+            data = encode_call(ERC20_TRANSFER_ABI, "transfer", [destination, 1])
+            gas = TX_GAS + calldata_gas(data) + token_transfer_gas(False, self.new_recipients)
+        return LocalTransaction(self.chain.include(gas))
+
+    def invoke_contract(self, contract_address, method, abi, args, amount=None, asset_id=None):
+        """Invoke Disperse or approve a token."""
+        time.sleep(ROUND_TRIP_SECONDS)
+        data = encode_call(abi, method, args)
+        gas = TX_GAS + calldata_gas(data) + COLD_ACCOUNT_ACCESS_GAS + OVERHEAD_GAS
+        if method == "approve":
+            gas += COLD_SLOAD_GAS + SSTORE_SET_GAS + LOG3_GAS
+        elif method == "disperseEther":
+            per_recipient = (
+                COLD_ACCOUNT_ACCESS_GAS
+                + CALL_VALUE_GAS
+                - CALL_STIPEND_GAS
+                + (NEW_ACCOUNT_GAS if self.new_recipients else 0)
+                + OVERHEAD_GAS
+            )
+            gas += len(args["recipients"]) * per_recipient
+        else:
+            # transferFrom of the total into Disperse, spending the allowance, then one warm
+            # transfer per recipient.
+            gas += COLD_ACCOUNT_ACCESS_GAS + token_transfer_gas(False, new_recipient=True)
+            gas += COLD_SLOAD_GAS + SSTORE_RESET_GAS
+            per_recipient = WARM_ACCESS_GAS + token_transfer_gas(True, self.new_recipients)
+            gas += len(args["recipients"]) * per_recipient
+        return LocalTransaction(self.chain.include(gas))
+
+
+ERC20_TRANSFER_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "value", "type": "uint256"},
+        ],
+        "name": "transfer",
+        "outputs": [{"internalType": "bool", "name": "", "type": "bool"}],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+
+def run(asset_id: str, network_id: str, new_recipients: bool) -> tuple[int, int, float]:
+    """Pay every recipient and return the gas, transaction count and seconds taken."""
+    set_nonce_manager(NonceManager())
+    set_asset_cache(AssetCache())
+    chain = LocalChain()
+    wallet = LocalWallet(chain, network_id, new_recipients)
+    recipients = [
+        {"destination": f"0x{index + 1:040x}", "amount": "0.01"} for index in range(RECIPIENTS)
+    ]
+    asset = LocalAsset(18, None) if asset_id == "eth" else LocalAsset(6, TOKEN_ADDRESS)
+
+    start = time.perf_counter()
+    with patch.object(asset_cache.Asset, "fetch", return_value=asset):
+        result = disperse(wallet, asset_id, recipients)
+    elapsed = time.perf_counter() - start
+
+    assert f"{RECIPIENTS} paid, 0 failed" in result, result
+    return chain.gas_used, chain.transactions, elapsed
+
+
+def main():
+    """Compare Disperse with one transfer per recipient for ETH and a token."""
+    print(f"Paying {RECIPIENTS} recipients")
+    for new_recipients in (True, False):
+        kind = "new" if new_recipients else "existing"
+        for asset_id in ("eth", "usdc"):
+            # Disperse is deployed on base-mainnet; base-sepolia takes the per-transfer fallback.
+            looped_gas, looped_txs, looped_seconds = run(asset_id, "base-sepolia", new_recipients)
+            disperse_gas, disperse_txs, disperse_seconds = run(
+                asset_id, "base-mainnet", new_recipients
+            )
+            label = f"{asset_id} to {kind}"
+            print(
+                f"{label:>16} transfers: {looped_gas:>10,} gas {looped_txs:>4} txs "
+                f"{looped_seconds:6.2f}s"
+            )
+            print(
+                f"{label:>16} disperse:  {disperse_gas:>10,} gas {disperse_txs:>4} txs "
+                f"{disperse_seconds:6.2f}s "
+                f"({disperse_gas / looped_gas:.0%} of the gas, "
+                f"{looped_seconds / disperse_seconds:.1f}x faster)"
+            )
+
+
+if __name__ == "__main__":
+    main()
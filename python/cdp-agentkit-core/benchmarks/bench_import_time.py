@@ -0,0 +1,61 @@
+"""Benchmark of the import time of the agentkit packages.
+
+Each module is imported in a fresh interpreter with `python -X importtime`, and the cumulative
+import time of the module itself is read from the report. The toolkit modules are measured
+rather than the bare `cdp_langchain` package, which imports nothing.
+
+Run with `poetry run python benchmarks/bench_import_time.py`, from an environment where
+cdp-langchain and twitter-langchain are installed as well.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = [
+    "cdp_agentkit_core.actions",
+    "cdp_langchain.agent_toolkits",
+    "twitter_langchain",
+]
+
+
+def import_time_us(module: str) -> int:
+    """Import a module in a fresh interpreter and return its cumulative import time in us."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise ValueError(f"{module} is missing from the import time report")
+
+
+def main():
+    """Measure and print the import time of every module."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="imports per module")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for module in MODULES:
+        timings = [import_time_us(module) / 1000 for _ in range(args.repeat)]
+        results[module] = {"min_ms": min(timings), "median_ms": statistics.median(timings)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for module, result in results.items():
+        print(f"{module:<30} min {result['min_ms']:8.1f} ms  median {result['median_ms']:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
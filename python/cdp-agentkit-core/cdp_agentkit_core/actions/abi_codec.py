@@ -0,0 +1,271 @@
+"""Compiled ABI codecs, parsed once per ABI and shared across calls.
+
+Encoding calldata from a raw ABI means finding the function, hashing its signature for the
+selector, deriving the type strings and walking every parameter to convert the arguments, on
+every call. A codec does that work once per ABI: it holds the selector, the eth-abi tuple encoder
+and decoder and a converter compiled for each parameter of every function.
+
+Example:
+    .. code-block:: python
+
+        call_data = encode_call(UNISWAP_V3_ABI, "fee")
+        fee = decode_result(UNISWAP_V3_ABI, "fee", return_data)
+
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from eth_abi.decoding import ContextFramesBytesIO
+from eth_abi.registry import registry
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+from web3 import Web3
+
+Converter = Callable[[Any], Any]
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+@dataclass(frozen=True)
+class FunctionCodec:
+    """The compiled encoder and decoder of a single ABI function."""
+
+    name: str
+    selector: bytes
+    abi: dict
+    input_names: tuple[str, ...]
+    input_converters: tuple[Converter, ...]
+    output_converters: tuple[Converter, ...]
+    encoder: Callable[[Sequence[Any]], bytes]
+    decoder: Callable[[ContextFramesBytesIO], tuple[Any, ...]]
+    # The name of the only parameter when it is a struct, which may be passed flattened.
+    struct_input: str | None
+
+    @classmethod
+    def compile(cls, function: dict) -> "FunctionCodec":
+        """Compile the codec of an ABI function.
+
+        Args:
+            function (dict): The ABI entry of the function
+
+        Returns:
+            FunctionCodec: The codec
+
+        """
+        inputs = function.get("inputs", [])
+        outputs = function.get("outputs", [])
+        return cls(
+            name=function["name"],
+            selector=function_abi_to_4byte_selector(function),
+            abi=function,
+            input_names=tuple(abi_input["name"] for abi_input in inputs),
+            input_converters=tuple(_compile_to_abi(abi_input) for abi_input in inputs),
+            output_converters=tuple(_compile_from_abi(output) for output in outputs),
+            encoder=registry.get_tuple_encoder(*get_abi_input_types(function)),
+            decoder=registry.get_tuple_decoder(*get_abi_output_types(function)),
+            struct_input=(
+                inputs[0]["name"] if len(inputs) == 1 and inputs[0]["type"] == "tuple" else None
+            ),
+        )
+
+    def encode_call(self, args: dict | Sequence[Any] | None = None) -> bytes:
+        """Encode calldata from `SmartContract.read` style named or positional arguments.
+
+        Args:
+            args (dict | Sequence[Any] | None): The arguments keyed by input name, or in order
+
+        Returns:
+            bytes: The selector followed by the ABI encoded arguments
+
+        """
+        if not args:
+            values = ()
+        elif isinstance(args, dict):
+            # A single struct parameter may be passed either nested under its name or flattened.
+            if self.struct_input is not None and self.struct_input not in args:
+                args = {self.struct_input: args}
+            values = [args[name] for name in self.input_names]
+        else:
+            values = args
+
+        return self.selector + self.encoder(
+            [convert(value) for convert, value in zip(self.input_converters, values, strict=True)]
+        )
+
+    def decode_result(self, return_data: bytes) -> Any:
+        """Decode the return data of the function.
+
+        Args:
+            return_data (bytes): The raw return data
+
+        Returns:
+            Any: The single decoded output, or a list of outputs for multi-output functions
+
+        """
+        values = self.decoder(ContextFramesBytesIO(return_data))
+        converted = [
+            convert(value) for convert, value in zip(self.output_converters, values, strict=True)
+        ]
+        if len(converted) == 1:
+            return converted[0]
+        return converted
+
+
+class AbiCodec:
+    """The compiled codecs of every function in an ABI, keyed by function name.
+
+    Overloaded functions resolve to their first definition, as `SmartContract.read` does.
+    """
+
+    def __init__(self, abi: list[dict]):
+        self.abi = abi
+        self.functions: dict[str, FunctionCodec] = {}
+        for entry in abi:
+            if entry.get("type") == "function" and entry["name"] not in self.functions:
+                self.functions[entry["name"]] = get_function_codec(entry)
+
+    def function(self, method: str) -> FunctionCodec:
+        """Get the codec of a function.
+
+        Args:
+            method (str): The function name
+
+        Returns:
+            FunctionCodec: The codec
+
+        Raises:
+            ValueError: If the ABI has no function with the name.
+
+        """
+        try:
+            return self.functions[method]
+        except KeyError:
+            raise ValueError(f"Method {method} not found in ABI") from None
+
+
+# Codecs are keyed by the identity of the ABI object, which is kept alive alongside its codec so
+# the id is never reused. ABIs are module level constants, so the caches stay small.
+_abi_codecs: dict[int, tuple[list[dict], AbiCodec]] = {}
+_function_codecs: dict[int, tuple[dict, FunctionCodec]] = {}
+
+
+def get_abi_codec(abi: list[dict]) -> AbiCodec:
+    """Get the codec of an ABI, compiled on first use.
+
+    Args:
+        abi (list[dict]): The ABI
+
+    Returns:
+        AbiCodec: The codec, shared by every caller passing the same ABI object
+
+    """
+    cached = _abi_codecs.get(id(abi))
+    if cached is None:
+        cached = _abi_codecs[id(abi)] = (abi, AbiCodec(abi))
+    return cached[1]
+
+
+def get_function_codec(function: dict) -> FunctionCodec:
+    """Get the codec of an ABI function entry, compiled on first use.
+
+    Args:
+        function (dict): The ABI entry of the function
+
+    Returns:
+        FunctionCodec: The codec, shared by every caller passing the same entry object
+
+    """
+    cached = _function_codecs.get(id(function))
+    if cached is None:
+        cached = _function_codecs[id(function)] = (function, FunctionCodec.compile(function))
+    return cached[1]
+
+
+def encode_call(abi: list[dict], method: str, args: dict | Sequence[Any] | None = None) -> bytes:
+    """Encode calldata for a function of an ABI.
+
+    Args:
+        abi (list[dict]): The ABI containing the function
+        method (str): The function name
+        args (dict | Sequence[Any] | None): The arguments keyed by input name, or in order
+
+    Returns:
+        bytes: The selector followed by the ABI encoded arguments
+
+    """
+    return get_abi_codec(abi).function(method).encode_call(args)
+
+
+def decode_result(abi: list[dict], method: str, return_data: bytes) -> Any:
+    """Decode the return data of a function of an ABI.
+
+    Args:
+        abi (list[dict]): The ABI containing the function
+        method (str): The function name
+        return_data (bytes): The raw return data
+
+    Returns:
+        Any: The single decoded output, or a list of outputs for multi-output functions
+
+    """
+    return get_abi_codec(abi).function(method).decode_result(return_data)
+
+
+def _compile_to_abi(abi_param: dict) -> Converter:
+    abi_type = abi_param["type"]
+
+    if abi_type.endswith("]"):
+        convert_item = _compile_to_abi({**abi_param, "type": abi_type[: abi_type.rindex("[")]})
+        return lambda value: [convert_item(item) for item in value]
+    if abi_type == "tuple":
+        names = [component["name"] for component in abi_param["components"]]
+        converters = [_compile_to_abi(component) for component in abi_param["components"]]
+
+        def convert_tuple(value: Any) -> tuple:
+            if isinstance(value, dict):
+                value = [value[name] for name in names]
+            return tuple(convert(item) for convert, item in zip(converters, value, strict=True))
+
+        return convert_tuple
+    if abi_type.startswith(("uint", "int")):
+        return int
+    if abi_type == "address":
+        # The encoder takes the 20 address bytes, which skips hashing for a checksum.
+        return _address_bytes
+    if abi_type == "bool":
+        return lambda value: value == "true" if isinstance(value, str) else bool(value)
+    if abi_type.startswith("bytes"):
+        return lambda value: bytes.fromhex(_strip_0x(value)) if isinstance(value, str) else value
+    return _identity
+
+
+def _compile_from_abi(abi_param: dict) -> Converter:
+    abi_type = abi_param["type"]
+
+    if abi_type.endswith("]"):
+        convert_item = _compile_from_abi({**abi_param, "type": abi_type[: abi_type.rindex("[")]})
+        return lambda value: [convert_item(item) for item in value]
+    if abi_type == "tuple":
+        fields = [
+            (component["name"], _compile_from_abi(component))
+            for component in abi_param["components"]
+        ]
+        return lambda value: {
+            name: convert(item) for (name, convert), item in zip(fields, value, strict=True)
+        }
+    if abi_type == "address":
+        return Web3.to_checksum_address
+    if abi_type.startswith("bytes"):
+        return lambda value: "0x" + bytes(value).hex()
+    return _identity
+
+
+def _address_bytes(value: Any) -> Any:
+    return bytes.fromhex(_strip_0x(value)) if isinstance(value, str) else value
+
+
+def _strip_0x(value: str) -> str:
+    return value[2:] if value.startswith("0x") else value
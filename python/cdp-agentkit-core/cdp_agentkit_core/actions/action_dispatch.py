@@ -0,0 +1,108 @@
+"""Dispatch of actions resolved once per tool rather than on every call."""
+
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_WRITE
+
+
+@dataclass(frozen=True)
+class ActionDispatch:
+    """How to call an action: its functions, whether they take a context and its validator.
+
+    Built once when a tool is created, so calling the action needs neither signature inspection
+    nor a new validator. The context is the object a toolkit passes as the first argument of the
+    actions that declare it, the CDP wallet by default; toolkits with another context override
+    `takes_context`. The name and side effect of the action decide how its result is cached.
+    """
+
+    func: Callable[..., str]
+    afunc: Callable[..., Awaitable[str]] | None
+    func_takes_context: bool
+    afunc_takes_context: bool
+    validator: TypeAdapter | None
+    name: str = ""
+    side_effect: str = SIDE_EFFECT_WRITE
+
+    @classmethod
+    def for_action(
+        cls,
+        func: Callable[..., str],
+        afunc: Callable[..., Awaitable[str]] | None = None,
+        args_schema: type[BaseModel] | None = None,
+        name: str = "",
+        side_effect: str = SIDE_EFFECT_WRITE,
+    ) -> "ActionDispatch":
+        """Resolve the dispatch of an action.
+
+        Args:
+            func: Callable[..., str]. The action function.
+            afunc: Callable[..., Awaitable[str]] | None. The native async action function.
+            args_schema: type[BaseModel] | None. The input schema of the action.
+            name: str. The action name, used as its result cache key.
+            side_effect: str. The side effect of the action, `read`, `external` or `write`.
+
+        Returns:
+            ActionDispatch. The resolved dispatch.
+
+        """
+        return cls(
+            func=func,
+            afunc=afunc,
+            func_takes_context=cls.takes_context(func),
+            afunc_takes_context=afunc is not None and cls.takes_context(afunc),
+            validator=get_type_adapter(args_schema) if args_schema is not None else None,
+            name=name,
+            side_effect=side_effect,
+        )
+
+    @staticmethod
+    def takes_context(func: Callable[..., Any]) -> bool:
+        """Whether the first parameter of an action function is the context."""
+        return takes_wallet(func)
+
+    def parse_args(self, instructions: str | None, **kwargs: Any) -> dict[str, Any]:
+        """Validate the tool input and return the keyword arguments of the action.
+
+        The arguments are the `model_dump` of the validated args schema, so fields holding nested
+        models are passed to the action as plain dicts.
+
+        Raises:
+            ValidationError: If the input does not match the args schema.
+
+        """
+        if self.validator is None:
+            if not instructions or instructions == "{}":
+                # Catch other forms of empty input that GPT-4 likes to send.
+                instructions = ""
+            return {"instructions": instructions}
+
+        return self.validator.validate_python(kwargs).model_dump()
+
+
+@cache
+def get_type_adapter(args_schema: type[BaseModel]) -> TypeAdapter:
+    """Get the validator of an args schema, built once per schema and shared across tools."""
+    return TypeAdapter(args_schema)
+
+
+def takes_first_parameter(func: Callable[..., Any], annotation: type) -> bool:
+    """Whether the first parameter of an action function is annotated with a type."""
+    func_signature = inspect.signature(func)
+
+    first_kwarg = next(iter(func_signature.parameters.values()), None)
+
+    return first_kwarg is not None and first_kwarg.annotation is annotation
+
+
+def takes_wallet(func: Callable[..., Any]) -> bool:
+    """Whether the first parameter of an action function is the wallet."""
+    # Imported here so that listing tools does not import the CDP SDK.
+    from cdp import Wallet
+
+    return takes_first_parameter(func, Wallet)
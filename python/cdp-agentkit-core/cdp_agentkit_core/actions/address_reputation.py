@@ -5,6 +5,7 @@ from cdp import Address
 from pydantic import BaseModel, Field, field_validator
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ
 
 ADDRESS_REPUTATION_PROMPT = """
 This tool checks the reputation of an address on a given network. It takes:
@@ -70,3 +71,4 @@ class AddressReputationAction(CdpAction):
     description: str = ADDRESS_REPUTATION_PROMPT
     args_schema: type[BaseModel] | None = AddressReputationInput
     func: Callable[..., str] = check_address_reputation
+    side_effect: str = SIDE_EFFECT_READ
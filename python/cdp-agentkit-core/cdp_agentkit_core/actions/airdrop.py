@@ -0,0 +1,572 @@
+"""Resumable airdrops of tokens or NFTs to the recipients of a CSV or JSONL file.
+
+The recipients are streamed from the file one row at a time, so files of any size run in constant
+memory, and sent with up to `concurrency` transactions in flight. Every row is checkpointed to a
+local SQLite journal: once when its transaction is broadcast and again once it is confirmed. A job
+that is restarted after a crash or a stop skips the rows that are already confirmed and retries the
+rows that failed, so it picks up exactly where it stopped.
+
+A row whose transaction was broadcast but not confirmed before the stop is never sent again, since
+it may have landed; it is reported as unconfirmed with its transaction hash for manual review.
+
+CSV files need a header with a `destination` column and, for transfers, an `amount` column in whole
+units. JSONL files hold one object per line with the same keys.
+
+Example:
+    .. code-block:: console
+
+        $ cdp-airdrop recipients.csv --asset-id usdc --wallet-data wallet.json
+
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.batch_transfer import GASLESS_NETWORKS, validate_positive_amount
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+
+AIRDROP_PROMPT = """
+This tool will airdrop tokens or NFTs to every recipient listed in a CSV or JSONL file, as a background job that survives restarts.
+
+It takes the following inputs:
+- source: The path of the CSV or JSONL file of recipients
+- kind: `transfer` to send an asset, or `mint_nft` to mint an NFT to each recipient
+- asset_id: The asset ID to transfer, e.g. `eth` or `usdc`, for transfer airdrops
+- contract_address: The NFT contract to mint from, for mint_nft airdrops
+- resume: Whether to restart a job that is not running, retrying the rows that failed. Defaults to false.
+
+Important notes:
+- The first call starts the job and returns its progress; call the tool again with the same inputs to check on it, which never sends anything
+- Only set resume to true when the user asks to retry the failed rows or to continue a stopped job; confirmed rows are never sent twice
+- CSV files need a header with a `destination` column and, for transfers, an `amount` column in whole units
+- Ensure sufficient balance for the whole airdrop AND the gas cost of the transactions
+"""
+
+AIRDROP_KINDS = ("transfer", "mint_nft")
+
+# Default number of airdrop transactions in flight at once.
+AIRDROP_CONCURRENCY = 8
+
+ROW_SUBMITTED = "submitted"
+ROW_COMPLETE = "complete"
+ROW_FAILED = "failed"
+
+_JOURNAL_SCHEMA = """
+CREATE TABLE IF NOT EXISTS airdrop_rows (
+    job_id TEXT NOT NULL,
+    row_number INTEGER NOT NULL,
+    destination TEXT NOT NULL,
+    status TEXT NOT NULL,
+    transaction_hash TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, row_number)
+)
+"""
+
+
+def default_airdrop_journal_path() -> Path:
+    """Return the default location of the airdrop journal.
+
+    The directory can be overridden with the `CDP_AGENTKIT_CACHE_DIR` environment variable.
+    """
+    cache_dir = os.environ.get("CDP_AGENTKIT_CACHE_DIR") or Path.home() / ".cache" / "cdp-agentkit"
+    return Path(cache_dir) / "airdrop_journal.sqlite3"
+
+
+@dataclass(frozen=True)
+class AirdropRow:
+    """A recipient read from the source file, numbered from 1 in file order."""
+
+    number: int
+    destination: str
+    amount: str | None
+
+
+def read_recipients(source: str | Path) -> Iterator[AirdropRow]:
+    """Stream the recipients of a CSV or JSONL file without loading it into memory.
+
+    Files ending in `.jsonl` or `.ndjson` are read as JSONL, any other file as CSV. Blank JSONL
+    lines are skipped but still counted, so row numbers stay stable across runs.
+
+    Args:
+        source (str | Path): The path of the file
+
+    Yields:
+        AirdropRow: The recipients in file order
+
+    """
+    path = Path(source)
+    with path.open(newline="", encoding="utf-8") as file:
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            for number, line in enumerate(file, 1):
+                if line.strip():
+                    record = json.loads(line)
+                    yield _row(number, record)
+        else:
+            for number, record in enumerate(csv.DictReader(file), 1):
+                yield _row(number, record)
+
+
+def _row(number: int, record: dict) -> AirdropRow:
+    amount = record.get("amount")
+    return AirdropRow(
+        number=number,
+        destination=str(record.get("destination") or "").strip(),
+        amount=str(amount).strip() if amount not in (None, "") else None,
+    )
+
+
+class AirdropJournal:
+    """SQLite checkpoint journal of airdrop rows, safe to share between threads."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_JOURNAL_SCHEMA)
+        self._connection.commit()
+
+    def record(
+        self,
+        job_id: str,
+        row: AirdropRow,
+        status: str,
+        transaction_hash: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Checkpoint the status of a row, committed before returning.
+
+        Args:
+            job_id (str): The airdrop job ID
+            row (AirdropRow): The row
+            status (str): `submitted`, `complete` or `failed`
+            transaction_hash (str | None): The hash of the row's transaction, if broadcast
+            error (str | None): Why the row failed, if it did
+
+        """
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO airdrop_rows VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, row.number, row.destination, status, transaction_hash, error, time.time()),
+            )
+            self._connection.commit()
+
+    def settled_rows(self, job_id: str) -> set[int]:
+        """Get the numbers of the rows that must not be sent again: confirmed or unconfirmed."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT row_number FROM airdrop_rows WHERE job_id = ? AND status != ?",
+                (job_id, ROW_FAILED),
+            )
+            return {number for (number,) in cursor}
+
+    def counts(self, job_id: str) -> dict[str, int]:
+        """Get the number of rows of a job in each status."""
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT status, COUNT(*) FROM airdrop_rows WHERE job_id = ? GROUP BY status",
+                (job_id,),
+            )
+            return dict(cursor.fetchall())
+
+    def rows(self, job_id: str, status: str) -> list[tuple[int, str, str | None, str | None]]:
+        """Get the rows of a job in a status, such as the unconfirmed rows to review by hand.
+
+        Args:
+            job_id (str): The airdrop job ID
+            status (str): `submitted`, `complete` or `failed`
+
+        Returns:
+            list[tuple[int, str, str | None, str | None]]: The row number, destination,
+                transaction hash and error of each row, in row order
+
+        """
+        with self._lock:
+            cursor = self._connection.execute(
+                "SELECT row_number, destination, transaction_hash, error FROM airdrop_rows "
+                "WHERE job_id = ? AND status = ? ORDER BY row_number",
+                (job_id, status),
+            )
+            return cursor.fetchall()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+@dataclass(frozen=True)
+class AirdropProgress:
+    """A snapshot of the progress of an airdrop job."""
+
+    job_id: str
+    state: str
+    rows_read: int
+    complete: int
+    failed: int
+    unconfirmed: int
+    error: str | None = None
+
+    def __str__(self) -> str:
+        """Describe the progress for the agent."""
+        message = (
+            f"Airdrop job {self.job_id} is {self.state}: {self.complete} rows complete, "
+            f"{self.failed} failed, {self.unconfirmed} unconfirmed, "
+            f"{self.rows_read} rows read this run."
+        )
+        if self.error:
+            message += f"\nError: {self.error}"
+        return message
+
+
+class AirdropJob:
+    """An airdrop from a recipients file, checkpointed to a journal and resumable."""
+
+    def __init__(
+        self,
+        wallet: Wallet,
+        source: str | Path,
+        kind: str = "transfer",
+        asset_id: str | None = None,
+        contract_address: str | None = None,
+        journal: AirdropJournal | None = None,
+        concurrency: int = AIRDROP_CONCURRENCY,
+    ):
+        if kind not in AIRDROP_KINDS:
+            raise ValueError(f"Unknown airdrop kind {kind}, expected one of {AIRDROP_KINDS}")
+        if kind == "transfer" and not asset_id:
+            raise ValueError("A transfer airdrop needs an asset ID")
+        if kind == "mint_nft" and not contract_address:
+            raise ValueError("A mint_nft airdrop needs a contract address")
+
+        self.wallet = wallet
+        self.source = Path(source).resolve()
+        self.kind = kind
+        self.asset_id = asset_id
+        self.contract_address = contract_address
+        self.journal = journal or AirdropJournal(default_airdrop_journal_path())
+        self.concurrency = concurrency
+        self.job_id = airdrop_job_id(wallet, self.source, kind, asset_id or contract_address)
+
+        self._rows_read = 0
+        self._state = "pending"
+        self._error: str | None = None
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run(self) -> AirdropProgress:
+        """Send every row that is not settled yet, blocking until the file is exhausted or stopped.
+
+        Returns:
+            AirdropProgress: The progress once the run ends
+
+        """
+        self._state = "running"
+        self._rows_read = 0
+        self._error = None
+        self._stopped.clear()
+        settled = self.journal.settled_rows(self.job_id)
+        slots = threading.BoundedSemaphore(self.concurrency)
+
+        def send(row: AirdropRow) -> None:
+            try:
+                self._send(row)
+            except Exception as e:
+                # The journal could not be written, so the row is retried on the next run.
+                self._error = str(e)
+            finally:
+                slots.release()
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="cdp-airdrop"
+            ) as pool:
+                for row in read_recipients(self.source):
+                    if self._stopped.is_set():
+                        break
+                    self._rows_read += 1
+                    if row.number in settled:
+                        continue
+                    # Wait for a free slot so that only `concurrency` rows are read ahead.
+                    slots.acquire()
+                    pool.submit(send, row)
+            self._state = "stopped" if self._stopped.is_set() else "finished"
+        except Exception as e:
+            self._state = "stopped"
+            self._error = str(e)
+        return self.progress()
+
+    def start(self) -> None:
+        """Run the job from a background thread."""
+        if self.running:
+            return
+        self._state = "running"
+        self._thread = threading.Thread(
+            target=self.run, name=f"cdp-airdrop-{self.job_id}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop reading rows; rows already in flight are still confirmed and checkpointed.
+
+        Args:
+            timeout (float | None): Seconds to wait for the job to stop, forever if None.
+
+        """
+        self._stopped.set()
+        self.join(timeout)
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the background run of the job to end.
+
+        Args:
+            timeout (float | None): Seconds to wait, forever if None.
+
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        """Whether the job is running in its background thread."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def progress(self) -> AirdropProgress:
+        """Get the progress of the job from its journal."""
+        counts = self.journal.counts(self.job_id)
+        return AirdropProgress(
+            job_id=self.job_id,
+            state=self._state,
+            rows_read=self._rows_read,
+            complete=counts.get(ROW_COMPLETE, 0),
+            failed=counts.get(ROW_FAILED, 0),
+            unconfirmed=counts.get(ROW_SUBMITTED, 0),
+            error=self._error,
+        )
+
+    def _send(self, row: AirdropRow) -> None:
+        try:
+            if not row.destination:
+                raise ValueError("The row has no destination")
+            with wallet_submission(self.wallet):
+                if self.kind == "transfer":
+                    operation = self.wallet.transfer(
+                        amount=validate_positive_amount(row.amount or ""),
+                        asset_id=self.asset_id,
+                        destination=row.destination,
+                        gasless=self.asset_id.lower() == "usdc"
+                        and self.wallet.network_id in GASLESS_NETWORKS,
+                    )
+                else:
+                    operation = self.wallet.invoke_contract(
+                        contract_address=self.contract_address,
+                        method="mint",
+                        args={"to": row.destination, "quantity": "1"},
+                    )
+        except Exception as e:
+            self.journal.record(self.job_id, row, ROW_FAILED, error=str(e))
+            return
+
+        transaction_hash = operation.transaction_hash
+        self.journal.record(self.job_id, row, ROW_SUBMITTED, transaction_hash)
+        try:
+            operation.wait()
+        except Exception as e:
+            # The transaction may still land, so the row stays unconfirmed and is not resent.
+            self.journal.record(self.job_id, row, ROW_SUBMITTED, transaction_hash, str(e))
+            return
+        if str(operation.status) == ROW_FAILED:
+            self.journal.record(
+                self.job_id, row, ROW_FAILED, transaction_hash, "The transaction failed onchain"
+            )
+        else:
+            self.journal.record(self.job_id, row, ROW_COMPLETE, transaction_hash)
+
+
+def airdrop_job_id(wallet: Wallet, source: Path, kind: str, target: str | None) -> str:
+    """Get the ID of an airdrop job, the same for every run of the same airdrop.
+
+    Args:
+        wallet (Wallet): The wallet the airdrop is sent from
+        source (Path): The resolved path of the recipients file
+        kind (str): `transfer` or `mint_nft`
+        target (str | None): The asset ID or the NFT contract address
+
+    Returns:
+        str: The job ID
+
+    """
+    key = "|".join(
+        [wallet.network_id, wallet.default_address.address_id, str(source), kind, target or ""]
+    )
+    return hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+class AirdropInput(BaseModel):
+    """Input argument schema for airdrop action."""
+
+    source: str = Field(
+        ..., description="The path of the CSV or JSONL file of recipients, e.g. `recipients.csv`"
+    )
+    kind: str = Field(
+        default="transfer",
+        description="`transfer` to send an asset, or `mint_nft` to mint an NFT to each recipient",
+    )
+    asset_id: str | None = Field(
+        default=None,
+        description="The asset ID to transfer, e.g. `eth`, `usdc`. Required for transfer airdrops.",
+    )
+    contract_address: str | None = Field(
+        default=None,
+        description="The NFT contract to mint from, e.g. `0x036CbD53842c5426634e7929541eC2318f3dCF7e`. Required for mint_nft airdrops.",
+    )
+    resume: bool = Field(
+        default=False,
+        description="Whether to restart a job that is not running, retrying the rows that failed",
+    )
+
+
+_airdrop_jobs: dict[str, AirdropJob] = {}
+_airdrop_jobs_lock = threading.Lock()
+
+
+def airdrop(
+    wallet: Wallet,
+    source: str,
+    kind: str = "transfer",
+    asset_id: str | None = None,
+    contract_address: str | None = None,
+    resume: bool = False,
+) -> str:
+    """Start an airdrop job in the background, or report the progress of a known one.
+
+    A job that already has rows in the journal, whether it finished, stopped or was started before
+    a restart, is only restarted with `resume`, so checking on it never sends a transaction.
+
+    Args:
+        wallet (Wallet): The wallet to send the airdrop from.
+        source (str): The path of the CSV or JSONL file of recipients.
+        kind (str): `transfer` or `mint_nft`.
+        asset_id (str | None): The asset ID to transfer, for transfer airdrops.
+        contract_address (str | None): The NFT contract to mint from, for mint_nft airdrops.
+        resume (bool): Whether to restart a job that is not running, retrying its failed rows.
+
+    Returns:
+        str: The progress of the job.
+
+    """
+    try:
+        job_id = airdrop_job_id(wallet, Path(source).resolve(), kind, asset_id or contract_address)
+        with _airdrop_jobs_lock:
+            job = _airdrop_jobs.get(job_id)
+            known = job is not None
+            if job is None:
+                job = AirdropJob(wallet, source, kind, asset_id, contract_address)
+                _airdrop_jobs[job_id] = job
+                known = bool(job.journal.counts(job_id))
+            started = resume or not known
+            if started:
+                job.start()
+    except Exception as e:
+        return f"Error starting airdrop: {e!s}"
+
+    progress = str(job.progress())
+    if not started and not job.running:
+        progress += "\nThe job is not running; call the tool with resume set to true to restart it."
+    return progress
+
+
+class AirdropAction(CdpAction):
+    """Airdrop action."""
+
+    name: str = "airdrop"
+    description: str = AIRDROP_PROMPT
+    args_schema: type[BaseModel] | None = AirdropInput
+    func: Callable[..., str] = airdrop
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run an airdrop from the command line until it finishes, printing its progress.
+
+    The CDP API key is read from the `CDP_API_KEY_NAME` and `CDP_API_KEY_PRIVATE_KEY` environment
+    variables and the wallet from a file of exported wallet data.
+
+    Args:
+        argv (list[str] | None): The command line arguments, `sys.argv` if None.
+
+    Returns:
+        int: The exit status, 1 if any row failed or is unconfirmed.
+
+    """
+    parser = argparse.ArgumentParser(
+        prog="cdp-airdrop", description="Airdrop tokens or NFTs to the recipients of a file."
+    )
+    parser.add_argument("source", help="CSV or JSONL file of recipients")
+    parser.add_argument("--kind", choices=AIRDROP_KINDS, default="transfer")
+    parser.add_argument("--asset-id", help="asset to transfer, e.g. eth or usdc")
+    parser.add_argument("--contract-address", help="NFT contract to mint from")
+    parser.add_argument(
+        "--wallet-data", required=True, help="JSON file of the wallet data to send from"
+    )
+    parser.add_argument("--journal", help="SQLite journal path")
+    parser.add_argument("--concurrency", type=int, default=AIRDROP_CONCURRENCY)
+    parser.add_argument(
+        "--progress-interval", type=float, default=10.0, help="seconds between progress lines"
+    )
+    args = parser.parse_args(argv)
+
+    from cdp import Cdp, WalletData
+
+    Cdp.configure(
+        api_key_name=os.environ["CDP_API_KEY_NAME"],
+        private_key=os.environ["CDP_API_KEY_PRIVATE_KEY"].replace("\\n", "\n"),
+    )
+    wallet_data = WalletData.from_dict(json.loads(Path(args.wallet_data).read_text()))
+    wallet = Wallet.import_data(wallet_data)
+
+    job = AirdropJob(
+        wallet,
+        args.source,
+        args.kind,
+        args.asset_id,
+        args.contract_address,
+        AirdropJournal(args.journal) if args.journal else None,
+        args.concurrency,
+    )
+    job.start()
+    try:
+        while job.running:
+            job.join(args.progress_interval)
+            print(job.progress(), flush=True)
+    except KeyboardInterrupt:
+        print("Stopping after the rows in flight are confirmed...", file=sys.stderr)
+        job.stop()
+        print(job.progress())
+
+    progress = job.progress()
+    for status in (ROW_FAILED, ROW_SUBMITTED):
+        for number, destination, transaction_hash, error in job.journal.rows(job.job_id, status):
+            print(f"Row {number} to {destination} is {status}: {transaction_hash or error}")
+    return 1 if progress.failed or progress.unconfirmed or progress.error else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
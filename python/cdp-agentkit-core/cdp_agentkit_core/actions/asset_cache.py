@@ -0,0 +1,120 @@
+import threading
+from typing import Any
+
+from cdp import Asset
+
+
+class AssetCache:
+    """Network-keyed, in-memory cache of asset metadata.
+
+    The decimals and contract address of an asset never change, so an asset fetched once is
+    served from memory for the life of the process. Entries can be exported and loaded again,
+    so a wallet snapshot can carry them across restarts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assets: dict[tuple[str, str], Any] = {}
+
+    def fetch(self, network_id: str, asset_id: str) -> Asset:
+        """Get an asset, fetching it from the CDP API the first time.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            asset_id (str): The asset ID, such as `eth`, `usdc` or a contract address
+
+        Returns:
+            Asset: The asset
+
+        """
+        key = (network_id, asset_id.lower())
+        with self._lock:
+            asset = self._assets.get(key)
+        if asset is None:
+            asset = Asset.fetch(network_id, asset_id)
+            with self._lock:
+                asset = self._assets.setdefault(key, asset)
+        return asset
+
+    def export(self, network_id: str) -> list[dict[str, Any]]:
+        """Export the cached assets of a network.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+
+        Returns:
+            list[dict[str, Any]]: The network ID, asset ID, decimals and contract address of each
+                asset
+
+        """
+        with self._lock:
+            return [
+                {
+                    "network_id": network,
+                    "asset_id": asset_id,
+                    "decimals": asset.decimals,
+                    "contract_address": asset.contract_address,
+                }
+                for (network, asset_id), asset in self._assets.items()
+                if network == network_id
+            ]
+
+    def load(self, entries: list[dict[str, Any]]) -> None:
+        """Load exported assets, keeping any asset already cached.
+
+        Args:
+            entries (list[dict[str, Any]]): Assets exported with `export`
+
+        """
+        with self._lock:
+            for entry in entries:
+                self._assets.setdefault(
+                    (entry["network_id"], entry["asset_id"]),
+                    Asset(
+                        network_id=entry["network_id"],
+                        asset_id=entry["asset_id"],
+                        contract_address=entry["contract_address"],
+                        decimals=entry["decimals"],
+                    ),
+                )
+
+    def clear(self) -> None:
+        """Forget every cached asset."""
+        with self._lock:
+            self._assets = {}
+
+
+_asset_cache: AssetCache | None = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Get the process-wide asset cache."""
+    global _asset_cache
+    if _asset_cache is None:
+        _asset_cache = AssetCache()
+    return _asset_cache
+
+
+def set_asset_cache(cache: AssetCache) -> None:
+    """Replace the process-wide asset cache.
+
+    Args:
+        cache (AssetCache): The cache to use.
+
+    """
+    global _asset_cache
+    _asset_cache = cache
+
+
+def fetch_asset(network_id: str, asset_id: str) -> Asset:
+    """Get an asset through the process-wide asset cache.
+
+    Args:
+        network_id (str): The network ID, such as `base-sepolia`
+        asset_id (str): The asset ID, such as `eth`, `usdc` or a contract address
+
+    Returns:
+        Asset: The asset
+
+    """
+    return get_asset_cache().fetch(network_id, asset_id)
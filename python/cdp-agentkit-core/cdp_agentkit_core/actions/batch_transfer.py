@@ -0,0 +1,178 @@
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal, InvalidOperation
+
+from cdp import Wallet
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
+
+BATCH_TRANSFER_PROMPT = """
+This tool will transfer assets from the wallet to many onchain addresses in one call.
+
+It takes the following inputs:
+- transfers: The list of transfers, each with a destination, an amount and an asset ID
+
+Important notes:
+- Prefer this tool over calling transfer repeatedly when paying more than one recipient
+- USDC transfers are gasless on base-sepolia and base-mainnet (base)
+- Always use asset ID 'usdc' when transferring USDC
+- Ensure sufficient balance for every transfer in the batch AND the gas cost of the transfers
+- Each transfer succeeds or fails on its own; the result reports every transfer, so only retry the failed ones
+"""
+
+# Upper bound on transfers of one batch in flight at once.
+BATCH_TRANSFER_MAX_CONCURRENCY = 8
+
+# Largest batch accepted in one call.
+BATCH_TRANSFER_MAX_SIZE = 100
+
+# Networks where USDC transfers can be gasless.
+GASLESS_NETWORKS = ("base-sepolia", "base-mainnet")
+
+
+class BatchTransferItem(BaseModel):
+    """A single transfer of a batch."""
+
+    destination: str = Field(
+        ...,
+        description="The destination to transfer the funds, e.g. `0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027`, `example.eth`, `example.base.eth`",
+    )
+    amount: str = Field(
+        ..., description="The amount of the asset to transfer, e.g. `15`, `0.000001`"
+    )
+    asset_id: str = Field(
+        ...,
+        description="The asset ID to transfer, e.g. `eth`, `usdc`, `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, v: str) -> str:
+        """Validate that the amount is a positive number.
+
+        Args:
+            v (str): The amount to validate
+
+        Returns:
+            str: The validated amount
+
+        Raises:
+            ValueError: If the amount is not a positive number
+
+        """
+        return validate_positive_amount(v)
+
+
+def validate_positive_amount(v: str) -> str:
+    """Validate that an amount in whole units is a positive number.
+
+    Args:
+        v (str): The amount to validate
+
+    Returns:
+        str: The validated amount
+
+    Raises:
+        ValueError: If the amount is not a positive number
+
+    """
+    try:
+        amount = Decimal(v)
+    except InvalidOperation:
+        raise ValueError(f"Invalid amount {v}") from None
+    if not amount.is_finite() or amount <= 0:
+        raise ValueError(f"Amount must be positive, got {v}")
+    return v
+
+
+class BatchTransferInput(BaseModel):
+    """Input argument schema for batch transfer action."""
+
+    transfers: list[BatchTransferItem] = Field(
+        ...,
+        description="The transfers to send, each with a destination, an amount and an asset ID",
+        min_length=1,
+        max_length=BATCH_TRANSFER_MAX_SIZE,
+    )
+
+
+def batch_transfer(wallet: Wallet, transfers: list[BatchTransferItem | dict]) -> str:
+    """Transfer assets to many destinations onchain, with several transfers in flight at once.
+
+    The whole batch is validated before any transfer is sent. USDC transfers on Base Sepolia and
+    Mainnet are gasless. A failed transfer is reported on its row and does not stop the others.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the assets from.
+        transfers (list[BatchTransferItem | dict]): The transfers, each with a destination, an
+            amount and an asset ID.
+
+    Returns:
+        str: A summary of the batch with the outcome of each transfer.
+
+    """
+    try:
+        items = BatchTransferInput(transfers=transfers).transfers
+    except ValidationError as e:
+        return f"Error validating the batch transfer, no transfer was sent: {e!s}"
+
+    outcomes = send_transfers(wallet, items)
+    failed = sum(1 for succeeded, _ in outcomes if not succeeded)
+    lines = [
+        f"Batch transfer of {len(items)} transfers: {len(items) - failed} sent, {failed} failed."
+    ]
+    for index, (item, (_, outcome)) in enumerate(zip(items, outcomes, strict=True), 1):
+        lines.append(f"{index}. {item.amount} {item.asset_id} to {item.destination}: {outcome}")
+    return "\n".join(lines)
+
+
+def send_transfers(wallet: Wallet, items: list[BatchTransferItem]) -> list[tuple[bool, str]]:
+    """Send transfers with up to `BATCH_TRANSFER_MAX_CONCURRENCY` of them in flight at once.
+
+    Args:
+        wallet (Wallet): The wallet to transfer the assets from.
+        items (list[BatchTransferItem]): The validated transfers.
+
+    Returns:
+        list[tuple[bool, str]]: Whether each transfer was sent and its outcome, in input order.
+
+    """
+    max_workers = min(BATCH_TRANSFER_MAX_CONCURRENCY, len(items))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cdp-transfer") as pool:
+        return list(pool.map(lambda item: _transfer(wallet, item), items))
+
+
+def _transfer(wallet: Wallet, item: BatchTransferItem) -> tuple[bool, str]:
+    gasless = item.asset_id.lower() == "usdc" and wallet.network_id in GASLESS_NETWORKS
+    try:
+        with wallet_submission(wallet):
+            transfer = wallet.transfer(
+                amount=item.amount,
+                asset_id=item.asset_id,
+                destination=item.destination,
+                gasless=gasless,
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            tracked = tracker.track(
+                transfer, f"transfer of {item.amount} {item.asset_id} to {item.destination}"
+            )
+            return True, f"submitted, handle {tracked.handle}, hash {tracked.transaction_hash}"
+        transfer.wait()
+    except Exception as e:
+        return False, f"Error {e!s}"
+    if str(transfer.status) == "failed":
+        return False, f"Error the transfer failed onchain, hash {transfer.transaction_hash}"
+    return True, f"hash {transfer.transaction_hash}"
+
+
+class BatchTransferAction(CdpAction):
+    """Batch transfer action."""
+
+    name: str = "batch_transfer"
+    description: str = BATCH_TRANSFER_PROMPT
+    args_schema: type[BaseModel] | None = BatchTransferInput
+    func: Callable[..., str] = batch_transfer
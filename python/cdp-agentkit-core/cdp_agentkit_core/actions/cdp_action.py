@@ -1,7 +1,21 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from pydantic import BaseModel
 
+# Side effects of an action, which decide whether its results may be cached:
+# - read: reads onchain or CDP state, which changes with the wallet's own writes
+# - external: reads a third party HTTP API, which the wallet's writes do not change
+# - live: reads state that changes on its own, such as a pending transaction; never cached,
+#   but runs alongside reads
+# - write: changes state; never cached
+SIDE_EFFECT_READ = "read"
+SIDE_EFFECT_EXTERNAL = "external"
+SIDE_EFFECT_LIVE = "live"
+SIDE_EFFECT_WRITE = "write"
+
+# The side effects whose results may be cached.
+CACHEABLE_SIDE_EFFECTS = frozenset({SIDE_EFFECT_READ, SIDE_EFFECT_EXTERNAL})
+
 
 class CdpAction(BaseModel):
     """CDP Action Base Class."""
@@ -10,3 +24,5 @@ class CdpAction(BaseModel):
     description: str
     args_schema: type[BaseModel] | None = None
     func: Callable[..., str]
+    afunc: Callable[..., Awaitable[str]] | None = None
+    side_effect: str = SIDE_EFFECT_WRITE
@@ -5,6 +5,7 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 
 DEPLOY_CONTRACT_PROMPT = """
 Deploys smart contract with required args: solidity version (string), solidity input json (string), contract name (string), and optional constructor args (Dict[str, Any])
@@ -90,12 +91,14 @@ def deploy_contract(
     try:
         solidity_version = SOLIDITY_VERSIONS[solidity_version]
 
-        contract = wallet.deploy_contract(
-            solidity_version=solidity_version,
-            solidity_input_json=solidity_input_json,
-            contract_name=contract_name,
-            constructor_args=constructor_args or {},
-        ).wait()
+        with wallet_submission(wallet):
+            contract = wallet.deploy_contract(
+                solidity_version=solidity_version,
+                solidity_input_json=solidity_input_json,
+                contract_name=contract_name,
+                constructor_args=constructor_args or {},
+            )
+        contract.wait()
 
         return f"Deployed contract {contract_name} at address {contract.contract_address}. Transaction link: {contract.transaction.transaction_link}"
     except Exception as e:
@@ -4,6 +4,7 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 
 DEPLOY_NFT_PROMPT = """
 This tool will deploy an NFT (ERC-721) contract onchain from the wallet.
@@ -42,7 +43,9 @@ def deploy_nft(wallet: Wallet, name: str, symbol: str, base_uri: str) -> str:
 
     """
     try:
-        nft_contract = wallet.deploy_nft(name=name, symbol=symbol, base_uri=base_uri).wait()
+        with wallet_submission(wallet):
+            nft_contract = wallet.deploy_nft(name=name, symbol=symbol, base_uri=base_uri)
+        nft_contract.wait()
     except Exception as e:
         return f"Error deploying NFT {e!s}"
 
@@ -4,6 +4,7 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 
 DEPLOY_TOKEN_PROMPT = """
 This tool will deploy an ERC20 token smart contract. It takes the token name, symbol, and total supply as input.
@@ -35,7 +36,10 @@ def deploy_token(wallet: Wallet, name: str, symbol: str, total_supply: str) -> s
 
     """
     try:
-        token_contract = wallet.deploy_token(name=name, symbol=symbol, total_supply=total_supply)
+        with wallet_submission(wallet):
+            token_contract = wallet.deploy_token(
+                name=name, symbol=symbol, total_supply=total_supply
+            )
 
         token_contract.wait()
     except Exception as e:
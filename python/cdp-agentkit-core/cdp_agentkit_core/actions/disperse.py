@@ -0,0 +1,293 @@
+from collections.abc import Callable
+from decimal import Decimal
+
+from cdp import ContractInvocation, Wallet
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from web3 import Web3
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.asset_cache import fetch_asset
+from cdp_agentkit_core.actions.batch_transfer import (
+    BatchTransferItem,
+    send_transfers,
+    validate_positive_amount,
+)
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import (
+    TransactionTracker,
+    get_transaction_tracker,
+)
+from cdp_agentkit_core.actions.utils import approve
+
+DISPERSE_PROMPT = """
+This tool will pay one asset to many onchain addresses, such as a payroll or an airdrop, in as few transactions as possible.
+
+It takes the following inputs:
+- asset_id: The asset to pay, e.g. `eth`, `usdc` or a token contract address
+- recipients: The list of payments, each with a destination address and an amount in whole units
+
+Important notes:
+- Destinations must be 0x addresses; resolve ENS names and basenames first
+- On networks with the Disperse contract, the tokens are approved once and paid out in a few transactions; elsewhere every payment is a transfer of its own
+- Ensure sufficient balance for the total of the payments AND the gas cost of the transactions
+- Always use asset ID 'usdc' when paying USDC
+"""
+
+# Disperse (disperse.app) is deployed at the same address on the networks that have it.
+DISPERSE_ADDRESS = "0xD152f549545093347A162Dce210e7293f1452150"
+
+# Networks where the Disperse contract is deployed. Other networks fall back to transfers.
+DISPERSE_NETWORKS = frozenset({"base-mainnet", "ethereum-mainnet"})
+
+DISPERSE_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address[]", "name": "recipients", "type": "address[]"},
+            {"internalType": "uint256[]", "name": "values", "type": "uint256[]"},
+        ],
+        "name": "disperseEther",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "contract IERC20", "name": "token", "type": "address"},
+            {"internalType": "address[]", "name": "recipients", "type": "address[]"},
+            {"internalType": "uint256[]", "name": "values", "type": "uint256[]"},
+        ],
+        "name": "disperseToken",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# Gas budget of one disperse transaction, well under the block gas limit of supported networks.
+DISPERSE_CHUNK_GAS_LIMIT = 5_000_000
+
+# Fixed gas of a disperse transaction: the intrinsic cost, the call and the loop setup.
+DISPERSE_BASE_GAS = 60_000
+
+# Worst case gas per recipient: a value transfer to a new account, or a token transfer that
+# creates the recipient's balance slot, plus its calldata.
+DISPERSE_ETH_GAS_PER_RECIPIENT = 37_000
+DISPERSE_TOKEN_GAS_PER_RECIPIENT = 40_000
+
+# Largest number of recipients accepted in one call.
+DISPERSE_MAX_RECIPIENTS = 2_000
+
+
+class DisperseRecipient(BaseModel):
+    """A single payment of a disperse."""
+
+    destination: str = Field(
+        ...,
+        description="The destination address, e.g. `0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027`",
+    )
+    amount: str = Field(..., description="The amount to pay in whole units, e.g. `15`, `0.5`")
+
+    @field_validator("destination")
+    @classmethod
+    def validate_destination(cls, v: str) -> str:
+        """Validate that the destination is an address.
+
+        Args:
+            v (str): The destination to validate
+
+        Returns:
+            str: The checksummed address
+
+        Raises:
+            ValueError: If the destination is not an address
+
+        """
+        if not Web3.is_address(v):
+            raise ValueError(f"Destination {v} is not a 0x address")
+        return Web3.to_checksum_address(v)
+
+    @field_validator("amount")
+    @classmethod
+    def validate_amount(cls, v: str) -> str:
+        """Validate that the amount is a positive number.
+
+        Args:
+            v (str): The amount to validate
+
+        Returns:
+            str: The validated amount
+
+        Raises:
+            ValueError: If the amount is not a positive number
+
+        """
+        return validate_positive_amount(v)
+
+
+class DisperseInput(BaseModel):
+    """Input argument schema for disperse action."""
+
+    asset_id: str = Field(
+        ...,
+        description="The asset ID to pay, e.g. `eth`, `usdc`, `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+    )
+    recipients: list[DisperseRecipient] = Field(
+        ...,
+        description="The payments to make, each with a destination address and an amount",
+        min_length=1,
+        max_length=DISPERSE_MAX_RECIPIENTS,
+    )
+
+
+def disperse_chunk_size(gas_per_recipient: int, gas_limit: int = DISPERSE_CHUNK_GAS_LIMIT) -> int:
+    """Get the number of recipients paid by one disperse transaction within a gas limit.
+
+    Args:
+        gas_per_recipient (int): The worst case gas of paying one recipient
+        gas_limit (int): The gas budget of one transaction
+
+    Returns:
+        int: The number of recipients per transaction, at least one
+
+    """
+    return max(1, (gas_limit - DISPERSE_BASE_GAS) // gas_per_recipient)
+
+
+def disperse(
+    wallet: Wallet,
+    asset_id: str,
+    recipients: list[DisperseRecipient | dict],
+    gas_limit: int = DISPERSE_CHUNK_GAS_LIMIT,
+) -> str:
+    """Pay one asset to many addresses through the Disperse contract.
+
+    ERC20 tokens are approved once for the total, then every chunk of recipients that fits the gas
+    limit is paid in one transaction. On networks without the Disperse contract every payment is
+    sent as a transfer of its own.
+
+    Args:
+        wallet (Wallet): The wallet to pay from.
+        asset_id (str): The asset ID to pay, such as `eth`, `usdc` or a token contract address.
+        recipients (list[DisperseRecipient | dict]): The payments, each with a destination address
+            and an amount in whole units.
+        gas_limit (int): The gas budget of one disperse transaction.
+
+    Returns:
+        str: A summary of the payout with the outcome of each transaction.
+
+    """
+    try:
+        payments = DisperseInput(asset_id=asset_id, recipients=recipients).recipients
+    except ValidationError as e:
+        return f"Error validating the disperse, no payment was sent: {e!s}"
+
+    if wallet.network_id not in DISPERSE_NETWORKS:
+        return _disperse_with_transfers(wallet, asset_id, payments)
+
+    try:
+        asset = fetch_asset(wallet.network_id, asset_id)
+        values = [int(asset.to_atomic_amount(Decimal(p.amount))) for p in payments]
+
+        if asset.contract_address is None:
+            method, gas_per_recipient = "disperseEther", DISPERSE_ETH_GAS_PER_RECIPIENT
+        else:
+            method, gas_per_recipient = "disperseToken", DISPERSE_TOKEN_GAS_PER_RECIPIENT
+            approval_result = approve(wallet, asset.contract_address, DISPERSE_ADDRESS, sum(values))
+            if approval_result.startswith("Error"):
+                return f"Error approving Disperse as spender: {approval_result}"
+    except Exception as e:
+        return f"Error preparing the disperse, no payment was sent: {e!s}"
+
+    size = disperse_chunk_size(gas_per_recipient, gas_limit)
+    chunks = [
+        range(start, min(start + size, len(payments))) for start in range(0, len(payments), size)
+    ]
+
+    # Submit every chunk before waiting on any, so the transactions land in as few blocks as possible.
+    submitted = []
+    for chunk in chunks:
+        args = {
+            "recipients": [payments[i].destination for i in chunk],
+            "values": [str(values[i]) for i in chunk],
+        }
+        try:
+            with wallet_submission(wallet):
+                if asset.contract_address is None:
+                    invocation = wallet.invoke_contract(
+                        contract_address=DISPERSE_ADDRESS,
+                        method=method,
+                        abi=DISPERSE_ABI,
+                        args=args,
+                        amount=sum(Decimal(payments[i].amount) for i in chunk),
+                        asset_id=asset_id,
+                    )
+                else:
+                    invocation = wallet.invoke_contract(
+                        contract_address=DISPERSE_ADDRESS,
+                        method=method,
+                        abi=DISPERSE_ABI,
+                        args={"token": asset.contract_address, **args},
+                    )
+            submitted.append((chunk, invocation, None))
+        except Exception as e:
+            submitted.append((chunk, None, f"Error {e!s}"))
+
+    tracker = get_transaction_tracker()
+    paid = 0
+    lines = []
+    for index, (chunk, invocation, error) in enumerate(submitted, 1):
+        outcome = error
+        if invocation is not None:
+            outcome, sent = _settle(tracker, invocation, asset_id, len(chunk))
+            paid += len(chunk) if sent else 0
+        lines.append(f"{index}. recipients {chunk.start + 1}-{chunk.stop}: {outcome}")
+
+    header = (
+        f"Dispersed {asset_id} to {len(payments)} recipients in {len(chunks)} transactions: "
+        f"{paid} paid, {len(payments) - paid} failed."
+    )
+    return "\n".join([header, *lines])
+
+
+def _settle(
+    tracker: TransactionTracker | None, invocation: ContractInvocation, asset_id: str, count: int
+) -> tuple[str, bool]:
+    if tracker is not None:
+        tracked = tracker.track(invocation, f"disperse of {asset_id} to {count} recipients")
+        return f"submitted, handle {tracked.handle}, hash {tracked.transaction_hash}", True
+    try:
+        invocation.wait()
+    except Exception as e:
+        return f"Error {e!s}", False
+    if str(invocation.status) == "failed":
+        return f"Error the transaction failed onchain, hash {invocation.transaction_hash}", False
+    return f"hash {invocation.transaction_hash}", True
+
+
+def _disperse_with_transfers(
+    wallet: Wallet, asset_id: str, payments: list[DisperseRecipient]
+) -> str:
+    items = [
+        BatchTransferItem(destination=p.destination, amount=p.amount, asset_id=asset_id)
+        for p in payments
+    ]
+    outcomes = send_transfers(wallet, items)
+
+    failed = sum(1 for succeeded, _ in outcomes if not succeeded)
+    lines = [
+        f"Disperse is not available on {wallet.network_id}, so {asset_id} was sent to "
+        f"{len(payments)} recipients in {len(payments)} transfers: "
+        f"{len(payments) - failed} paid, {failed} failed."
+    ]
+    for index, (item, (_, outcome)) in enumerate(zip(items, outcomes, strict=True), 1):
+        lines.append(f"{index}. {item.amount} to {item.destination}: {outcome}")
+    return "\n".join(lines)
+
+
+class DisperseAction(CdpAction):
+    """Disperse action."""
+
+    name: str = "disperse"
+    description: str = DISPERSE_PROMPT
+    args_schema: type[BaseModel] | None = DisperseInput
+    func: Callable[..., str] = disperse
@@ -1,9 +1,11 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ
 
 GET_BALANCE_PROMPT = """
 This tool will get the balance of all the addresses in the wallet for a given asset.
@@ -41,10 +43,39 @@ def get_balance(wallet: Wallet, asset_id: str) -> str:
     except Exception as e:
         return f"Error getting balance for all addresses in the wallet {e!s}"
 
+    return _format_balances(wallet.id, balances)
+
+
+async def get_balance_async(wallet: Wallet, asset_id: str) -> str:
+    """Get balance for all addresses in the wallet for a given asset, concurrently.
+
+    Args:
+        wallet (Wallet): The wallet to get the balance for.
+        asset_id (str): The asset ID to get the balance for (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e")
+
+    Returns:
+        str: A message containing the balance information of all addresses in the wallet.
+
+    """
+    try:
+        addresses = wallet.addresses
+        results = await asyncio.gather(
+            *(asyncio.to_thread(address.balance, asset_id) for address in addresses)
+        )
+    except Exception as e:
+        return f"Error getting balance for all addresses in the wallet {e!s}"
+
+    balances = {
+        address.address_id: balance for address, balance in zip(addresses, results, strict=True)
+    }
+    return _format_balances(wallet.id, balances)
+
+
+def _format_balances(wallet_id: str, balances: dict) -> str:
     # Format each balance entry on a new line
     balance_lines = [f"  {addr}: {balance}" for addr, balance in balances.items()]
     formatted_balances = "\n".join(balance_lines)
-    return f"Balances for wallet {wallet.id}:\n{formatted_balances}"
+    return f"Balances for wallet {wallet_id}:\n{formatted_balances}"
 
 
 class GetBalanceAction(CdpAction):
@@ -54,3 +85,5 @@ class GetBalanceAction(CdpAction):
     description: str = GET_BALANCE_PROMPT
     args_schema: type[BaseModel] | None = GetBalanceInput
     func: Callable[..., str] = get_balance
+    afunc: Callable[..., Awaitable[str]] | None = get_balance_async
+    side_effect: str = SIDE_EFFECT_READ
@@ -1,10 +1,12 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
 from cdp import Wallet
 from cdp.smart_contract import SmartContract
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ
+from cdp_agentkit_core.actions.utils import read_contract_async
 
 GET_BALANCE_NFT_PROMPT = """
 This tool will get the NFTs (ERC721 tokens) owned by the wallet for a specific NFT contract.
@@ -41,22 +43,53 @@ def get_balance_nft(
         str: A message containing the NFT balance details.
 
     """
-    try:
-        check_address = address if address is not None else wallet.default_address.address_id
+    check_address = address if address is not None else wallet.default_address.address_id
 
+    try:
         owned_tokens = SmartContract.read(
             wallet.network_id, contract_address, "tokensOfOwner", args={"owner": check_address}
         )
+    except Exception as e:
+        return f"Error getting NFT balance for address {check_address} in contract {contract_address}: {e!s}"
+
+    return _format_nft_balance(check_address, contract_address, owned_tokens)
+
+
+async def get_balance_nft_async(
+    wallet: Wallet,
+    contract_address: str,
+    address: str | None = None,
+) -> str:
+    """Get NFT balance for a specific contract without blocking the event loop.
+
+    Args:
+        wallet (Wallet): The wallet to check balance from.
+        contract_address (str): The NFT contract address.
+        address (str | None): The address to check balance for. Defaults to wallet's default address.
 
-        if not owned_tokens:
-            return f"Address {check_address} owns no NFTs in contract {contract_address}"
+    Returns:
+        str: A message containing the NFT balance details.
 
-        token_list = ", ".join(str(token_id) for token_id in owned_tokens)
-        return f"Address {check_address} owns {len(owned_tokens)} NFTs in contract {contract_address}.\nToken IDs: {token_list}"
+    """
+    check_address = address if address is not None else wallet.default_address.address_id
 
+    try:
+        owned_tokens = await read_contract_async(
+            wallet.network_id, contract_address, "tokensOfOwner", args={"owner": check_address}
+        )
     except Exception as e:
         return f"Error getting NFT balance for address {check_address} in contract {contract_address}: {e!s}"
 
+    return _format_nft_balance(check_address, contract_address, owned_tokens)
+
+
+def _format_nft_balance(check_address: str, contract_address: str, owned_tokens: list) -> str:
+    if not owned_tokens:
+        return f"Address {check_address} owns no NFTs in contract {contract_address}"
+
+    token_list = ", ".join(str(token_id) for token_id in owned_tokens)
+    return f"Address {check_address} owns {len(owned_tokens)} NFTs in contract {contract_address}.\nToken IDs: {token_list}"
+
 
 class GetBalanceNftAction(CdpAction):
     """Get NFT balance action."""
@@ -65,3 +98,5 @@ class GetBalanceNftAction(CdpAction):
     description: str = GET_BALANCE_NFT_PROMPT
     args_schema: type[BaseModel] | None = GetBalanceNftInput
     func: Callable[..., str] = get_balance_nft
+    afunc: Callable[..., Awaitable[str]] | None = get_balance_nft_async
+    side_effect: str = SIDE_EFFECT_READ
@@ -0,0 +1,155 @@
+from collections.abc import Callable
+from decimal import Decimal
+
+from cdp import Asset, Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.asset_cache import fetch_asset
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ
+from cdp_agentkit_core.actions.multicall import erc20_balances
+from cdp_agentkit_core.actions.read_planner import ReadPlanner
+
+GET_PORTFOLIO_PROMPT = """
+This tool will get the balances of many assets across every address in the wallet at once, as a table with one row per address and a total row.
+
+It takes the following inputs:
+- asset_ids: The list of asset IDs to get the balances for. Always use 'eth' for the native asset ETH and 'usdc' for USDC.
+
+Prefer this tool over calling get_balance once per asset.
+"""
+
+# Largest number of assets accepted in one snapshot.
+GET_PORTFOLIO_MAX_ASSETS = 25
+
+
+class GetPortfolioInput(BaseModel):
+    """Input argument schema for get portfolio action."""
+
+    asset_ids: list[str] = Field(
+        ...,
+        description="The asset IDs to get the balances for, e.g. `eth`, `usdc`, `0x036CbD53842c5426634e7929541eC2318f3dCF7e`",
+        min_length=1,
+        max_length=GET_PORTFOLIO_MAX_ASSETS,
+    )
+
+
+def get_portfolio(wallet: Wallet, asset_ids: list[str]) -> str:
+    """Get the balance of every asset for every address in the wallet.
+
+    The reads run as a ReadPlanner graph: the assets are fetched concurrently, then the ERC20
+    balances of every address are read with a single Multicall `balanceOf` batch, and native
+    asset balances, and ERC20 balances if the batch fails, are fetched concurrently per address.
+
+    Args:
+        wallet (Wallet): The wallet to get the balances for.
+        asset_ids (list[str]): The asset IDs to get the balances for (e.g., "eth", "usdc", or a valid contract address like "0x036CbD53842c5426634e7929541eC2318f3dCF7e")
+
+    Returns:
+        str: A table of the balances, one row per address and a total row.
+
+    """
+    asset_ids = list(dict.fromkeys(asset_ids))
+
+    try:
+        addresses = wallet.addresses
+        asset_reads = [f"asset:{asset_id}" for asset_id in asset_ids]
+
+        planner = ReadPlanner()
+        for asset_id, asset_read in zip(asset_ids, asset_reads, strict=True):
+            planner.add(
+                asset_read, lambda _, asset_id=asset_id: fetch_asset(wallet.network_id, asset_id)
+            )
+        planner.add(
+            "token_balances",
+            lambda results: _token_balances(
+                wallet.network_id,
+                addresses,
+                [
+                    results[asset_read]
+                    for asset_read in asset_reads
+                    if results[asset_read].contract_address is not None
+                ],
+            ),
+            depends_on=tuple(asset_reads),
+        )
+        for address in addresses:
+            for asset_id, asset_read in zip(asset_ids, asset_reads, strict=True):
+                planner.add(
+                    f"balance:{address.address_id}:{asset_id}",
+                    lambda results, address=address, asset_id=asset_id, asset_read=asset_read: (
+                        _balance(address, asset_id, results[asset_read], results["token_balances"])
+                    ),
+                    depends_on=(asset_read, "token_balances"),
+                )
+        results = planner.execute()
+    except Exception as e:
+        return f"Error getting the portfolio of the wallet {e!s}"
+
+    rows = [
+        (
+            address.address_id,
+            [results[f"balance:{address.address_id}:{asset_id}"] for asset_id in asset_ids],
+        )
+        for address in addresses
+    ]
+
+    return _format_portfolio(wallet, asset_ids, rows)
+
+
+def _balance(
+    address, asset_id: str, asset: Asset, token_balances: dict[tuple[str, str], Decimal]
+) -> Decimal:
+    key = (address.address_id, asset.contract_address)
+    if key in token_balances:
+        return token_balances[key]
+    return Decimal(address.balance(asset_id))
+
+
+def _token_balances(
+    network_id: str, addresses: list, tokens: list[Asset]
+) -> dict[tuple[str, str], Decimal]:
+    pairs = [(token, address.address_id) for token in tokens for address in addresses]
+    if not pairs:
+        return {}
+    try:
+        balances = erc20_balances(
+            network_id, [(token.contract_address, account) for token, account in pairs]
+        )
+    except Exception:
+        # Fall back to fetching each balance through the CDP API.
+        return {}
+    return {
+        (account, token.contract_address): token.from_atomic_amount(Decimal(balance))
+        for (token, account), balance in zip(pairs, balances, strict=True)
+    }
+
+
+def _format_portfolio(
+    wallet: Wallet, asset_ids: list[str], rows: list[tuple[str, list[Decimal]]]
+) -> str:
+    totals = [sum(column, Decimal(0)) for column in zip(*(row for _, row in rows), strict=True)]
+    table = [["address", *asset_ids]]
+    table += [[address_id, *(_format_amount(b) for b in row)] for address_id, row in rows]
+    table.append(["total", *(_format_amount(total) for total in totals)])
+
+    widths = [max(len(line[i]) for line in table) for i in range(len(table[0]))]
+    lines = [
+        " | ".join(cell.ljust(width) for cell, width in zip(line, widths, strict=True)).rstrip()
+        for line in table
+    ]
+    return f"Portfolio of wallet {wallet.id} on {wallet.network_id}:\n" + "\n".join(lines)
+
+
+def _format_amount(amount: Decimal) -> str:
+    return f"{amount.normalize():f}" if amount else "0"
+
+
+class GetPortfolioAction(CdpAction):
+    """Get wallet portfolio action."""
+
+    name: str = "get_portfolio"
+    description: str = GET_PORTFOLIO_PROMPT
+    args_schema: type[BaseModel] | None = GetPortfolioInput
+    func: Callable[..., str] = get_portfolio
+    side_effect: str = SIDE_EFFECT_READ
@@ -0,0 +1,65 @@
+from collections.abc import Callable
+
+from cdp import Wallet
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_LIVE
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
+
+GET_TRANSACTION_STATUS_PROMPT = """
+This tool will get the status of transactions submitted by write actions that returned a transaction handle instead of waiting for confirmation.
+
+It takes the following inputs:
+- handle: The transaction handle returned by the write action. Leave it empty to list every tracked transaction of the wallet.
+
+Important notes:
+- A transaction is settled once its status is complete or failed
+- Only rely on the outcome of a write, such as a balance change, once its transaction is complete
+"""
+
+
+class GetTransactionStatusInput(BaseModel):
+    """Input argument schema for get transaction status action."""
+
+    handle: str | None = Field(
+        default=None,
+        description="The transaction handle returned by the write action, e.g. `3f2a9c1b7d4e`. Leave empty to list every tracked transaction.",
+    )
+
+
+def get_transaction_status(wallet: Wallet, handle: str | None = None) -> str:
+    """Get the status of the wallet's transactions followed by the transaction tracker.
+
+    Args:
+        wallet (Wallet): The wallet whose transactions to report.
+        handle (str | None): The transaction handle, or None for every tracked transaction.
+
+    Returns:
+        str: A message containing the status of the transactions.
+
+    """
+    tracker = get_transaction_tracker()
+    if tracker is None:
+        return "Transaction tracking is not enabled, so write actions report their confirmed result directly."
+
+    if handle:
+        tracked = tracker.get(handle, wallet.id)
+        if tracked is None:
+            return f"Error getting transaction status: no tracked transaction with handle {handle}"
+        return str(tracked)
+
+    transactions = tracker.transactions(wallet.id)
+    if not transactions:
+        return "No transactions are being tracked."
+    return "\n\n".join(str(tracked) for tracked in transactions)
+
+
+class GetTransactionStatusAction(CdpAction):
+    """Get transaction status action."""
+
+    name: str = "get_transaction_status"
+    description: str = GET_TRANSACTION_STATUS_PROMPT
+    args_schema: type[BaseModel] | None = GetTransactionStatusInput
+    func: Callable[..., str] = get_transaction_status
+    side_effect: str = SIDE_EFFECT_LIVE
@@ -4,6 +4,7 @@ from cdp import Wallet
 from pydantic import BaseModel
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ
 
 
 class GetWalletDetailsInput(BaseModel):
@@ -30,3 +31,4 @@ class GetWalletDetailsAction(CdpAction):
     description: str = "This tool will get details about the MPC Wallet."
     args_schema: type[BaseModel] | None = GetWalletDetailsInput
     func: Callable[..., str] = get_wallet_details
+    side_effect: str = SIDE_EFFECT_READ
@@ -4,6 +4,8 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 MINT_NFT_PROMPT = """
 This tool will mint an NFT (ERC-721) to a specified destination address onchain via a contract invocation.
@@ -40,9 +42,16 @@ def mint_nft(wallet: Wallet, contract_address: str, destination: str) -> str:
     mint_args = {"to": destination, "quantity": "1"}
 
     try:
-        mint_invocation = wallet.invoke_contract(
-            contract_address=contract_address, method="mint", args=mint_args
-        ).wait()
+        with wallet_submission(wallet):
+            mint_invocation = wallet.invoke_contract(
+                contract_address=contract_address, method="mint", args=mint_args
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                mint_invocation, f"mint of an NFT from {contract_address} to {destination}"
+            )
+        mint_invocation.wait()
     except Exception as e:
         return f"Error minting NFT {e!s}"
 
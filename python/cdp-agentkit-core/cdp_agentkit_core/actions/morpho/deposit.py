@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
 from cdp_agentkit_core.actions.morpho.constants import METAMORPHO_ABI
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 from cdp_agentkit_core.actions.utils import approve
 
 
@@ -76,12 +78,19 @@ def deposit_to_morpho(
 
         deposit_args = {"assets": atomic_assets, "receiver": receiver}
 
-        invocation = wallet.invoke_contract(
-            contract_address=vault_address,
-            method="deposit",
-            abi=METAMORPHO_ABI,
-            args=deposit_args,
-        ).wait()
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=vault_address,
+                method="deposit",
+                abi=METAMORPHO_ABI,
+                args=deposit_args,
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation, f"deposit of {assets} to Morpho Vault {vault_address}"
+            )
+        invocation.wait()
 
         return f"Deposited {assets} to Morpho Vault {vault_address} with transaction hash: {invocation.transaction_hash} and transaction link: {invocation.transaction_link}"
 
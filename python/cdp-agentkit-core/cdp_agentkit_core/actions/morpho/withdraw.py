@@ -5,6 +5,8 @@ from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
 from cdp_agentkit_core.actions.morpho.constants import METAMORPHO_ABI
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 
 class MorphoWithdrawInput(BaseModel):
@@ -41,16 +43,23 @@ def withdraw_from_morpho(wallet: Wallet, vault_address: str, assets: str, receiv
         return "Error: Assets amount must be greater than 0"
 
     try:
-        invocation = wallet.invoke_contract(
-            contract_address=vault_address,
-            method="withdraw",
-            abi=METAMORPHO_ABI,
-            args={
-                "assets": assets,
-                "receiver": receiver,
-                "owner": receiver,
-            },
-        ).wait()
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=vault_address,
+                method="withdraw",
+                abi=METAMORPHO_ABI,
+                args={
+                    "assets": assets,
+                    "receiver": receiver,
+                    "owner": receiver,
+                },
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation, f"withdrawal of {assets} from Morpho Vault {vault_address}"
+            )
+        invocation.wait()
 
         return f"Withdrawn {assets} from Morpho Vault {vault_address} with transaction hash: {invocation.transaction_hash} and transaction link: {invocation.transaction_link}"
 
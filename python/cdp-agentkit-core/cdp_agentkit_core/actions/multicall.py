@@ -0,0 +1,237 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from cdp import SmartContract
+from web3 import Web3
+
+from cdp_agentkit_core.actions.abi_codec import get_abi_codec
+
+# Multicall3 is deployed at the same address on every supported EVM network.
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+ERC20_BALANCE_OF_ABI = [
+    {
+        "inputs": [{"internalType": "address", "name": "account", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# An aggregate3 transport executes a list of (target, allow_failure, call_data) calls in one
+# eth_call against Multicall3 and returns a (success, return_data) pair for each call.
+Aggregate3Transport = Callable[[str, list[tuple[str, bool, bytes]]], list[tuple[bool, bytes]]]
+
+
+class MulticallError(Exception):
+    """Raised when a call that does not allow failure reverts inside a multicall batch."""
+
+
+@dataclass
+class MulticallCall:
+    """A single contract call packed into a multicall batch."""
+
+    contract_address: str
+    method: str
+    abi: list[dict]
+    args: dict | None = None
+    allow_failure: bool = False
+
+
+def cdp_aggregate3(
+    network_id: str, calls: list[tuple[str, bool, bytes]]
+) -> list[tuple[bool, bytes]]:
+    """Execute an aggregate3 batch with a single CDP contract read.
+
+    Args:
+        network_id (str): The network ID, such as `base-sepolia`
+        calls (list[tuple[str, bool, bytes]]): The (target, allow_failure, call_data) calls to execute
+
+    Returns:
+        list[tuple[bool, bytes]]: The (success, return_data) result of each call
+
+    """
+    results = SmartContract.read(
+        network_id,
+        MULTICALL3_ADDRESS,
+        "aggregate3",
+        abi=MULTICALL3_ABI,
+        args={
+            "calls": [
+                [target, allow_failure, "0x" + call_data.hex()]
+                for target, allow_failure, call_data in calls
+            ]
+        },
+    )
+    return [
+        (bool(result["success"]), bytes.fromhex(_strip_0x(result["returnData"])))
+        for result in results
+    ]
+
+
+def web3_aggregate3(w3: Web3) -> Aggregate3Transport:
+    """Create an aggregate3 transport that executes batches through a web3 provider.
+
+    This is useful against local nodes and in-process EVMs where Multicall3 is deployed.
+
+    Args:
+        w3 (Web3): The web3 instance to issue the eth_call through
+
+    Returns:
+        Aggregate3Transport: The transport
+
+    """
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+    def _aggregate3(
+        network_id: str, calls: list[tuple[str, bool, bytes]]
+    ) -> list[tuple[bool, bytes]]:
+        results = multicall.functions.aggregate3(calls).call()
+        return [(bool(success), bytes(return_data)) for success, return_data in results]
+
+    return _aggregate3
+
+
+class MulticallReader:
+    """Batch many contract reads into a single Multicall3 `aggregate3` call.
+
+    Calldata is encoded and return data decoded locally, so a batch of N reads costs a single
+    round trip. Decoded values follow the conventions of `SmartContract.read`: integers for
+    numeric types, checksummed addresses, dicts for named tuples and lists for arrays.
+
+    Example:
+        .. code-block:: python
+
+            reader = MulticallReader("base-sepolia")
+            token0 = reader.add(pool_address, "token0", UNISWAP_V3_ABI)
+            fee = reader.add(pool_address, "fee", UNISWAP_V3_ABI)
+            results = reader.execute()
+            results[token0], results[fee]
+
+    """
+
+    def __init__(self, network_id: str, transport: Aggregate3Transport | None = None):
+        self.network_id = network_id
+        self._transport = transport or cdp_aggregate3
+        self._calls: list[MulticallCall] = []
+
+    def add(
+        self,
+        contract_address: str,
+        method: str,
+        abi: list[dict],
+        args: dict | None = None,
+        allow_failure: bool = False,
+    ) -> int:
+        """Add a read to the batch.
+
+        Args:
+            contract_address (str): The address of the contract to read from.
+            method (str): The contract method to call.
+            abi (list[dict]): The ABI containing the method.
+            args (dict | None): The method arguments, keyed by input name.
+            allow_failure (bool): Whether a revert yields None instead of failing the batch.
+
+        Returns:
+            int: The index of the read's result in the list returned by `execute`.
+
+        """
+        self._calls.append(MulticallCall(contract_address, method, abi, args, allow_failure))
+        return len(self._calls) - 1
+
+    def execute(self) -> list[Any]:
+        """Execute every read in the batch with one aggregate3 call.
+
+        Returns:
+            list[Any]: The decoded result of each read in the order they were added. Reads that
+                allow failure and reverted are None.
+
+        Raises:
+            MulticallError: If a read that does not allow failure reverted.
+
+        """
+        if not self._calls:
+            return []
+
+        functions = [get_abi_codec(call.abi).function(call.method) for call in self._calls]
+        encoded_calls = [
+            (
+                Web3.to_checksum_address(call.contract_address),
+                call.allow_failure,
+                function.encode_call(call.args),
+            )
+            for call, function in zip(self._calls, functions, strict=True)
+        ]
+
+        results = self._transport(self.network_id, encoded_calls)
+
+        decoded = []
+        for call, function, (success, return_data) in zip(
+            self._calls, functions, results, strict=True
+        ):
+            if not success:
+                if call.allow_failure:
+                    decoded.append(None)
+                    continue
+                raise MulticallError(f"Call to {call.method} on {call.contract_address} reverted")
+            decoded.append(function.decode_result(return_data))
+        return decoded
+
+
+def erc20_balances(
+    network_id: str,
+    token_accounts: list[tuple[str, str]],
+    transport: Aggregate3Transport | None = None,
+) -> list[int]:
+    """Read many ERC20 balances with a single multicall.
+
+    Args:
+        network_id (str): The network ID, such as `base-sepolia`
+        token_accounts (list[tuple[str, str]]): The (token_address, account) pairs to read
+        transport (Aggregate3Transport | None): The transport to use. Defaults to CDP.
+
+    Returns:
+        list[int]: The balance of each pair, in atomic units
+
+    """
+    reader = MulticallReader(network_id, transport)
+    for token_address, account in token_accounts:
+        reader.add(token_address, "balanceOf", ERC20_BALANCE_OF_ABI, {"account": account})
+    return reader.execute()
+
+
+def _strip_0x(value: str) -> str:
+    return value[2:] if value.startswith("0x") else value
@@ -0,0 +1,109 @@
+"""Submission ordering per (network, address).
+
+Concurrent writes from one address race on its nonce: parallel tool calls, or several agent
+threads sharing one wallet, may build transactions with the same nonce so that all but one fail.
+The nonce manager keeps the submission queue of each (network, address) behind its own lock so
+writes from different addresses never wait on each other.
+
+CDP assigns the nonce when a transfer, trade or contract invocation is created, so CDP writes take
+a submission slot: creating, signing and broadcasting run one at a time and in arrival order per
+address, while waiting for confirmation runs outside the slot. Writes are pipelined, with many
+pending in the same block, instead of serialized end to end.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
+
+from cdp import Wallet
+
+
+@dataclass
+class _AddressState:
+    condition: threading.Condition = field(default_factory=threading.Condition)
+    next_ticket: int = 0
+    serving_ticket: int = 0
+
+
+class NonceManager:
+    """Orders submissions per (network, address)."""
+
+    def __init__(self):
+        self._states: dict[tuple[str, str], _AddressState] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def submission(self, network_id: str, address: str) -> Iterator[None]:
+        """Take the submission slot of an address, waiting for earlier submissions in order.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            address (str): The sending address
+
+        """
+        state = self._state(network_id, address)
+        with state.condition:
+            ticket = state.next_ticket
+            state.next_ticket += 1
+            while state.serving_ticket != ticket:
+                state.condition.wait()
+        try:
+            yield
+        finally:
+            with state.condition:
+                state.serving_ticket += 1
+                state.condition.notify_all()
+
+    def _state(self, network_id: str, address: str) -> _AddressState:
+        key = (network_id, address.lower())
+        state = self._states.get(key)
+        if state is None:
+            with self._lock:
+                state = self._states.setdefault(key, _AddressState())
+        return state
+
+
+_nonce_manager: NonceManager | None = None
+_nonce_manager_lock = threading.Lock()
+
+
+def get_nonce_manager() -> NonceManager:
+    """Get the process-wide nonce manager, created on first use."""
+    global _nonce_manager
+    with _nonce_manager_lock:
+        if _nonce_manager is None:
+            _nonce_manager = NonceManager()
+        return _nonce_manager
+
+
+def set_nonce_manager(nonce_manager: NonceManager) -> None:
+    """Replace the process-wide nonce manager.
+
+    Args:
+        nonce_manager (NonceManager): The nonce manager to use
+
+    """
+    global _nonce_manager
+    with _nonce_manager_lock:
+        _nonce_manager = nonce_manager
+
+
+def wallet_submission(wallet: Wallet) -> AbstractContextManager[None]:
+    """Take the submission slot of the default address of a wallet.
+
+    Example:
+        .. code-block:: python
+
+            with wallet_submission(wallet):
+                invocation = wallet.invoke_contract(...)
+            invocation.wait()
+
+    Args:
+        wallet (Wallet): The wallet to write from
+
+    Returns:
+        AbstractContextManager[None]: The submission slot, held while the transaction is broadcast
+
+    """
+    return get_nonce_manager().submission(wallet.network_id, wallet.default_address.address_id)
@@ -0,0 +1,255 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from cdp_agentkit_core.actions.pyth.hermes import (
+    HERMES_TIMEOUT,
+    PYTH_HERMES_URL,
+    get_hermes_session,
+    normalize_price_feed_id,
+)
+
+# The catalog is refreshed in the background once it is older than this many seconds.
+PRICE_FEED_CATALOG_TTL_SECONDS = 6 * 60 * 60
+
+PRICE_FEED_CATALOG_VERSION = 1
+
+logger = logging.getLogger(__name__)
+
+
+def default_price_feed_catalog_path() -> Path:
+    """Return the default location of the price feed catalog file.
+
+    The directory can be overridden with the `CDP_AGENTKIT_CACHE_DIR` environment variable.
+    """
+    cache_dir = os.environ.get("CDP_AGENTKIT_CACHE_DIR") or Path.home() / ".cache" / "cdp-agentkit"
+    return Path(cache_dir) / "pyth_price_feeds.json"
+
+
+@dataclass
+class PriceFeedIndex:
+    """An immutable snapshot of the Pyth crypto price feeds, indexed for constant time lookups.
+
+    Symbols are indexed in lower case. Feeds sharing a base or quote symbol keep the order in
+    which Hermes listed them.
+    """
+
+    feeds: list[dict]
+    fetched_at: float
+    by_id: dict[str, dict] = field(default_factory=dict)
+    by_base: dict[str, list[dict]] = field(default_factory=dict)
+    by_quote: dict[str, list[dict]] = field(default_factory=dict)
+    by_pair: dict[tuple[str, str], dict] = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Index the feeds by ID, base symbol, quote symbol and pair."""
+        for feed in self.feeds:
+            attributes = feed.get("attributes", {})
+            base = attributes.get("base", "").lower()
+            quote = attributes.get("quote", "").lower()
+
+            self.by_id[normalize_price_feed_id(feed["id"])] = feed
+            self.by_base.setdefault(base, []).append(feed)
+            self.by_quote.setdefault(quote, []).append(feed)
+            self.by_pair.setdefault((base, quote), feed)
+
+
+class PriceFeedCatalog:
+    """Local catalog of Pyth crypto price feeds, downloaded once and persisted to disk.
+
+    The first lookup loads the catalog from disk, or downloads it from Hermes if there is no
+    copy; concurrent first lookups wait for that single load. Once the catalog is older than
+    `ttl_seconds`, lookups keep answering from the stale copy while a single background thread
+    downloads a fresh one and swaps it in.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ttl_seconds: float = PRICE_FEED_CATALOG_TTL_SECONDS,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.ttl_seconds = ttl_seconds
+        self._index: PriceFeedIndex | None = None
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._refresh_thread: threading.Thread | None = None
+
+    def get(self, price_feed_id: str) -> dict | None:
+        """Get a price feed by ID.
+
+        Args:
+            price_feed_id (str): The price feed ID, with or without a `0x` prefix
+
+        Returns:
+            dict | None: The price feed, None if it is not in the catalog
+
+        """
+        return self._get_index().by_id.get(normalize_price_feed_id(price_feed_id))
+
+    def find_by_base(self, base_symbol: str) -> list[dict]:
+        """Get every price feed for a base symbol, such as `BTC`.
+
+        Args:
+            base_symbol (str): The base symbol
+
+        Returns:
+            list[dict]: The price feeds quoting the base symbol in any currency
+
+        """
+        return list(self._get_index().by_base.get(base_symbol.lower(), []))
+
+    def find_by_quote(self, quote_symbol: str) -> list[dict]:
+        """Get every price feed quoted in a symbol, such as `USD`.
+
+        Args:
+            quote_symbol (str): The quote symbol
+
+        Returns:
+            list[dict]: The price feeds quoted in the symbol
+
+        """
+        return list(self._get_index().by_quote.get(quote_symbol.lower(), []))
+
+    def get_price_feed_id(self, base_symbol: str, quote_symbol: str = "USD") -> str | None:
+        """Get the price feed ID for a base symbol.
+
+        Args:
+            base_symbol (str): The base symbol, such as `BTC`
+            quote_symbol (str): The preferred quote symbol
+
+        Returns:
+            str | None: The ID of the feed for the pair, or of the first feed for the base symbol
+                if the pair is not listed. None if the base symbol is not listed.
+
+        """
+        index = self._get_index()
+        feed = index.by_pair.get((base_symbol.lower(), quote_symbol.lower()))
+        if feed is None:
+            feeds = index.by_base.get(base_symbol.lower())
+            feed = feeds[0] if feeds else None
+        return feed["id"] if feed else None
+
+    def get_price_feed_ids(
+        self, base_symbols: list[str], quote_symbol: str = "USD"
+    ) -> dict[str, str | None]:
+        """Get the price feed IDs for many base symbols.
+
+        Args:
+            base_symbols (list[str]): The base symbols, such as `["BTC", "ETH"]`
+            quote_symbol (str): The preferred quote symbol
+
+        Returns:
+            dict[str, str | None]: The price feed ID of each symbol, None if it is not listed
+
+        """
+        return {symbol: self.get_price_feed_id(symbol, quote_symbol) for symbol in base_symbols}
+
+    def refresh(self) -> None:
+        """Download the catalog from Hermes and write it through to disk."""
+        response = get_hermes_session().get(
+            f"{PYTH_HERMES_URL}/v2/price_feeds",
+            params={"asset_type": "crypto"},
+            timeout=HERMES_TIMEOUT,
+        )
+        response.raise_for_status()
+        index = PriceFeedIndex(response.json(), time.time())
+
+        with self._lock:
+            self._index = index
+        self._save(index)
+
+    def refresh_in_background(self) -> None:
+        """Start refreshing the catalog on a background thread unless a refresh is running."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_quietly, name="pyth-price-feed-catalog", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def _get_index(self) -> PriceFeedIndex:
+        index = self._index
+        if index is None:
+            with self._load_lock:
+                if self._index is None:
+                    loaded = self._load()
+                    if loaded is None:
+                        self.refresh()
+                    else:
+                        with self._lock:
+                            self._index = loaded
+                index = self._index
+
+        if time.time() - index.fetched_at >= self.ttl_seconds:
+            self.refresh_in_background()
+        return index
+
+    def _refresh_quietly(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            # The stale catalog keeps serving lookups until a later refresh succeeds.
+            logger.warning("Error refreshing Pyth price feed catalog", exc_info=True)
+
+    def _load(self) -> PriceFeedIndex | None:
+        if self.path is None or not self.path.exists():
+            return None
+
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") != PRICE_FEED_CATALOG_VERSION:
+                return None
+            return PriceFeedIndex(data["feeds"], data["fetched_at"])
+        except (OSError, ValueError, KeyError):
+            # A corrupt or unreadable catalog is downloaded again.
+            return None
+
+    def _save(self, index: PriceFeedIndex) -> None:
+        if self.path is None:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".pyth_price_feeds")
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {
+                        "version": PRICE_FEED_CATALOG_VERSION,
+                        "fetched_at": index.fetched_at,
+                        "feeds": index.feeds,
+                    },
+                    f,
+                )
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Persistence is best effort; the in-memory catalog remains authoritative.
+            pass
+
+
+_price_feed_catalog: PriceFeedCatalog | None = None
+
+
+def get_price_feed_catalog() -> PriceFeedCatalog:
+    """Get the process-wide price feed catalog, persisted to `default_price_feed_catalog_path`."""
+    global _price_feed_catalog
+    if _price_feed_catalog is None:
+        _price_feed_catalog = PriceFeedCatalog(default_price_feed_catalog_path())
+    return _price_feed_catalog
+
+
+def set_price_feed_catalog(catalog: PriceFeedCatalog) -> None:
+    """Replace the process-wide price feed catalog.
+
+    Args:
+        catalog (PriceFeedCatalog): The catalog to use, without a path to keep it in memory.
+
+    """
+    global _price_feed_catalog
+    _price_feed_catalog = catalog
@@ -1,9 +1,14 @@
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 
-import requests
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_LIVE
+from cdp_agentkit_core.actions.pyth.hermes import (
+    fetch_price_updates,
+    fetch_price_updates_async,
+)
+from cdp_agentkit_core.actions.pyth.stream import get_streamed_price_updates
 
 PYTH_FETCH_PRICE_PROMPT = """
 Fetch the price of a given price feed from Pyth. First fetch the price feed ID forusing the pyth_fetch_price_feed_id action.
@@ -26,20 +31,43 @@ class PythFetchPriceInput(BaseModel):
 
 
 def pyth_fetch_price(price_feed_id: str) -> str:
-    """Fetch the price of a given price feed from Pyth."""
-    url = f"https://hermes.pyth.network/v2/updates/price/latest?ids[]={price_feed_id}"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
-    parsed_data = data["parsed"]
-
-    if not parsed_data:
+    """Fetch the price of a given price feed from Pyth.
+
+    A fresh price from the price stream is used when one is running, otherwise Hermes is queried.
+    """
+    updates = get_streamed_price_updates([price_feed_id])
+    if price_feed_id not in updates:
+        updates = fetch_price_updates([price_feed_id])
+    return _format_price_update(price_feed_id, updates)
+
+
+async def pyth_fetch_price_async(price_feed_id: str) -> str:
+    """Fetch the price of a given price feed from Pyth without blocking the event loop."""
+    updates = get_streamed_price_updates([price_feed_id])
+    if price_feed_id not in updates:
+        updates = await fetch_price_updates_async([price_feed_id])
+    return _format_price_update(price_feed_id, updates)
+
+
+def _format_price_update(price_feed_id: str, updates: dict[str, dict]) -> str:
+    if price_feed_id not in updates:
         raise ValueError(f"No price data found for {price_feed_id}")
 
-    price_info = parsed_data[0]["price"]
-    price = int(price_info["price"])
-    exponent = price_info["expo"]
+    price_info = updates[price_feed_id]
+    return format_price(int(price_info["price"]), price_info["expo"])
+
+
+def format_price(price: int, exponent: int) -> str:
+    """Format a raw Pyth price and exponent as a decimal string with two decimal places.
+
+    Args:
+        price (int): The raw price as published by Pyth.
+        exponent (int): The power of ten to apply to the raw price.
+
+    Returns:
+        str: The human readable price.
 
+    """
     if exponent < 0:
         adjusted_price = price * 100
         divisor = 10**-exponent
@@ -58,3 +86,5 @@ class PythFetchPriceAction(CdpAction):
     description: str = PYTH_FETCH_PRICE_PROMPT
     args_schema: type[BaseModel] | None = PythFetchPriceInput
     func: Callable[..., str] = pyth_fetch_price
+    afunc: Callable[..., Awaitable[str]] | None = pyth_fetch_price_async
+    side_effect: str = SIDE_EFFECT_LIVE
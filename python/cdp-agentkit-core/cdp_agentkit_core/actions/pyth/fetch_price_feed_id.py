@@ -1,9 +1,11 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
-import requests
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_EXTERNAL
+from cdp_agentkit_core.actions.pyth.catalog import get_price_feed_catalog
 
 PYTH_FETCH_PRICE_FEED_ID_PROMPT = """
 Fetch the price feed ID for a given token symbol (e.g. BTC, ETH, etc.) from Pyth.
@@ -17,22 +19,21 @@ class PythFetchPriceFeedIDInput(BaseModel):
 
 
 def pyth_fetch_price_feed_id(token_symbol: str) -> str:
-    """Fetch the price feed ID for a given token symbol from Pyth."""
-    url = f"https://hermes.pyth.network/v2/price_feeds?query={token_symbol}&asset_type=crypto"
-    response = requests.get(url)
-    response.raise_for_status()
-    data = response.json()
+    """Fetch the price feed ID for a given token symbol from Pyth.
 
-    if not data:
+    The ID is looked up in the local price feed catalog, which is downloaded from Hermes once and
+    refreshed in the background, preferring the feed quoted in USD.
+    """
+    price_feed_id = get_price_feed_catalog().get_price_feed_id(token_symbol)
+    if price_feed_id is None:
         raise ValueError(f"No price feed found for {token_symbol}")
 
-    filtered_data = [
-        item for item in data if item["attributes"]["base"].lower() == token_symbol.lower()
-    ]
-    if not filtered_data:
-        raise ValueError(f"No price feed found for {token_symbol}")
+    return price_feed_id
+
 
-    return filtered_data[0]["id"]
+async def pyth_fetch_price_feed_id_async(token_symbol: str) -> str:
+    """Fetch the price feed ID for a given token symbol from Pyth without blocking the event loop."""
+    return await asyncio.to_thread(pyth_fetch_price_feed_id, token_symbol)
 
 
 class PythFetchPriceFeedIDAction(CdpAction):
@@ -42,3 +43,5 @@ class PythFetchPriceFeedIDAction(CdpAction):
     description: str = PYTH_FETCH_PRICE_FEED_ID_PROMPT
     args_schema: type[BaseModel] | None = PythFetchPriceFeedIDInput
     func: Callable[..., str] = pyth_fetch_price_feed_id
+    afunc: Callable[..., Awaitable[str]] | None = pyth_fetch_price_feed_id_async
+    side_effect: str = SIDE_EFFECT_EXTERNAL
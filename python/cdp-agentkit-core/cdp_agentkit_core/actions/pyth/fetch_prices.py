@@ -0,0 +1,88 @@
+import json
+from collections.abc import Awaitable, Callable
+
+from pydantic import BaseModel, Field
+
+from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_LIVE
+from cdp_agentkit_core.actions.pyth.fetch_price import format_price
+from cdp_agentkit_core.actions.pyth.hermes import fetch_price_updates, fetch_price_updates_async
+from cdp_agentkit_core.actions.pyth.stream import get_streamed_price_updates
+
+PYTH_FETCH_PRICES_PROMPT = """
+Fetch the prices of many price feeds from Pyth in a single request. First fetch the price feed IDs using the pyth_fetch_price_feed_id action.
+
+Inputs:
+- A list of Pyth price feed IDs
+
+Important notes:
+- Do not assume that a random ID is a Pyth price feed ID. If you are confused, ask a clarifying question.
+- This action only fetches price inputs from Pyth price feeds. No other source.
+- Prefer this action over calling pyth_fetch_price repeatedly when more than one price is needed.
+- The result is a JSON object mapping each price feed ID to its price, or to null if no price was found.
+"""
+
+
+class PythFetchPricesInput(BaseModel):
+    """Input schema for fetching many Pyth prices."""
+
+    price_feed_ids: list[str] = Field(
+        ..., description="The price feed IDs to fetch the prices for.", min_length=1
+    )
+
+
+def pyth_fetch_prices(price_feed_ids: list[str]) -> str:
+    """Fetch the prices of many price feeds from Pyth in a single request.
+
+    Args:
+        price_feed_ids (list[str]): The price feed IDs to fetch the prices for.
+
+    Returns:
+        str: A JSON object mapping each price feed ID to its price, or null if none was found.
+
+    """
+    updates = get_streamed_price_updates(price_feed_ids)
+    missing = [price_feed_id for price_feed_id in price_feed_ids if price_feed_id not in updates]
+    if missing:
+        updates.update(fetch_price_updates(missing))
+    return _format_price_updates(price_feed_ids, updates)
+
+
+async def pyth_fetch_prices_async(price_feed_ids: list[str]) -> str:
+    """Fetch the prices of many price feeds from Pyth without blocking the event loop.
+
+    Args:
+        price_feed_ids (list[str]): The price feed IDs to fetch the prices for.
+
+    Returns:
+        str: A JSON object mapping each price feed ID to its price, or null if none was found.
+
+    """
+    updates = get_streamed_price_updates(price_feed_ids)
+    missing = [price_feed_id for price_feed_id in price_feed_ids if price_feed_id not in updates]
+    if missing:
+        updates.update(await fetch_price_updates_async(missing))
+    return _format_price_updates(price_feed_ids, updates)
+
+
+def _format_price_updates(price_feed_ids: list[str], updates: dict[str, dict]) -> str:
+    prices = {
+        price_feed_id: (
+            format_price(int(updates[price_feed_id]["price"]), updates[price_feed_id]["expo"])
+            if price_feed_id in updates
+            else None
+        )
+        for price_feed_id in price_feed_ids
+    }
+    return json.dumps(prices)
+
+
+class PythFetchPricesAction(CdpAction):
+    """Fetch many Pyth prices action."""
+
+    name: str = "pyth_fetch_prices"
+    description: str = PYTH_FETCH_PRICES_PROMPT
+    args_schema: type[BaseModel] | None = PythFetchPricesInput
+    func: Callable[..., str] = pyth_fetch_prices
+    afunc: Callable[..., Awaitable[str]] | None = pyth_fetch_prices_async
+    side_effect: str = SIDE_EFFECT_LIVE
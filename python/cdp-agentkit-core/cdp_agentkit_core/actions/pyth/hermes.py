@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import weakref
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+PYTH_HERMES_URL = "https://hermes.pyth.network"
+
+# (connect, read) timeouts in seconds for requests to Hermes.
+HERMES_TIMEOUT = (3.05, 10.0)
+
+# Number of times a failed or throttled request to Hermes is retried, with exponential backoff.
+HERMES_RETRIES = 3
+HERMES_BACKOFF_FACTOR = 0.25
+HERMES_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Hermes accepts many feed IDs per request; larger batches are split to bound the URL length.
+MAX_FEEDS_PER_REQUEST = 100
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# aiohttp sessions are bound to the event loop they were created on, so there is one per loop.
+_async_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_hermes_session() -> requests.Session:
+    """Get the process-wide keep-alive session used for requests to Hermes.
+
+    The session pools connections and retries failed or throttled GET requests.
+
+    Returns:
+        requests.Session: The shared session
+
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=HERMES_RETRIES,
+                backoff_factor=HERMES_BACKOFF_FACTOR,
+                status_forcelist=HERMES_RETRY_STATUSES,
+                allowed_methods=frozenset(["GET"]),
+            )
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(max_retries=retry, pool_maxsize=16))
+            session.mount("http://", HTTPAdapter(max_retries=retry, pool_maxsize=16))
+            _session = session
+        return _session
+
+
+def get_hermes_async_session() -> aiohttp.ClientSession:
+    """Get the keep-alive aiohttp session used for requests to Hermes from the running event loop.
+
+    One session is kept per event loop and reused by every async request made on that loop.
+    Close it with `close_hermes_async_session` before the loop shuts down.
+
+    Returns:
+        aiohttp.ClientSession: The session of the running event loop
+
+    """
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        timeout = aiohttp.ClientTimeout(sock_connect=HERMES_TIMEOUT[0], sock_read=HERMES_TIMEOUT[1])
+        session = _async_sessions[loop] = aiohttp.ClientSession(timeout=timeout)
+    return session
+
+
+async def close_hermes_async_session() -> None:
+    """Close the aiohttp session of the running event loop, if it has one."""
+    session = _async_sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None:
+        await session.close()
+
+
+def fetch_price_updates(price_feed_ids: list[str]) -> dict[str, dict]:
+    """Fetch the latest price of many Pyth price feeds in as few requests as possible.
+
+    Args:
+        price_feed_ids (list[str]): The price feed IDs, with or without a `0x` prefix
+
+    Returns:
+        dict[str, dict]: The `price` object (price, conf, expo and publish_time) of every feed
+            Hermes returned, keyed by the ID as it was passed in
+
+    """
+    session = get_hermes_session()
+    updates = {}
+    for chunk in _chunks(price_feed_ids):
+        response = session.get(
+            f"{PYTH_HERMES_URL}/v2/updates/price/latest",
+            params=[("ids[]", price_feed_id) for price_feed_id in chunk],
+            timeout=HERMES_TIMEOUT,
+        )
+        response.raise_for_status()
+        updates.update(_parse_price_updates(chunk, response.json()))
+    return updates
+
+
+async def fetch_price_updates_async(price_feed_ids: list[str]) -> dict[str, dict]:
+    """Fetch the latest price of many Pyth price feeds without blocking the event loop.
+
+    Args:
+        price_feed_ids (list[str]): The price feed IDs, with or without a `0x` prefix
+
+    Returns:
+        dict[str, dict]: The `price` object (price, conf, expo and publish_time) of every feed
+            Hermes returned, keyed by the ID as it was passed in
+
+    """
+    session = get_hermes_async_session()
+    updates = {}
+    for chunk in _chunks(price_feed_ids):
+        params = [("ids[]", price_feed_id) for price_feed_id in chunk]
+        data = await _get_json_with_retries(
+            session, f"{PYTH_HERMES_URL}/v2/updates/price/latest", params
+        )
+        updates.update(_parse_price_updates(chunk, data))
+    return updates
+
+
+def normalize_price_feed_id(price_feed_id: str) -> str:
+    """Normalize a price feed ID to the lowercase form without a `0x` prefix used by Hermes."""
+    price_feed_id = price_feed_id.lower()
+    return price_feed_id[2:] if price_feed_id.startswith("0x") else price_feed_id
+
+
+async def _get_json_with_retries(
+    session: aiohttp.ClientSession, url: str, params: list[tuple[str, str]]
+) -> dict:
+    attempt = 0
+    while True:
+        try:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientConnectionError, aiohttp.ClientResponseError, TimeoutError) as e:
+            status = getattr(e, "status", None)
+            if attempt >= HERMES_RETRIES or (
+                status is not None and status not in HERMES_RETRY_STATUSES
+            ):
+                raise
+            await asyncio.sleep(HERMES_BACKOFF_FACTOR * 2**attempt)
+            attempt += 1
+
+
+def _parse_price_updates(price_feed_ids: list[str], data: dict) -> dict[str, dict]:
+    # Hermes returns lowercase IDs without the 0x prefix.
+    parsed = {item["id"].lower(): item["price"] for item in data.get("parsed") or []}
+    return {
+        price_feed_id: parsed[normalize_price_feed_id(price_feed_id)]
+        for price_feed_id in price_feed_ids
+        if normalize_price_feed_id(price_feed_id) in parsed
+    }
+
+
+def _chunks(price_feed_ids: list[str]) -> list[list[str]]:
+    unique_ids = list(dict.fromkeys(price_feed_ids))
+    return [
+        unique_ids[i : i + MAX_FEEDS_PER_REQUEST]
+        for i in range(0, len(unique_ids), MAX_FEEDS_PER_REQUEST)
+    ]
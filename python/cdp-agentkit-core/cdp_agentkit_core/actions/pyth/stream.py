@@ -0,0 +1,219 @@
+import json
+import logging
+import threading
+import time
+
+import requests
+
+from cdp_agentkit_core.actions.pyth.hermes import (
+    HERMES_TIMEOUT,
+    PYTH_HERMES_URL,
+    normalize_price_feed_id,
+)
+
+# Streamed prices older than this many seconds are not served; callers fall back to HTTP.
+PRICE_STREAM_MAX_AGE_SECONDS = 10.0
+
+# Delay before reconnecting after the stream drops, doubled on each failure up to the maximum.
+PRICE_STREAM_RECONNECT_DELAY = 0.5
+PRICE_STREAM_MAX_RECONNECT_DELAY = 30.0
+
+logger = logging.getLogger(__name__)
+
+
+class PriceStream:
+    """Background subscriber to the Hermes price update stream.
+
+    A daemon thread reads the `/v2/updates/price/stream` server-sent events for the subscribed
+    feeds and keeps the latest `price` object (price, conf, expo and publish_time) of each feed.
+    The stream thread is the only writer and replaces each entry with a single dict assignment,
+    so readers never take a lock. The stream reconnects with backoff whenever it drops.
+    """
+
+    def __init__(
+        self,
+        price_feed_ids: list[str],
+        max_age_seconds: float = PRICE_STREAM_MAX_AGE_SECONDS,
+        hermes_url: str = PYTH_HERMES_URL,
+    ):
+        self.price_feed_ids = list(
+            dict.fromkeys(normalize_price_feed_id(i) for i in price_feed_ids)
+        )
+        self.max_age_seconds = max_age_seconds
+        self.hermes_url = hermes_url
+        self.connections = 0
+        self._prices: dict[str, dict] = {}
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._response: requests.Response | None = None
+
+    def start(self) -> None:
+        """Start the subscriber thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="pyth-price-stream", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the subscriber thread and close the stream.
+
+        A read in progress is not interrupted, so the thread exits once the next event arrives.
+
+        Args:
+            timeout (float | None): Seconds to wait for the thread to exit, forever if None.
+
+        """
+        self._stopped.set()
+        response = self._response
+        if response is not None:
+            response.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def get(self, price_feed_id: str, max_age_seconds: float | None = None) -> dict | None:
+        """Get the latest streamed price of a feed if it is fresh enough.
+
+        Args:
+            price_feed_id (str): The price feed ID, with or without a `0x` prefix
+            max_age_seconds (float | None): The maximum age of the price by its publish time,
+                `max_age_seconds` of the stream if None
+
+        Returns:
+            dict | None: The `price` object, None if the feed has no fresh price
+
+        """
+        price = self._prices.get(normalize_price_feed_id(price_feed_id))
+        if price is None:
+            return None
+
+        max_age = self.max_age_seconds if max_age_seconds is None else max_age_seconds
+        if time.time() - price["publish_time"] > max_age:
+            return None
+        return price
+
+    def get_fresh_updates(self, price_feed_ids: list[str]) -> dict[str, dict]:
+        """Get the fresh streamed prices of many feeds.
+
+        Args:
+            price_feed_ids (list[str]): The price feed IDs, with or without a `0x` prefix
+
+        Returns:
+            dict[str, dict]: The `price` object of every feed with a fresh price, keyed by the ID
+                as it was passed in
+
+        """
+        updates = {}
+        for price_feed_id in price_feed_ids:
+            price = self.get(price_feed_id)
+            if price is not None:
+                updates[price_feed_id] = price
+        return updates
+
+    def _run(self) -> None:
+        delay = PRICE_STREAM_RECONNECT_DELAY
+        while not self._stopped.is_set():
+            try:
+                self._consume()
+                delay = PRICE_STREAM_RECONNECT_DELAY
+            except Exception:
+                if self._stopped.is_set():
+                    break
+                logger.warning("Error reading Pyth price stream", exc_info=True)
+                delay = min(delay * 2, PRICE_STREAM_MAX_RECONNECT_DELAY)
+            self._stopped.wait(delay)
+
+    def _consume(self) -> None:
+        # A plain request is used rather than the shared session so that closing the streamed
+        # response from `stop` never races with pooled connections.
+        with requests.get(
+            f"{self.hermes_url}/v2/updates/price/stream",
+            params=[("ids[]", price_feed_id) for price_feed_id in self.price_feed_ids]
+            + [("parsed", "true")],
+            stream=True,
+            timeout=HERMES_TIMEOUT,
+        ) as response:
+            response.raise_for_status()
+            self._response = response
+            self.connections += 1
+            try:
+                # Read each chunk as it arrives rather than waiting to fill a fixed size buffer.
+                for line in response.iter_lines(chunk_size=None, decode_unicode=True):
+                    if self._stopped.is_set():
+                        return
+                    if line and line.startswith("data:"):
+                        self._apply(json.loads(line[len("data:") :]))
+            finally:
+                self._response = None
+
+    def _apply(self, data: dict) -> None:
+        for item in data.get("parsed") or []:
+            price_feed_id = item["id"].lower()
+            price = item["price"]
+            current = self._prices.get(price_feed_id)
+            if current is None or price["publish_time"] >= current["publish_time"]:
+                self._prices[price_feed_id] = price
+
+
+_price_stream: PriceStream | None = None
+
+
+def get_price_stream() -> PriceStream | None:
+    """Get the process-wide price stream, None unless one was started."""
+    return _price_stream
+
+
+def set_price_stream(price_stream: PriceStream | None) -> None:
+    """Replace the process-wide price stream.
+
+    Args:
+        price_stream (PriceStream | None): The stream to serve prices from, None to always use HTTP.
+
+    """
+    global _price_stream
+    _price_stream = price_stream
+
+
+def get_streamed_price_updates(price_feed_ids: list[str]) -> dict[str, dict]:
+    """Get the fresh prices of many feeds from the process-wide price stream.
+
+    Args:
+        price_feed_ids (list[str]): The price feed IDs, with or without a `0x` prefix
+
+    Returns:
+        dict[str, dict]: The `price` object of every feed with a fresh streamed price, keyed by
+            the ID as it was passed in. Empty if no stream is running.
+
+    """
+    price_stream = get_price_stream()
+    return price_stream.get_fresh_updates(price_feed_ids) if price_stream is not None else {}
+
+
+def start_price_stream(
+    price_feed_ids: list[str], max_age_seconds: float = PRICE_STREAM_MAX_AGE_SECONDS
+) -> PriceStream:
+    """Subscribe to price updates for feeds and serve `pyth_fetch_price` from the stream.
+
+    Any previously started stream is stopped.
+
+    Args:
+        price_feed_ids (list[str]): The price feed IDs to subscribe to
+        max_age_seconds (float): The maximum age of a streamed price before HTTP is used instead
+
+    Returns:
+        PriceStream: The started stream
+
+    """
+    stop_price_stream()
+    price_stream = PriceStream(price_feed_ids, max_age_seconds)
+    price_stream.start()
+    set_price_stream(price_stream)
+    return price_stream
+
+
+def stop_price_stream() -> None:
+    """Stop the process-wide price stream, if any, and go back to fetching prices over HTTP."""
+    price_stream = get_price_stream()
+    set_price_stream(None)
+    if price_stream is not None:
+        price_stream.stop(timeout=HERMES_TIMEOUT[0])
@@ -0,0 +1,119 @@
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+# Upper bound on concurrent reads issued by all planners in the process.
+MAX_CONCURRENT_READS = 8
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_READS, thread_name_prefix="cdp-read"
+        )
+    return _executor
+
+
+@dataclass
+class PlannedRead:
+    """A read scheduled by a ReadPlanner.
+
+    `read` receives the results of the reads listed in `depends_on`, keyed by name.
+    """
+
+    read: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = field(default_factory=tuple)
+
+
+class ReadPlanner:
+    """Run a dependency graph of blocking reads concurrently on a bounded executor.
+
+    Reads without dependencies are issued immediately; a dependent read is issued as soon as
+    every read it depends on has completed, so the latency of a plan is bounded by the depth
+    of its dependency graph rather than the number of reads. Reads run on a process-wide
+    executor of `MAX_CONCURRENT_READS` threads, so a read must not execute a planner itself.
+
+    Example:
+        .. code-block:: python
+
+            planner = ReadPlanner()
+            planner.add("usdc", lambda _: fetch_asset(network_id, "usdc"))
+            planner.add(
+                "balance",
+                lambda results: address.balance(results["usdc"].asset_id),
+                depends_on=("usdc",),
+            )
+            results = planner.execute()
+
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor | None = None):
+        self._executor = executor
+        self._reads: dict[str, PlannedRead] = {}
+
+    def add(
+        self,
+        name: str,
+        read: Callable[[dict[str, Any]], Any],
+        depends_on: tuple[str, ...] = (),
+    ) -> "ReadPlanner":
+        """Schedule a read under the given result name.
+
+        Args:
+            name (str): The key the result is returned under.
+            read (Callable): The read, called with the results of its dependencies.
+            depends_on (tuple[str, ...]): Names of reads that must complete before this one is issued.
+
+        Returns:
+            ReadPlanner: The planner, to allow chaining.
+
+        """
+        if name in self._reads:
+            raise ValueError(f"Read {name} is already planned")
+        for dependency in depends_on:
+            if dependency not in self._reads:
+                raise ValueError(f"Read {name} depends on unknown read {dependency}")
+
+        self._reads[name] = PlannedRead(read, tuple(depends_on))
+        return self
+
+    def execute(self) -> dict[str, Any]:
+        """Execute all planned reads.
+
+        Returns:
+            dict[str, Any]: The result of every read, keyed by name.
+
+        Raises:
+            Exception: The first error raised by any read. Reads not yet issued are skipped.
+
+        """
+        executor = self._executor or _get_executor()
+        results: dict[str, Any] = {}
+        pending: dict[Future, str] = {}
+        waiting = dict(self._reads)
+
+        def submit_ready() -> None:
+            for name, read in list(waiting.items()):
+                if all(dependency in results for dependency in read.depends_on):
+                    del waiting[name]
+                    resolved = {dependency: results[dependency] for dependency in read.depends_on}
+                    pending[executor.submit(read.read, resolved)] = name
+
+        submit_ready()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    results[name] = future.result()
+                except Exception:
+                    for other in pending:
+                        other.cancel()
+                    raise
+            submit_ready()
+
+        return results
@@ -1,11 +1,14 @@
 from collections.abc import Callable
 
 from cdp import Wallet
+from ens.utils import raw_name_to_hash
 from pydantic import BaseModel, Field
-from web3 import Web3
 from web3.exceptions import ContractLogicError
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.abi_codec import get_abi_codec
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 # Constants
 REGISTER_BASENAME_PROMPT = """
@@ -65,14 +68,18 @@ def register_basename(wallet: Wallet, basename: str, amount: str = "0.002") -> s
             else BASENAMES_REGISTRAR_CONTROLLER_ADDRESS_TESTNET
         )
 
-        invocation = wallet.invoke_contract(
-            contract_address=contract_address,
-            method="register",
-            args=register_args,
-            abi=registrar_abi,
-            amount=amount,
-            asset_id="eth",
-        )
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=contract_address,
+                method="register",
+                args=register_args,
+                abi=registrar_abi,
+                amount=amount,
+                asset_id="eth",
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(invocation, f"registration of basename {basename}")
         invocation.wait()
         return f"Successfully registered basename {basename} for address {address_id}"
     except ContractLogicError as e:
@@ -94,15 +101,13 @@ def create_register_contract_method_args(base_name: str, address_id: str, is_mai
         dict: Formatted arguments for the register contract method
 
     """
-    w3 = Web3()
-
-    resolver_contract = w3.eth.contract(abi=l2_resolver_abi)
+    resolver_codec = get_abi_codec(l2_resolver_abi)
 
-    name_hash = w3.ens.namehash(base_name)
+    name_hash = raw_name_to_hash(base_name)
 
-    address_data = resolver_contract.encode_abi("setAddr", args=[name_hash, address_id])
+    address_data = resolver_codec.function("setAddr").encode_call([name_hash, address_id])
 
-    name_data = resolver_contract.encode_abi("setName", args=[name_hash, base_name])
+    name_data = resolver_codec.function("setName").encode_call([name_hash, base_name])
 
     register_args = {
         "request": [
@@ -110,7 +115,7 @@ def create_register_contract_method_args(base_name: str, address_id: str, is_mai
             address_id,
             REGISTRATION_DURATION,
             L2_RESOLVER_ADDRESS_MAINNET if is_mainnet else L2_RESOLVER_ADDRESS_TESTNET,
-            [address_data, name_data],
+            ["0x" + address_data.hex(), "0x" + name_data.hex()],
             True,
         ]
     }
@@ -0,0 +1,167 @@
+"""Registry of CDP Actions backed by a static manifest.
+
+The manifest lists the name, description, JSON input schema and side effect of every action, and
+the module that defines it, so actions can be listed without importing their modules, the CDP SDK
+or web3. An action module is imported the first time the action itself is needed.
+
+Regenerate the manifest after adding or changing an action with `make manifest`.
+"""
+
+import importlib
+import json
+import pkgutil
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_WRITE, CdpAction
+
+ACTION_MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# Packages under `cdp_agentkit_core.actions` that do not hold CDP Actions.
+_NON_ACTION_PACKAGES = ("cdp_agentkit_core.actions.social",)
+
+
+@dataclass(frozen=True)
+class ActionManifestEntry:
+    """An action as listed in the manifest."""
+
+    name: str
+    description: str
+    args_schema: dict[str, Any] | None
+    module: str
+    class_name: str
+    side_effect: str = SIDE_EFFECT_WRITE
+
+
+class ActionRegistry:
+    """Lists CDP Actions from the manifest and imports each one on first use."""
+
+    def __init__(self, entries: list[ActionManifestEntry]):
+        self._entries = {entry.name: entry for entry in entries}
+        self._actions: dict[str, CdpAction] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def entries(self) -> list[ActionManifestEntry]:
+        """The manifest entries of every action, in manifest order."""
+        return list(self._entries.values())
+
+    def names(self) -> list[str]:
+        """Get the names of every action, in manifest order."""
+        return list(self._entries)
+
+    def get_entry(self, name: str) -> ActionManifestEntry:
+        """Get the manifest entry of an action without importing it.
+
+        Args:
+            name (str): The action name, such as `get_balance`
+
+        Returns:
+            ActionManifestEntry: The manifest entry
+
+        Raises:
+            KeyError: If there is no action with the name.
+
+        """
+        return self._entries[name]
+
+    def load(self, name: str) -> CdpAction:
+        """Import an action and return its instance, shared across calls.
+
+        Args:
+            name (str): The action name, such as `get_balance`
+
+        Returns:
+            CdpAction: The action
+
+        Raises:
+            KeyError: If there is no action with the name.
+
+        """
+        action = self._actions.get(name)
+        if action is None:
+            entry = self._entries[name]
+            with self._lock:
+                action = self._actions.get(name)
+                if action is None:
+                    module = importlib.import_module(entry.module)
+                    action = getattr(module, entry.class_name)()
+                    self._actions[name] = action
+        return action
+
+    def load_all(self) -> list[CdpAction]:
+        """Import every action and return their instances, in manifest order."""
+        return [self.load(name) for name in self._entries]
+
+
+def load_action_manifest(path: Path = ACTION_MANIFEST_PATH) -> list[ActionManifestEntry]:
+    """Read the action manifest.
+
+    Args:
+        path (Path): The manifest file
+
+    Returns:
+        list[ActionManifestEntry]: The manifest entries
+
+    """
+    return [ActionManifestEntry(**entry) for entry in json.loads(path.read_text())]
+
+
+def build_action_manifest() -> list[ActionManifestEntry]:
+    """Build the manifest by importing every action module in the package.
+
+    This imports every action and is meant for regenerating the manifest, not for runtime use.
+
+    Returns:
+        list[ActionManifestEntry]: The manifest entries, ordered by module
+
+    """
+    package = importlib.import_module("cdp_agentkit_core.actions")
+    for module_info in pkgutil.walk_packages(package.__path__, f"{package.__name__}."):
+        if not module_info.name.startswith(_NON_ACTION_PACKAGES):
+            importlib.import_module(module_info.name)
+
+    entries = []
+    for action_class in CdpAction.__subclasses__():
+        if not action_class.__module__.startswith(f"{package.__name__}."):
+            continue
+        action = action_class()
+        entries.append(
+            ActionManifestEntry(
+                name=action.name,
+                description=action.description,
+                args_schema=(
+                    action.args_schema.model_json_schema() if action.args_schema else None
+                ),
+                module=action_class.__module__,
+                class_name=action_class.__name__,
+                side_effect=action.side_effect,
+            )
+        )
+    return sorted(entries, key=lambda entry: entry.module)
+
+
+def write_action_manifest(path: Path = ACTION_MANIFEST_PATH) -> None:
+    """Regenerate the action manifest.
+
+    Args:
+        path (Path): The manifest file
+
+    """
+    manifest = [asdict(entry) for entry in build_action_manifest()]
+    path.write_text(json.dumps(manifest, indent=2) + "\n")
+
+
+_registry: ActionRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def get_action_registry() -> ActionRegistry:
+    """Get the process-wide action registry, read from the manifest on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ActionRegistry(load_action_manifest())
+        return _registry
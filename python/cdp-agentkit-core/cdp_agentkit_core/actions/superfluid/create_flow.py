@@ -4,9 +4,11 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 from cdp_agentkit_core.actions.superfluid.constants import (
     CREATE_ABI,
 )
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 SUPERFLUID_CREATE_FLOW_PROMPT = """
 This tool will create a money flow to a specified token recipient using Superfluid. Do not use this tool for any other purpose, or trading other assets.
@@ -49,19 +51,26 @@ def superfluid_create_flow(
 
     """
     try:
-        invocation = wallet.invoke_contract(
-            contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
-            abi=CREATE_ABI,
-            method="createFlow",
-            args={
-                "token": token_address,
-                "sender": wallet.default_address.address_id,
-                "receiver": recipient,
-                "flowrate": flow_rate,
-                "userData": "0x",
-            },
-        )
-
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
+                abi=CREATE_ABI,
+                method="createFlow",
+                args={
+                    "token": token_address,
+                    "sender": wallet.default_address.address_id,
+                    "receiver": recipient,
+                    "flowrate": flow_rate,
+                    "userData": "0x",
+                },
+            )
+
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation,
+                f"creation of a flow of {flow_rate} wei/s of {token_address} to {recipient}",
+            )
         invocation.wait()
 
         return f"Flow created successfully. Result: {invocation}"
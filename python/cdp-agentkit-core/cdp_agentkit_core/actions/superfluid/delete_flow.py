@@ -4,9 +4,11 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 from cdp_agentkit_core.actions.superfluid.constants import (
     DELETE_ABI,
 )
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 SUPERFLUID_DELETE_FLOW_PROMPT = """
 This tool will delete an existing money flow to a token recipient using Superfluid. Do not use this tool for any other purpose, or trading other assets.
@@ -38,18 +40,24 @@ def superfluid_delete_flow(wallet: Wallet, recipient: str, token_address: str) -
 
     """
     try:
-        invocation = wallet.invoke_contract(
-            contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
-            abi=DELETE_ABI,
-            method="deleteFlow",
-            args={
-                "token": token_address,
-                "sender": wallet.default_address.address_id,
-                "receiver": recipient,
-                "userData": "0x",
-            },
-        )
-
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
+                abi=DELETE_ABI,
+                method="deleteFlow",
+                args={
+                    "token": token_address,
+                    "sender": wallet.default_address.address_id,
+                    "receiver": recipient,
+                    "userData": "0x",
+                },
+            )
+
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation, f"deletion of the flow of {token_address} to {recipient}"
+            )
         invocation.wait()
 
         return f"Flow deleted successfully. Result: {invocation}"
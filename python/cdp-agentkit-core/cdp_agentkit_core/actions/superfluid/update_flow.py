@@ -4,9 +4,11 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 from cdp_agentkit_core.actions.superfluid.constants import (
     UPDATE_ABI,
 )
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 SUPERFLUID_UPDATE_FLOW_PROMPT = """
 This tool will update an existing money flow to a specified token recipient using Superfluid. Do not use this tool for any other purpose, or trading other assets.
@@ -49,19 +51,26 @@ def superfluid_update_flow(
 
     """
     try:
-        invocation = wallet.invoke_contract(
-            contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
-            abi=UPDATE_ABI,
-            method="updateFlow",
-            args={
-                "token": token_address,
-                "sender": wallet.default_address.address_id,
-                "receiver": recipient,
-                "flowrate": new_flow_rate,
-                "userData": "0x",
-            },
-        )
-
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address="0xcfA132E353cB4E398080B9700609bb008eceB125",
+                abi=UPDATE_ABI,
+                method="updateFlow",
+                args={
+                    "token": token_address,
+                    "sender": wallet.default_address.address_id,
+                    "receiver": recipient,
+                    "flowrate": new_flow_rate,
+                    "userData": "0x",
+                },
+            )
+
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation,
+                f"update of the flow of {token_address} to {recipient} to {new_flow_rate} wei/s",
+            )
         invocation.wait()
 
         return f"Flow updated successfully. Result: {invocation}"
@@ -4,6 +4,8 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 TRADE_PROMPT = """
 This tool will trade a specified amount of a 'from asset' to a 'to asset' for the wallet.
@@ -50,9 +52,14 @@ def trade(wallet: Wallet, amount: str, from_asset_id: str, to_asset_id: str) ->
 
     """
     try:
-        trade_result = wallet.trade(
-            amount=amount, from_asset_id=from_asset_id, to_asset_id=to_asset_id
-        ).wait()
+        with wallet_submission(wallet):
+            trade = wallet.trade(
+                amount=amount, from_asset_id=from_asset_id, to_asset_id=to_asset_id
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(trade, f"trade of {amount} {from_asset_id} for {to_asset_id}")
+        trade_result = trade.wait()
     except Exception as e:
         return f"Error trading assets {e!s}"
 
@@ -0,0 +1,306 @@
+"""Fire-and-track mode for write actions.
+
+By default a write action blocks on `.wait()` until its transaction lands onchain. With a
+transaction tracker started, write actions return as soon as the transaction is broadcast, with a
+handle and the transaction hash, and a single background thread polls every pending transaction
+until it completes or fails. The `get_transaction_status` action reports what the tracker knows,
+so an agent can queue several independent writes in one turn and check on them later.
+
+Each transaction records the ID of the wallet that submitted it, and status queries for a wallet
+only see its own transactions, so one tracker can serve the wallets of several tenants.
+
+Example:
+    .. code-block:: python
+
+        start_transaction_tracker()
+
+"""
+
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+# Delay between polls of the pending transactions.
+TRANSACTION_TRACKER_POLL_INTERVAL = 1.0
+
+# Transactions still pending after this many seconds are no longer polled.
+TRANSACTION_TRACKER_TIMEOUT_SECONDS = 300.0
+
+# Settled transactions kept for status queries; the oldest are dropped first.
+TRANSACTION_TRACKER_MAX_SETTLED = 1000
+
+TERMINAL_STATUSES = frozenset({"complete", "failed"})
+TIMED_OUT_STATUS = "timed out"
+
+
+@dataclass
+class TrackedTransaction:
+    """A broadcast transaction followed by the tracker.
+
+    The operation is the CDP SDK object returned by the write, such as a `Transfer`, `Trade` or
+    `ContractInvocation`, all of which can `reload()` and report a status.
+    """
+
+    handle: str
+    description: str
+    operation: Any = field(repr=False)
+    submitted_at: float
+    status: str
+    transaction_hash: str | None
+    transaction_link: str | None
+    # The last error raised while polling, kept for reporting; polling carries on.
+    error: str | None = None
+    wallet_id: str | None = None
+
+    @property
+    def settled(self) -> bool:
+        """Whether the transaction completed, failed or stopped being polled."""
+        return self.status in TERMINAL_STATUSES or self.status == TIMED_OUT_STATUS
+
+    def refresh(self) -> None:
+        """Copy the status, hash and link from the operation."""
+        self.status, self.transaction_hash, self.transaction_link = _transaction_details(
+            self.operation
+        )
+
+    def __str__(self) -> str:
+        """Describe the transaction for the agent."""
+        lines = [f"Transaction {self.handle} ({self.description}): {self.status}"]
+        if self.transaction_hash:
+            lines.append(f"Transaction hash: {self.transaction_hash}")
+        if self.transaction_link:
+            lines.append(f"Transaction link: {self.transaction_link}")
+        if self.error and not self.settled:
+            lines.append(f"Last polling error: {self.error}")
+        return "\n".join(lines)
+
+
+class TransactionTracker:
+    """Background confirmation tracker for broadcast transactions.
+
+    A single daemon thread multiplexes polling for every pending transaction, so write actions
+    neither hold the agent turn nor a thread while their transactions land.
+    """
+
+    def __init__(
+        self,
+        poll_interval: float = TRANSACTION_TRACKER_POLL_INTERVAL,
+        timeout_seconds: float = TRANSACTION_TRACKER_TIMEOUT_SECONDS,
+        max_settled: int = TRANSACTION_TRACKER_MAX_SETTLED,
+    ):
+        self.poll_interval = poll_interval
+        self.timeout_seconds = timeout_seconds
+        self.max_settled = max_settled
+        self._transactions: dict[str, TrackedTransaction] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the polling thread."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="cdp-transaction-tracker", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the polling thread. Pending transactions are kept but no longer polled.
+
+        Args:
+            timeout (float | None): Seconds to wait for the thread to exit, forever if None.
+
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def track(self, operation: Any, description: str) -> TrackedTransaction:
+        """Add a broadcast transaction to poll until it settles.
+
+        Args:
+            operation (Any): The CDP SDK object returned by the write, such as a `Transfer`
+            description (str): What the transaction does, such as `transfer of 1 eth to 0x...`
+
+        Returns:
+            TrackedTransaction: The tracked transaction
+
+        """
+        status, transaction_hash, transaction_link = _transaction_details(operation)
+        tracked = TrackedTransaction(
+            handle=uuid.uuid4().hex[:12],
+            description=description,
+            operation=operation,
+            submitted_at=time.monotonic(),
+            status=status,
+            transaction_hash=transaction_hash,
+            transaction_link=transaction_link,
+            wallet_id=_wallet_id(operation),
+        )
+        with self._condition:
+            self._transactions[tracked.handle] = tracked
+            self._prune()
+            self._condition.notify_all()
+        return tracked
+
+    def submit(self, operation: Any, description: str) -> str:
+        """Track a broadcast transaction and describe the submission for the agent.
+
+        Args:
+            operation (Any): The CDP SDK object returned by the write, such as a `Transfer`
+            description (str): What the transaction does, such as `transfer of 1 eth to 0x...`
+
+        Returns:
+            str: A message with the handle and hash of the transaction
+
+        """
+        tracked = self.track(operation, description)
+        return (
+            f"Submitted {description}. The transaction is pending confirmation; check on it with "
+            f"get_transaction_status and handle {tracked.handle}.\n"
+            f"Transaction hash: {tracked.transaction_hash}\n"
+            f"Transaction link: {tracked.transaction_link}"
+        )
+
+    def get(self, handle: str, wallet_id: str | None = None) -> TrackedTransaction | None:
+        """Get a tracked transaction by its handle.
+
+        Args:
+            handle (str): The handle returned when the transaction was submitted
+            wallet_id (str | None): The wallet the transaction must belong to, any if None
+
+        Returns:
+            TrackedTransaction | None: The transaction, None if the handle is unknown
+
+        """
+        tracked = self._transactions.get(handle)
+        if tracked is None or wallet_id not in (None, tracked.wallet_id):
+            return None
+        return tracked
+
+    def transactions(self, wallet_id: str | None = None) -> list[TrackedTransaction]:
+        """Get the tracked transactions, oldest first.
+
+        Args:
+            wallet_id (str | None): The wallet whose transactions to get, every wallet if None
+
+        Returns:
+            list[TrackedTransaction]: The transactions
+
+        """
+        with self._condition:
+            return [
+                tracked
+                for tracked in self._transactions.values()
+                if wallet_id in (None, tracked.wallet_id)
+            ]
+
+    def pending(self, wallet_id: str | None = None) -> list[TrackedTransaction]:
+        """Get the transactions that have not settled yet, oldest first.
+
+        Args:
+            wallet_id (str | None): The wallet whose transactions to get, every wallet if None
+
+        Returns:
+            list[TrackedTransaction]: The pending transactions
+
+        """
+        return [tracked for tracked in self.transactions(wallet_id) if not tracked.settled]
+
+    def poll(self) -> None:
+        """Reload every pending transaction once."""
+        now = time.monotonic()
+        for tracked in self.pending():
+            try:
+                tracked.operation.reload()
+                tracked.refresh()
+                tracked.error = None
+            except Exception as e:
+                tracked.error = str(e)
+            if not tracked.settled and now - tracked.submitted_at > self.timeout_seconds:
+                tracked.status = TIMED_OUT_STATUS
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and not any(
+                    not tracked.settled for tracked in self._transactions.values()
+                ):
+                    self._condition.wait()
+                if self._stopped:
+                    return
+            self.poll()
+            with self._condition:
+                if not self._stopped:
+                    self._condition.wait(self.poll_interval)
+
+    def _prune(self) -> None:
+        settled = [handle for handle, tracked in self._transactions.items() if tracked.settled]
+        for handle in settled[: max(0, len(settled) - self.max_settled)]:
+            del self._transactions[handle]
+
+
+def _transaction_details(operation: Any) -> tuple[str, str | None, str | None]:
+    # Transfers and contract invocations report their hash themselves, trades on their transaction.
+    source = operation if hasattr(operation, "transaction_hash") else operation.transaction
+    return str(operation.status), source.transaction_hash, source.transaction_link
+
+
+_transaction_tracker: TransactionTracker | None = None
+
+
+def _wallet_id(operation: Any) -> str | None:
+    wallet_id = getattr(operation, "wallet_id", None)
+    return wallet_id if isinstance(wallet_id, str) else None
+
+
+def get_transaction_tracker() -> TransactionTracker | None:
+    """Get the process-wide transaction tracker, None unless fire-and-track mode is on."""
+    return _transaction_tracker
+
+
+def set_transaction_tracker(tracker: TransactionTracker | None) -> None:
+    """Replace the process-wide transaction tracker, turning fire-and-track mode on or off.
+
+    Args:
+        tracker (TransactionTracker | None): The tracker to use, or None to wait on every write.
+
+    """
+    global _transaction_tracker
+    _transaction_tracker = tracker
+
+
+def start_transaction_tracker(
+    poll_interval: float = TRANSACTION_TRACKER_POLL_INTERVAL,
+    timeout_seconds: float = TRANSACTION_TRACKER_TIMEOUT_SECONDS,
+) -> TransactionTracker:
+    """Turn on fire-and-track mode with a new transaction tracker.
+
+    Args:
+        poll_interval (float): Seconds between polls of the pending transactions.
+        timeout_seconds (float): Seconds after which a pending transaction is no longer polled.
+
+    Returns:
+        TransactionTracker: The running tracker
+
+    """
+    stop_transaction_tracker()
+    tracker = TransactionTracker(poll_interval, timeout_seconds)
+    tracker.start()
+    set_transaction_tracker(tracker)
+    return tracker
+
+
+def stop_transaction_tracker() -> None:
+    """Turn off fire-and-track mode, stopping the running tracker if there is one."""
+    tracker = get_transaction_tracker()
+    set_transaction_tracker(None)
+    if tracker is not None:
+        tracker.stop()
@@ -4,6 +4,8 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 TRANSFER_PROMPT = """
 This tool will transfer an asset from the wallet to another onchain address.
@@ -60,9 +62,14 @@ def transfer(
 
     """
     try:
-        transfer_result = wallet.transfer(
-            amount=amount, asset_id=asset_id, destination=destination, gasless=gasless
-        ).wait()
+        with wallet_submission(wallet):
+            transfer = wallet.transfer(
+                amount=amount, asset_id=asset_id, destination=destination, gasless=gasless
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(transfer, f"transfer of {amount} {asset_id} to {destination}")
+        transfer_result = transfer.wait()
     except Exception as e:
         return f"Error transferring the asset {e!s}"
 
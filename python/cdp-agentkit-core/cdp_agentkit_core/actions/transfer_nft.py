@@ -4,6 +4,8 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 TRANSFER_NFT_PROMPT = """
 This tool will transfer an NFT (ERC721 token) from the wallet to another onchain address.
@@ -57,11 +59,19 @@ def transfer_nft(
     """
     try:
         from_addr = from_address if from_address is not None else wallet.default_address.address_id
-        transfer_result = wallet.invoke_contract(
-            contract_address=contract_address,
-            method="transferFrom",
-            args={"from": from_addr, "to": destination, "tokenId": token_id},
-        ).wait()
+        with wallet_submission(wallet):
+            transfer_result = wallet.invoke_contract(
+                contract_address=contract_address,
+                method="transferFrom",
+                args={"from": from_addr, "to": destination, "tokenId": token_id},
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                transfer_result,
+                f"transfer of NFT {token_id} from contract {contract_address} to {destination}",
+            )
+        transfer_result.wait()
     except Exception as e:
         return f"Error transferring the NFT (contract: {contract_address}, ID: {token_id}) from {from_addr} to {destination}): {e!s}"
 
@@ -1,6 +1,10 @@
-from cdp import Wallet
+import asyncio
+from typing import Any
+
+from cdp import SmartContract, Wallet
 
 from cdp_agentkit_core.actions.constants import ERC20_APPROVE_ABI
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
 
 
 def approve(wallet: Wallet, token_address: str, spender: str, amount: int) -> str:
@@ -19,17 +23,47 @@ def approve(wallet: Wallet, token_address: str, spender: str, amount: int) -> st
     try:
         amount_str = str(amount)
 
-        invocation = wallet.invoke_contract(
-            contract_address=token_address,
-            method="approve",
-            abi=ERC20_APPROVE_ABI,
-            args={
-                "spender": spender,
-                "value": amount_str,
-            },
-        ).wait()
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=token_address,
+                method="approve",
+                abi=ERC20_APPROVE_ABI,
+                args={
+                    "spender": spender,
+                    "value": amount_str,
+                },
+            )
+        invocation.wait()
 
         return f"Approved {amount} tokens for {spender} with transaction hash: {invocation.transaction_hash} and transaction link: {invocation.transaction_link}"
 
     except Exception as e:
         return f"Error approving tokens: {e!s}"
+
+
+async def read_contract_async(
+    network_id: str,
+    contract_address: str,
+    method: str,
+    abi: list[dict] | None = None,
+    args: dict | None = None,
+) -> Any:
+    """Read data from a smart contract without blocking the event loop.
+
+    The CDP SDK client is synchronous, so the read is offloaded to the default executor and
+    awaited. Callers can gather several reads to overlap their round trips.
+
+    Args:
+        network_id (str): The network ID, such as `base-sepolia`
+        contract_address (str): The address of the contract to read from
+        method (str): The contract method to call
+        abi (list[dict] | None): The ABI of the contract
+        args (dict | None): The arguments to pass to the method
+
+    Returns:
+        Any: The decoded value returned by the contract
+
+    """
+    return await asyncio.to_thread(
+        SmartContract.read, network_id, contract_address, method, abi=abi, args=args
+    )
@@ -0,0 +1,230 @@
+"""Sharded execution of write actions across the addresses of one wallet.
+
+A wallet writes from its default address, so the nonce of that one address caps throughput. A shard
+pool derives several addresses in the wallet and hands each action a view of the wallet whose
+default address is one of them, picked round robin or by fewest pending actions. Independent
+writes then run from different addresses in parallel, and reads that iterate `wallet.addresses`,
+such as `get_balance`, report the whole shard set.
+
+A treasury address, the default address unless another is given, keeps the other shards funded:
+`top_up` transfers from it to every shard whose balance fell below a minimum, either on demand or
+periodically from a background thread.
+"""
+
+import itertools
+import logging
+import threading
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from decimal import Decimal
+from typing import Any
+
+from cdp import Wallet, WalletAddress
+
+from cdp_agentkit_core.actions.nonce_manager import get_nonce_manager
+
+SHARD_STRATEGIES = ("least_pending", "round_robin")
+
+logger = logging.getLogger(__name__)
+
+# The wallet methods that act from the default address, forwarded to the shard address.
+_ADDRESS_METHODS = frozenset(
+    {
+        "balance",
+        "balances",
+        "deploy_contract",
+        "deploy_multi_token",
+        "deploy_nft",
+        "deploy_token",
+        "faucet",
+        "fund",
+        "invoke_contract",
+        "quote_fund",
+        "sign_payload",
+        "trade",
+        "transfer",
+    }
+)
+
+
+class WalletShard:
+    """A view of a wallet whose default address is one of its shard addresses.
+
+    Everything else, such as `id`, `network_id` and `addresses`, is the wallet's own.
+    """
+
+    def __init__(self, wallet: Wallet, address: WalletAddress):
+        self.wallet = wallet
+        self.default_address = address
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward default address methods to the shard address and the rest to the wallet."""
+        if name in _ADDRESS_METHODS:
+            return getattr(self.default_address, name)
+        return getattr(self.wallet, name)
+
+
+class WalletShardPool:
+    """Load balances actions across the first `size` addresses of a wallet.
+
+    Missing addresses are derived in the wallet when the pool is created.
+    """
+
+    def __init__(
+        self,
+        wallet: Wallet,
+        size: int,
+        strategy: str = "least_pending",
+        treasury_address: str | None = None,
+        min_balance: Decimal | str | None = None,
+        top_up_amount: Decimal | str | None = None,
+        asset_id: str = "eth",
+    ):
+        if strategy not in SHARD_STRATEGIES:
+            raise ValueError(
+                f"Unknown shard strategy {strategy}, expected one of {SHARD_STRATEGIES}"
+            )
+        if size < 1:
+            raise ValueError("A shard pool needs at least one address")
+
+        self.wallet = wallet
+        self.strategy = strategy
+        self.min_balance = Decimal(min_balance) if min_balance is not None else None
+        self.top_up_amount = (
+            Decimal(top_up_amount) if top_up_amount is not None else self.min_balance
+        )
+        self.asset_id = asset_id
+
+        while len(wallet.addresses) < size:
+            wallet.create_address()
+        self.addresses: list[WalletAddress] = list(wallet.addresses[:size])
+
+        treasury_address = treasury_address or wallet.default_address.address_id
+        self.treasury = next(
+            (address for address in wallet.addresses if address.address_id == treasury_address),
+            None,
+        )
+        if self.treasury is None:
+            raise ValueError(f"Treasury address {treasury_address} is not in the wallet")
+
+        self._pending = [0] * size
+        self._turns = itertools.count()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._top_up_thread: threading.Thread | None = None
+
+    @contextmanager
+    def acquire(self) -> Iterator[WalletShard]:
+        """Pick a shard for an action and count the action as pending on it until it returns.
+
+        Yields:
+            WalletShard: The wallet, as seen from the picked shard address
+
+        """
+        index = self._check_out()
+        try:
+            yield WalletShard(self.wallet, self.addresses[index])
+        finally:
+            self._check_in(index)
+
+    @asynccontextmanager
+    async def aacquire(self) -> AsyncIterator[WalletShard]:
+        """Pick a shard for an async action and count it as pending on it until it returns.
+
+        Yields:
+            WalletShard: The wallet, as seen from the picked shard address
+
+        """
+        index = self._check_out()
+        try:
+            yield WalletShard(self.wallet, self.addresses[index])
+        finally:
+            self._check_in(index)
+
+    def pending(self) -> dict[str, int]:
+        """Get the number of pending actions of each shard address."""
+        with self._lock:
+            return {
+                address.address_id: pending
+                for address, pending in zip(self.addresses, self._pending, strict=True)
+            }
+
+    def top_up(self) -> dict[str, Decimal]:
+        """Fund every shard whose balance is below the minimum from the treasury.
+
+        Returns:
+            dict[str, Decimal]: The amount sent to each shard address that was topped up
+
+        """
+        if self.min_balance is None:
+            return {}
+
+        transfers = {}
+        for address in self.addresses:
+            if address.address_id == self.treasury.address_id:
+                continue
+            if Decimal(address.balance(self.asset_id)) >= self.min_balance:
+                continue
+            with get_nonce_manager().submission(self.wallet.network_id, self.treasury.address_id):
+                transfer = self.treasury.transfer(
+                    self.top_up_amount, self.asset_id, address.address_id
+                )
+            transfers[address.address_id] = transfer
+        for transfer in transfers.values():
+            transfer.wait()
+        return {address_id: self.top_up_amount for address_id in transfers}
+
+    def start_top_ups(self, interval_seconds: float = 60.0) -> None:
+        """Top up the shards periodically from a background thread.
+
+        Args:
+            interval_seconds (float): Seconds between top ups
+
+        """
+        if self._top_up_thread is not None and self._top_up_thread.is_alive():
+            return
+        self._stopped.clear()
+        self._top_up_thread = threading.Thread(
+            target=self._run_top_ups,
+            args=(interval_seconds,),
+            name="cdp-wallet-shard-top-ups",
+            daemon=True,
+        )
+        self._top_up_thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the top up thread.
+
+        Args:
+            timeout (float | None): Seconds to wait for the thread to exit, forever if None.
+
+        """
+        self._stopped.set()
+        if self._top_up_thread is not None:
+            self._top_up_thread.join(timeout)
+
+    def _check_out(self) -> int:
+        with self._lock:
+            index = self._pick()
+            self._pending[index] += 1
+        return index
+
+    def _check_in(self, index: int) -> None:
+        with self._lock:
+            self._pending[index] -= 1
+
+    def _pick(self) -> int:
+        turn = next(self._turns)
+        if self.strategy == "round_robin":
+            return turn % len(self.addresses)
+        # Rotate the starting point so ties between idle shards are spread round robin.
+        order = [(turn + offset) % len(self.addresses) for offset in range(len(self.addresses))]
+        return min(order, key=lambda index: self._pending[index])
+
+    def _run_top_ups(self, interval_seconds: float) -> None:
+        while not self._stopped.is_set():
+            try:
+                self.top_up()
+            except Exception:
+                logger.warning("Error topping up wallet shards", exc_info=True)
+            self._stopped.wait(interval_seconds)
@@ -0,0 +1,278 @@
+"""Local WOW bonding curve pricing.
+
+This is a port of the WOW `BondingCurve` contract, which prices tokens on the exponential curve
+`price = A * e^(B * supply)`, together with the Solady fixed point `expWad` and `lnWad` it is
+built on. Quotes computed from a token's total supply match the contract to the wei.
+"""
+
+import logging
+import os
+import random
+import threading
+from dataclasses import dataclass
+from typing import Literal
+
+from cdp import SmartContract
+
+from cdp_agentkit_core.actions.wow.constants import BONDING_CURVE_ABI, addresses
+
+WAD = 10**18
+
+# Curve parameters of the deployed WOW BondingCurve contract.
+BONDING_CURVE_A = 1060848709
+BONDING_CURVE_B = 4379701787
+
+# Fraction of local quotes that are also read from the BondingCurve contract to detect drift.
+CROSS_CHECK_SAMPLE_RATE_ENV = "CDP_AGENTKIT_WOW_CROSS_CHECK_RATE"
+
+_LN_2_X96 = 54916777467707473351141471128
+
+logger = logging.getLogger(__name__)
+
+
+class BondingCurveDriftError(Exception):
+    """Raised in strict cross-check mode when a local quote differs from the contract."""
+
+
+def exp_wad(x: int) -> int:
+    """Calculate e^x for an 18 decimal fixed point x, as Solady `FixedPointMathLib.expWad`."""
+    if x <= -41446531673892822313:
+        return 0
+    if x >= 135305999368893231589:
+        raise OverflowError("expWad overflow")
+
+    # Convert to a 2**96 basis and reduce the range to (-1/2 ln 2, 1/2 ln 2).
+    x = _sdiv(x << 78, 5**18)
+    k = (_sdiv(x << 96, _LN_2_X96) + 2**95) >> 96
+    x = x - k * _LN_2_X96
+
+    y = x + 1346386616545796478920950773328
+    y = ((y * x) >> 96) + 57155421227552351082224309758442
+    p = y + x - 94201549194550492254356042504812
+    p = ((p * y) >> 96) + 28719021644029726153956944680412240
+    p = p * x + (4385272521454847904659076985693276 << 96)
+
+    q = x - 2855989394907223263936484059900
+    q = ((q * x) >> 96) + 50020603652535783019961831881945
+    q = ((q * x) >> 96) - 533845033583426703283633433725380
+    q = ((q * x) >> 96) + 3604857256930695427073651918091429
+    q = ((q * x) >> 96) - 14423608567350463180887372962807573
+    q = ((q * x) >> 96) + 26449188498355588339934803723976023
+
+    r = _sdiv(p, q)
+    return (r * 3822833074963236453042738258902158003155416615667) >> (195 - k)
+
+
+def ln_wad(x: int) -> int:
+    """Calculate ln(x) for an 18 decimal fixed point x, as Solady `FixedPointMathLib.lnWad`."""
+    if x <= 0:
+        raise ValueError("lnWad undefined for non-positive values")
+
+    # Reduce the range of x to [1, 2) * 2**96, remembering the power of two factored out.
+    r = 255 ^ (x.bit_length() - 1)
+    x = (x << r) >> 159
+
+    p = (((x + 3273285459638523848632254066296) * x) >> 96) + 24828157081833163892658089445524
+    p = (((p * x) >> 96) + 43456485725739037958740375743393) * x >> 96
+    p = p - 11111509109440967052023855526967
+    p = ((p * x) >> 96) - 45023709667254063763336534515857
+    p = ((p * x) >> 96) - 14706773417378608786704636184526
+    p = p * x - (795164235651350426258249787498 << 96)
+
+    q = x + 5573035233440673466300451813936
+    q = ((q * x) >> 96) + 71694874799317883764090561454958
+    q = ((q * x) >> 96) + 283447036172924575727196451306956
+    q = ((q * x) >> 96) + 401686690394027663651624208769553
+    q = ((q * x) >> 96) + 204048457590392012362485061816622
+    q = ((q * x) >> 96) + 31853899698501571402653359427138
+    q = ((q * x) >> 96) + 909429971244387300277376558375
+
+    p = _sdiv(p, q) * 1677202110996718588342820967067443963516166
+    p += 16597577552685614221487285958193947469193820559219878177908093499208371 * (159 - r)
+    p += 600920179829731861736702779321621459595472258049074101567377883020018308
+    return p >> 174
+
+
+def get_eth_buy_quote(current_supply: int, eth_order_size: int) -> int:
+    """Get the number of tokens bought for an amount of ETH.
+
+    Args:
+        current_supply (int): The total supply of the token, in wei
+        eth_order_size (int): The amount of ETH to spend, in wei
+
+    Returns:
+        int: The number of tokens received, in wei
+
+    """
+    exp_b_x0 = exp_wad(_mul_wad(BONDING_CURVE_B, current_supply))
+    exp_b_x1 = exp_b_x0 + eth_order_size * BONDING_CURVE_B // BONDING_CURVE_A
+    return ln_wad(exp_b_x1) * WAD // BONDING_CURVE_B - current_supply
+
+
+def get_eth_sell_quote(current_supply: int, eth_order_size: int) -> int:
+    """Get the number of tokens to sell to receive an amount of ETH.
+
+    Args:
+        current_supply (int): The total supply of the token, in wei
+        eth_order_size (int): The amount of ETH to receive, in wei
+
+    Returns:
+        int: The number of tokens to sell, in wei
+
+    """
+    exp_b_x0 = exp_wad(_mul_wad(BONDING_CURVE_B, current_supply))
+    exp_b_x1 = exp_b_x0 - eth_order_size * BONDING_CURVE_B // BONDING_CURVE_A
+    return current_supply - ln_wad(exp_b_x1) * WAD // BONDING_CURVE_B
+
+
+def get_token_buy_quote(current_supply: int, token_order_size: int) -> int:
+    """Get the amount of ETH needed to buy a number of tokens.
+
+    Args:
+        current_supply (int): The total supply of the token, in wei
+        token_order_size (int): The number of tokens to buy, in wei
+
+    Returns:
+        int: The amount of ETH to spend, in wei
+
+    """
+    exp_b_x0 = exp_wad(_mul_wad(BONDING_CURVE_B, current_supply))
+    exp_b_x1 = exp_wad(_mul_wad(BONDING_CURVE_B, current_supply + token_order_size))
+    return (exp_b_x1 - exp_b_x0) * BONDING_CURVE_A // BONDING_CURVE_B
+
+
+def get_token_sell_quote(current_supply: int, tokens_to_sell: int) -> int:
+    """Get the amount of ETH received for selling a number of tokens.
+
+    Args:
+        current_supply (int): The total supply of the token, in wei
+        tokens_to_sell (int): The number of tokens to sell, in wei
+
+    Returns:
+        int: The amount of ETH received, in wei
+
+    Raises:
+        ValueError: If more tokens are sold than the current supply.
+
+    """
+    if tokens_to_sell > current_supply:
+        raise ValueError("Insufficient supply")
+
+    exp_b_x0 = exp_wad(_mul_wad(BONDING_CURVE_B, current_supply))
+    exp_b_x1 = exp_wad(_mul_wad(BONDING_CURVE_B, current_supply - tokens_to_sell))
+    return (exp_b_x0 - exp_b_x1) * BONDING_CURVE_A // BONDING_CURVE_B
+
+
+@dataclass
+class CrossCheckStats:
+    """Counters of local quotes that were compared against the BondingCurve contract."""
+
+    samples: int = 0
+    mismatches: int = 0
+    max_drift: int = 0
+
+
+class BondingCurveCrossCheck:
+    """Sample local bonding curve quotes and compare them against the deployed contract.
+
+    The contract is read with the same total supply the local quote was computed from, so any
+    difference is drift in the local pricing rather than a race with other trades. On a mismatch
+    the contract quote is returned, or BondingCurveDriftError is raised when `strict` is set.
+    """
+
+    def __init__(self, sample_rate: float = 0.0, strict: bool = False):
+        self.sample_rate = sample_rate
+        self.strict = strict
+        self.stats = CrossCheckStats()
+        self._lock = threading.Lock()
+
+    def check(
+        self,
+        network_id: str,
+        quote_type: Literal["buy", "sell"],
+        current_supply: int,
+        amount: int,
+        local_quote: int,
+    ) -> int:
+        """Compare a local quote against the contract if it is sampled.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            quote_type (Literal["buy", "sell"]): Whether the quote is for buying or selling
+            current_supply (int): The total supply the quote was computed from, in wei
+            amount (int): The ETH (buy) or token (sell) amount that was quoted, in wei
+            local_quote (int): The locally computed quote
+
+        Returns:
+            int: The contract quote if the quote was sampled, the local quote otherwise
+
+        Raises:
+            BondingCurveDriftError: If the quote drifted and `strict` is set.
+
+        """
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return local_quote
+
+        method, amount_arg = (
+            ("getEthBuyQuote", "ethOrderSize")
+            if quote_type == "buy"
+            else ("getTokenSellQuote", "tokensToSell")
+        )
+        contract_quote = int(
+            SmartContract.read(
+                network_id,
+                addresses[network_id]["BondingCurve"],
+                method,
+                abi=BONDING_CURVE_ABI,
+                args={"currentSupply": str(current_supply), amount_arg: str(amount)},
+            )
+        )
+
+        drift = abs(contract_quote - local_quote)
+        with self._lock:
+            self.stats.samples += 1
+            if drift:
+                self.stats.mismatches += 1
+                self.stats.max_drift = max(self.stats.max_drift, drift)
+
+        if drift:
+            message = (
+                f"Local bonding curve {quote_type} quote {local_quote} differs from the contract "
+                f"quote {contract_quote} at supply {current_supply}"
+            )
+            if self.strict:
+                raise BondingCurveDriftError(message)
+            logger.warning(message)
+        return contract_quote
+
+
+_cross_check: BondingCurveCrossCheck | None = None
+
+
+def get_bonding_curve_cross_check() -> BondingCurveCrossCheck:
+    """Get the process-wide cross-check, sampling at the rate in `CDP_AGENTKIT_WOW_CROSS_CHECK_RATE`."""
+    global _cross_check
+    if _cross_check is None:
+        _cross_check = BondingCurveCrossCheck(float(os.environ.get(CROSS_CHECK_SAMPLE_RATE_ENV, 0)))
+    return _cross_check
+
+
+def set_bonding_curve_cross_check(cross_check: BondingCurveCrossCheck) -> None:
+    """Replace the process-wide cross-check.
+
+    Args:
+        cross_check (BondingCurveCrossCheck): The cross-check to use.
+
+    """
+    global _cross_check
+    _cross_check = cross_check
+
+
+def _mul_wad(x: int, y: int) -> int:
+    return x * y // WAD
+
+
+def _sdiv(a: int, b: int) -> int:
+    # Signed division truncating toward zero, as the EVM `sdiv` opcode.
+    quotient = abs(a) // abs(b)
+    return quotient if (a < 0) == (b < 0) else -quotient
@@ -4,11 +4,16 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 from cdp_agentkit_core.actions.wow.constants import (
     WOW_ABI,
 )
+from cdp_agentkit_core.actions.wow.price_impact import (
+    DEFAULT_MAX_PRICE_IMPACT,
+    get_price_impact_curve,
+)
 from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
-from cdp_agentkit_core.actions.wow.utils import get_buy_quote
 
 WOW_BUY_TOKEN_PROMPT = """
 This tool can only be used to buy a Zora Wow ERC20 memecoin with ETH. Do not use this tool for any other purpose, or trading other assets.
@@ -17,6 +22,7 @@ Inputs:
 - WOW token contract address
 - Address to receive the tokens
 - Amount of ETH to spend (in wei)
+- Optionally, the maximum price impact to accept, such as 0.05 for 5%
 
 Important notes:
 - The amount is a string and cannot have any decimal points, since the unit of measurement is wei.
@@ -42,43 +48,69 @@ class WowBuyTokenInput(BaseModel):
         description="Amount of ETH to spend (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH",
     )
 
+    max_price_impact: float = Field(
+        DEFAULT_MAX_PRICE_IMPACT,
+        description="The maximum price impact to accept, such as 0.05 for 5%",
+        ge=0,
+        lt=1,
+    )
+
 
-def wow_buy_token(wallet: Wallet, contract_address: str, amount_eth_in_wei: str) -> str:
+def wow_buy_token(
+    wallet: Wallet,
+    contract_address: str,
+    amount_eth_in_wei: str,
+    max_price_impact: float = DEFAULT_MAX_PRICE_IMPACT,
+) -> str:
     """Buy a Zora Wow ERC20 memecoin with ETH.
 
     Args:
         wallet (Wallet): The wallet to create the token from.
         contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount_eth_in_wei (str): Amount of ETH to spend (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
+        max_price_impact (float): The maximum price impact to accept, such as 0.05 for 5%
 
     Returns:
         str: A message containing the token purchase details.
 
     """
-    token_quote = get_buy_quote(wallet.network_id, contract_address, amount_eth_in_wei)
+    curve = get_price_impact_curve(wallet.network_id, contract_address, [amount_eth_in_wei], "buy")
+    if curve.price_impact[0] > max_price_impact:
+        return (
+            f"Error buying Zora Wow ERC20 memecoin: price impact of {curve.price_impact[0]:.2%} "
+            f"exceeds the maximum of {max_price_impact:.2%}"
+        )
 
-    # Multiply by 99/100 and floor to get 99% of quote as minimum
-    min_tokens = str(int((token_quote * 99) // 100))  # Using integer division to floor the result
+    # Accept any fill priced within the maximum price impact of the spot price.
+    min_tokens = str(curve.min_output(0, max_price_impact))
 
     has_graduated = get_has_graduated(wallet.network_id, contract_address)
 
     try:
-        invocation = wallet.invoke_contract(
-            contract_address=contract_address,
-            method="buy",
-            abi=WOW_ABI,
-            args={
-                "recipient": wallet.default_address.address_id,
-                "refundRecipient": wallet.default_address.address_id,
-                "orderReferrer": "0x0000000000000000000000000000000000000000",
-                "expectedMarketType": (has_graduated and "1") or "0",
-                "minOrderSize": min_tokens,
-                "sqrtPriceLimitX96": "0",
-                "comment": "",
-            },
-            amount=amount_eth_in_wei,
-            asset_id="wei",
-        ).wait()
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=contract_address,
+                method="buy",
+                abi=WOW_ABI,
+                args={
+                    "recipient": wallet.default_address.address_id,
+                    "refundRecipient": wallet.default_address.address_id,
+                    "orderReferrer": "0x0000000000000000000000000000000000000000",
+                    "expectedMarketType": (has_graduated and "1") or "0",
+                    "minOrderSize": min_tokens,
+                    "sqrtPriceLimitX96": "0",
+                    "comment": "",
+                },
+                amount=amount_eth_in_wei,
+                asset_id="wei",
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation,
+                f"purchase of WoW ERC20 memecoin {contract_address} for {amount_eth_in_wei} wei",
+            )
+        invocation.wait()
     except Exception as e:
         return f"Error buying Zora Wow ERC20 memecoin {e!s}"
 
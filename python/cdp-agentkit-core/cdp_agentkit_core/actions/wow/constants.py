@@ -814,6 +814,49 @@ WOW_ABI = [
     {"stateMutability": "payable", "type": "receive"},
 ]
 
+BONDING_CURVE_ABI = [
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "currentSupply", "type": "uint256"},
+            {"internalType": "uint256", "name": "ethOrderSize", "type": "uint256"},
+        ],
+        "name": "getEthBuyQuote",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "currentSupply", "type": "uint256"},
+            {"internalType": "uint256", "name": "ethOrderSize", "type": "uint256"},
+        ],
+        "name": "getEthSellQuote",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "currentSupply", "type": "uint256"},
+            {"internalType": "uint256", "name": "tokenOrderSize", "type": "uint256"},
+        ],
+        "name": "getTokenBuyQuote",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "pure",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "currentSupply", "type": "uint256"},
+            {"internalType": "uint256", "name": "tokensToSell", "type": "uint256"},
+        ],
+        "name": "getTokenSellQuote",
+        "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
+        "stateMutability": "pure",
+        "type": "function",
+    },
+]
+
 WOW_FACTORY_CONTRACT_ADDRESSES = {
     "base-sepolia": "0x04870e22fa217Cb16aa00501D7D5253B8838C1eA",
     "base-mainnet": "0x997020E5F59cCB79C74D527Be492Cc610CB9fA2B",
@@ -4,6 +4,8 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 from cdp_agentkit_core.actions.wow.constants import (
     GENERIC_TOKEN_METADATA_URI,
     WOW_FACTORY_ABI,
@@ -59,18 +61,23 @@ def wow_create_token(wallet: Wallet, name: str, symbol: str, token_uri: str | No
     factory_address = get_factory_address(wallet.network_id)
 
     try:
-        invocation = wallet.invoke_contract(
-            contract_address=factory_address,
-            method="deploy",
-            abi=WOW_FACTORY_ABI,
-            args={
-                "_tokenCreator": wallet.default_address.address_id,
-                "_platformReferrer": "0x0000000000000000000000000000000000000000",
-                "_tokenURI": token_uri or GENERIC_TOKEN_METADATA_URI,
-                "_name": name,
-                "_symbol": symbol,
-            },
-        ).wait()
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=factory_address,
+                method="deploy",
+                abi=WOW_FACTORY_ABI,
+                args={
+                    "_tokenCreator": wallet.default_address.address_id,
+                    "_platformReferrer": "0x0000000000000000000000000000000000000000",
+                    "_tokenURI": token_uri or GENERIC_TOKEN_METADATA_URI,
+                    "_name": name,
+                    "_symbol": symbol,
+                },
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(invocation, f"creation of WoW ERC20 memecoin {name} ({symbol})")
+        invocation.wait()
     except Exception as e:
         return f"Error creating Zora Wow ERC20 memecoin {e!s}"
 
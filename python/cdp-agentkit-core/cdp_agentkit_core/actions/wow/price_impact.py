@@ -0,0 +1,226 @@
+"""Price impact curves for WOW tokens.
+
+A curve quotes many candidate order sizes against a single snapshot of the market: the token's
+total supply before graduation, or the Uniswap v3 pool state and ticks after. Every quote uses the
+same exact integer math as the contracts, so sizing an order costs one snapshot rather than one
+quote read per candidate amount.
+
+Quotes are net of the WOW trading fee, which the token contract takes from the ETH side of every
+trade: from the ETH sent in by a buy and from the ETH paid out by a sell, both before and after
+graduation. The spot prices are quoted less the fee as well, so the price impact of an order is its
+slippage alone and the minimum outputs derived from it account for the fee.
+"""
+
+import logging
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+
+from cdp_agentkit_core.actions.wow import bonding_curve
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    PoolInfo,
+    exact_input_single,
+    get_has_graduated,
+    get_pool_address,
+    get_pool_info,
+    get_pool_ticks,
+)
+from cdp_agentkit_core.actions.wow.uniswap.quoter import (
+    FEE_DENOMINATOR,
+    MissingTickDataError,
+    PoolTicks,
+    quote_exact_input,
+)
+from cdp_agentkit_core.actions.wow.utils import get_current_supply
+
+# Default maximum price impact accepted by the buy and sell actions.
+DEFAULT_MAX_PRICE_IMPACT = 0.05
+
+# Trading fee of the WOW token contract (`TOTAL_FEE_BPS`), in basis points.
+WOW_TOTAL_FEE_BPS = 100
+_WOW_FEE_FACTOR = 1 - WOW_TOTAL_FEE_BPS / 10_000
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PriceImpactCurve:
+    """Quotes for a range of order sizes against a single market snapshot.
+
+    Amounts are exact integers in wei, held in object arrays. Prices are output per unit of input
+    as floats, and the price impact of an order is `1 - effective_price / spot_price`.
+    """
+
+    amounts_in: np.ndarray
+    amounts_out: np.ndarray
+    effective_price: np.ndarray
+    price_impact: np.ndarray
+    spot_price: float
+
+    def min_output(self, index: int, max_price_impact: float) -> int:
+        """Get the minimum output to accept for an order at the given price impact.
+
+        Args:
+            index (int): The index of the order size in the curve
+            max_price_impact (float): The maximum price impact to accept, such as 0.05 for 5%
+
+        Returns:
+            int: The minimum output in wei, priced at the spot price less the price impact
+
+        """
+        return math.floor(int(self.amounts_in[index]) * self.spot_price * (1 - max_price_impact))
+
+
+def bonding_curve_price_impact(
+    total_supply: int, amounts_in: Sequence[int], quote_type: Literal["buy", "sell"]
+) -> PriceImpactCurve:
+    """Build a price impact curve on the WOW bonding curve.
+
+    Args:
+        total_supply (int): The total supply of the token, in wei
+        amounts_in (Sequence[int]): The ETH (buy) or token (sell) amounts to quote, in wei
+        quote_type (Literal["buy", "sell"]): Whether the orders buy or sell the token
+
+    Returns:
+        PriceImpactCurve: The quotes for each amount, net of the WOW trading fee
+
+    """
+    if quote_type == "buy":
+        amounts_out = [
+            bonding_curve.get_eth_buy_quote(total_supply, _less_wow_fee(int(amount)))
+            for amount in amounts_in
+        ]
+    else:
+        amounts_out = [
+            _less_wow_fee(bonding_curve.get_token_sell_quote(total_supply, int(amount)))
+            for amount in amounts_in
+        ]
+
+    # The marginal price of the curve in ETH per token is A * e^(B * supply / WAD^2) / WAD.
+    eth_per_token = (
+        bonding_curve.BONDING_CURVE_A
+        * math.exp(bonding_curve.BONDING_CURVE_B * total_supply / bonding_curve.WAD**2)
+        / bonding_curve.WAD
+    )
+    spot_price = 1 / eth_per_token if quote_type == "buy" else eth_per_token
+    return _build_curve(amounts_in, amounts_out, spot_price * _WOW_FEE_FACTOR)
+
+
+def uniswap_price_impact(
+    pool: PoolInfo, ticks: PoolTicks, zero_for_one: bool, amounts_in: Sequence[int]
+) -> PriceImpactCurve:
+    """Build a price impact curve on a Uniswap v3 pool snapshot.
+
+    Args:
+        pool (PoolInfo): The pool snapshot
+        ticks (PoolTicks): The initialized ticks around the current price
+        zero_for_one (bool): Whether token0 is swapped for token1
+        amounts_in (Sequence[int]): The exact input amounts to quote, in wei
+
+    Returns:
+        PriceImpactCurve: The quotes for each amount
+
+    Raises:
+        MissingTickDataError: If an order walks past the fetched ticks.
+
+    """
+    amounts_out = [quote_exact_input(pool, ticks, zero_for_one, int(a)) for a in amounts_in]
+    return _build_curve(amounts_in, amounts_out, _uniswap_spot_price(pool, zero_for_one))
+
+
+def get_price_impact_curve(
+    network_id: str,
+    token_address: str,
+    amounts_in: Sequence[int | str],
+    quote_type: Literal["buy", "sell"],
+) -> PriceImpactCurve:
+    """Quote many order sizes for a WOW token against one snapshot of its market.
+
+    Before graduation the bonding curve is priced from the token's total supply. After
+    graduation the Uniswap pool state and ticks are read once and every amount is quoted locally;
+    if an order walks past the fetched ticks, that amount falls back to the on-chain quoter.
+
+    Args:
+        network_id (str): The network ID, such as `base-sepolia`
+        token_address (str): The WOW token address
+        amounts_in (Sequence[int | str]): The ETH (buy) or token (sell) amounts to quote, in wei
+        quote_type (Literal["buy", "sell"]): Whether the orders buy or sell the token
+
+    Returns:
+        PriceImpactCurve: The quotes for each amount, net of the WOW trading fee
+
+    """
+    amounts_in = [int(amount) for amount in amounts_in]
+
+    if not get_has_graduated(network_id, token_address):
+        total_supply = get_current_supply(token_address, network_id)
+        return bonding_curve_price_impact(total_supply, amounts_in, quote_type)
+
+    pool_address = get_pool_address(token_address, network_id)
+    pool = get_pool_info(network_id, pool_address)
+    is_token0_weth = pool.token0.lower() == addresses[network_id]["WETH"].lower()
+    zero_for_one = is_token0_weth == (quote_type == "buy")
+    token_in, token_out = (pool.token0, pool.token1) if zero_for_one else (pool.token1, pool.token0)
+
+    try:
+        ticks = get_pool_ticks(network_id, pool_address, pool)
+    except Exception:
+        logger.warning("Error fetching ticks of pool %s", pool_address, exc_info=True)
+        ticks = None
+
+    amounts_out = []
+    for amount in amounts_in:
+        # A buy swaps the ETH left after the fee; a sell pays out the swapped ETH less the fee.
+        swap_in = _less_wow_fee(amount) if quote_type == "buy" else amount
+        try:
+            if ticks is None:
+                raise MissingTickDataError("Pool ticks are unavailable")
+            swap_out = quote_exact_input(pool, ticks, zero_for_one, swap_in)
+        except MissingTickDataError:
+            swap_out = int(
+                exact_input_single(network_id, token_in, token_out, str(swap_in), pool.fee)
+            )
+        amounts_out.append(swap_out if quote_type == "buy" else _less_wow_fee(swap_out))
+
+    spot_price = _uniswap_spot_price(pool, zero_for_one) * _WOW_FEE_FACTOR
+    return _build_curve(amounts_in, amounts_out, spot_price)
+
+
+def _less_wow_fee(amount: int) -> int:
+    # The token contract rounds the fee down, as `amount * TOTAL_FEE_BPS / 10_000`.
+    return amount - amount * WOW_TOTAL_FEE_BPS // 10_000
+
+
+def _uniswap_spot_price(pool: PoolInfo, zero_for_one: bool) -> float:
+    # The marginal price of token0 in token1 is (sqrtPriceX96 / 2**96)**2, less the pool fee.
+    price = (pool.sqrt_price_x96 / 2**96) ** 2
+    fee_factor = 1 - pool.fee / FEE_DENOMINATOR
+    return (price if zero_for_one else 1 / price) * fee_factor
+
+
+def _build_curve(
+    amounts_in: Sequence[int], amounts_out: Sequence[int], spot_price: float
+) -> PriceImpactCurve:
+    amounts_in_array = np.array([int(amount) for amount in amounts_in], dtype=object)
+    amounts_out_array = np.array([int(amount) for amount in amounts_out], dtype=object)
+
+    amounts_in_float = amounts_in_array.astype(np.float64)
+    effective_price = np.divide(
+        amounts_out_array.astype(np.float64),
+        amounts_in_float,
+        out=np.zeros(len(amounts_in_float)),
+        where=amounts_in_float > 0,
+    )
+    price_impact = 1 - effective_price / spot_price
+
+    return PriceImpactCurve(
+        amounts_in=amounts_in_array,
+        amounts_out=amounts_out_array,
+        effective_price=effective_price,
+        price_impact=price_impact,
+        spot_price=spot_price,
+    )
@@ -4,11 +4,16 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions.cdp_action import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 from cdp_agentkit_core.actions.wow.constants import (
     WOW_ABI,
 )
+from cdp_agentkit_core.actions.wow.price_impact import (
+    DEFAULT_MAX_PRICE_IMPACT,
+    get_price_impact_curve,
+)
 from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated
-from cdp_agentkit_core.actions.wow.utils import get_sell_quote
 
 WOW_SELL_TOKEN_PROMPT = """
 This tool can only be used to sell a Zora Wow ERC20 memecoin for ETH. Do not use this tool for any other purpose, or trading other assets.
@@ -16,6 +21,7 @@ This tool can only be used to sell a Zora Wow ERC20 memecoin for ETH. Do not use
 Inputs:
 - WOW token contract address
 - Amount of tokens to sell (in wei)
+- Optionally, the maximum price impact to accept, such as 0.05 for 5%
 
 Important notes:
 - The amount is a string and cannot have any decimal points, since the unit of measurement is wei.
@@ -41,40 +47,68 @@ class WowSellTokenInput(BaseModel):
         description="Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token",
     )
 
+    max_price_impact: float = Field(
+        DEFAULT_MAX_PRICE_IMPACT,
+        description="The maximum price impact to accept, such as 0.05 for 5%",
+        ge=0,
+        lt=1,
+    )
+
 
-def wow_sell_token(wallet: Wallet, contract_address: str, amount_tokens_in_wei: str):
+def wow_sell_token(
+    wallet: Wallet,
+    contract_address: str,
+    amount_tokens_in_wei: str,
+    max_price_impact: float = DEFAULT_MAX_PRICE_IMPACT,
+):
     """Sell WOW tokens for ETH.
 
     Args:
         wallet (Wallet): The wallet to sell the tokens from.
         contract_address (str): The WOW token contract address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
         amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
+        max_price_impact (float): The maximum price impact to accept, such as 0.05 for 5%
 
     Returns:
         str: A message confirming the sale with the transaction hash
 
     """
-    eth_quote = get_sell_quote(wallet.network_id, contract_address, amount_tokens_in_wei)
+    curve = get_price_impact_curve(
+        wallet.network_id, contract_address, [amount_tokens_in_wei], "sell"
+    )
+    if curve.price_impact[0] > max_price_impact:
+        return (
+            f"Error selling Zora Wow ERC20 memecoin: price impact of {curve.price_impact[0]:.2%} "
+            f"exceeds the maximum of {max_price_impact:.2%}"
+        )
     has_graduated = get_has_graduated(wallet.network_id, contract_address)
 
-    # Multiply by 98/100 and floor to get 98% of quote as minimum (slippage protection)
-    min_eth = str(int((eth_quote * 98) // 100))
+    # Accept any payout priced within the maximum price impact of the spot price.
+    min_eth = str(curve.min_output(0, max_price_impact))
 
     try:
-        invocation = wallet.invoke_contract(
-            contract_address=contract_address,
-            method="sell",
-            abi=WOW_ABI,
-            args={
-                "tokensToSell": str(amount_tokens_in_wei),
-                "recipient": wallet.default_address.address_id,
-                "orderReferrer": "0x0000000000000000000000000000000000000000",
-                "comment": "",
-                "expectedMarketType": "1" if has_graduated else "0",
-                "minPayoutSize": min_eth,
-                "sqrtPriceLimitX96": "0",
-            },
-        ).wait()
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=contract_address,
+                method="sell",
+                abi=WOW_ABI,
+                args={
+                    "tokensToSell": str(amount_tokens_in_wei),
+                    "recipient": wallet.default_address.address_id,
+                    "orderReferrer": "0x0000000000000000000000000000000000000000",
+                    "comment": "",
+                    "expectedMarketType": "1" if has_graduated else "0",
+                    "minPayoutSize": min_eth,
+                    "sqrtPriceLimitX96": "0",
+                },
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(
+                invocation,
+                f"sale of {amount_tokens_in_wei} wei of WoW ERC20 memecoin {contract_address}",
+            )
+        invocation.wait()
     except Exception as e:
         return f"Error selling Zora Wow ERC20 memecoin {e!s}"
 
@@ -0,0 +1,271 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from cdp_agentkit_core.actions.wow.uniswap.quoter import PoolTicks
+
+# A token that has not graduated is re-checked after this many seconds, and only the fact that
+# it was checked is kept in memory. Graduation is one-way, so a graduated token is persisted and
+# never re-checked.
+UNGRADUATED_TTL_SECONDS = 30.0
+
+# The total supply of a token on its bonding curve changes with every trade, so it is only
+# reused for this many seconds and is never persisted.
+TOTAL_SUPPLY_TTL_SECONDS = 5.0
+
+# The initialized ticks of a pool only change when liquidity is added or removed, so they are
+# reused for this many seconds while the pool's active liquidity is unchanged and its current tick
+# stays within the fetched range. They are never persisted.
+POOL_TICKS_TTL_SECONDS = 60.0
+
+TOKEN_FACTS_CACHE_VERSION = 1
+
+
+def default_token_facts_path() -> Path:
+    """Return the default location of the token facts cache file.
+
+    The directory can be overridden with the `CDP_AGENTKIT_CACHE_DIR` environment variable.
+    """
+    cache_dir = os.environ.get("CDP_AGENTKIT_CACHE_DIR") or Path.home() / ".cache" / "cdp-agentkit"
+    return Path(cache_dir) / "wow_token_facts.json"
+
+
+class TokenFactsCache:
+    """Network-keyed cache of immutable facts about WOW tokens and their Uniswap pools.
+
+    Facts such as a token's pool address or a pool's token0, token1 and fee never change
+    once observed, so they are cached forever. Whether a token has graduated is cached forever
+    once true, and re-checked after `ungraduated_ttl_seconds` while false.
+
+    When a path is given, every update that changes a fact is written through to disk so facts
+    survive restarts. The last time a token was found not to have graduated, its total supply for
+    `total_supply_ttl_seconds` and a pool's initialized ticks for `pool_ticks_ttl_seconds` are
+    cached in memory only, so refreshing them never rewrites the file.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ungraduated_ttl_seconds: float = UNGRADUATED_TTL_SECONDS,
+        total_supply_ttl_seconds: float = TOTAL_SUPPLY_TTL_SECONDS,
+        pool_ticks_ttl_seconds: float = POOL_TICKS_TTL_SECONDS,
+    ):
+        self.path = Path(path) if path is not None else None
+        self.ungraduated_ttl_seconds = ungraduated_ttl_seconds
+        self.total_supply_ttl_seconds = total_supply_ttl_seconds
+        self.pool_ticks_ttl_seconds = pool_ticks_ttl_seconds
+        self._lock = threading.Lock()
+        self._facts: dict[str, dict[str, Any]] | None = None
+        self._ungraduated_checks: dict[str, float] = {}
+        self._total_supplies: dict[str, tuple[int, float]] = {}
+        self._pool_ticks: dict[str, tuple[Any, int, float]] = {}
+
+    def get(self, network_id: str, address: str) -> dict[str, Any]:
+        """Get every cached fact about an address.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            address (str): The token or pool address
+
+        Returns:
+            dict[str, Any]: A copy of the cached facts, empty if nothing is known
+
+        """
+        with self._lock:
+            return dict(self._load().get(_key(network_id, address), {}))
+
+    def update(self, network_id: str, address: str, **facts: Any) -> None:
+        """Record facts about an address and write them through to disk if any of them changed.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            address (str): The token or pool address
+            **facts: The facts to record
+
+        """
+        with self._lock:
+            cache = self._load()
+            known = cache.setdefault(_key(network_id, address), {})
+            if all(name in known and known[name] == value for name, value in facts.items()):
+                return
+            known.update(facts)
+            self._save(cache)
+
+    def get_has_graduated(self, network_id: str, token_address: str) -> bool | None:
+        """Get whether a token has graduated, if it is known and still fresh.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            token_address (str): The token address
+
+        Returns:
+            bool | None: True if the token has graduated, False if it had not graduated within
+                the TTL, None if it has to be read from the chain
+
+        """
+        if self.get(network_id, token_address).get("has_graduated") is True:
+            return True
+        with self._lock:
+            checked_at = self._ungraduated_checks.get(_key(network_id, token_address), 0.0)
+        if time.time() - checked_at < self.ungraduated_ttl_seconds:
+            return False
+        return None
+
+    def set_has_graduated(self, network_id: str, token_address: str, has_graduated: bool) -> None:
+        """Record whether a token has graduated.
+
+        Only graduation is written to disk; a token that has not graduated is remembered in memory
+        until its TTL expires.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            token_address (str): The token address
+            has_graduated (bool): Whether the token has graduated
+
+        """
+        if has_graduated:
+            self.update(network_id, token_address, has_graduated=True)
+            return
+        with self._lock:
+            self._ungraduated_checks[_key(network_id, token_address)] = time.time()
+
+    def get_total_supply(self, network_id: str, token_address: str) -> int | None:
+        """Get the total supply of a token, if it was read within the TTL.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            token_address (str): The token address
+
+        Returns:
+            int | None: The total supply in wei, None if it has to be read from the chain
+
+        """
+        with self._lock:
+            total_supply, read_at = self._total_supplies.get(
+                _key(network_id, token_address), (None, 0.0)
+            )
+        if time.time() - read_at < self.total_supply_ttl_seconds:
+            return total_supply
+        return None
+
+    def set_total_supply(self, network_id: str, token_address: str, total_supply: int) -> None:
+        """Record the total supply of a token.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            token_address (str): The token address
+            total_supply (int): The total supply in wei
+
+        """
+        with self._lock:
+            self._total_supplies[_key(network_id, token_address)] = (total_supply, time.time())
+
+    def get_pool_ticks(
+        self, network_id: str, pool_address: str, liquidity: int, tick: int
+    ) -> "PoolTicks | None":
+        """Get the initialized ticks of a pool, if they are still valid for its current state.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            pool_address (str): The uniswap v3 pool address
+            liquidity (int): The current active liquidity of the pool
+            tick (int): The current tick of the pool
+
+        Returns:
+            PoolTicks | None: The ticks, None if they have to be read from the chain
+
+        """
+        with self._lock:
+            ticks, ticks_liquidity, read_at = self._pool_ticks.get(
+                _key(network_id, pool_address), (None, None, 0.0)
+            )
+        if (
+            ticks is None
+            or ticks_liquidity != liquidity
+            or time.time() - read_at >= self.pool_ticks_ttl_seconds
+        ):
+            return None
+        word = (tick // ticks.tick_spacing) >> 8
+        return ticks if ticks.min_word <= word <= ticks.max_word else None
+
+    def set_pool_ticks(
+        self, network_id: str, pool_address: str, ticks: "PoolTicks", liquidity: int
+    ) -> None:
+        """Record the initialized ticks of a pool.
+
+        Args:
+            network_id (str): The network ID, such as `base-sepolia`
+            pool_address (str): The uniswap v3 pool address
+            ticks (PoolTicks): The initialized ticks
+            liquidity (int): The active liquidity of the pool the ticks were read at
+
+        """
+        with self._lock:
+            self._pool_ticks[_key(network_id, pool_address)] = (ticks, liquidity, time.time())
+
+    def clear(self) -> None:
+        """Forget every cached fact, including those persisted to disk."""
+        with self._lock:
+            self._ungraduated_checks = {}
+            self._total_supplies = {}
+            self._pool_ticks = {}
+            self._facts = {}
+            self._save(self._facts)
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._facts is None:
+            self._facts = {}
+            if self.path is not None and self.path.exists():
+                try:
+                    data = json.loads(self.path.read_text())
+                    if data.get("version") == TOKEN_FACTS_CACHE_VERSION:
+                        self._facts = data["facts"]
+                except (OSError, ValueError, KeyError):
+                    # A corrupt or unreadable cache is rebuilt from the chain.
+                    self._facts = {}
+        return self._facts
+
+    def _save(self, facts: dict[str, dict[str, Any]]) -> None:
+        if self.path is None:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".token_facts")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": TOKEN_FACTS_CACHE_VERSION, "facts": facts}, f)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            # Persistence is best effort; the in-memory cache remains authoritative.
+            pass
+
+
+_token_facts_cache: TokenFactsCache | None = None
+
+
+def get_token_facts_cache() -> TokenFactsCache:
+    """Get the process-wide token facts cache, persisted to `default_token_facts_path`."""
+    global _token_facts_cache
+    if _token_facts_cache is None:
+        _token_facts_cache = TokenFactsCache(default_token_facts_path())
+    return _token_facts_cache
+
+
+def set_token_facts_cache(cache: TokenFactsCache) -> None:
+    """Replace the process-wide token facts cache.
+
+    Args:
+        cache (TokenFactsCache): The cache to use, e.g. one without a path to disable persistence.
+
+    """
+    global _token_facts_cache
+    _token_facts_cache = cache
+
+
+def _key(network_id: str, address: str) -> str:
+    return f"{network_id}:{address.lower()}"
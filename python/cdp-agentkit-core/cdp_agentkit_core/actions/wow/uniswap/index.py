@@ -1,3 +1,4 @@
+import logging
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Literal
@@ -6,8 +7,19 @@ from cdp import SmartContract
 from web3 import Web3
 from web3.types import Wei
 
+from cdp_agentkit_core.actions.multicall import ERC20_BALANCE_OF_ABI, MulticallReader
+from cdp_agentkit_core.actions.utils import read_contract_async
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI, addresses
+from cdp_agentkit_core.actions.wow.token_facts import get_token_facts_cache
 from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+from cdp_agentkit_core.actions.wow.uniswap.quoter import (
+    MissingTickDataError,
+    PoolTicks,
+    fetch_pool_ticks,
+    quote_exact_input,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -56,6 +68,8 @@ class PoolInfo:
     fee: int
     liquidity: int
     sqrt_price_x96: int
+    tick: int | None = None
+    tick_spacing: int | None = None
 
 
 def create_price_info(wei_amount: Wei, eth_price_in_usd: float) -> PriceInfo:
@@ -85,13 +99,47 @@ def get_has_graduated(network_id: str, token_address: str) -> bool:
         bool: True if the token has graduated, False otherwise
 
     """
+    cache = get_token_facts_cache()
+    has_graduated = cache.get_has_graduated(network_id, token_address)
+    if has_graduated is not None:
+        return has_graduated
+
     market_type = SmartContract.read(
         network_id,
         contract_address=token_address,
         method="marketType",
         abi=WOW_ABI,
     )
-    return market_type == 1
+    has_graduated = market_type == 1
+    cache.set_has_graduated(network_id, token_address, has_graduated)
+    return has_graduated
+
+
+async def get_has_graduated_async(network_id: str, token_address: str) -> bool:
+    """Check if a token has graduated from the Zora Wow protocol without blocking the event loop.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Token address, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+
+    Returns:
+        bool: True if the token has graduated, False otherwise
+
+    """
+    cache = get_token_facts_cache()
+    has_graduated = cache.get_has_graduated(network_id, token_address)
+    if has_graduated is not None:
+        return has_graduated
+
+    market_type = await read_contract_async(
+        network_id,
+        contract_address=token_address,
+        method="marketType",
+        abi=WOW_ABI,
+    )
+    has_graduated = market_type == 1
+    cache.set_has_graduated(network_id, token_address, has_graduated)
+    return has_graduated
 
 
 def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
@@ -102,57 +150,37 @@ def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
         pool_address: Uniswap v3 pool address
 
     Returns:
-        PoolInfo: A PoolInfo object containing the token0, balance0, token1, balance1, fee, liquidity, and sqrt_price_x96.
+        PoolInfo: A PoolInfo object containing the token0, balance0, token1, balance1, fee, liquidity, sqrt_price_x96, tick and tick_spacing.
 
     """
     try:
-        # Parallel execution of contract calls
-        token0 = SmartContract.read(
-            network_id,
-            pool_address,
-            "token0",
-            abi=UNISWAP_V3_ABI,
-        )
-        token1 = SmartContract.read(
-            network_id,
-            pool_address,
-            "token1",
-            abi=UNISWAP_V3_ABI,
-        )
-        fee = SmartContract.read(
-            network_id,
-            pool_address,
-            "fee",
-            abi=UNISWAP_V3_ABI,
-        )
-        liquidity = SmartContract.read(
-            network_id,
-            pool_address,
-            "liquidity",
-            abi=UNISWAP_V3_ABI,
-        )
-        slot0 = SmartContract.read(
-            network_id,
-            pool_address,
-            "slot0",
-            abi=UNISWAP_V3_ABI,
-        )
+        # token0, token1, fee and tickSpacing never change, so they are read once and cached.
+        # The remaining fields and both pool balances are then read in a single multicall.
+        cache = get_token_facts_cache()
+        pool_facts = cache.get(network_id, pool_address)
+        if not all(fact in pool_facts for fact in ("token0", "token1", "fee", "tick_spacing")):
+            reader = MulticallReader(network_id)
+            reader.add(pool_address, "token0", UNISWAP_V3_ABI)
+            reader.add(pool_address, "token1", UNISWAP_V3_ABI)
+            reader.add(pool_address, "fee", UNISWAP_V3_ABI)
+            reader.add(pool_address, "tickSpacing", UNISWAP_V3_ABI)
+            token0, token1, fee, tick_spacing = reader.execute()
+            pool_facts = {
+                "token0": token0,
+                "token1": token1,
+                "fee": fee,
+                "tick_spacing": tick_spacing,
+            }
+            cache.update(network_id, pool_address, **pool_facts)
 
-        balance0 = SmartContract.read(
-            network_id,
-            token0,
-            "balanceOf",
-            abi=WOW_ABI,
-            args={"account": pool_address},
-        )
+        token0, token1, fee = pool_facts["token0"], pool_facts["token1"], pool_facts["fee"]
 
-        balance1 = SmartContract.read(
-            network_id,
-            token1,
-            "balanceOf",
-            abi=WOW_ABI,
-            args={"account": pool_address},
-        )
+        reader = MulticallReader(network_id)
+        reader.add(pool_address, "liquidity", UNISWAP_V3_ABI)
+        reader.add(pool_address, "slot0", UNISWAP_V3_ABI)
+        reader.add(token0, "balanceOf", ERC20_BALANCE_OF_ABI, {"account": pool_address})
+        reader.add(token1, "balanceOf", ERC20_BALANCE_OF_ABI, {"account": pool_address})
+        liquidity, slot0, balance0, balance1 = reader.execute()
 
         return PoolInfo(
             token0=token0,
@@ -162,6 +190,8 @@ def get_pool_info(network_id: str, pool_address: str) -> PoolInfo:
             fee=fee,
             liquidity=liquidity,
             sqrt_price_x96=slot0[0],
+            tick=slot0[1],
+            tick_spacing=pool_facts["tick_spacing"],
         )
     except Exception as error:
         raise Exception(f"Failed to fetch pool information: {error!s}") from error
@@ -227,7 +257,8 @@ def get_uniswap_quote(
     utilization = Wei(0)
     insufficient_liquidity = False
 
-    pool_address = get_pool_address(token_address)
+    amount = int(amount)
+    pool_address = get_pool_address(token_address, network_id)
     invalid_pool_error = "Invalid pool address" if not pool_address else None
     print("pool address: " + pool_address)
 
@@ -255,7 +286,9 @@ def get_uniswap_quote(
         insufficient_liquidity = quote_type == "buy" and amount > balance_out
         utilization = Wei(int(amount / balance_out)) if quote_type == "buy" else Wei(0)
 
-        quote_result = exact_input_single(network_id, token_in, token_out, amount, fee)
+        quote_result = _quote_locally(network_id, pool_address, pool_info, token_in, amount)
+        if quote_result is None:
+            quote_result = exact_input_single(network_id, token_in, token_out, amount, fee)
         print("quote_result", quote_result)
     except Exception as error:
         print(f"Error fetching quote: {error}")
@@ -292,15 +325,68 @@ def get_uniswap_quote(
     )
 
 
-def get_pool_address(token_address: str) -> str:
+def _quote_locally(
+    network_id: str, pool_address: str, pool_info: PoolInfo, token_in: str, amount: int
+) -> int | None:
+    """Quote an exact input swap from a snapshot of the pool's ticks.
+
+    Returns None when the snapshot does not cover the swap, in which case the on-chain quoter
+    has to be used instead.
+    """
+    if pool_info.tick is None or not pool_info.tick_spacing:
+        return None
+
+    try:
+        ticks = get_pool_ticks(network_id, pool_address, pool_info)
+        return quote_exact_input(pool_info, ticks, token_in == pool_info.token0, amount)
+    except MissingTickDataError:
+        return None
+    except Exception:
+        logger.warning("Error quoting locally on pool %s", pool_address, exc_info=True)
+        return None
+
+
+def get_pool_ticks(network_id: str, pool_address: str, pool_info: PoolInfo) -> PoolTicks:
+    """Get the initialized ticks around the current tick of a pool.
+
+    Ticks are cached with the pool's facts and reused while the pool's active liquidity is
+    unchanged and its current tick stays within the fetched range.
+
+    Args:
+        network_id (str): Network ID, which is either `base-sepolia` or `base-mainnet`
+        pool_address (str): Uniswap v3 pool address
+        pool_info (PoolInfo): A current snapshot of the pool, with its tick and tick spacing
+
+    Returns:
+        PoolTicks: The initialized ticks and their net liquidity
+
+    """
+    cache = get_token_facts_cache()
+    ticks = cache.get_pool_ticks(network_id, pool_address, pool_info.liquidity, pool_info.tick)
+    if ticks is None:
+        ticks = fetch_pool_ticks(network_id, pool_address, pool_info.tick, pool_info.tick_spacing)
+        cache.set_pool_ticks(network_id, pool_address, ticks, pool_info.liquidity)
+    return ticks
+
+
+def get_pool_address(token_address: str, network_id: str = "base-sepolia") -> str:
     """Fetch the uniswap v3 pool address for a given token.
 
+    The pool address of a token never changes, so it is cached after the first read.
+
     Args:
         token_address (str): The address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        network_id (str): Network ID, which is either `base-sepolia` or `base-mainnet`
 
     Returns:
         str: The uniswap v3 pool address associated with the token.
 
     """
-    pool_address = SmartContract.read("base-sepolia", token_address, "poolAddress", abi=WOW_ABI)
-    return str(pool_address)
+    cache = get_token_facts_cache()
+    pool_address = cache.get(network_id, token_address).get("pool_address")
+    if pool_address is None:
+        pool_address = str(
+            SmartContract.read(network_id, token_address, "poolAddress", abi=WOW_ABI)
+        )
+        cache.update(network_id, token_address, pool_address=pool_address)
+    return pool_address
@@ -0,0 +1,491 @@
+"""Local Uniswap v3 swap quoting.
+
+This is a port of the integer math used by the Uniswap v3 pool contract (`TickMath`,
+`SqrtPriceMath`, `SwapMath` and the tick walk in `UniswapV3Pool.swap`), so quotes computed from a
+snapshot of a pool's state match the on-chain quoter exactly without a round trip per quote.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from cdp_agentkit_core.actions.multicall import MulticallReader
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_V3_ABI
+
+if TYPE_CHECKING:
+    from cdp_agentkit_core.actions.wow.uniswap.index import PoolInfo
+
+Q96 = 1 << 96
+MAX_UINT256 = (1 << 256) - 1
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+FEE_DENOMINATOR = 1_000_000
+
+# Number of tick bitmap words fetched on each side of the current word. Each word covers 256
+# initialized-tick slots, i.e. 256 * tick_spacing ticks.
+TICK_WORD_RADIUS = 2
+
+_TICK_RATIO_MULTIPLIERS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+class MissingTickDataError(Exception):
+    """Raised when a swap walks past the range of ticks fetched for a pool."""
+
+
+@dataclass
+class PoolTicks:
+    """Initialized ticks of a pool within a contiguous range of tick bitmap words.
+
+    `liquidity_net` maps each initialized tick to the liquidity added when the price crosses it
+    from left to right. Words in [min_word, max_word] are known to be complete.
+    """
+
+    tick_spacing: int
+    min_word: int
+    max_word: int
+    liquidity_net: dict[int, int] = field(default_factory=dict)
+
+    def next_initialized_tick_within_one_word(self, tick: int, lte: bool) -> tuple[int, bool]:
+        """Find the next initialized tick in the same bitmap word, mirroring `TickBitmap`.
+
+        Args:
+            tick (int): The starting tick
+            lte (bool): Whether to search to the left (less than or equal) of the starting tick
+
+        Returns:
+            tuple[int, bool]: The next tick, and whether it is initialized. If no initialized tick
+                is found in the word, the word boundary is returned.
+
+        """
+        compressed = tick // self.tick_spacing
+        if not lte:
+            compressed += 1
+
+        word = compressed >> 8
+        if word < self.min_word or word > self.max_word:
+            raise MissingTickDataError(f"Tick bitmap word {word} was not fetched")
+
+        if lte:
+            candidates = [
+                t // self.tick_spacing
+                for t in self.liquidity_net
+                if word << 8 <= t // self.tick_spacing <= compressed
+            ]
+            if candidates:
+                return max(candidates) * self.tick_spacing, True
+            return (word << 8) * self.tick_spacing, False
+
+        candidates = [
+            t // self.tick_spacing
+            for t in self.liquidity_net
+            if compressed <= t // self.tick_spacing <= (word << 8) + 255
+        ]
+        if candidates:
+            return min(candidates) * self.tick_spacing, True
+        return ((word << 8) + 255) * self.tick_spacing, False
+
+
+def mul_div(a: int, b: int, denominator: int) -> int:
+    """Calculate floor(a * b / denominator) with full precision."""
+    return a * b // denominator
+
+
+def mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    """Calculate ceil(a * b / denominator) with full precision."""
+    return -(-a * b // denominator)
+
+
+def div_rounding_up(a: int, b: int) -> int:
+    """Calculate ceil(a / b)."""
+    return -(-a // b)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """Calculate sqrt(1.0001^tick) * 2^96, as `TickMath.getSqrtRatioAtTick`."""
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} is out of range")
+
+    ratio = (
+        0xFFFCB933BD6FAD37AA2D162D1A594001
+        if abs_tick & 0x1
+        else 0x100000000000000000000000000000000
+    )
+    for bit, multiplier in _TICK_RATIO_MULTIPLIERS:
+        if abs_tick & bit:
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """Calculate the greatest tick whose sqrt ratio is at most the given price."""
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"Sqrt price {sqrt_price_x96} is out of range")
+
+    low, high = MIN_TICK, MAX_TICK
+    while low < high:
+        mid = (low + high + 1) // 2
+        if get_sqrt_ratio_at_tick(mid) <= sqrt_price_x96:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def get_amount0_delta(
+    sqrt_ratio_a_x96: int, sqrt_ratio_b_x96: int, liquidity: int, round_up: bool
+) -> int:
+    """Calculate the amount of token0 between two prices, as `SqrtPriceMath.getAmount0Delta`."""
+    if sqrt_ratio_a_x96 > sqrt_ratio_b_x96:
+        sqrt_ratio_a_x96, sqrt_ratio_b_x96 = sqrt_ratio_b_x96, sqrt_ratio_a_x96
+
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_ratio_b_x96 - sqrt_ratio_a_x96
+
+    if round_up:
+        return div_rounding_up(
+            mul_div_rounding_up(numerator1, numerator2, sqrt_ratio_b_x96), sqrt_ratio_a_x96
+        )
+    return mul_div(numerator1, numerator2, sqrt_ratio_b_x96) // sqrt_ratio_a_x96
+
+
+def get_amount1_delta(
+    sqrt_ratio_a_x96: int, sqrt_ratio_b_x96: int, liquidity: int, round_up: bool
+) -> int:
+    """Calculate the amount of token1 between two prices, as `SqrtPriceMath.getAmount1Delta`."""
+    if sqrt_ratio_a_x96 > sqrt_ratio_b_x96:
+        sqrt_ratio_a_x96, sqrt_ratio_b_x96 = sqrt_ratio_b_x96, sqrt_ratio_a_x96
+
+    if round_up:
+        return mul_div_rounding_up(liquidity, sqrt_ratio_b_x96 - sqrt_ratio_a_x96, Q96)
+    return mul_div(liquidity, sqrt_ratio_b_x96 - sqrt_ratio_a_x96, Q96)
+
+
+def _get_next_sqrt_price_from_amount0_rounding_up(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    if amount == 0:
+        return sqrt_price_x96
+
+    numerator1 = liquidity << 96
+    product = amount * sqrt_price_x96
+
+    if add:
+        # The contract uses the precise formula unless the intermediate values overflow 256 bits.
+        if product <= MAX_UINT256 and numerator1 + product <= MAX_UINT256:
+            return mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 + product)
+        return div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount)
+
+    if product > MAX_UINT256 or numerator1 <= product:
+        raise ValueError("Insufficient liquidity for the requested output")
+    return mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 - product)
+
+
+def _get_next_sqrt_price_from_amount1_rounding_down(
+    sqrt_price_x96: int, liquidity: int, amount: int, add: bool
+) -> int:
+    if add:
+        return sqrt_price_x96 + mul_div(amount, Q96, liquidity)
+
+    quotient = mul_div_rounding_up(amount, Q96, liquidity)
+    if sqrt_price_x96 <= quotient:
+        raise ValueError("Insufficient liquidity for the requested output")
+    return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int, liquidity: int, amount_in: int, zero_for_one: bool
+) -> int:
+    """Calculate the price after adding an input amount, as `SqrtPriceMath`."""
+    if zero_for_one:
+        return _get_next_sqrt_price_from_amount0_rounding_up(
+            sqrt_price_x96, liquidity, amount_in, True
+        )
+    return _get_next_sqrt_price_from_amount1_rounding_down(
+        sqrt_price_x96, liquidity, amount_in, True
+    )
+
+
+def get_next_sqrt_price_from_output(
+    sqrt_price_x96: int, liquidity: int, amount_out: int, zero_for_one: bool
+) -> int:
+    """Calculate the price after removing an output amount, as `SqrtPriceMath`."""
+    if zero_for_one:
+        return _get_next_sqrt_price_from_amount1_rounding_down(
+            sqrt_price_x96, liquidity, amount_out, False
+        )
+    return _get_next_sqrt_price_from_amount0_rounding_up(
+        sqrt_price_x96, liquidity, amount_out, False
+    )
+
+
+def compute_swap_step(
+    sqrt_ratio_current_x96: int,
+    sqrt_ratio_target_x96: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> tuple[int, int, int, int]:
+    """Compute a single swap step within one tick range, as `SwapMath.computeSwapStep`.
+
+    Args:
+        sqrt_ratio_current_x96 (int): The current sqrt price
+        sqrt_ratio_target_x96 (int): The sqrt price that cannot be exceeded
+        liquidity (int): The usable liquidity
+        amount_remaining (int): The amount remaining; positive for exact input, negative for exact output
+        fee_pips (int): The fee in hundredths of a bip
+
+    Returns:
+        tuple[int, int, int, int]: The next sqrt price, amount in, amount out and fee amount
+
+    """
+    zero_for_one = sqrt_ratio_current_x96 >= sqrt_ratio_target_x96
+    exact_in = amount_remaining >= 0
+    amount_in = amount_out = 0
+
+    if exact_in:
+        amount_remaining_less_fee = mul_div(
+            amount_remaining, FEE_DENOMINATOR - fee_pips, FEE_DENOMINATOR
+        )
+        amount_in = (
+            get_amount0_delta(sqrt_ratio_target_x96, sqrt_ratio_current_x96, liquidity, True)
+            if zero_for_one
+            else get_amount1_delta(sqrt_ratio_current_x96, sqrt_ratio_target_x96, liquidity, True)
+        )
+        if amount_remaining_less_fee >= amount_in:
+            sqrt_ratio_next_x96 = sqrt_ratio_target_x96
+        else:
+            sqrt_ratio_next_x96 = get_next_sqrt_price_from_input(
+                sqrt_ratio_current_x96, liquidity, amount_remaining_less_fee, zero_for_one
+            )
+    else:
+        amount_out = (
+            get_amount1_delta(sqrt_ratio_target_x96, sqrt_ratio_current_x96, liquidity, False)
+            if zero_for_one
+            else get_amount0_delta(sqrt_ratio_current_x96, sqrt_ratio_target_x96, liquidity, False)
+        )
+        if -amount_remaining >= amount_out:
+            sqrt_ratio_next_x96 = sqrt_ratio_target_x96
+        else:
+            sqrt_ratio_next_x96 = get_next_sqrt_price_from_output(
+                sqrt_ratio_current_x96, liquidity, -amount_remaining, zero_for_one
+            )
+
+    reached_target = sqrt_ratio_target_x96 == sqrt_ratio_next_x96
+
+    if zero_for_one:
+        if not (reached_target and exact_in):
+            amount_in = get_amount0_delta(
+                sqrt_ratio_next_x96, sqrt_ratio_current_x96, liquidity, True
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount1_delta(
+                sqrt_ratio_next_x96, sqrt_ratio_current_x96, liquidity, False
+            )
+    else:
+        if not (reached_target and exact_in):
+            amount_in = get_amount1_delta(
+                sqrt_ratio_current_x96, sqrt_ratio_next_x96, liquidity, True
+            )
+        if not (reached_target and not exact_in):
+            amount_out = get_amount0_delta(
+                sqrt_ratio_current_x96, sqrt_ratio_next_x96, liquidity, False
+            )
+
+    if not exact_in and amount_out > -amount_remaining:
+        amount_out = -amount_remaining
+
+    if exact_in and sqrt_ratio_next_x96 != sqrt_ratio_target_x96:
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = mul_div_rounding_up(amount_in, fee_pips, FEE_DENOMINATOR - fee_pips)
+
+    return sqrt_ratio_next_x96, amount_in, amount_out, fee_amount
+
+
+def simulate_swap(
+    pool: "PoolInfo", ticks: PoolTicks, zero_for_one: bool, amount_specified: int
+) -> tuple[int, int, int]:
+    """Simulate a swap against a pool snapshot, as `UniswapV3Pool.swap` without a price limit.
+
+    Args:
+        pool (PoolInfo): The pool snapshot
+        ticks (PoolTicks): The initialized ticks around the current price
+        zero_for_one (bool): Whether token0 is swapped for token1
+        amount_specified (int): Positive for exact input, negative for exact output
+
+    Returns:
+        tuple[int, int, int]: The amount in (including fees), amount out and final sqrt price
+
+    Raises:
+        MissingTickDataError: If the swap walks past the fetched ticks.
+
+    """
+    if amount_specified == 0:
+        raise ValueError("Amount must not be zero")
+
+    exact_input = amount_specified > 0
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+
+    amount_remaining = amount_specified
+    amount_in_total = 0
+    amount_out_total = 0
+    sqrt_price_x96 = pool.sqrt_price_x96
+    tick = pool.tick if pool.tick is not None else get_tick_at_sqrt_ratio(sqrt_price_x96)
+    liquidity = pool.liquidity
+
+    while amount_remaining != 0 and sqrt_price_x96 != sqrt_price_limit_x96:
+        sqrt_price_start_x96 = sqrt_price_x96
+
+        tick_next, initialized = ticks.next_initialized_tick_within_one_word(tick, zero_for_one)
+        tick_next = min(max(tick_next, MIN_TICK), MAX_TICK)
+        sqrt_price_next_x96 = get_sqrt_ratio_at_tick(tick_next)
+
+        if (zero_for_one and sqrt_price_next_x96 < sqrt_price_limit_x96) or (
+            not zero_for_one and sqrt_price_next_x96 > sqrt_price_limit_x96
+        ):
+            sqrt_price_target_x96 = sqrt_price_limit_x96
+        else:
+            sqrt_price_target_x96 = sqrt_price_next_x96
+
+        sqrt_price_x96, step_in, step_out, step_fee = compute_swap_step(
+            sqrt_price_x96, sqrt_price_target_x96, liquidity, amount_remaining, pool.fee
+        )
+
+        if exact_input:
+            amount_remaining -= step_in + step_fee
+        else:
+            amount_remaining += step_out
+        amount_in_total += step_in + step_fee
+        amount_out_total += step_out
+
+        if sqrt_price_x96 == sqrt_price_next_x96:
+            if initialized:
+                liquidity_net = ticks.liquidity_net[tick_next]
+                liquidity += -liquidity_net if zero_for_one else liquidity_net
+            tick = tick_next - 1 if zero_for_one else tick_next
+        elif sqrt_price_x96 != sqrt_price_start_x96:
+            tick = get_tick_at_sqrt_ratio(sqrt_price_x96)
+
+    return amount_in_total, amount_out_total, sqrt_price_x96
+
+
+def quote_exact_input(
+    pool: "PoolInfo", ticks: PoolTicks, zero_for_one: bool, amount_in: int
+) -> int:
+    """Quote the output of swapping an exact input amount.
+
+    Args:
+        pool (PoolInfo): The pool snapshot
+        ticks (PoolTicks): The initialized ticks around the current price
+        zero_for_one (bool): Whether token0 is swapped for token1
+        amount_in (int): The exact input amount, in atomic units
+
+    Returns:
+        int: The output amount, in atomic units
+
+    """
+    _, amount_out, _ = simulate_swap(pool, ticks, zero_for_one, amount_in)
+    return amount_out
+
+
+def quote_exact_output(
+    pool: "PoolInfo", ticks: PoolTicks, zero_for_one: bool, amount_out: int
+) -> int:
+    """Quote the input required to receive an exact output amount.
+
+    Args:
+        pool (PoolInfo): The pool snapshot
+        ticks (PoolTicks): The initialized ticks around the current price
+        zero_for_one (bool): Whether token0 is swapped for token1
+        amount_out (int): The exact output amount, in atomic units
+
+    Returns:
+        int: The input amount including fees, in atomic units
+
+    Raises:
+        ValueError: If the pool cannot provide the full output amount.
+
+    """
+    amount_in, received, _ = simulate_swap(pool, ticks, zero_for_one, -amount_out)
+    if received != amount_out:
+        raise ValueError("Insufficient liquidity for the requested output")
+    return amount_in
+
+
+def fetch_pool_ticks(
+    network_id: str,
+    pool_address: str,
+    tick: int,
+    tick_spacing: int,
+    word_radius: int = TICK_WORD_RADIUS,
+) -> PoolTicks:
+    """Fetch the initialized ticks around the current tick of a pool with two multicalls.
+
+    Args:
+        network_id (str): The network ID, such as `base-sepolia`
+        pool_address (str): The uniswap v3 pool address
+        tick (int): The current tick of the pool
+        tick_spacing (int): The tick spacing of the pool
+        word_radius (int): The number of bitmap words to fetch on each side of the current word
+
+    Returns:
+        PoolTicks: The initialized ticks and their net liquidity
+
+    """
+    center_word = (tick // tick_spacing) >> 8
+    words = range(center_word - word_radius, center_word + word_radius + 1)
+
+    reader = MulticallReader(network_id)
+    for word in words:
+        reader.add(pool_address, "tickBitmap", UNISWAP_V3_ABI, {"wordPosition": word})
+    bitmaps = reader.execute()
+
+    initialized_ticks = [
+        ((word << 8) + bit) * tick_spacing
+        for word, bitmap in zip(words, bitmaps, strict=True)
+        for bit in range(256)
+        if bitmap >> bit & 1
+    ]
+
+    reader = MulticallReader(network_id)
+    for initialized_tick in initialized_ticks:
+        reader.add(pool_address, "ticks", UNISWAP_V3_ABI, {"tick": initialized_tick})
+    tick_infos = reader.execute()
+
+    return PoolTicks(
+        tick_spacing=tick_spacing,
+        min_word=words[0],
+        max_word=words[-1],
+        liquidity_net={
+            initialized_tick: tick_info[1]
+            for initialized_tick, tick_info in zip(initialized_ticks, tick_infos, strict=True)
+        },
+    )
@@ -1,24 +1,59 @@
+import asyncio
+from typing import Literal
+
 from cdp import SmartContract
 
+from cdp_agentkit_core.actions.multicall import MulticallReader
+from cdp_agentkit_core.actions.utils import read_contract_async
+from cdp_agentkit_core.actions.wow import bonding_curve
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
-from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated, get_uniswap_quote
+from cdp_agentkit_core.actions.wow.token_facts import get_token_facts_cache
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    get_has_graduated_async,
+    get_uniswap_quote,
+)
 
 
-def get_current_supply(token_address):
+def get_current_supply(token_address, network_id: str = "base-sepolia"):
     """Get the current supply of a token.
 
+    The supply is cached for a few seconds, so bursts of quotes for the same token share a read.
+
     Args:
         token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
 
     """
-    test = SmartContract.read(
-        "base-sepolia",
-        token_address,
-        "totalSupply",
-        WOW_ABI,
-    )
-    print(test)
-    return test
+    cache = get_token_facts_cache()
+    total_supply = cache.get_total_supply(network_id, token_address)
+    if total_supply is None:
+        total_supply = int(SmartContract.read(network_id, token_address, "totalSupply", WOW_ABI))
+        cache.set_total_supply(network_id, token_address, total_supply)
+    return total_supply
+
+
+async def get_current_supply_async(token_address, network_id: str = "base-sepolia"):
+    """Get the current supply of a token without blocking the event loop.
+
+    Args:
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+
+    """
+    cache = get_token_facts_cache()
+    total_supply = cache.get_total_supply(network_id, token_address)
+    if total_supply is None:
+        total_supply = int(
+            await read_contract_async(network_id, token_address, "totalSupply", abi=WOW_ABI)
+        )
+        cache.set_total_supply(network_id, token_address, total_supply)
+    return total_supply
+
+
+_CURVE_QUOTE_METHODS = {
+    "buy": ("getEthBuyQuote", "ethOrderSize"),
+    "sell": ("getTokenSellQuote", "tokenOrderSize"),
+}
 
 
 def get_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str):
@@ -30,18 +65,7 @@ def get_buy_quote(network_id: str, token_address: str, amount_eth_in_wei: str):
         amount_eth_in_wei: Amount of ETH to buy (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
 
     """
-    has_graduated = get_has_graduated(network_id, token_address)
-    token_quote = (
-        has_graduated
-        and (get_uniswap_quote(network_id, token_address, amount_eth_in_wei, "buy")).amount_out
-    ) or SmartContract.read(
-        network_id,
-        token_address,
-        "getEthBuyQuote",
-        abi=WOW_ABI,
-        args={"ethOrderSize": str(amount_eth_in_wei)},
-    )
-    return token_quote
+    return _get_quote(network_id, token_address, amount_eth_in_wei, "buy")
 
 
 def get_sell_quote(network_id: str, token_address: str, amount_tokens_in_wei: str):
@@ -53,15 +77,123 @@ def get_sell_quote(network_id: str, token_address: str, amount_tokens_in_wei: st
         amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
 
     """
-    has_graduated = get_has_graduated(network_id, token_address)
-    token_quote = (
-        has_graduated
-        and (get_uniswap_quote(network_id, token_address, amount_tokens_in_wei, "sell")).amount_out
-    ) or SmartContract.read(
+    return _get_quote(network_id, token_address, amount_tokens_in_wei, "sell")
+
+
+def _get_quote(
+    network_id: str,
+    token_address: str,
+    amount_in_wei: str,
+    quote_type: Literal["buy", "sell"],
+):
+    cache = get_token_facts_cache()
+    has_graduated = cache.get_has_graduated(network_id, token_address)
+
+    if has_graduated is None:
+        # Read the market type and the total supply in one round trip.
+        reader = MulticallReader(network_id)
+        reader.add(token_address, "marketType", WOW_ABI)
+        reader.add(token_address, "totalSupply", WOW_ABI)
+        market_type, total_supply = reader.execute()
+        has_graduated = market_type == 1
+        cache.set_has_graduated(network_id, token_address, has_graduated)
+        cache.set_total_supply(network_id, token_address, total_supply)
+
+    if has_graduated:
+        token_quote = get_uniswap_quote(network_id, token_address, amount_in_wei, quote_type)
+        if token_quote.amount_out:
+            return token_quote.amount_out
+        curve_method, curve_arg = _CURVE_QUOTE_METHODS[quote_type]
+        return SmartContract.read(
+            network_id,
+            token_address,
+            curve_method,
+            abi=WOW_ABI,
+            args={curve_arg: str(amount_in_wei)},
+        )
+
+    return _get_curve_quote(
         network_id,
-        token_address,
-        "getTokenSellQuote",
-        WOW_ABI,
-        args={"tokenOrderSize": str(amount_tokens_in_wei)},
+        quote_type,
+        get_current_supply(token_address, network_id),
+        int(amount_in_wei),
+    )
+
+
+def _get_curve_quote(
+    network_id: str, quote_type: Literal["buy", "sell"], total_supply: int, amount_in_wei: int
+) -> int:
+    local_quote = (
+        bonding_curve.get_eth_buy_quote(total_supply, amount_in_wei)
+        if quote_type == "buy"
+        else bonding_curve.get_token_sell_quote(total_supply, amount_in_wei)
+    )
+    return bonding_curve.get_bonding_curve_cross_check().check(
+        network_id, quote_type, total_supply, amount_in_wei, local_quote
+    )
+
+
+async def get_buy_quote_async(network_id: str, token_address: str, amount_eth_in_wei: str):
+    """Get quote for buying tokens without blocking the event loop.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_eth_in_wei: Amount of ETH to buy (in wei), meaning 1 is 1 wei or 0.000000000000000001 of ETH
+
+    """
+    has_graduated = await get_has_graduated_async(network_id, token_address)
+    token_quote = None
+    if has_graduated:
+        quote = await asyncio.to_thread(
+            get_uniswap_quote, network_id, token_address, amount_eth_in_wei, "buy"
+        )
+        token_quote = quote.amount_out
+    if token_quote:
+        return token_quote
+    if has_graduated:
+        return await read_contract_async(
+            network_id,
+            token_address,
+            "getEthBuyQuote",
+            abi=WOW_ABI,
+            args={"ethOrderSize": str(amount_eth_in_wei)},
+        )
+
+    total_supply = await get_current_supply_async(token_address, network_id)
+    return await asyncio.to_thread(
+        _get_curve_quote, network_id, "buy", total_supply, int(amount_eth_in_wei)
+    )
+
+
+async def get_sell_quote_async(network_id: str, token_address: str, amount_tokens_in_wei: str):
+    """Get quote for selling tokens without blocking the event loop.
+
+    Args:
+        network_id: Network ID, which is either `base-sepolia` or `base-mainnet`
+        token_address: Address of the token contract, such as `0x036CbD53842c5426634e7929541eC2318f3dCF7e`
+        amount_tokens_in_wei (str): Amount of tokens to sell (in wei), meaning 1 is 1 wei or 0.000000000000000001 of the token
+
+    """
+    has_graduated = await get_has_graduated_async(network_id, token_address)
+    token_quote = None
+    if has_graduated:
+        quote = await asyncio.to_thread(
+            get_uniswap_quote, network_id, token_address, amount_tokens_in_wei, "sell"
+        )
+        token_quote = quote.amount_out
+    if token_quote:
+        return token_quote
+    if has_graduated:
+        return await read_contract_async(
+            network_id,
+            token_address,
+            "getTokenSellQuote",
+            abi=WOW_ABI,
+            args={"tokenOrderSize": str(amount_tokens_in_wei)},
+        )
+
+    total_supply = await get_current_supply_async(token_address, network_id)
+    return await asyncio.to_thread(
+        _get_curve_quote, network_id, "sell", total_supply, int(amount_tokens_in_wei)
     )
-    return token_quote
@@ -4,6 +4,8 @@ from cdp import Wallet
 from pydantic import BaseModel, Field
 
 from cdp_agentkit_core.actions import CdpAction
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 
 WETH_ADDRESS = "0x4200000000000000000000000000000000000006"
 
@@ -70,14 +72,18 @@ def wrap_eth(wallet: Wallet, amount_to_wrap: str) -> str:
 
     """
     try:
-        invocation = wallet.invoke_contract(
-            contract_address=WETH_ADDRESS,
-            method="deposit",
-            abi=WETH_ABI,
-            args={},
-            amount=amount_to_wrap,
-            asset_id="wei",
-        )
+        with wallet_submission(wallet):
+            invocation = wallet.invoke_contract(
+                contract_address=WETH_ADDRESS,
+                method="deposit",
+                abi=WETH_ABI,
+                args={},
+                amount=amount_to_wrap,
+                asset_id="wei",
+            )
+        tracker = get_transaction_tracker()
+        if tracker is not None:
+            return tracker.submit(invocation, f"wrap of {amount_to_wrap} wei of ETH")
         result = invocation.wait()
         return f"Wrapped ETH with transaction hash: {result.transaction.transaction_hash}"
     except Exception as e:
@@ -0,0 +1,170 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from cdp_agentkit_core.actions.pyth.catalog import (
+    PRICE_FEED_CATALOG_VERSION,
+    PriceFeedCatalog,
+    default_price_feed_catalog_path,
+)
+
+MOCK_SESSION_PATH = "cdp_agentkit_core.actions.pyth.catalog.get_hermes_session"
+
+
+def _feed(feed_id, base, quote):
+    return {
+        "id": feed_id,
+        "type": "price_feed",
+        "attributes": {"base": base, "quote": quote, "asset_type": "crypto"},
+    }
+
+
+MOCK_FEEDS = [
+    _feed("aa" * 32, "BTC", "EUR"),
+    _feed("bb" * 32, "BTC", "USD"),
+    _feed("cc" * 32, "ETH", "USD"),
+    _feed("dd" * 32, "STETH", "ETH"),
+]
+
+
+def _mock_session(mock_session, feeds=MOCK_FEEDS):
+    mock_get = mock_session.return_value.get
+    mock_get.return_value.json.return_value = feeds
+    mock_get.return_value.raise_for_status.return_value = None
+    return mock_get
+
+
+def test_catalog_lookups_download_once():
+    """Test that every lookup is answered from a single download of the catalog."""
+    catalog = PriceFeedCatalog()
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        mock_get = _mock_session(mock_session)
+
+        assert catalog.get_price_feed_id("btc") == "bb" * 32
+        assert catalog.get_price_feed_id("BTC", quote_symbol="EUR") == "aa" * 32
+        assert catalog.get_price_feed_id("STETH") == "dd" * 32
+        assert catalog.get_price_feed_id("DOGE") is None
+        assert catalog.get_price_feed_ids(["ETH", "BTC", "DOGE"]) == {
+            "ETH": "cc" * 32,
+            "BTC": "bb" * 32,
+            "DOGE": None,
+        }
+        assert catalog.get("0x" + "CC" * 32) == MOCK_FEEDS[2]
+        assert catalog.find_by_base("BTC") == MOCK_FEEDS[:2]
+        assert catalog.find_by_quote("usd") == [MOCK_FEEDS[1], MOCK_FEEDS[2]]
+
+    mock_get.assert_called_once()
+
+
+def test_concurrent_first_lookups_download_once():
+    """Test that lookups racing on an empty catalog share a single download."""
+    catalog = PriceFeedCatalog()
+    release = threading.Event()
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        mock_get = _mock_session(mock_session)
+        response = mock_get.return_value
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return response
+
+        mock_get.side_effect = slow_get
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(catalog.get_price_feed_id, "ETH") for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            assert [future.result() for future in futures] == ["cc" * 32] * 4
+
+    mock_get.assert_called_once()
+
+
+def test_catalog_persists_to_disk(tmp_path):
+    """Test that a downloaded catalog is written through and reloaded without a request."""
+    path = tmp_path / "pyth_price_feeds.json"
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        _mock_session(mock_session)
+        assert PriceFeedCatalog(path).get_price_feed_id("ETH") == "cc" * 32
+
+    data = json.loads(path.read_text())
+    assert data["version"] == PRICE_FEED_CATALOG_VERSION
+    assert data["feeds"] == MOCK_FEEDS
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        assert PriceFeedCatalog(path).get_price_feed_id("ETH") == "cc" * 32
+
+    mock_session.assert_not_called()
+
+
+def test_catalog_ignores_corrupt_file(tmp_path):
+    """Test that an unreadable catalog file is replaced by a fresh download."""
+    path = tmp_path / "pyth_price_feeds.json"
+    path.write_text("{not json")
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        mock_get = _mock_session(mock_session)
+        assert PriceFeedCatalog(path).get_price_feed_id("BTC") == "bb" * 32
+
+    mock_get.assert_called_once()
+    assert json.loads(path.read_text())["feeds"] == MOCK_FEEDS
+
+
+def test_stale_catalog_is_served_while_refreshing(tmp_path):
+    """Test that a stale catalog answers lookups while a background refresh swaps in new feeds."""
+    path = tmp_path / "pyth_price_feeds.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": PRICE_FEED_CATALOG_VERSION,
+                "fetched_at": time.time() - 60,
+                "feeds": MOCK_FEEDS,
+            }
+        )
+    )
+    catalog = PriceFeedCatalog(path, ttl_seconds=30)
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        mock_get = _mock_session(mock_session, [*MOCK_FEEDS, _feed("ee" * 32, "SOL", "USD")])
+
+        assert catalog.get_price_feed_id("SOL") is None
+        catalog._refresh_thread.join(timeout=5)
+
+        assert catalog.get_price_feed_id("SOL") == "ee" * 32
+
+    mock_get.assert_called_once()
+
+
+def test_failed_background_refresh_keeps_stale_catalog(tmp_path, caplog):
+    """Test that a failed refresh leaves the stale catalog in place."""
+    path = tmp_path / "pyth_price_feeds.json"
+    path.write_text(
+        json.dumps(
+            {
+                "version": PRICE_FEED_CATALOG_VERSION,
+                "fetched_at": 0,
+                "feeds": MOCK_FEEDS,
+            }
+        )
+    )
+    catalog = PriceFeedCatalog(path, ttl_seconds=30)
+
+    with patch(MOCK_SESSION_PATH) as mock_session:
+        mock_session.return_value.get.side_effect = ConnectionError("offline")
+
+        assert catalog.get_price_feed_id("ETH") == "cc" * 32
+        catalog._refresh_thread.join(timeout=5)
+
+        assert catalog.get_price_feed_id("ETH") == "cc" * 32
+    assert "Error refreshing Pyth price feed catalog" in caplog.text
+
+
+def test_default_price_feed_catalog_path(monkeypatch, tmp_path):
+    """Test that the catalog is stored under CDP_AGENTKIT_CACHE_DIR."""
+    monkeypatch.setenv("CDP_AGENTKIT_CACHE_DIR", str(tmp_path))
+
+    assert default_price_feed_catalog_path() == tmp_path / "pyth_price_feeds.json"
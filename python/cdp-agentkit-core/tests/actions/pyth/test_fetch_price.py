@@ -1,12 +1,16 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 import requests
 
 from cdp_agentkit_core.actions.pyth.fetch_price import (
     PythFetchPriceInput,
+    format_price,
     pyth_fetch_price,
+    pyth_fetch_price_async,
 )
+from cdp_agentkit_core.actions.pyth.hermes import HERMES_TIMEOUT
 
 MOCK_PRICE_FEED_ID = "valid-price-feed-id"
 
@@ -36,26 +40,81 @@ def test_pyth_fetch_price_success():
                     "expo": -2,
                     "conf": "1234",
                 },
-                "id": "test_feed_id",
+                "id": MOCK_PRICE_FEED_ID,
             }
         ]
     }
 
-    with patch("requests.get") as mock_get:
+    with patch("cdp_agentkit_core.actions.pyth.hermes.get_hermes_session") as mock_get_session:
+        mock_get = mock_get_session.return_value.get
         mock_get.return_value.json.return_value = mock_response
         mock_get.return_value.raise_for_status.return_value = None
 
         result = pyth_fetch_price(MOCK_PRICE_FEED_ID)
 
         assert result == "42123.45"
+        mock_get.assert_called_once_with(
+            "https://hermes.pyth.network/v2/updates/price/latest",
+            params=[("ids[]", MOCK_PRICE_FEED_ID)],
+            timeout=HERMES_TIMEOUT,
+        )
+
+
+def test_pyth_fetch_price_not_found():
+    """Test pyth fetch price when Hermes returns no price for the feed."""
+    with patch("cdp_agentkit_core.actions.pyth.hermes.get_hermes_session") as mock_get_session:
+        mock_get_session.return_value.get.return_value.json.return_value = {"parsed": []}
+
+        with pytest.raises(ValueError, match="No price data found"):
+            pyth_fetch_price(MOCK_PRICE_FEED_ID)
 
 
 def test_pyth_fetch_price_http_error():
     """Test pyth fetch price error with HTTP error."""
-    with patch("requests.get") as mock_get:
+    with patch("cdp_agentkit_core.actions.pyth.hermes.get_hermes_session") as mock_get_session:
+        mock_get = mock_get_session.return_value.get
         mock_get.return_value.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found"
         )
 
         with pytest.raises(requests.exceptions.HTTPError):
             pyth_fetch_price(MOCK_PRICE_FEED_ID)
+
+
+def test_pyth_fetch_price_async_success():
+    """Test successful pyth fetch price on the event loop."""
+    mock_response = {
+        "parsed": [
+            {"id": MOCK_PRICE_FEED_ID, "price": {"price": "4212345", "expo": -2, "conf": "1234"}}
+        ]
+    }
+
+    with patch("aiohttp.ClientSession") as mock_session_cls:
+        mock_session = mock_session_cls.return_value
+        mock_session.closed = False
+        mock_session.get = MagicMock()
+        mock_http_response = mock_session.get.return_value.__aenter__.return_value
+        mock_http_response.raise_for_status = Mock()
+        mock_http_response.json = AsyncMock(return_value=mock_response)
+
+        result = asyncio.run(pyth_fetch_price_async(MOCK_PRICE_FEED_ID))
+
+        assert result == "42123.45"
+        mock_session.get.assert_called_once_with(
+            "https://hermes.pyth.network/v2/updates/price/latest",
+            params=[("ids[]", MOCK_PRICE_FEED_ID)],
+        )
+
+
+@pytest.mark.parametrize(
+    ("price", "exponent", "expected"),
+    [
+        (4212345, -2, "42123.45"),
+        (5, -8, "0.00"),
+        (123456789, -8, "1.23"),
+        (42, 0, "42"),
+    ],
+)
+def test_format_price(price, exponent, expected):
+    """Test formatting of raw Pyth prices."""
+    assert format_price(price, exponent) == expected
@@ -0,0 +1,96 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from cdp_agentkit_core.actions.pyth.fetch_prices import (
+    PythFetchPricesInput,
+    pyth_fetch_prices,
+    pyth_fetch_prices_async,
+)
+from cdp_agentkit_core.actions.pyth.hermes import HERMES_TIMEOUT
+
+MOCK_BTC_FEED_ID = "0xe62df6c8b4a85fe1a67db44dc12de5db330f7ac66b72dc658afedf0f4a415b43"
+MOCK_ETH_FEED_ID = "ff61491a931112ddf1bd8147cd1b641375f79f5825126d665480874634fd0ace"
+MOCK_UNKNOWN_FEED_ID = "0000000000000000000000000000000000000000000000000000000000000000"
+
+MOCK_RESPONSE = {
+    "parsed": [
+        {
+            "id": MOCK_BTC_FEED_ID[2:],
+            "price": {"price": "9712345678901", "expo": -8, "conf": "1", "publish_time": 1},
+        },
+        {
+            "id": MOCK_ETH_FEED_ID,
+            "price": {"price": "312345", "expo": -2, "conf": "1", "publish_time": 1},
+        },
+    ]
+}
+
+
+def test_pyth_fetch_prices_input_model_valid():
+    """Test that PythFetchPricesInput accepts valid parameters."""
+    input_model = PythFetchPricesInput(price_feed_ids=[MOCK_BTC_FEED_ID, MOCK_ETH_FEED_ID])
+
+    assert input_model.price_feed_ids == [MOCK_BTC_FEED_ID, MOCK_ETH_FEED_ID]
+
+
+def test_pyth_fetch_prices_input_model_empty():
+    """Test that PythFetchPricesInput requires at least one price feed ID."""
+    with pytest.raises(ValueError):
+        PythFetchPricesInput(price_feed_ids=[])
+
+
+def test_pyth_fetch_prices_success():
+    """Test fetching many prices with one request."""
+    feed_ids = [MOCK_BTC_FEED_ID, MOCK_ETH_FEED_ID, MOCK_UNKNOWN_FEED_ID]
+
+    with patch("cdp_agentkit_core.actions.pyth.hermes.get_hermes_session") as mock_get_session:
+        mock_get = mock_get_session.return_value.get
+        mock_get.return_value.json.return_value = MOCK_RESPONSE
+
+        result = pyth_fetch_prices(feed_ids)
+
+    assert json.loads(result) == {
+        MOCK_BTC_FEED_ID: "97123.45",
+        MOCK_ETH_FEED_ID: "3123.45",
+        MOCK_UNKNOWN_FEED_ID: None,
+    }
+    mock_get.assert_called_once_with(
+        "https://hermes.pyth.network/v2/updates/price/latest",
+        params=[("ids[]", feed_id) for feed_id in feed_ids],
+        timeout=HERMES_TIMEOUT,
+    )
+
+
+def test_pyth_fetch_prices_chunks_large_batches():
+    """Test that batches beyond the per-request limit are split across requests."""
+    feed_ids = [f"{i:064x}" for i in range(5)]
+
+    with (
+        patch("cdp_agentkit_core.actions.pyth.hermes.MAX_FEEDS_PER_REQUEST", 2),
+        patch("cdp_agentkit_core.actions.pyth.hermes.get_hermes_session") as mock_get_session,
+    ):
+        mock_get = mock_get_session.return_value.get
+        mock_get.return_value.json.return_value = {"parsed": []}
+
+        pyth_fetch_prices(feed_ids)
+
+    assert mock_get.call_count == 3
+
+
+def test_pyth_fetch_prices_async_success():
+    """Test fetching many prices on the event loop."""
+    with patch("aiohttp.ClientSession") as mock_session_cls:
+        mock_session = mock_session_cls.return_value
+        mock_session.closed = False
+        mock_session.get = MagicMock()
+        mock_http_response = mock_session.get.return_value.__aenter__.return_value
+        mock_http_response.raise_for_status = Mock()
+        mock_http_response.json = AsyncMock(return_value=MOCK_RESPONSE)
+
+        result = asyncio.run(pyth_fetch_prices_async([MOCK_BTC_FEED_ID, MOCK_ETH_FEED_ID]))
+
+    assert json.loads(result) == {MOCK_BTC_FEED_ID: "97123.45", MOCK_ETH_FEED_ID: "3123.45"}
+    mock_session.get.assert_called_once()
@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import aiohttp
+import pytest
+
+from cdp_agentkit_core.actions.pyth.hermes import (
+    HERMES_RETRIES,
+    close_hermes_async_session,
+    fetch_price_updates_async,
+    get_hermes_async_session,
+    get_hermes_session,
+)
+
+MOCK_PRICE_FEED_ID = "0x" + "ab" * 32
+MOCK_PRICE = {"price": "100", "expo": -2, "conf": "1", "publish_time": 1}
+
+
+def test_get_hermes_session_is_shared_and_retries():
+    """Test that one pooled session with retries is reused across calls."""
+    session = get_hermes_session()
+
+    assert get_hermes_session() is session
+    assert session.get_adapter("https://hermes.pyth.network").max_retries.total == HERMES_RETRIES
+
+
+def test_get_hermes_async_session_is_shared_per_event_loop():
+    """Test that one aiohttp session is reused on a loop and each loop gets its own."""
+
+    async def sessions():
+        session = get_hermes_async_session()
+        assert get_hermes_async_session() is session
+        await close_hermes_async_session()
+        assert session.closed
+        replacement = get_hermes_async_session()
+        assert replacement is not session
+        await close_hermes_async_session()
+        return session
+
+    assert asyncio.run(sessions()) is not asyncio.run(sessions())
+
+
+def _mock_aiohttp_session(mock_session_cls, responses):
+    mock_session = mock_session_cls.return_value
+    mock_session.closed = False
+    mock_session.get = MagicMock()
+    contexts = []
+    for response in responses:
+        context = MagicMock()
+        if isinstance(response, Exception):
+            context.__aenter__ = AsyncMock(side_effect=response)
+        else:
+            mock_response = MagicMock()
+            mock_response.raise_for_status = Mock()
+            mock_response.json = AsyncMock(return_value=response)
+            context.__aenter__ = AsyncMock(return_value=mock_response)
+        contexts.append(context)
+    mock_session.get.side_effect = contexts
+    return mock_session
+
+
+def test_fetch_price_updates_async_retries_connection_errors():
+    """Test that a dropped connection is retried with backoff."""
+    with (
+        patch("aiohttp.ClientSession") as mock_session_cls,
+        patch("asyncio.sleep", new=AsyncMock()) as mock_sleep,
+    ):
+        mock_session = _mock_aiohttp_session(
+            mock_session_cls,
+            [
+                aiohttp.ClientConnectionError("reset"),
+                {"parsed": [{"id": MOCK_PRICE_FEED_ID[2:], "price": MOCK_PRICE}]},
+            ],
+        )
+
+        updates = asyncio.run(fetch_price_updates_async([MOCK_PRICE_FEED_ID]))
+
+    assert updates == {MOCK_PRICE_FEED_ID: MOCK_PRICE}
+    assert mock_session.get.call_count == 2
+    mock_sleep.assert_awaited_once()
+
+
+def test_fetch_price_updates_async_does_not_retry_client_errors():
+    """Test that a 4xx response other than 429 fails immediately."""
+    error = aiohttp.ClientResponseError(MagicMock(), (), status=400)
+
+    with (
+        patch("aiohttp.ClientSession") as mock_session_cls,
+        patch("asyncio.sleep", new=AsyncMock()),
+    ):
+        mock_session = _mock_aiohttp_session(mock_session_cls, [error])
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            asyncio.run(fetch_price_updates_async([MOCK_PRICE_FEED_ID]))
+
+    assert mock_session.get.call_count == 1
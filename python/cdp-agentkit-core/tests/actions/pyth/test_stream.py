@@ -0,0 +1,196 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from cdp_agentkit_core.actions.pyth.fetch_price import pyth_fetch_price
+from cdp_agentkit_core.actions.pyth.fetch_prices import pyth_fetch_prices
+from cdp_agentkit_core.actions.pyth.stream import PriceStream, set_price_stream
+
+MOCK_BTC_ID = "aa" * 32
+MOCK_ETH_ID = "bb" * 32
+
+
+class _SseServer(ThreadingHTTPServer):
+    """Local stand-in for the Hermes price update stream.
+
+    Each connection receives the queued events, then the connection is closed after `hold`
+    seconds to exercise reconnects.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SseHandler)
+        self.events: list[dict] = []
+        self.hold = 5.0
+        self.closing = False
+        self.requests: list[dict] = []
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _SseHandler(BaseHTTPRequestHandler):
+    # Hermes streams events with chunked transfer encoding, one event per chunk.
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        parsed = urlparse(self.path)
+        self.server.requests.append({"path": parsed.path, "query": parse_qs(parsed.query)})
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for event in list(self.server.events):
+            self._write_chunk(f"data:{json.dumps(event)}\n\n".encode())
+        # Keep the stream live with comment lines, as Hermes publishes continuously.
+        deadline = time.time() + self.server.hold
+        while time.time() < deadline and not self.server.closing:
+            self._write_chunk(b":\n\n")
+            time.sleep(0.05)
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _update(price_feed_id, price, publish_time=None):
+    return {
+        "id": price_feed_id,
+        "price": {
+            "price": str(price),
+            "conf": "1",
+            "expo": -2,
+            "publish_time": int(time.time()) if publish_time is None else publish_time,
+        },
+    }
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return
+        time.sleep(0.01)
+    raise AssertionError("Timed out waiting for the price stream")
+
+
+@pytest.fixture
+def sse_server():
+    """Serve price update events on a local port."""
+    server = _SseServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.closing = True
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def price_stream(sse_server):
+    """Subscribe to the local stream and serve Pyth prices from it."""
+    stream = PriceStream(["0x" + MOCK_BTC_ID, MOCK_ETH_ID], hermes_url=sse_server.url)
+    set_price_stream(stream)
+    yield stream
+    set_price_stream(None)
+    stream.stop(timeout=5)
+
+
+def test_price_stream_subscribes_to_feeds(sse_server, price_stream):
+    """Test that the stream subscribes to the parsed updates of every feed."""
+    sse_server.events = [{"binary": {}, "parsed": [_update(MOCK_BTC_ID, 4212345)]}]
+    price_stream.start()
+
+    _wait_for(lambda: price_stream.get(MOCK_BTC_ID) is not None)
+
+    assert sse_server.requests[0] == {
+        "path": "/v2/updates/price/stream",
+        "query": {"ids[]": [MOCK_BTC_ID, MOCK_ETH_ID], "parsed": ["true"]},
+    }
+    assert price_stream.get("0x" + MOCK_BTC_ID.upper())["price"] == "4212345"
+
+
+def test_pyth_fetch_price_answers_from_stream(sse_server, price_stream):
+    """Test that fresh streamed prices are served without an HTTP request."""
+    sse_server.events = [
+        {"parsed": [_update(MOCK_BTC_ID, 4212345)]},
+        {"parsed": [_update(MOCK_BTC_ID, 4212399), _update(MOCK_ETH_ID, 250000)]},
+    ]
+    price_stream.start()
+    _wait_for(lambda: price_stream.get(MOCK_ETH_ID) is not None)
+
+    with patch("cdp_agentkit_core.actions.pyth.fetch_price.fetch_price_updates") as mock_fetch:
+        assert pyth_fetch_price(MOCK_BTC_ID) == "42123.99"
+
+    mock_fetch.assert_not_called()
+
+
+def test_pyth_fetch_price_falls_back_to_http_when_stale(sse_server, price_stream):
+    """Test that stale or missing streamed prices are fetched over HTTP."""
+    sse_server.events = [{"parsed": [_update(MOCK_BTC_ID, 4212345, publish_time=1)]}]
+    price_stream.start()
+    _wait_for(lambda: MOCK_BTC_ID in price_stream._prices)
+
+    with patch(
+        "cdp_agentkit_core.actions.pyth.fetch_price.fetch_price_updates",
+        return_value={MOCK_BTC_ID: _update(MOCK_BTC_ID, 100)["price"]},
+    ) as mock_fetch:
+        assert pyth_fetch_price(MOCK_BTC_ID) == "1.00"
+
+    mock_fetch.assert_called_once_with([MOCK_BTC_ID])
+
+
+def test_pyth_fetch_prices_fetches_only_missing_feeds(sse_server, price_stream):
+    """Test that only feeds without a fresh streamed price are fetched over HTTP."""
+    sse_server.events = [{"parsed": [_update(MOCK_BTC_ID, 4212345)]}]
+    price_stream.start()
+    _wait_for(lambda: price_stream.get(MOCK_BTC_ID) is not None)
+
+    with patch(
+        "cdp_agentkit_core.actions.pyth.fetch_prices.fetch_price_updates",
+        return_value={MOCK_ETH_ID: _update(MOCK_ETH_ID, 250000)["price"]},
+    ) as mock_fetch:
+        result = json.loads(pyth_fetch_prices([MOCK_BTC_ID, MOCK_ETH_ID]))
+
+    assert result == {MOCK_BTC_ID: "42123.45", MOCK_ETH_ID: "2500.00"}
+    mock_fetch.assert_called_once_with([MOCK_ETH_ID])
+
+
+def test_price_stream_ignores_out_of_order_updates(sse_server, price_stream):
+    """Test that an older update never replaces a newer price."""
+    now = int(time.time())
+    sse_server.events = [
+        {"parsed": [_update(MOCK_BTC_ID, 2, publish_time=now)]},
+        {"parsed": [_update(MOCK_BTC_ID, 1, publish_time=now - 1)]},
+        {"parsed": [_update(MOCK_ETH_ID, 3, publish_time=now)]},
+    ]
+    price_stream.start()
+    _wait_for(lambda: price_stream.get(MOCK_ETH_ID) is not None)
+
+    assert price_stream.get(MOCK_BTC_ID)["price"] == "2"
+
+
+def test_price_stream_reconnects(sse_server, price_stream):
+    """Test that the stream reconnects after the server closes the connection."""
+    sse_server.hold = 0
+    sse_server.events = [{"parsed": [_update(MOCK_BTC_ID, 4212345)]}]
+    price_stream.start()
+
+    _wait_for(lambda: price_stream.connections >= 2)
+    price_stream.stop(timeout=5)
+
+    assert not price_stream._thread.is_alive()
+    assert price_stream.get(MOCK_BTC_ID) is not None
@@ -0,0 +1,83 @@
+import pytest
+from eth_abi import encode
+from web3 import Web3
+
+from cdp_agentkit_core.actions.abi_codec import (
+    decode_result,
+    encode_call,
+    get_abi_codec,
+    get_function_codec,
+)
+from cdp_agentkit_core.actions.morpho.constants import METAMORPHO_ABI
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_V3_ABI
+
+MOCK_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+def test_abi_codec_is_compiled_once():
+    """Test that the codec of an ABI is compiled once and shared."""
+    assert get_abi_codec(WOW_ABI) is get_abi_codec(WOW_ABI)
+    assert get_abi_codec(WOW_ABI).function("buy") is get_function_codec(
+        next(entry for entry in WOW_ABI if entry.get("name") == "buy")
+    )
+
+
+@pytest.mark.parametrize(
+    ("abi", "method", "args"),
+    [
+        (METAMORPHO_ABI, "deposit", {"assets": "1000", "receiver": MOCK_ADDRESS.lower()}),
+        (
+            WOW_ABI,
+            "buy",
+            {
+                "recipient": MOCK_ADDRESS,
+                "refundRecipient": MOCK_ADDRESS,
+                "orderReferrer": MOCK_ADDRESS,
+                "comment": "",
+                "expectedMarketType": 0,
+                "minOrderSize": "10",
+                "sqrtPriceLimitX96": "0",
+            },
+        ),
+        (UNISWAP_V3_ABI, "fee", None),
+    ],
+)
+def test_encode_call_matches_web3(abi, method, args):
+    """Test that calldata matches the encoding of a web3 contract."""
+    function = next(entry for entry in abi if entry.get("name") == method)
+    positional = [
+        int(value) if abi_input["type"].startswith("uint") else value
+        for abi_input, value in zip(function["inputs"], (args or {}).values(), strict=True)
+    ]
+    positional = [
+        Web3.to_checksum_address(value) if abi_input["type"] == "address" else value
+        for abi_input, value in zip(function["inputs"], positional, strict=True)
+    ]
+    expected = Web3().eth.contract(abi=abi).encode_abi(method, args=positional)
+
+    assert "0x" + encode_call(abi, method, args).hex() == expected
+    assert "0x" + encode_call(abi, method, positional).hex() == expected
+
+
+def test_decode_result_multiple_outputs():
+    """Test that multi-output functions decode to a list with converted values."""
+    return_data = encode(
+        ["uint160", "int24", "uint16", "uint16", "uint16", "uint8", "bool"],
+        [2**96, -10, 1, 2, 3, 0, True],
+    )
+
+    assert decode_result(UNISWAP_V3_ABI, "slot0", return_data) == [2**96, -10, 1, 2, 3, 0, True]
+
+
+def test_decode_result_address():
+    """Test that addresses decode to their checksummed form."""
+    return_data = encode(["address"], [MOCK_ADDRESS.lower()])
+
+    assert decode_result(UNISWAP_V3_ABI, "token0", return_data) == MOCK_ADDRESS
+
+
+def test_unknown_method():
+    """Test that encoding an unknown method raises ValueError."""
+    with pytest.raises(ValueError, match="Method unknown not found in ABI"):
+        encode_call(UNISWAP_V3_ABI, "unknown")
@@ -0,0 +1,66 @@
+from cdp import Wallet
+from pydantic import BaseModel
+
+from cdp_agentkit_core.actions.action_dispatch import ActionDispatch
+
+
+class RecipientInput(BaseModel):
+    """Test schema of a nested recipient."""
+
+    address: str
+    amount: int
+
+
+class PayInput(BaseModel):
+    """Test schema of an action taking nested models."""
+
+    asset_id: str
+    recipients: list[RecipientInput]
+
+
+def pay(wallet: Wallet, asset_id: str, recipients: list[dict]) -> str:
+    """Test action that takes the wallet."""
+    return asset_id
+
+
+def ping() -> str:
+    """Test action without a context."""
+    return "pong"
+
+
+class EchoDispatch(ActionDispatch):
+    """Dispatch whose context is a string."""
+
+    @staticmethod
+    def takes_context(func) -> bool:
+        """Whether the action is named after its context."""
+        return func.__name__ == "ping"
+
+
+def test_for_action_resolves_wallet_context():
+    """Test that actions taking the wallet are resolved once."""
+    assert ActionDispatch.for_action(pay, args_schema=PayInput).func_takes_context
+    assert not ActionDispatch.for_action(ping).func_takes_context
+
+
+def test_for_action_uses_overridden_context():
+    """Test that subclasses decide which actions take their context."""
+    assert EchoDispatch.for_action(ping).func_takes_context
+    assert not EchoDispatch.for_action(pay).func_takes_context
+
+
+def test_parse_args_dumps_nested_models():
+    """Test that nested models are passed to the action as plain dicts."""
+    dispatch = ActionDispatch.for_action(pay, args_schema=PayInput)
+
+    args = dispatch.parse_args(None, asset_id="eth", recipients=[{"address": "0x1", "amount": "2"}])
+
+    assert args == {"asset_id": "eth", "recipients": [{"address": "0x1", "amount": 2}]}
+
+
+def test_parse_args_without_schema():
+    """Test that actions without a schema receive the raw instructions."""
+    dispatch = ActionDispatch.for_action(ping)
+
+    assert dispatch.parse_args("{}") == {"instructions": ""}
+    assert dispatch.parse_args("hello") == {"instructions": "hello"}
@@ -0,0 +1,233 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+from cdp import Transfer
+
+from cdp_agentkit_core.actions import airdrop as airdrop_module
+from cdp_agentkit_core.actions.airdrop import (
+    AirdropJob,
+    AirdropJournal,
+    AirdropRow,
+    airdrop,
+    read_recipients,
+)
+
+MOCK_DESTINATIONS = [f"0x{index:040x}" for index in range(1, 6)]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Create an airdrop journal in a temporary directory."""
+    journal = AirdropJournal(tmp_path / "journal.sqlite3")
+    yield journal
+    journal.close()
+
+
+@pytest.fixture
+def recipients_csv(tmp_path):
+    """Write a CSV of five recipients."""
+    path = tmp_path / "recipients.csv"
+    lines = ["destination,amount"] + [f"{d},{i}" for i, d in enumerate(MOCK_DESTINATIONS, 1)]
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def _transfer(status="complete", wait=None):
+    transfer = Mock(spec=Transfer)
+    transfer.transaction_hash = "0xhash"
+    transfer.status = status
+    if wait is not None:
+        transfer.wait.side_effect = wait
+    return transfer
+
+
+def test_read_recipients_csv(recipients_csv):
+    """Test that CSV rows are numbered from 1 after the header."""
+    rows = list(read_recipients(recipients_csv))
+
+    assert rows[0] == AirdropRow(number=1, destination=MOCK_DESTINATIONS[0], amount="1")
+    assert len(rows) == 5
+
+
+def test_read_recipients_jsonl(tmp_path):
+    """Test that blank JSONL lines are skipped but keep the row numbers stable."""
+    path = tmp_path / "recipients.jsonl"
+    path.write_text(
+        f'{{"destination": "{MOCK_DESTINATIONS[0]}", "amount": 1}}\n'
+        "\n"
+        f'{{"destination": "{MOCK_DESTINATIONS[1]}"}}\n'
+    )
+
+    assert list(read_recipients(path)) == [
+        AirdropRow(number=1, destination=MOCK_DESTINATIONS[0], amount="1"),
+        AirdropRow(number=3, destination=MOCK_DESTINATIONS[1], amount=None),
+    ]
+
+
+def test_airdrop_job_invalid_kind(wallet_factory, recipients_csv, journal):
+    """Test that a job needs a known kind and its target."""
+    with pytest.raises(ValueError):
+        AirdropJob(wallet_factory(), recipients_csv, "burn", journal=journal)
+    with pytest.raises(ValueError):
+        AirdropJob(wallet_factory(), recipients_csv, "transfer", journal=journal)
+
+
+def test_airdrop_job_transfers(wallet_factory, recipients_csv, journal):
+    """Test that every row is transferred and checkpointed as complete."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(mock_wallet, "transfer", return_value=_transfer()) as mock_transfer:
+        progress = AirdropJob(mock_wallet, recipients_csv, asset_id="usdc", journal=journal).run()
+
+    assert (progress.state, progress.rows_read, progress.complete) == ("finished", 5, 5)
+    mock_transfer.assert_any_call(
+        amount="5", asset_id="usdc", destination=MOCK_DESTINATIONS[4], gasless=True
+    )
+
+
+def test_airdrop_job_mint(wallet_factory, contract_invocation_factory, tmp_path, journal):
+    """Test that a mint_nft airdrop mints one NFT to each recipient."""
+    mock_wallet = wallet_factory()
+    path = tmp_path / "recipients.csv"
+    path.write_text(f"destination\n{MOCK_DESTINATIONS[0]}\n")
+    invocation = contract_invocation_factory()
+    invocation.status = "complete"
+    invocation.transaction_hash = "0xhash"
+
+    with patch.object(mock_wallet, "invoke_contract", return_value=invocation) as mock_invoke:
+        progress = AirdropJob(
+            mock_wallet, path, "mint_nft", contract_address="0xnft", journal=journal
+        ).run()
+
+    assert progress.complete == 1
+    mock_invoke.assert_called_once_with(
+        contract_address="0xnft", method="mint", args={"to": MOCK_DESTINATIONS[0], "quantity": "1"}
+    )
+
+
+def test_airdrop_job_resumes(wallet_factory, recipients_csv, journal):
+    """Test that a rerun retries failed rows only, never resending confirmed or unconfirmed ones."""
+    mock_wallet = wallet_factory()
+
+    def first_run(destination, **kwargs):
+        if destination == MOCK_DESTINATIONS[1]:
+            raise Exception("insufficient balance")
+        if destination == MOCK_DESTINATIONS[2]:
+            return _transfer(status="failed")
+        if destination == MOCK_DESTINATIONS[3]:
+            return _transfer(wait=TimeoutError("timed out"))
+        return _transfer()
+
+    with patch.object(mock_wallet, "transfer", side_effect=first_run):
+        progress = AirdropJob(mock_wallet, recipients_csv, asset_id="eth", journal=journal).run()
+
+    assert (progress.complete, progress.failed, progress.unconfirmed) == (2, 2, 1)
+    job_id = progress.job_id
+    assert journal.rows(job_id, "submitted") == [(4, MOCK_DESTINATIONS[3], "0xhash", "timed out")]
+
+    with patch.object(mock_wallet, "transfer", return_value=_transfer()) as mock_transfer:
+        progress = AirdropJob(mock_wallet, recipients_csv, asset_id="eth", journal=journal).run()
+
+    assert sorted(call.kwargs["destination"] for call in mock_transfer.call_args_list) == [
+        MOCK_DESTINATIONS[1],
+        MOCK_DESTINATIONS[2],
+    ]
+    assert progress.job_id == job_id
+    assert (progress.complete, progress.failed, progress.unconfirmed) == (4, 0, 1)
+
+
+def test_airdrop_job_bounded_concurrency(wallet_factory, recipients_csv, journal):
+    """Test that no more than `concurrency` rows are in flight at once."""
+    mock_wallet = wallet_factory()
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def wait():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    with patch.object(mock_wallet, "transfer", side_effect=lambda **kwargs: _transfer(wait=wait)):
+        progress = AirdropJob(
+            mock_wallet, recipients_csv, asset_id="eth", journal=journal, concurrency=2
+        ).run()
+
+    assert progress.complete == 5
+    assert peak == 2
+
+
+def test_airdrop_action_reports_progress(wallet_factory, recipients_csv, tmp_path, monkeypatch):
+    """Test that the action runs the job in the background and reports its progress."""
+    monkeypatch.setenv("CDP_AGENTKIT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(airdrop_module, "_airdrop_jobs", {})
+    mock_wallet = wallet_factory()
+    confirmed = threading.Event()
+
+    with patch.object(
+        mock_wallet, "transfer", side_effect=lambda **kwargs: _transfer(wait=confirmed.wait)
+    ):
+        first_response = airdrop(mock_wallet, str(recipients_csv), asset_id="eth")
+        second_response = airdrop(mock_wallet, str(recipients_csv), asset_id="eth")
+        (job,) = airdrop_module._airdrop_jobs.values()
+        confirmed.set()
+        job.join()
+
+    assert first_response.startswith(f"Airdrop job {job.job_id} is running")
+    assert second_response.startswith(f"Airdrop job {job.job_id} is running")
+    assert str(job.progress()) == (
+        f"Airdrop job {job.job_id} is finished: 5 rows complete, 0 failed, 0 unconfirmed, "
+        "5 rows read this run."
+    )
+    assert (tmp_path / "airdrop_journal.sqlite3").exists()
+
+
+def test_airdrop_action_only_resumes_on_request(
+    wallet_factory, recipients_csv, tmp_path, monkeypatch
+):
+    """Test that checking on a finished job never resends its failed rows."""
+    monkeypatch.setenv("CDP_AGENTKIT_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(airdrop_module, "_airdrop_jobs", {})
+    mock_wallet = wallet_factory()
+
+    def transfer(destination, **kwargs):
+        if destination == MOCK_DESTINATIONS[0]:
+            raise Exception("insufficient balance")
+        return _transfer()
+
+    with patch.object(mock_wallet, "transfer", side_effect=transfer) as mock_transfer:
+        airdrop(mock_wallet, str(recipients_csv), asset_id="eth")
+        (job,) = airdrop_module._airdrop_jobs.values()
+        job.join()
+        assert mock_transfer.call_count == 5
+
+        check_response = airdrop(mock_wallet, str(recipients_csv), asset_id="eth")
+        assert mock_transfer.call_count == 5
+
+        # After a restart the job is only known from its journal.
+        monkeypatch.setattr(airdrop_module, "_airdrop_jobs", {})
+        restart_response = airdrop(mock_wallet, str(recipients_csv), asset_id="eth")
+        assert mock_transfer.call_count == 5
+
+        airdrop(mock_wallet, str(recipients_csv), asset_id="eth", resume=True)
+        airdrop_module._airdrop_jobs[job.job_id].join()
+
+    assert mock_transfer.call_count == 6
+    assert "1 failed" in check_response
+    assert check_response.endswith("call the tool with resume set to true to restart it.")
+    assert restart_response.endswith("call the tool with resume set to true to restart it.")
+
+
+def test_airdrop_action_error(wallet_factory, recipients_csv, monkeypatch):
+    """Test that a job that cannot start is reported as an error."""
+    monkeypatch.setattr(airdrop_module, "_airdrop_jobs", {})
+
+    action_response = airdrop(wallet_factory(), str(recipients_csv), kind="burn")
+
+    assert action_response.startswith("Error starting airdrop: Unknown airdrop kind burn")
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from cdp import Asset
+
+from cdp_agentkit_core.actions.asset_cache import AssetCache, fetch_asset
+
+MOCK_USDC_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+def _usdc(network_id: str = "base-sepolia") -> Asset:
+    return Asset(
+        network_id=network_id, asset_id="usdc", contract_address=MOCK_USDC_ADDRESS, decimals=6
+    )
+
+
+def test_fetch_asset_fetches_once(asset_cache):
+    """Test that an asset is fetched from the API once per network."""
+    with patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch", return_value=_usdc()) as fetch:
+        assert fetch_asset("base-sepolia", "usdc") is fetch_asset("base-sepolia", "USDC")
+        fetch_asset("base-mainnet", "usdc")
+
+    assert fetch.call_count == 2
+
+
+def test_export_and_load():
+    """Test that exported assets load into another cache without fetching."""
+    cache = AssetCache()
+    with patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch", return_value=_usdc()):
+        cache.fetch("base-sepolia", "usdc")
+
+    exported = cache.export("base-sepolia")
+    assert exported == [
+        {
+            "network_id": "base-sepolia",
+            "asset_id": "usdc",
+            "decimals": 6,
+            "contract_address": MOCK_USDC_ADDRESS,
+        }
+    ]
+    assert cache.export("base-mainnet") == []
+
+    restored = AssetCache()
+    restored.load(exported)
+    with patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch") as fetch:
+        asset = restored.fetch("base-sepolia", "usdc")
+
+    fetch.assert_not_called()
+    assert asset.decimals == 6
+    assert asset.contract_address == MOCK_USDC_ADDRESS
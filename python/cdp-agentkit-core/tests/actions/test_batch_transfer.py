@@ -0,0 +1,134 @@
+from unittest.mock import Mock, patch
+
+import pytest
+from cdp import Transfer
+
+from cdp_agentkit_core.actions.batch_transfer import (
+    BatchTransferInput,
+    batch_transfer,
+)
+
+MOCK_DESTINATION = "0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027"
+MOCK_OTHER_DESTINATION = "example.base.eth"
+
+
+def _transfer(transaction_hash, status="complete"):
+    transfer = Mock(spec=Transfer)
+    transfer.transaction_hash = transaction_hash
+    transfer.status = status
+    return transfer
+
+
+def test_batch_transfer_input_model_valid():
+    """Test that BatchTransferInput accepts a list of transfers."""
+    input_model = BatchTransferInput(
+        transfers=[{"destination": MOCK_DESTINATION, "amount": "0.5", "asset_id": "usdc"}]
+    )
+
+    assert input_model.transfers[0].amount == "0.5"
+
+
+@pytest.mark.parametrize("amount", ["0", "-1", "abc", "NaN"])
+def test_batch_transfer_input_model_invalid_amount(amount):
+    """Test that BatchTransferInput rejects amounts that are not positive numbers."""
+    with pytest.raises(ValueError):
+        BatchTransferInput(
+            transfers=[{"destination": MOCK_DESTINATION, "amount": amount, "asset_id": "eth"}]
+        )
+
+
+def test_batch_transfer_input_model_empty():
+    """Test that BatchTransferInput rejects an empty batch."""
+    with pytest.raises(ValueError):
+        BatchTransferInput(transfers=[])
+
+
+def test_batch_transfer_success(wallet_factory):
+    """Test that every transfer is sent, USDC gasless, and summarized in order."""
+    mock_wallet = wallet_factory(network_id="base-sepolia")
+    transfers = {
+        MOCK_DESTINATION: _transfer("0xhash1"),
+        MOCK_OTHER_DESTINATION: _transfer("0xhash2"),
+    }
+
+    with patch.object(
+        mock_wallet, "transfer", side_effect=lambda **kwargs: transfers[kwargs["destination"]]
+    ) as mock_transfer:
+        action_response = batch_transfer(
+            mock_wallet,
+            [
+                {"destination": MOCK_DESTINATION, "amount": "1", "asset_id": "usdc"},
+                {"destination": MOCK_OTHER_DESTINATION, "amount": "0.01", "asset_id": "eth"},
+            ],
+        )
+
+    assert action_response == (
+        "Batch transfer of 2 transfers: 2 sent, 0 failed.\n"
+        f"1. 1 usdc to {MOCK_DESTINATION}: hash 0xhash1\n"
+        f"2. 0.01 eth to {MOCK_OTHER_DESTINATION}: hash 0xhash2"
+    )
+    mock_transfer.assert_any_call(
+        amount="1", asset_id="usdc", destination=MOCK_DESTINATION, gasless=True
+    )
+    mock_transfer.assert_any_call(
+        amount="0.01", asset_id="eth", destination=MOCK_OTHER_DESTINATION, gasless=False
+    )
+    for transfer in transfers.values():
+        transfer.wait.assert_called_once_with()
+
+
+def test_batch_transfer_partial_failure(wallet_factory):
+    """Test that failed transfers are reported per row without aborting the batch."""
+    mock_wallet = wallet_factory()
+
+    def transfer(**kwargs):
+        if kwargs["destination"] == MOCK_OTHER_DESTINATION:
+            raise Exception("insufficient balance")
+        return _transfer("0xhash1")
+
+    with patch.object(mock_wallet, "transfer", side_effect=transfer):
+        action_response = batch_transfer(
+            mock_wallet,
+            [
+                {"destination": MOCK_DESTINATION, "amount": "1", "asset_id": "eth"},
+                {"destination": MOCK_OTHER_DESTINATION, "amount": "2", "asset_id": "eth"},
+            ],
+        )
+
+    assert action_response == (
+        "Batch transfer of 2 transfers: 1 sent, 1 failed.\n"
+        f"1. 1 eth to {MOCK_DESTINATION}: hash 0xhash1\n"
+        f"2. 2 eth to {MOCK_OTHER_DESTINATION}: Error insufficient balance"
+    )
+
+
+def test_batch_transfer_invalid_batch_sends_nothing(wallet_factory):
+    """Test that an invalid row rejects the whole batch before any transfer is sent."""
+    mock_wallet = wallet_factory()
+
+    with patch.object(mock_wallet, "transfer") as mock_transfer:
+        action_response = batch_transfer(
+            mock_wallet,
+            [
+                {"destination": MOCK_DESTINATION, "amount": "1", "asset_id": "eth"},
+                {"destination": MOCK_DESTINATION, "amount": "-1", "asset_id": "eth"},
+            ],
+        )
+
+    assert action_response.startswith("Error validating the batch transfer")
+    mock_transfer.assert_not_called()
+
+
+def test_batch_transfer_fire_and_track(wallet_factory, transaction_tracker):
+    """Test that with a transaction tracker the transfers are tracked instead of awaited."""
+    mock_wallet = wallet_factory()
+    transfer = _transfer("0xhash1", status="broadcast")
+
+    with patch.object(mock_wallet, "transfer", return_value=transfer):
+        action_response = batch_transfer(
+            mock_wallet, [{"destination": MOCK_DESTINATION, "amount": "1", "asset_id": "eth"}]
+        )
+
+    (tracked,) = transaction_tracker.transactions()
+    assert f"submitted, handle {tracked.handle}, hash 0xhash1" in action_response
+    transfer.wait.assert_not_called()
@@ -0,0 +1,244 @@
+from decimal import Decimal
+from unittest.mock import Mock, call, patch
+
+import pytest
+from cdp import Asset, Transfer
+
+from cdp_agentkit_core.actions.disperse import (
+    DISPERSE_ABI,
+    DISPERSE_ADDRESS,
+    DISPERSE_BASE_GAS,
+    DisperseInput,
+    disperse,
+    disperse_chunk_size,
+)
+
+MOCK_NETWORK_ID = "base-mainnet"
+MOCK_TOKEN_ADDRESS = "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913"
+MOCK_RECIPIENTS = [
+    "0x58dBecc0894Ab4C24F98a0e684c989eD07e4e027",
+    "0x742d35Cc6634C0532925a3b844Bc454e4438f44e",
+    "0x1234567890123456789012345678901234567890",
+]
+
+
+def _asset(decimals, contract_address=None):
+    asset = Mock(spec=Asset)
+    asset.contract_address = contract_address
+    asset.to_atomic_amount.side_effect = lambda amount: amount * Decimal(10) ** decimals
+    return asset
+
+
+def _recipients(*amounts):
+    return [
+        {"destination": destination, "amount": amount}
+        for destination, amount in zip(MOCK_RECIPIENTS, amounts, strict=False)
+    ]
+
+
+def test_disperse_input_model_valid():
+    """Test that DisperseInput accepts and checksums addresses."""
+    input_model = DisperseInput(
+        asset_id="eth",
+        recipients=[{"destination": MOCK_RECIPIENTS[1].lower(), "amount": "1"}],
+    )
+
+    assert input_model.recipients[0].destination == MOCK_RECIPIENTS[1]
+
+
+@pytest.mark.parametrize(
+    "recipient",
+    [
+        {"destination": "example.base.eth", "amount": "1"},
+        {"destination": MOCK_RECIPIENTS[0], "amount": "0"},
+    ],
+)
+def test_disperse_input_model_invalid(recipient):
+    """Test that DisperseInput rejects names and amounts that are not positive."""
+    with pytest.raises(ValueError):
+        DisperseInput(asset_id="eth", recipients=[recipient])
+
+
+def test_disperse_chunk_size():
+    """Test that chunks fit the gas limit and hold at least one recipient."""
+    assert disperse_chunk_size(1_000, DISPERSE_BASE_GAS + 2_500) == 2
+    assert disperse_chunk_size(1_000_000, DISPERSE_BASE_GAS) == 1
+
+
+def test_disperse_eth_in_chunks(wallet_factory, contract_invocation_factory):
+    """Test that ETH is dispersed in gas limited chunks with the value of each chunk attached."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+    invocation = contract_invocation_factory()
+    invocation.status = "complete"
+    invocation.transaction_hash = "0xhash"
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.asset_cache.Asset.fetch", return_value=_asset(18)
+        ) as mock_fetch,
+        patch("cdp_agentkit_core.actions.disperse.approve") as mock_approve,
+        patch.object(mock_wallet, "invoke_contract", return_value=invocation) as mock_invoke,
+    ):
+        action_response = disperse(
+            mock_wallet,
+            "eth",
+            _recipients("1", "0.5", "0.25"),
+            gas_limit=DISPERSE_BASE_GAS + 2 * 37_000,
+        )
+
+    mock_fetch.assert_called_once_with(MOCK_NETWORK_ID, "eth")
+    mock_approve.assert_not_called()
+    assert mock_invoke.call_args_list == [
+        call(
+            contract_address=DISPERSE_ADDRESS,
+            method="disperseEther",
+            abi=DISPERSE_ABI,
+            args={
+                "recipients": MOCK_RECIPIENTS[:2],
+                "values": ["1000000000000000000", "500000000000000000"],
+            },
+            amount=Decimal("1.5"),
+            asset_id="eth",
+        ),
+        call(
+            contract_address=DISPERSE_ADDRESS,
+            method="disperseEther",
+            abi=DISPERSE_ABI,
+            args={"recipients": MOCK_RECIPIENTS[2:], "values": ["250000000000000000"]},
+            amount=Decimal("0.25"),
+            asset_id="eth",
+        ),
+    ]
+    assert action_response == (
+        "Dispersed eth to 3 recipients in 2 transactions: 3 paid, 0 failed.\n"
+        "1. recipients 1-2: hash 0xhash\n"
+        "2. recipients 3-3: hash 0xhash"
+    )
+
+
+def test_disperse_token_approves_once(wallet_factory, contract_invocation_factory):
+    """Test that a token is approved once for the total and dispersed in one transaction."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+    invocation = contract_invocation_factory()
+    invocation.status = "complete"
+    invocation.transaction_hash = "0xhash"
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.asset_cache.Asset.fetch",
+            return_value=_asset(6, MOCK_TOKEN_ADDRESS),
+        ),
+        patch(
+            "cdp_agentkit_core.actions.disperse.approve", return_value="Approved"
+        ) as mock_approve,
+        patch.object(mock_wallet, "invoke_contract", return_value=invocation) as mock_invoke,
+    ):
+        action_response = disperse(mock_wallet, "usdc", _recipients("1", "2.5"))
+
+    mock_approve.assert_called_once_with(
+        mock_wallet, MOCK_TOKEN_ADDRESS, DISPERSE_ADDRESS, 3_500_000
+    )
+    mock_invoke.assert_called_once_with(
+        contract_address=DISPERSE_ADDRESS,
+        method="disperseToken",
+        abi=DISPERSE_ABI,
+        args={
+            "token": MOCK_TOKEN_ADDRESS,
+            "recipients": MOCK_RECIPIENTS[:2],
+            "values": ["1000000", "2500000"],
+        },
+    )
+    assert action_response.startswith("Dispersed usdc to 2 recipients in 1 transactions")
+
+
+def test_disperse_token_approval_error(wallet_factory):
+    """Test that a failed approval stops the disperse before any payment."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.asset_cache.Asset.fetch",
+            return_value=_asset(6, MOCK_TOKEN_ADDRESS),
+        ),
+        patch(
+            "cdp_agentkit_core.actions.disperse.approve",
+            return_value="Error approving tokens: insufficient gas",
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = disperse(mock_wallet, "usdc", _recipients("1"))
+
+    assert action_response == (
+        "Error approving Disperse as spender: Error approving tokens: insufficient gas"
+    )
+    mock_invoke.assert_not_called()
+
+
+def test_disperse_chunk_failure(wallet_factory, contract_invocation_factory):
+    """Test that a chunk that fails onchain is reported without hiding the others."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+    succeeded = contract_invocation_factory()
+    succeeded.status = "complete"
+    succeeded.transaction_hash = "0xhash1"
+    failed = contract_invocation_factory()
+    failed.status = "failed"
+    failed.transaction_hash = "0xhash2"
+
+    with (
+        patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch", return_value=_asset(18)),
+        patch.object(mock_wallet, "invoke_contract", side_effect=[succeeded, failed]),
+    ):
+        action_response = disperse(
+            mock_wallet, "eth", _recipients("1", "1"), gas_limit=DISPERSE_BASE_GAS + 37_000
+        )
+
+    assert action_response == (
+        "Dispersed eth to 2 recipients in 2 transactions: 1 paid, 1 failed.\n"
+        "1. recipients 1-1: hash 0xhash1\n"
+        "2. recipients 2-2: Error the transaction failed onchain, hash 0xhash2"
+    )
+
+
+def test_disperse_fire_and_track(wallet_factory, contract_invocation_factory, transaction_tracker):
+    """Test that with a transaction tracker the chunks are tracked instead of awaited."""
+    mock_wallet = wallet_factory(network_id=MOCK_NETWORK_ID)
+    invocation = contract_invocation_factory()
+    invocation.status = "broadcast"
+    invocation.transaction_hash = "0xhash"
+    invocation.transaction_link = "https://basescan.org/tx/0xhash"
+
+    with (
+        patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch", return_value=_asset(18)),
+        patch.object(mock_wallet, "invoke_contract", return_value=invocation),
+    ):
+        action_response = disperse(mock_wallet, "eth", _recipients("1"))
+
+    (tracked,) = transaction_tracker.transactions()
+    assert f"1. recipients 1-1: submitted, handle {tracked.handle}, hash 0xhash" in action_response
+    invocation.wait.assert_not_called()
+
+
+def test_disperse_falls_back_to_transfers(wallet_factory):
+    """Test that networks without the Disperse contract pay every recipient with a transfer."""
+    mock_wallet = wallet_factory(network_id="base-sepolia")
+    transfer = Mock(spec=Transfer)
+    transfer.status = "complete"
+    transfer.transaction_hash = "0xhash"
+
+    with (
+        patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch") as mock_fetch,
+        patch.object(mock_wallet, "transfer", return_value=transfer) as mock_transfer,
+    ):
+        action_response = disperse(mock_wallet, "usdc", _recipients("1", "2"))
+
+    mock_fetch.assert_not_called()
+    assert mock_transfer.call_count == 2
+    mock_transfer.assert_any_call(
+        amount="2", asset_id="usdc", destination=MOCK_RECIPIENTS[1], gasless=True
+    )
+    assert action_response == (
+        "Disperse is not available on base-sepolia, so usdc was sent to 2 recipients in 2 "
+        "transfers: 2 paid, 0 failed.\n"
+        f"1. 1 to {MOCK_RECIPIENTS[0]}: hash 0xhash\n"
+        f"2. 2 to {MOCK_RECIPIENTS[1]}: hash 0xhash"
+    )
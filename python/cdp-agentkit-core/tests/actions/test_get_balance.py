@@ -0,0 +1,64 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from cdp_agentkit_core.actions.get_balance import (
+    GetBalanceInput,
+    get_balance,
+    get_balance_async,
+)
+
+MOCK_ASSET_ID = "eth"
+
+
+def _mock_address(address_id, balance=None, side_effect=None):
+    address = Mock()
+    address.address_id = address_id
+    address.balance = Mock(return_value=balance, side_effect=side_effect)
+    return address
+
+
+def test_get_balance_input_model_valid():
+    """Test that GetBalanceInput accepts valid parameters."""
+    input_model = GetBalanceInput(asset_id=MOCK_ASSET_ID)
+
+    assert input_model.asset_id == MOCK_ASSET_ID
+
+
+def test_get_balance_input_model_missing_params():
+    """Test that GetBalanceInput raises error when params are missing."""
+    with pytest.raises(ValueError):
+        GetBalanceInput()
+
+
+def test_get_balance_success(wallet_factory):
+    """Test successful balance lookup across all wallet addresses."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [_mock_address("0xaddr1", "1.5"), _mock_address("0xaddr2", "0")]
+
+    action_response = get_balance(mock_wallet, MOCK_ASSET_ID)
+
+    assert action_response == "Balances for wallet test-wallet-id:\n  0xaddr1: 1.5\n  0xaddr2: 0"
+
+
+def test_get_balance_async_success(wallet_factory):
+    """Test concurrent balance lookup across all wallet addresses."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [_mock_address("0xaddr1", "1.5"), _mock_address("0xaddr2", "0")]
+
+    action_response = asyncio.run(get_balance_async(mock_wallet, MOCK_ASSET_ID))
+
+    assert action_response == "Balances for wallet test-wallet-id:\n  0xaddr1: 1.5\n  0xaddr2: 0"
+    for address in mock_wallet.addresses:
+        address.balance.assert_called_once_with(MOCK_ASSET_ID)
+
+
+def test_get_balance_async_api_error(wallet_factory):
+    """Test concurrent balance lookup when API error occurs."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [_mock_address("0xaddr1", side_effect=Exception("API error"))]
+
+    action_response = asyncio.run(get_balance_async(mock_wallet, MOCK_ASSET_ID))
+
+    assert action_response == "Error getting balance for all addresses in the wallet API error"
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -5,6 +6,7 @@ import pytest
 from cdp_agentkit_core.actions.get_balance_nft import (
     GetBalanceNftInput,
     get_balance_nft,
+    get_balance_nft_async,
 )
 
 MOCK_CONTRACT_ADDRESS = "0xvalidContractAddress"
@@ -104,3 +106,36 @@ def test_get_balance_nft_api_error(wallet_factory):
 
         expected_response = f"Error getting NFT balance for address {MOCK_ADDRESS} in contract {MOCK_CONTRACT_ADDRESS}: API error"
         assert action_response == expected_response
+
+
+def test_get_balance_nft_async_success(wallet_factory):
+    """Test successful NFT balance check on the event loop."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = "base-sepolia"
+    mock_wallet.default_address.address_id = MOCK_ADDRESS
+
+    with patch("cdp.smart_contract.SmartContract.read", return_value=MOCK_TOKEN_IDS) as mock_read:
+        action_response = asyncio.run(get_balance_nft_async(mock_wallet, MOCK_CONTRACT_ADDRESS))
+
+        expected_response = f"Address {MOCK_ADDRESS} owns {len(MOCK_TOKEN_IDS)} NFTs in contract {MOCK_CONTRACT_ADDRESS}.\nToken IDs: 1, 2, 3"
+        assert action_response == expected_response
+        mock_read.assert_called_once_with(
+            "base-sepolia",
+            MOCK_CONTRACT_ADDRESS,
+            "tokensOfOwner",
+            abi=None,
+            args={"owner": MOCK_ADDRESS},
+        )
+
+
+def test_get_balance_nft_async_api_error(wallet_factory):
+    """Test NFT balance check on the event loop when API error occurs."""
+    mock_wallet = wallet_factory()
+    mock_wallet.network_id = "base-sepolia"
+    mock_wallet.default_address.address_id = MOCK_ADDRESS
+
+    with patch("cdp.smart_contract.SmartContract.read", side_effect=Exception("API error")):
+        action_response = asyncio.run(get_balance_nft_async(mock_wallet, MOCK_CONTRACT_ADDRESS))
+
+        expected_response = f"Error getting NFT balance for address {MOCK_ADDRESS} in contract {MOCK_CONTRACT_ADDRESS}: API error"
+        assert action_response == expected_response
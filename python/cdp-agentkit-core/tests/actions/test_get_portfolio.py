@@ -0,0 +1,99 @@
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+from cdp import Asset
+
+from cdp_agentkit_core.actions.get_portfolio import GetPortfolioInput, get_portfolio
+
+MOCK_USDC_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+
+
+def _mock_address(address_id, balances):
+    address = Mock()
+    address.address_id = address_id
+    address.balance = Mock(side_effect=lambda asset_id: Decimal(balances[asset_id]))
+    return address
+
+
+def _fetch_asset(network_id, asset_id):
+    asset = Mock(spec=Asset)
+    asset.contract_address = MOCK_USDC_ADDRESS if asset_id == "usdc" else None
+    asset.from_atomic_amount.side_effect = lambda amount: amount / Decimal(10) ** 6
+    return asset
+
+
+def test_get_portfolio_input_model_valid():
+    """Test that GetPortfolioInput accepts a list of asset IDs."""
+    input_model = GetPortfolioInput(asset_ids=["eth", "usdc"])
+
+    assert input_model.asset_ids == ["eth", "usdc"]
+
+
+def test_get_portfolio_input_model_empty():
+    """Test that GetPortfolioInput needs at least one asset ID."""
+    with pytest.raises(ValueError):
+        GetPortfolioInput(asset_ids=[])
+
+
+def test_get_portfolio_success(wallet_factory):
+    """Test that tokens are read with one multicall and native assets per address."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [
+        _mock_address("0xaddr1", {"eth": "1.5"}),
+        _mock_address("0xaddr2", {"eth": "0.25"}),
+    ]
+
+    with (
+        patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch", side_effect=_fetch_asset),
+        patch(
+            "cdp_agentkit_core.actions.get_portfolio.erc20_balances",
+            return_value=[10_000_000, 0],
+        ) as mock_erc20_balances,
+    ):
+        action_response = get_portfolio(mock_wallet, ["eth", "usdc", "eth"])
+
+    mock_erc20_balances.assert_called_once_with(
+        "base-sepolia", [(MOCK_USDC_ADDRESS, "0xaddr1"), (MOCK_USDC_ADDRESS, "0xaddr2")]
+    )
+    for address in mock_wallet.addresses:
+        address.balance.assert_called_once_with("eth")
+    assert action_response == (
+        "Portfolio of wallet test-wallet-id on base-sepolia:\n"
+        "address | eth  | usdc\n"
+        "0xaddr1 | 1.5  | 10\n"
+        "0xaddr2 | 0.25 | 0\n"
+        "total   | 1.75 | 10"
+    )
+
+
+def test_get_portfolio_multicall_fallback(wallet_factory):
+    """Test that token balances are fetched per address when the multicall fails."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [_mock_address("0xaddr1", {"usdc": "3"})]
+
+    with (
+        patch("cdp_agentkit_core.actions.asset_cache.Asset.fetch", side_effect=_fetch_asset),
+        patch(
+            "cdp_agentkit_core.actions.get_portfolio.erc20_balances",
+            side_effect=Exception("execution reverted"),
+        ),
+    ):
+        action_response = get_portfolio(mock_wallet, ["usdc"])
+
+    mock_wallet.addresses[0].balance.assert_called_once_with("usdc")
+    assert action_response.endswith("0xaddr1 | 3\ntotal   | 3")
+
+
+def test_get_portfolio_api_error(wallet_factory):
+    """Test that an asset that cannot be fetched is reported as an error."""
+    mock_wallet = wallet_factory()
+    mock_wallet.addresses = [_mock_address("0xaddr1", {})]
+
+    with patch(
+        "cdp_agentkit_core.actions.asset_cache.Asset.fetch",
+        side_effect=Exception("unknown asset"),
+    ):
+        action_response = get_portfolio(mock_wallet, ["doge"])
+
+    assert action_response == "Error getting the portfolio of the wallet unknown asset"
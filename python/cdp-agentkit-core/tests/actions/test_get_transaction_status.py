@@ -0,0 +1,64 @@
+from unittest.mock import Mock
+
+from cdp import Transfer
+
+from cdp_agentkit_core.actions.get_transaction_status import (
+    GetTransactionStatusInput,
+    get_transaction_status,
+)
+
+
+def test_get_transaction_status_input_model_valid():
+    """Test that GetTransactionStatusInput accepts an optional handle."""
+    assert GetTransactionStatusInput().handle is None
+    assert GetTransactionStatusInput(handle="abc").handle == "abc"
+
+
+def _transfer(wallet_id="test-wallet-id"):
+    transfer = Mock(spec=Transfer)
+    transfer.wallet_id = wallet_id
+    transfer.status = "complete"
+    transfer.transaction_hash = "0xvalidTransactionHash"
+    transfer.transaction_link = "https://basescan.org/tx/0xvalidTransactionHash"
+    return transfer
+
+
+def test_get_transaction_status_disabled(wallet_factory):
+    """Test the status when fire-and-track mode is off."""
+    assert get_transaction_status(wallet_factory()).startswith(
+        "Transaction tracking is not enabled"
+    )
+
+
+def test_get_transaction_status(transaction_tracker, wallet_factory):
+    """Test the status of a tracked transaction, by handle and in the full listing."""
+    wallet = wallet_factory()
+    tracked = transaction_tracker.track(_transfer(wallet.id), "transfer of 1 eth")
+
+    expected_response = (
+        f"Transaction {tracked.handle} (transfer of 1 eth): complete\n"
+        "Transaction hash: 0xvalidTransactionHash\n"
+        "Transaction link: https://basescan.org/tx/0xvalidTransactionHash"
+    )
+    assert get_transaction_status(wallet, tracked.handle) == expected_response
+    assert get_transaction_status(wallet) == expected_response
+
+
+def test_get_transaction_status_unknown_handle(transaction_tracker, wallet_factory):
+    """Test the status of an unknown handle."""
+    assert get_transaction_status(wallet_factory(), "unknown") == (
+        "Error getting transaction status: no tracked transaction with handle unknown"
+    )
+
+
+def test_get_transaction_status_of_another_wallet(transaction_tracker, wallet_factory):
+    """Test that a wallet does not see the transactions of another wallet."""
+    wallet = wallet_factory(wallet_id="wallet-a")
+    other_wallet = wallet_factory(wallet_id="wallet-b")
+    tracked = transaction_tracker.track(_transfer("wallet-a"), "transfer of 1 eth")
+
+    assert get_transaction_status(other_wallet) == "No transactions are being tracked."
+    assert get_transaction_status(other_wallet, tracked.handle).startswith(
+        "Error getting transaction status: no tracked transaction"
+    )
+    assert get_transaction_status(wallet).startswith(f"Transaction {tracked.handle}")
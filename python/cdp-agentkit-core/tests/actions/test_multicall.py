@@ -0,0 +1,133 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.abi_codec import decode_result, encode_call
+from cdp_agentkit_core.actions.multicall import (
+    ERC20_BALANCE_OF_ABI,
+    MULTICALL3_ADDRESS,
+    MulticallError,
+    MulticallReader,
+    cdp_aggregate3,
+    erc20_balances,
+)
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_QUOTER_ABI, UNISWAP_V3_ABI
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+MOCK_TOKEN_ADDRESS = "0x2222222222222222222222222222222222222222"
+MOCK_ACCOUNT = "0x3333333333333333333333333333333333333333"
+
+
+def test_multicall_reader_batches_reads(fake_chain):
+    """Test that many reads are executed in a single aggregate3 call."""
+    fake_chain.register(
+        MOCK_POOL_ADDRESS,
+        UNISWAP_V3_ABI,
+        fee=lambda: 3000,
+        token0=lambda: MOCK_TOKEN_ADDRESS,
+        slot0=lambda: (2**96, -10, 1, 2, 3, 0, True),
+    )
+
+    reader = MulticallReader(MOCK_NETWORK_ID)
+    fee = reader.add(MOCK_POOL_ADDRESS, "fee", UNISWAP_V3_ABI)
+    token0 = reader.add(MOCK_POOL_ADDRESS, "token0", UNISWAP_V3_ABI)
+    slot0 = reader.add(MOCK_POOL_ADDRESS, "slot0", UNISWAP_V3_ABI)
+    results = reader.execute()
+
+    assert len(fake_chain.batches) == 1
+    assert results[fee] == 3000
+    assert results[token0] == MOCK_TOKEN_ADDRESS
+    assert results[slot0] == [2**96, -10, 1, 2, 3, 0, True]
+
+
+def test_multicall_reader_allow_failure(fake_chain):
+    """Test that reverted reads that allow failure decode to None."""
+
+    def revert():
+        raise Exception("execution reverted")
+
+    fake_chain.register(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, fee=revert, liquidity=lambda: 5)
+
+    reader = MulticallReader(MOCK_NETWORK_ID)
+    reader.add(MOCK_POOL_ADDRESS, "fee", UNISWAP_V3_ABI, allow_failure=True)
+    reader.add(MOCK_POOL_ADDRESS, "liquidity", UNISWAP_V3_ABI)
+
+    assert reader.execute() == [None, 5]
+
+
+def test_multicall_reader_raises_on_failure(fake_chain):
+    """Test that a reverted read that does not allow failure raises."""
+
+    def revert():
+        raise Exception("execution reverted")
+
+    fake_chain.register(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, fee=revert)
+
+    reader = MulticallReader(MOCK_NETWORK_ID)
+    reader.add(MOCK_POOL_ADDRESS, "fee", UNISWAP_V3_ABI)
+
+    with pytest.raises(MulticallError):
+        reader.execute()
+
+
+def test_multicall_reader_empty_batch():
+    """Test that an empty batch does not issue any call."""
+    with patch("cdp_agentkit_core.actions.multicall.cdp_aggregate3") as mock_aggregate3:
+        assert MulticallReader(MOCK_NETWORK_ID).execute() == []
+
+    mock_aggregate3.assert_not_called()
+
+
+def test_erc20_balances(fake_chain):
+    """Test reading many ERC20 balances in one batch."""
+    fake_chain.register(MOCK_TOKEN_ADDRESS, ERC20_BALANCE_OF_ABI, balanceOf=lambda account: 7)
+    fake_chain.register(MOCK_POOL_ADDRESS, ERC20_BALANCE_OF_ABI, balanceOf=lambda account: 9)
+
+    balances = erc20_balances(
+        MOCK_NETWORK_ID, [(MOCK_TOKEN_ADDRESS, MOCK_ACCOUNT), (MOCK_POOL_ADDRESS, MOCK_ACCOUNT)]
+    )
+
+    assert balances == [7, 9]
+    assert len(fake_chain.batches) == 1
+
+
+def test_encode_call_flattened_struct():
+    """Test encoding a single struct parameter passed as flattened named arguments."""
+    flattened = encode_call(
+        UNISWAP_QUOTER_ABI,
+        "quoteExactInputSingle",
+        {
+            "tokenIn": MOCK_TOKEN_ADDRESS,
+            "tokenOut": MOCK_POOL_ADDRESS,
+            "fee": "3000",
+            "amountIn": "1000",
+            "sqrtPriceLimitX96": 0,
+        },
+    )
+    nested = encode_call(
+        UNISWAP_QUOTER_ABI,
+        "quoteExactInputSingle",
+        {"params": [MOCK_TOKEN_ADDRESS, MOCK_POOL_ADDRESS, 1000, 3000, 0]},
+    )
+
+    assert flattened == nested
+    assert flattened[:4].hex() == "c6a5026a"
+
+
+def test_decode_result_single_output():
+    """Test decoding a single output returns the bare value."""
+    assert decode_result(ERC20_BALANCE_OF_ABI, "balanceOf", (42).to_bytes(32, "big")) == 42
+
+
+def test_cdp_aggregate3():
+    """Test that the CDP transport issues a single aggregate3 read."""
+    read_result = [{"success": True, "returnData": "0x" + (42).to_bytes(32, "big").hex()}]
+
+    with patch("cdp.smart_contract.SmartContract.read", return_value=read_result) as mock_read:
+        results = cdp_aggregate3(MOCK_NETWORK_ID, [(MOCK_TOKEN_ADDRESS, False, b"\x01\x02")])
+
+    assert results == [(True, (42).to_bytes(32, "big"))]
+    mock_read.assert_called_once()
+    assert mock_read.call_args[0][1] == MULTICALL3_ADDRESS
+    assert mock_read.call_args[1]["args"] == {"calls": [[MOCK_TOKEN_ADDRESS, False, "0x0102"]]}
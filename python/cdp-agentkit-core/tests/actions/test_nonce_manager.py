@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from cdp_agentkit_core.actions.nonce_manager import wallet_submission
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_ADDRESS = "0x742d35Cc6634C0532925a3b844Bc454e4438f44e"
+
+
+def test_submissions_are_ordered_per_address(local_evm, wallet_factory):
+    """Test that submission slots stop writes whose nonce is assigned remotely from colliding."""
+    local_evm.broadcast_delay = 0.001
+    wallet = wallet_factory(default_address=MOCK_ADDRESS)
+
+    def invoke_contract(_):
+        # As with CDP, the nonce is assigned when the transaction is created.
+        with wallet_submission(wallet):
+            nonce = local_evm.get_transaction_count(MOCK_NETWORK_ID, MOCK_ADDRESS)
+            local_evm.send_transaction(MOCK_ADDRESS, nonce)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(invoke_contract, range(32)))
+
+    assert [nonce for _, nonce in local_evm.executed] == list(range(32))
@@ -0,0 +1,70 @@
+import threading
+import time
+
+import pytest
+
+from cdp_agentkit_core.actions.read_planner import ReadPlanner
+
+
+def test_read_planner_resolves_dependencies():
+    """Test that dependent reads receive the results of their dependencies."""
+    planner = ReadPlanner()
+    planner.add("token0", lambda results: "0xtoken0")
+    planner.add("fee", lambda results: 3000)
+    planner.add("balance0", lambda results: (results["token0"], 42), depends_on=("token0",))
+
+    assert planner.execute() == {"token0": "0xtoken0", "fee": 3000, "balance0": ("0xtoken0", 42)}
+
+
+def test_read_planner_passes_only_dependencies():
+    """Test that a read only sees the results it depends on."""
+    seen = {}
+    planner = ReadPlanner()
+    planner.add("token0", lambda results: "0xtoken0")
+    planner.add("token1", lambda results: "0xtoken1")
+    planner.add("balance1", seen.update, depends_on=("token1",))
+    planner.execute()
+
+    assert seen == {"token1": "0xtoken1"}
+
+
+def test_read_planner_runs_independent_reads_concurrently():
+    """Test that independent reads are in flight at the same time."""
+    barrier = threading.Barrier(3, timeout=5)
+
+    def read(name):
+        barrier.wait()
+        return name
+
+    planner = ReadPlanner()
+    for name in ("fee", "liquidity", "slot0"):
+        planner.add(name, lambda results, name=name: read(name))
+
+    assert planner.execute() == {"fee": "fee", "liquidity": "liquidity", "slot0": "slot0"}
+
+
+def test_read_planner_propagates_errors():
+    """Test that a failing read raises and skips dependent reads."""
+    calls = []
+
+    def fail(results):
+        calls.append("token0")
+        time.sleep(0.01)
+        raise Exception("API error")
+
+    planner = ReadPlanner()
+    planner.add("token0", fail)
+    planner.add("balance0", lambda results: calls.append("balance0"), depends_on=("token0",))
+
+    with pytest.raises(Exception, match="API error"):
+        planner.execute()
+
+    assert calls == ["token0"]
+
+
+def test_read_planner_rejects_unknown_dependency():
+    """Test that planning a read with an unknown dependency fails."""
+    planner = ReadPlanner()
+
+    with pytest.raises(ValueError):
+        planner.add("balance0", lambda results: 0, depends_on=("token0",))
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+import textwrap
+from collections.abc import Callable
+
+import pytest
+
+from cdp_agentkit_core.actions import (
+    CDP_ACTIONS,
+    CdpAction,
+    WowBuyTokenAction,
+    get_all_cdp_actions,
+)
+from cdp_agentkit_core.actions.registry import (
+    ActionRegistry,
+    build_action_manifest,
+    get_action_registry,
+    load_action_manifest,
+)
+
+
+def test_action_manifest_is_up_to_date():
+    """Test that the checked in manifest matches the actions in the package."""
+    assert (
+        load_action_manifest() == build_action_manifest()
+    ), "The action manifest is out of date, regenerate it with `make manifest`."
+
+
+def test_registry_lists_actions_without_importing_them():
+    """Test that importing the actions package and listing actions imports no action module."""
+    script = textwrap.dedent(
+        """
+        import sys
+
+        from cdp_agentkit_core.actions import get_action_registry
+
+        registry = get_action_registry()
+        assert "wow_buy_token" in registry.names()
+        assert registry.get_entry("wow_buy_token").args_schema["required"]
+
+        assert "cdp" not in sys.modules, "cdp"
+        assert "web3" not in sys.modules, "web3"
+        assert "cdp_agentkit_core.actions.wow.constants" not in sys.modules, "wow constants"
+
+        registry.load("wow_buy_token")
+        assert "cdp_agentkit_core.actions.wow.constants" in sys.modules
+        """
+    )
+
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+
+def test_registry_loads_actions_once():
+    """Test that an action is imported on first use and its instance is then reused."""
+    registry = ActionRegistry(load_action_manifest())
+
+    action = registry.load("wow_buy_token")
+
+    assert isinstance(action, WowBuyTokenAction)
+    assert registry.load("wow_buy_token") is action
+
+
+def test_registry_unknown_action():
+    """Test that loading an unknown action raises KeyError."""
+    with pytest.raises(KeyError):
+        get_action_registry().load("unknown_action")
+
+
+def test_cdp_actions_match_manifest():
+    """Test that CDP_ACTIONS starts with every action in the manifest, in manifest order."""
+    names = get_action_registry().names()
+
+    assert [action.name for action in CDP_ACTIONS][: len(names)] == names
+    assert all(isinstance(action, CdpAction) for action in CDP_ACTIONS)
+
+
+def test_user_defined_actions_are_discovered():
+    """Test that CdpAction subclasses outside the manifest are returned after the manifest."""
+
+    class GreetAction(CdpAction):
+        name: str = "greet"
+        description: str = "Say hello"
+        args_schema: None = None
+        func: Callable[..., str] = lambda: "hello"
+
+    actions = get_all_cdp_actions()
+
+    assert [action.name for action in actions].count("greet") == 1
+    assert isinstance(actions[-1], GreetAction)
+
+
+def test_registry_lists_side_effects():
+    """Test that the manifest records the side effect of every action, writes by default."""
+    registry = get_action_registry()
+
+    assert registry.get_entry("get_balance").side_effect == "read"
+    assert registry.get_entry("get_transaction_status").side_effect == "live"
+    assert registry.get_entry("pyth_fetch_price").side_effect == "live"
+    assert registry.get_entry("pyth_fetch_price_feed_id").side_effect == "external"
+    assert registry.get_entry("transfer").side_effect == "write"
@@ -0,0 +1,104 @@
+import time
+from unittest.mock import Mock
+
+from cdp import Trade, Transaction, Transfer
+
+from cdp_agentkit_core.actions.transaction_tracker import TIMED_OUT_STATUS, TransactionTracker
+
+
+def _pending_transfer(polls_until_complete):
+    transfer = Mock(spec=Transfer)
+    transfer.status = "broadcast"
+    transfer.transaction_hash = "0xvalidTransactionHash"
+    transfer.transaction_link = "https://basescan.org/tx/0xvalidTransactionHash"
+
+    def reload():
+        if transfer.reload.call_count >= polls_until_complete:
+            transfer.status = "complete"
+
+    transfer.reload.side_effect = reload
+    return transfer
+
+
+def _wait_until_settled(tracked, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not tracked.settled and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_tracker_polls_until_complete():
+    """Test that the tracker reloads a pending transaction in the background until it settles."""
+    tracker = TransactionTracker(poll_interval=0.01)
+    tracker.start()
+    transfer = _pending_transfer(polls_until_complete=3)
+
+    tracked = tracker.track(transfer, "transfer of 1 eth")
+    assert tracked.status == "broadcast"
+
+    _wait_until_settled(tracked)
+    tracker.stop()
+
+    assert tracked.status == "complete"
+    assert transfer.reload.call_count == 3
+    assert tracker.get(tracked.handle) is tracked
+    assert tracker.pending() == []
+
+
+def test_tracker_multiplexes_transactions():
+    """Test that one polling thread settles several transactions."""
+    tracker = TransactionTracker(poll_interval=0.01)
+    tracker.start()
+    transfers = [_pending_transfer(polls_until_complete=n) for n in (1, 2, 4)]
+
+    tracked = [tracker.track(transfer, f"transfer {i}") for i, transfer in enumerate(transfers)]
+    for item in tracked:
+        _wait_until_settled(item)
+    tracker.stop()
+
+    assert [item.status for item in tracked] == ["complete"] * 3
+    assert [transfer.reload.call_count for transfer in transfers] == [1, 2, 4]
+
+
+def test_tracker_reads_trade_hash_from_transaction():
+    """Test that trades report the hash of their transaction."""
+    trade = Mock(spec=Trade)
+    trade.status = "complete"
+    trade.transaction = Mock(spec=Transaction)
+    trade.transaction.transaction_hash = "0xtradeHash"
+    trade.transaction.transaction_link = "https://basescan.org/tx/0xtradeHash"
+
+    tracked = TransactionTracker().track(trade, "trade of 1 eth for usdc")
+
+    assert tracked.settled
+    assert tracked.transaction_hash == "0xtradeHash"
+
+
+def test_tracker_keeps_polling_after_errors():
+    """Test that a failed poll is reported and retried."""
+    tracker = TransactionTracker()
+    transfer = _pending_transfer(polls_until_complete=2)
+    transfer.reload.side_effect = [Exception("API error"), None]
+
+    tracked = tracker.track(transfer, "transfer of 1 eth")
+    tracker.poll()
+
+    assert tracked.error == "API error"
+    assert "Last polling error: API error" in str(tracked)
+
+    transfer.status = "complete"
+    tracker.poll()
+
+    assert tracked.status == "complete"
+    assert tracked.error is None
+
+
+def test_tracker_times_out():
+    """Test that transactions pending past the timeout are no longer polled."""
+    tracker = TransactionTracker(timeout_seconds=0)
+    transfer = _pending_transfer(polls_until_complete=100)
+
+    tracked = tracker.track(transfer, "transfer of 1 eth")
+    tracker.poll()
+
+    assert tracked.status == TIMED_OUT_STATUS
+    assert tracker.pending() == []
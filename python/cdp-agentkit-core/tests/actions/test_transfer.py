@@ -78,3 +78,27 @@ def test_transfer_api_error(wallet_factory):
             destination=MOCK_DESTINATION,
             gasless=MOCK_GASLESS,
         )
+
+
+def test_transfer_fire_and_track(wallet_factory, transfer_factory, transaction_tracker):
+    """Test that with a transaction tracker the transfer returns after broadcast."""
+    mock_wallet = wallet_factory()
+    mock_transfer_instance = transfer_factory()
+    mock_transfer_instance.status = "broadcast"
+
+    with (
+        patch.object(mock_wallet, "transfer", return_value=mock_transfer_instance),
+        patch.object(mock_transfer_instance, "wait") as mock_transfer_wait,
+    ):
+        action_response = transfer(
+            mock_wallet, MOCK_AMOUNT, MOCK_ASSET_ID, MOCK_DESTINATION, MOCK_GASLESS
+        )
+
+    (tracked,) = transaction_tracker.transactions()
+    assert action_response.startswith(
+        f"Submitted transfer of {MOCK_AMOUNT} {MOCK_ASSET_ID} to {MOCK_DESTINATION}."
+    )
+    assert f"handle {tracked.handle}" in action_response
+    assert f"Transaction hash: {mock_transfer_instance.transaction_hash}" in action_response
+    assert tracked.operation is mock_transfer_instance
+    mock_transfer_wait.assert_not_called()
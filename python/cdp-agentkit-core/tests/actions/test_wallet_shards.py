@@ -0,0 +1,139 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from threading import Barrier
+from unittest.mock import Mock
+
+import pytest
+from cdp import Transfer, WalletAddress
+
+from cdp_agentkit_core.actions.get_balance import get_balance
+from cdp_agentkit_core.actions.wallet_shards import WalletShardPool
+
+
+def _address(address_id, balance="1"):
+    address = Mock(spec=WalletAddress)
+    address.address_id = address_id
+    address.balance.return_value = Decimal(balance)
+    address.transfer.return_value = Mock(spec=Transfer)
+    return address
+
+
+@pytest.fixture
+def sharded_wallet(wallet_factory):
+    """Create a wallet mock that derives new addresses on create_address."""
+    wallet = wallet_factory(default_address="0xaddress0")
+    wallet.addresses = [wallet.default_address]
+    wallet.default_address.balance.return_value = Decimal("10")
+
+    def create_address():
+        address = _address(f"0xaddress{len(wallet.addresses)}")
+        wallet.addresses.append(address)
+        return address
+
+    wallet.create_address.side_effect = create_address
+    return wallet
+
+
+def test_pool_derives_missing_addresses(sharded_wallet):
+    """Test that the pool derives addresses until the wallet has one per shard."""
+    pool = WalletShardPool(sharded_wallet, 3)
+
+    assert sharded_wallet.create_address.call_count == 2
+    assert [address.address_id for address in pool.addresses] == [
+        "0xaddress0",
+        "0xaddress1",
+        "0xaddress2",
+    ]
+
+
+def test_shard_writes_from_its_address(sharded_wallet):
+    """Test that a shard sends writes from its address and forwards the rest to the wallet."""
+    pool = WalletShardPool(sharded_wallet, 2, strategy="round_robin")
+
+    with pool.acquire(), pool.acquire() as shard:
+        shard.invoke_contract(contract_address="0xcontract", method="mint")
+
+        assert shard.default_address.address_id == "0xaddress1"
+        assert shard.id == sharded_wallet.id
+        assert shard.network_id == sharded_wallet.network_id
+        pool.addresses[1].invoke_contract.assert_called_once_with(
+            contract_address="0xcontract", method="mint"
+        )
+        sharded_wallet.invoke_contract.assert_not_called()
+
+
+def test_round_robin(sharded_wallet):
+    """Test that round robin cycles through the shards."""
+    pool = WalletShardPool(sharded_wallet, 3, strategy="round_robin")
+
+    picked = []
+    for _ in range(6):
+        with pool.acquire() as shard:
+            picked.append(shard.default_address.address_id)
+
+    assert picked == ["0xaddress0", "0xaddress1", "0xaddress2"] * 2
+
+
+def test_least_pending_spreads_concurrent_actions(sharded_wallet):
+    """Test that concurrent actions each get a shard with no other pending action."""
+    pool = WalletShardPool(sharded_wallet, 4)
+    barrier = Barrier(4)
+
+    def action(_):
+        with pool.acquire() as shard:
+            barrier.wait(timeout=5)
+            return shard.default_address.address_id
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        picked = list(executor.map(action, range(4)))
+
+    assert sorted(picked) == [f"0xaddress{i}" for i in range(4)]
+    assert set(pool.pending().values()) == {0}
+
+
+def test_async_acquire_spreads_concurrent_actions(sharded_wallet):
+    """Test that concurrent async actions each get a shard with no other pending action."""
+    pool = WalletShardPool(sharded_wallet, 3)
+
+    async def action():
+        async with pool.aacquire() as shard:
+            await asyncio.sleep(0.01)
+            return shard.default_address.address_id
+
+    async def run():
+        return await asyncio.gather(*(action() for _ in range(3)))
+
+    assert sorted(asyncio.run(run())) == [f"0xaddress{i}" for i in range(3)]
+    assert set(pool.pending().values()) == {0}
+
+
+def test_top_up_funds_shards_below_minimum(sharded_wallet):
+    """Test that shards below the minimum balance are funded from the treasury."""
+    pool = WalletShardPool(sharded_wallet, 3, min_balance="0.5", top_up_amount="2")
+    pool.addresses[1].balance.return_value = Decimal("0.1")
+
+    assert pool.top_up() == {"0xaddress1": Decimal("2")}
+    sharded_wallet.default_address.transfer.assert_called_once_with(
+        Decimal("2"), "eth", "0xaddress1"
+    )
+    sharded_wallet.default_address.transfer.return_value.wait.assert_called_once_with()
+
+
+def test_balances_report_every_shard(sharded_wallet):
+    """Test that get_balance run from a shard reports the whole shard set."""
+    pool = WalletShardPool(sharded_wallet, 2)
+
+    with pool.acquire() as shard:
+        response = get_balance(shard, "eth")
+
+    assert "0xaddress0: 10" in response
+    assert "0xaddress1: 1" in response
+
+
+def test_invalid_pool(sharded_wallet):
+    """Test that invalid pool settings raise ValueError."""
+    with pytest.raises(ValueError):
+        WalletShardPool(sharded_wallet, 2, strategy="random")
+    with pytest.raises(ValueError):
+        WalletShardPool(sharded_wallet, 2, treasury_address="0xunknown")
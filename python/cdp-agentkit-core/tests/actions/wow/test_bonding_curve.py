@@ -0,0 +1,138 @@
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.bonding_curve import (
+    WAD,
+    BondingCurveCrossCheck,
+    BondingCurveDriftError,
+    exp_wad,
+    get_eth_buy_quote,
+    get_eth_sell_quote,
+    get_token_buy_quote,
+    get_token_sell_quote,
+    ln_wad,
+)
+from cdp_agentkit_core.actions.wow.constants import BONDING_CURVE_ABI, addresses
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOTAL_SUPPLY = 500_000_000 * WAD
+MOCK_ETH_AMOUNT = WAD // 10
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        (-3 * WAD, 49787068367863942),
+        (-WAD, 367879441171442321),
+        (0, WAD),
+        (WAD // 2, 1648721270700128146),
+        (WAD, 2718281828459045235),
+        (3 * WAD, 20085536923187667741),
+        (-41446531673892822313, 0),
+    ],
+)
+def test_exp_wad_known_values(x, expected):
+    """Test expWad against the values from the Solady test suite."""
+    assert exp_wad(x) == expected
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        (WAD, 0),
+        (2718281828459045235, 999999999999999999),
+        (11723640096265400935, 2461607324344817918),
+        (1, -41446531673892822313),
+        (42, -37708862055609454007),
+        (10**9, -20723265836946411157),
+        (2**255 - 1, 135305999368893231589),
+    ],
+)
+def test_ln_wad_known_values(x, expected):
+    """Test lnWad against the values from the Solady test suite."""
+    assert ln_wad(x) == expected
+
+
+def test_quotes_are_consistent():
+    """Test that the buy and sell quotes invert each other up to rounding."""
+    tokens = get_eth_buy_quote(MOCK_TOTAL_SUPPLY, MOCK_ETH_AMOUNT)
+    assert tokens > 0
+
+    # Buying the tokens costs at most the ETH spent, and selling them back returns no more.
+    assert get_token_buy_quote(MOCK_TOTAL_SUPPLY, tokens) <= MOCK_ETH_AMOUNT
+    assert get_token_sell_quote(MOCK_TOTAL_SUPPLY + tokens, tokens) <= MOCK_ETH_AMOUNT
+    assert get_eth_sell_quote(MOCK_TOTAL_SUPPLY + tokens, MOCK_ETH_AMOUNT) == pytest.approx(
+        tokens, rel=1e-12
+    )
+
+
+def test_price_increases_with_supply():
+    """Test that the same ETH buys fewer tokens as the supply grows."""
+    assert get_eth_buy_quote(2 * MOCK_TOTAL_SUPPLY, MOCK_ETH_AMOUNT) < get_eth_buy_quote(
+        MOCK_TOTAL_SUPPLY, MOCK_ETH_AMOUNT
+    )
+
+
+def test_token_sell_quote_insufficient_supply():
+    """Test selling more than the total supply."""
+    with pytest.raises(ValueError, match="Insufficient supply"):
+        get_token_sell_quote(WAD, 2 * WAD)
+
+
+def test_cross_check_not_sampled():
+    """Test that an unsampled quote does not read the contract."""
+    cross_check = BondingCurveCrossCheck(sample_rate=0)
+
+    with patch("cdp.smart_contract.SmartContract.read") as mock_read:
+        assert cross_check.check(MOCK_NETWORK_ID, "buy", MOCK_TOTAL_SUPPLY, 1, 123) == 123
+
+    mock_read.assert_not_called()
+    assert cross_check.stats.samples == 0
+
+
+def test_cross_check_match():
+    """Test that a sampled quote is read from the BondingCurve at the same supply."""
+    cross_check = BondingCurveCrossCheck(sample_rate=1)
+    local_quote = get_eth_buy_quote(MOCK_TOTAL_SUPPLY, MOCK_ETH_AMOUNT)
+
+    with patch("cdp.smart_contract.SmartContract.read", return_value=local_quote) as mock_read:
+        assert (
+            cross_check.check(
+                MOCK_NETWORK_ID, "buy", MOCK_TOTAL_SUPPLY, MOCK_ETH_AMOUNT, local_quote
+            )
+            == local_quote
+        )
+
+    mock_read.assert_called_once_with(
+        MOCK_NETWORK_ID,
+        addresses[MOCK_NETWORK_ID]["BondingCurve"],
+        "getEthBuyQuote",
+        abi=BONDING_CURVE_ABI,
+        args={"currentSupply": str(MOCK_TOTAL_SUPPLY), "ethOrderSize": str(MOCK_ETH_AMOUNT)},
+    )
+    assert cross_check.stats.samples == 1
+    assert cross_check.stats.mismatches == 0
+
+
+def test_cross_check_drift(caplog):
+    """Test that drift is counted and logged, and the contract quote wins."""
+    cross_check = BondingCurveCrossCheck(sample_rate=1)
+
+    with patch("cdp.smart_contract.SmartContract.read", return_value=105):
+        assert cross_check.check(MOCK_NETWORK_ID, "sell", MOCK_TOTAL_SUPPLY, 1, 100) == 105
+
+    assert cross_check.stats.mismatches == 1
+    assert cross_check.stats.max_drift == 5
+    assert "differs from the contract quote 105" in caplog.text
+
+
+def test_cross_check_drift_strict():
+    """Test that drift raises in strict mode."""
+    cross_check = BondingCurveCrossCheck(sample_rate=1, strict=True)
+
+    with (
+        patch("cdp.smart_contract.SmartContract.read", return_value=105),
+        pytest.raises(BondingCurveDriftError),
+    ):
+        cross_check.check(MOCK_NETWORK_ID, "sell", MOCK_TOTAL_SUPPLY, 1, 100)
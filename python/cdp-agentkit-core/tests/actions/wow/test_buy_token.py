@@ -7,12 +7,17 @@ from cdp_agentkit_core.actions.wow.buy_token import (
     wow_buy_token,
 )
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.price_impact import (
+    DEFAULT_MAX_PRICE_IMPACT,
+    bonding_curve_price_impact,
+)
 
 MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
 MOCK_AMOUNT_ETH = "100000000000000"
 MOCK_NETWORK_ID = "base-sepolia"
 MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
-MOCK_TOKEN_QUOTE = 1000000
+MOCK_TOTAL_SUPPLY = 500_000_000 * 10**18
+MOCK_CURVE = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, [int(MOCK_AMOUNT_ETH)], "buy")
 
 
 def test_buy_token_input_model_valid():
@@ -41,7 +46,8 @@ def test_buy_token_success(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
+            "cdp_agentkit_core.actions.wow.buy_token.get_price_impact_curve",
+            return_value=MOCK_CURVE,
         ),
         patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=False),
         patch.object(
@@ -60,8 +66,8 @@ def test_buy_token_success(wallet_factory, contract_invocation_factory):
         expected_response = f"Purchased WoW ERC20 memecoin with transaction hash: {mock_contract_instance.transaction.transaction_hash}"
         assert action_response == expected_response
 
-        # Calculate expected minimum tokens (99% of quote)
-        expected_min_tokens = str(int((MOCK_TOKEN_QUOTE * 99) // 100))
+        # The minimum output is priced at the spot price less the maximum price impact
+        expected_min_tokens = str(MOCK_CURVE.min_output(0, DEFAULT_MAX_PRICE_IMPACT))
 
         mock_invoke.assert_called_once_with(
             contract_address=MOCK_CONTRACT_ADDRESS,
@@ -91,7 +97,8 @@ def test_buy_token_graduated_pool(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
+            "cdp_agentkit_core.actions.wow.buy_token.get_price_impact_curve",
+            return_value=MOCK_CURVE,
         ),
         patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=True),
         patch.object(
@@ -117,7 +124,8 @@ def test_buy_token_api_error(wallet_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.buy_token.get_buy_quote", return_value=MOCK_TOKEN_QUOTE
+            "cdp_agentkit_core.actions.wow.buy_token.get_price_impact_curve",
+            return_value=MOCK_CURVE,
         ),
         patch("cdp_agentkit_core.actions.wow.buy_token.get_has_graduated", return_value=False),
         patch.object(
@@ -134,3 +142,28 @@ def test_buy_token_api_error(wallet_factory):
 
         assert action_response == expected_response
         mock_invoke.assert_called_once()
+
+
+def test_buy_token_price_impact_too_high(wallet_factory):
+    """Test that an order above the maximum price impact is not sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+    curve = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, [MOCK_TOTAL_SUPPLY // 10], "buy")
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.buy_token.get_price_impact_curve",
+            return_value=curve,
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = wow_buy_token(
+            mock_wallet,
+            MOCK_CONTRACT_ADDRESS,
+            MOCK_AMOUNT_ETH,
+            max_price_impact=0.01,
+        )
+
+    assert action_response.startswith("Error buying Zora Wow ERC20 memecoin: price impact of")
+    mock_invoke.assert_not_called()
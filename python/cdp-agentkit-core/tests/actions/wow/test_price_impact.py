@@ -0,0 +1,161 @@
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from cdp_agentkit_core.actions.wow.bonding_curve import get_eth_buy_quote, get_token_sell_quote
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.price_impact import (
+    DEFAULT_MAX_PRICE_IMPACT,
+    bonding_curve_price_impact,
+    get_price_impact_curve,
+    uniswap_price_impact,
+)
+from cdp_agentkit_core.actions.wow.uniswap.index import PoolInfo
+from cdp_agentkit_core.actions.wow.uniswap.quoter import (
+    MissingTickDataError,
+    PoolTicks,
+    get_sqrt_ratio_at_tick,
+    quote_exact_input,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+MOCK_WETH_ADDRESS = addresses[MOCK_NETWORK_ID]["WETH"]
+MOCK_TOTAL_SUPPLY = 500_000_000 * 10**18
+MOCK_AMOUNTS = [10**15, 10**16, 10**17, 10**18]
+MOCK_TOKEN_AMOUNTS = [10**23, 10**24, 10**25, 10**26]
+
+MOCK_POOL = PoolInfo(
+    token0=MOCK_WETH_ADDRESS,
+    balance0=10**24,
+    token1=MOCK_TOKEN_ADDRESS,
+    balance1=10**24,
+    fee=10000,
+    liquidity=10**20,
+    sqrt_price_x96=get_sqrt_ratio_at_tick(0),
+    tick=0,
+    tick_spacing=200,
+)
+MOCK_TICKS = PoolTicks(
+    tick_spacing=200, min_word=-2, max_word=2, liquidity_net={-20000: 10**20, 20000: -(10**20)}
+)
+
+
+def test_bonding_curve_price_impact():
+    """Test that every amount is quoted exactly, net of the fee, and impact grows with size."""
+    buy_curve = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, MOCK_AMOUNTS, "buy")
+    sell_curve = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, MOCK_TOKEN_AMOUNTS, "sell")
+
+    assert list(buy_curve.amounts_out) == [
+        get_eth_buy_quote(MOCK_TOTAL_SUPPLY, amount - amount // 100) for amount in MOCK_AMOUNTS
+    ]
+    assert list(sell_curve.amounts_out) == [
+        quote - quote // 100
+        for quote in (
+            get_token_sell_quote(MOCK_TOTAL_SUPPLY, amount) for amount in MOCK_TOKEN_AMOUNTS
+        )
+    ]
+    for curve in (buy_curve, sell_curve):
+        assert np.all(np.diff(curve.price_impact) > 0)
+        assert curve.price_impact[0] == pytest.approx(0, abs=1e-3)
+
+
+@pytest.mark.parametrize("quote_type", ["buy", "sell"])
+def test_min_output_accounts_for_the_wow_fee(quote_type):
+    """Test that a small order's minimum output stays below its output after the fee."""
+    amounts = MOCK_AMOUNTS if quote_type == "buy" else MOCK_TOKEN_AMOUNTS
+    curve = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, amounts, quote_type)
+
+    assert curve.min_output(0, 0.001) <= curve.amounts_out[0]
+    assert curve.min_output(0, DEFAULT_MAX_PRICE_IMPACT) < curve.amounts_out[0]
+
+
+def test_uniswap_price_impact():
+    """Test quoting a range of amounts on a pool snapshot."""
+    curve = uniswap_price_impact(MOCK_POOL, MOCK_TICKS, True, MOCK_AMOUNTS)
+
+    assert list(curve.amounts_out) == [
+        quote_exact_input(MOCK_POOL, MOCK_TICKS, True, amount) for amount in MOCK_AMOUNTS
+    ]
+    assert curve.spot_price == pytest.approx(0.99)
+    assert np.all(np.diff(curve.price_impact) > 0)
+
+
+def test_min_output():
+    """Test that the minimum output is priced at the spot price less the price impact."""
+    curve = uniswap_price_impact(MOCK_POOL, MOCK_TICKS, True, MOCK_AMOUNTS)
+
+    assert curve.min_output(3, 0.05) == pytest.approx(10**18 * 0.99 * 0.95)
+    assert curve.min_output(3, 0.05) < curve.amounts_out[3]
+
+
+def test_get_price_impact_curve_graduated():
+    """Test that a graduated token is quoted from one pool snapshot without the quoter."""
+    with (
+        patch("cdp_agentkit_core.actions.wow.price_impact.get_has_graduated", return_value=True),
+        patch(
+            "cdp_agentkit_core.actions.wow.price_impact.get_pool_address",
+            return_value=MOCK_POOL_ADDRESS,
+        ),
+        patch(
+            "cdp_agentkit_core.actions.wow.price_impact.get_pool_info", return_value=MOCK_POOL
+        ) as mock_pool_info,
+        patch(
+            "cdp_agentkit_core.actions.wow.price_impact.get_pool_ticks",
+            return_value=MOCK_TICKS,
+        ) as mock_fetch_ticks,
+        patch("cdp_agentkit_core.actions.wow.price_impact.exact_input_single") as mock_quoter,
+    ):
+        curve = get_price_impact_curve(
+            MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, [str(a) for a in MOCK_AMOUNTS], "buy"
+        )
+
+    assert list(curve.amounts_out) == [
+        quote_exact_input(MOCK_POOL, MOCK_TICKS, True, amount - amount // 100)
+        for amount in MOCK_AMOUNTS
+    ]
+    assert curve.spot_price == pytest.approx(0.99 * 0.99)
+    mock_pool_info.assert_called_once()
+    mock_fetch_ticks.assert_called_once_with(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, MOCK_POOL)
+    mock_quoter.assert_not_called()
+
+
+def test_get_price_impact_curve_missing_ticks():
+    """Test that amounts walking past the fetched ticks fall back to the quoter."""
+    with (
+        patch("cdp_agentkit_core.actions.wow.price_impact.get_has_graduated", return_value=True),
+        patch(
+            "cdp_agentkit_core.actions.wow.price_impact.get_pool_address",
+            return_value=MOCK_POOL_ADDRESS,
+        ),
+        patch("cdp_agentkit_core.actions.wow.price_impact.get_pool_info", return_value=MOCK_POOL),
+        patch(
+            "cdp_agentkit_core.actions.wow.price_impact.get_pool_ticks",
+            side_effect=MissingTickDataError("Tick bitmap word 3 was not fetched"),
+        ),
+        patch(
+            "cdp_agentkit_core.actions.wow.price_impact.exact_input_single", return_value=42
+        ) as mock_quoter,
+    ):
+        curve = get_price_impact_curve(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, [10**18], "sell")
+
+    assert list(curve.amounts_out) == [42]
+    mock_quoter.assert_called_once_with(
+        MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_WETH_ADDRESS, str(10**18), 10000
+    )
+
+
+def test_get_price_impact_curve_bonding_curve(token_facts_cache):
+    """Test that a pre-graduation token is quoted from its cached total supply."""
+    token_facts_cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, False)
+    token_facts_cache.set_total_supply(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_TOTAL_SUPPLY)
+
+    with patch("cdp.smart_contract.SmartContract.read") as mock_read:
+        curve = get_price_impact_curve(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNTS, "buy")
+
+    mock_read.assert_not_called()
+    assert list(curve.amounts_out) == [
+        get_eth_buy_quote(MOCK_TOTAL_SUPPLY, amount - amount // 100) for amount in MOCK_AMOUNTS
+    ]
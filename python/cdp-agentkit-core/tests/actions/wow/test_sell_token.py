@@ -3,6 +3,10 @@ from unittest.mock import patch
 import pytest
 
 from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.price_impact import (
+    DEFAULT_MAX_PRICE_IMPACT,
+    bonding_curve_price_impact,
+)
 from cdp_agentkit_core.actions.wow.sell_token import (
     WowSellTokenInput,
     wow_sell_token,
@@ -12,7 +16,8 @@ MOCK_CONTRACT_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
 MOCK_AMOUNT_TOKENS = "100000000000000"
 MOCK_NETWORK_ID = "base-sepolia"
 MOCK_WALLET_ADDRESS = "0x1234567890123456789012345678901234567890"
-MOCK_ETH_QUOTE = 1000000
+MOCK_TOTAL_SUPPLY = 500_000_000 * 10**18
+MOCK_CURVE = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, [int(MOCK_AMOUNT_TOKENS)], "sell")
 
 
 def test_sell_token_input_model_valid():
@@ -41,8 +46,8 @@ def test_sell_token_success(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
+            "cdp_agentkit_core.actions.wow.sell_token.get_price_impact_curve",
+            return_value=MOCK_CURVE,
         ),
         patch(
             "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
@@ -64,8 +69,8 @@ def test_sell_token_success(wallet_factory, contract_invocation_factory):
         expected_response = f"Sold WoW ERC20 memecoin with transaction hash: {mock_contract_instance.transaction.transaction_hash}"
         assert action_response == expected_response
 
-        # Calculate expected minimum ETH (98% of quote)
-        expected_min_eth = str(int((MOCK_ETH_QUOTE * 98) // 100))
+        # The minimum output is priced at the spot price less the maximum price impact
+        expected_min_eth = str(MOCK_CURVE.min_output(0, DEFAULT_MAX_PRICE_IMPACT))
 
         mock_invoke.assert_called_once_with(
             contract_address=MOCK_CONTRACT_ADDRESS,
@@ -93,8 +98,8 @@ def test_sell_token_graduated_pool(wallet_factory, contract_invocation_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
+            "cdp_agentkit_core.actions.wow.sell_token.get_price_impact_curve",
+            return_value=MOCK_CURVE,
         ),
         patch(
             "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
@@ -123,8 +128,8 @@ def test_sell_token_api_error(wallet_factory):
 
     with (
         patch(
-            "cdp_agentkit_core.actions.wow.sell_token.get_sell_quote",
-            return_value=MOCK_ETH_QUOTE,
+            "cdp_agentkit_core.actions.wow.sell_token.get_price_impact_curve",
+            return_value=MOCK_CURVE,
         ),
         patch(
             "cdp_agentkit_core.actions.wow.sell_token.get_has_graduated",
@@ -144,3 +149,28 @@ def test_sell_token_api_error(wallet_factory):
 
         assert action_response == expected_response
         mock_invoke.assert_called_once()
+
+
+def test_sell_token_price_impact_too_high(wallet_factory):
+    """Test that an order above the maximum price impact is not sent."""
+    mock_wallet = wallet_factory()
+    mock_wallet.default_address.address_id = MOCK_WALLET_ADDRESS
+    mock_wallet.network_id = MOCK_NETWORK_ID
+    curve = bonding_curve_price_impact(MOCK_TOTAL_SUPPLY, [MOCK_TOTAL_SUPPLY // 10], "sell")
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.sell_token.get_price_impact_curve",
+            return_value=curve,
+        ),
+        patch.object(mock_wallet, "invoke_contract") as mock_invoke,
+    ):
+        action_response = wow_sell_token(
+            mock_wallet,
+            MOCK_CONTRACT_ADDRESS,
+            MOCK_AMOUNT_TOKENS,
+            max_price_impact=0.01,
+        )
+
+    assert action_response.startswith("Error selling Zora Wow ERC20 memecoin: price impact of")
+    mock_invoke.assert_not_called()
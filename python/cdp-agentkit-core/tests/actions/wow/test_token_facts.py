@@ -0,0 +1,112 @@
+from unittest.mock import patch
+
+from cdp_agentkit_core.actions.wow.token_facts import TokenFactsCache
+from cdp_agentkit_core.actions.wow.uniswap.index import get_has_graduated, get_pool_address
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+
+
+def test_token_facts_cache_is_network_keyed():
+    """Test that facts recorded on one network are not visible on another."""
+    cache = TokenFactsCache()
+    cache.update(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, pool_address=MOCK_POOL_ADDRESS)
+
+    assert cache.get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS.lower()) == {
+        "pool_address": MOCK_POOL_ADDRESS
+    }
+    assert cache.get("base-mainnet", MOCK_TOKEN_ADDRESS) == {}
+
+
+def test_token_facts_cache_writes_through_to_disk(tmp_path):
+    """Test that facts survive a new cache instance reading the same file."""
+    path = tmp_path / "facts.json"
+    TokenFactsCache(path).update(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, pool_address="0xpool")
+
+    assert TokenFactsCache(path).get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) == {
+        "pool_address": "0xpool"
+    }
+
+
+def test_token_facts_cache_ignores_corrupt_file(tmp_path):
+    """Test that a corrupt cache file is treated as empty."""
+    path = tmp_path / "facts.json"
+    path.write_text("not json")
+
+    assert TokenFactsCache(path).get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) == {}
+
+
+def test_token_facts_cache_graduation_ttl():
+    """Test that graduated=true is kept forever and graduated=false expires."""
+    cache = TokenFactsCache(ungraduated_ttl_seconds=30)
+
+    with patch("cdp_agentkit_core.actions.wow.token_facts.time.time", return_value=1000):
+        cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, False)
+        cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, True)
+
+    with patch("cdp_agentkit_core.actions.wow.token_facts.time.time", return_value=1010):
+        assert cache.get_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) is False
+
+    with patch("cdp_agentkit_core.actions.wow.token_facts.time.time", return_value=100000):
+        assert cache.get_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) is None
+        assert cache.get_has_graduated(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS) is True
+
+
+def test_token_facts_cache_total_supply_ttl(tmp_path):
+    """Test that the total supply expires and is never written to disk."""
+    path = tmp_path / "facts.json"
+    cache = TokenFactsCache(path, total_supply_ttl_seconds=5)
+
+    with patch("cdp_agentkit_core.actions.wow.token_facts.time.time", return_value=1000):
+        cache.set_total_supply(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, 42)
+
+    with patch("cdp_agentkit_core.actions.wow.token_facts.time.time", return_value=1004):
+        assert cache.get_total_supply(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) == 42
+
+    with patch("cdp_agentkit_core.actions.wow.token_facts.time.time", return_value=1006):
+        assert cache.get_total_supply(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) is None
+
+    assert not path.exists()
+
+
+def test_token_facts_cache_writes_only_changed_facts(tmp_path):
+    """Test that ungraduated checks and unchanged facts never rewrite the file."""
+    path = tmp_path / "facts.json"
+    cache = TokenFactsCache(path)
+
+    with patch.object(cache, "_save", wraps=cache._save) as save:
+        cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, False)
+        cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, False)
+        assert save.call_count == 0
+
+        cache.update(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, pool_address=MOCK_POOL_ADDRESS)
+        cache.update(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, pool_address=MOCK_POOL_ADDRESS)
+        cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, True)
+        cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, True)
+        assert save.call_count == 2
+
+    assert TokenFactsCache(path).get(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) == {
+        "pool_address": MOCK_POOL_ADDRESS,
+        "has_graduated": True,
+    }
+
+
+def test_get_pool_address_is_cached():
+    """Test that the pool address is read from the chain only once."""
+    with patch(
+        "cdp.smart_contract.SmartContract.read", return_value=MOCK_POOL_ADDRESS
+    ) as mock_read:
+        assert get_pool_address(MOCK_TOKEN_ADDRESS, MOCK_NETWORK_ID) == MOCK_POOL_ADDRESS
+        assert get_pool_address(MOCK_TOKEN_ADDRESS, MOCK_NETWORK_ID) == MOCK_POOL_ADDRESS
+
+    mock_read.assert_called_once()
+
+
+def test_get_has_graduated_is_cached():
+    """Test that a graduated token is read from the chain only once."""
+    with patch("cdp.smart_contract.SmartContract.read", return_value=1) as mock_read:
+        assert get_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) is True
+        assert get_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS) is True
+
+    mock_read.assert_called_once()
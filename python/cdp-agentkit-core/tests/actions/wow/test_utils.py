@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from cdp_agentkit_core.actions.wow.bonding_curve import get_eth_buy_quote, get_token_sell_quote
+from cdp_agentkit_core.actions.wow.constants import WOW_ABI
+from cdp_agentkit_core.actions.wow.utils import get_buy_quote, get_sell_quote
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_TOKEN_ADDRESS = "0x036CbD53842c5426634e7929541eC2318f3dCF7e"
+MOCK_AMOUNT = "100000000000000"
+MOCK_TOTAL_SUPPLY = 500_000_000 * 10**18
+
+
+def test_get_buy_quote_bonding_curve(fake_chain):
+    """Test that a pre-graduation buy quote is priced locally after a single multicall."""
+    fake_chain.register(
+        MOCK_TOKEN_ADDRESS,
+        WOW_ABI,
+        marketType=lambda: 0,
+        totalSupply=lambda: MOCK_TOTAL_SUPPLY,
+    )
+
+    assert get_buy_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT) == get_eth_buy_quote(
+        MOCK_TOTAL_SUPPLY, int(MOCK_AMOUNT)
+    )
+    assert get_buy_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT) == get_eth_buy_quote(
+        MOCK_TOTAL_SUPPLY, int(MOCK_AMOUNT)
+    )
+    assert len(fake_chain.batches) == 1
+
+
+def test_get_sell_quote_reuses_cached_graduation(fake_chain, token_facts_cache):
+    """Test that a fresh cached graduation status only reads the total supply."""
+    token_facts_cache.set_has_graduated(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, False)
+
+    with patch(
+        "cdp.smart_contract.SmartContract.read", return_value=MOCK_TOTAL_SUPPLY
+    ) as mock_read:
+        assert get_sell_quote(
+            MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT
+        ) == get_token_sell_quote(MOCK_TOTAL_SUPPLY, int(MOCK_AMOUNT))
+
+    mock_read.assert_called_once_with(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "totalSupply", WOW_ABI)
+    assert fake_chain.batches == []
+
+
+def test_get_sell_quote_graduated(fake_chain):
+    """Test that a graduated sell quote is priced on uniswap."""
+    fake_chain.register(
+        MOCK_TOKEN_ADDRESS,
+        WOW_ABI,
+        marketType=lambda: 1,
+        totalSupply=lambda: MOCK_TOTAL_SUPPLY,
+    )
+
+    with patch("cdp_agentkit_core.actions.wow.utils.get_uniswap_quote") as mock_uniswap_quote:
+        mock_uniswap_quote.return_value.amount_out = 42
+
+        assert get_sell_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT) == 42
+
+    mock_uniswap_quote.assert_called_once_with(
+        MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_AMOUNT, "sell"
+    )
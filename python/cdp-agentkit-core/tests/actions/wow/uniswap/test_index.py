@@ -0,0 +1,57 @@
+import pytest
+
+from cdp_agentkit_core.actions.multicall import ERC20_BALANCE_OF_ABI
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_V3_ABI
+from cdp_agentkit_core.actions.wow.uniswap.index import PoolInfo, get_pool_info
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+MOCK_TOKEN0 = "0x2222222222222222222222222222222222222222"
+MOCK_TOKEN1 = "0x4200000000000000000000000000000000000006"
+MOCK_SQRT_PRICE_X96 = 79228162514264337593543950336
+
+
+def test_get_pool_info_success(fake_chain):
+    """Test fetching pool info caches the immutable fields of the pool."""
+    fake_chain.register(
+        MOCK_POOL_ADDRESS,
+        UNISWAP_V3_ABI,
+        token0=lambda: MOCK_TOKEN0,
+        token1=lambda: MOCK_TOKEN1,
+        fee=lambda: 10000,
+        tickSpacing=lambda: 200,
+        liquidity=lambda: 123456789,
+        slot0=lambda: (MOCK_SQRT_PRICE_X96, 0, 0, 1, 1, 0, True),
+    )
+    fake_chain.register(MOCK_TOKEN0, ERC20_BALANCE_OF_ABI, balanceOf=lambda account: 1000)
+    fake_chain.register(MOCK_TOKEN1, ERC20_BALANCE_OF_ABI, balanceOf=lambda account: 2000)
+
+    pool_info = get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
+
+    assert pool_info == PoolInfo(
+        token0=MOCK_TOKEN0,
+        balance0=1000,
+        token1=MOCK_TOKEN1,
+        balance1=2000,
+        fee=10000,
+        liquidity=123456789,
+        sqrt_price_x96=MOCK_SQRT_PRICE_X96,
+        tick=0,
+        tick_spacing=200,
+    )
+    assert len(fake_chain.batches) == 2
+
+    assert get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS) == pool_info
+    assert len(fake_chain.batches) == 3
+
+
+def test_get_pool_info_api_error(fake_chain):
+    """Test fetching pool info when a read fails."""
+
+    def revert():
+        raise Exception("execution reverted")
+
+    fake_chain.register(MOCK_POOL_ADDRESS, UNISWAP_V3_ABI, token0=revert)
+
+    with pytest.raises(Exception, match="Failed to fetch pool information"):
+        get_pool_info(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS)
@@ -0,0 +1,270 @@
+import random
+from fractions import Fraction
+from unittest.mock import patch
+
+import pytest
+
+from cdp_agentkit_core.actions.wow.constants import addresses
+from cdp_agentkit_core.actions.wow.uniswap.constants import UNISWAP_V3_ABI
+from cdp_agentkit_core.actions.wow.uniswap.index import (
+    PoolInfo,
+    get_pool_ticks,
+    get_uniswap_quote,
+)
+from cdp_agentkit_core.actions.wow.uniswap.quoter import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    Q96,
+    MissingTickDataError,
+    PoolTicks,
+    compute_swap_step,
+    fetch_pool_ticks,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+    quote_exact_input,
+    quote_exact_output,
+)
+
+MOCK_NETWORK_ID = "base-sepolia"
+MOCK_POOL_ADDRESS = "0x1111111111111111111111111111111111111111"
+MOCK_TOKEN_ADDRESS = "0x2222222222222222222222222222222222222222"
+MOCK_WETH_ADDRESS = addresses[MOCK_NETWORK_ID]["WETH"]
+MOCK_TICK_SPACING = 60
+MOCK_FEE = 3000
+
+
+def _pool(tick, liquidity, fee=MOCK_FEE):
+    return PoolInfo(
+        token0=MOCK_TOKEN_ADDRESS,
+        balance0=10**30,
+        token1=MOCK_WETH_ADDRESS,
+        balance1=10**30,
+        fee=fee,
+        liquidity=liquidity,
+        sqrt_price_x96=get_sqrt_ratio_at_tick(tick),
+        tick=tick,
+        tick_spacing=MOCK_TICK_SPACING,
+    )
+
+
+def _snapshot(tick, positions, word_radius=2):
+    """Build a pool snapshot from (tick_lower, tick_upper, liquidity) positions."""
+    liquidity_net = {}
+    for tick_lower, tick_upper, liquidity in positions:
+        liquidity_net[tick_lower] = liquidity_net.get(tick_lower, 0) + liquidity
+        liquidity_net[tick_upper] = liquidity_net.get(tick_upper, 0) - liquidity
+
+    active_liquidity = sum(
+        liquidity
+        for tick_lower, tick_upper, liquidity in positions
+        if tick_lower <= tick < tick_upper
+    )
+    center_word = (tick // MOCK_TICK_SPACING) >> 8
+    ticks = PoolTicks(
+        tick_spacing=MOCK_TICK_SPACING,
+        min_word=center_word - word_radius,
+        max_word=center_word + word_radius,
+        liquidity_net={t: net for t, net in liquidity_net.items() if net != 0},
+    )
+    return _pool(tick, active_liquidity), ticks
+
+
+def _reference_exact_input(pool, ticks, zero_for_one, amount_in):
+    """Quote an exact input swap with exact rational arithmetic and no rounding."""
+    fee_factor = 1 - Fraction(pool.fee, 1_000_000)
+    remaining = Fraction(amount_in)
+    amount_out = Fraction(0)
+    sqrt_price = Fraction(pool.sqrt_price_x96, Q96)
+    liquidity = pool.liquidity
+
+    if zero_for_one:
+        boundaries = sorted((t for t in ticks.liquidity_net if t <= pool.tick), reverse=True)
+    else:
+        boundaries = sorted(t for t in ticks.liquidity_net if t > pool.tick)
+
+    for boundary in boundaries:
+        target = Fraction(get_sqrt_ratio_at_tick(boundary), Q96)
+        if zero_for_one:
+            needed = liquidity * (1 / target - 1 / sqrt_price) / fee_factor
+        else:
+            needed = liquidity * (target - sqrt_price) / fee_factor
+
+        if remaining < needed:
+            break
+
+        amount_out += (
+            liquidity * (sqrt_price - target)
+            if zero_for_one
+            else liquidity * (1 / sqrt_price - 1 / target)
+        )
+        remaining -= needed
+        sqrt_price = target
+        liquidity += (
+            -ticks.liquidity_net[boundary] if zero_for_one else ticks.liquidity_net[boundary]
+        )
+
+    if zero_for_one:
+        next_price = 1 / (1 / sqrt_price + remaining * fee_factor / liquidity)
+        amount_out += liquidity * (sqrt_price - next_price)
+    else:
+        next_price = sqrt_price + remaining * fee_factor / liquidity
+        amount_out += liquidity * (1 / sqrt_price - 1 / next_price)
+
+    return amount_out
+
+
+def test_get_sqrt_ratio_at_tick_known_values():
+    """Test the tick math against the bounds published by Uniswap."""
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == Q96
+
+
+def test_get_tick_at_sqrt_ratio_round_trip():
+    """Test that every tick maps back to itself from its sqrt ratio."""
+    for tick in (MIN_TICK, -887271, -50000, -1, 0, 1, 50000, MAX_TICK - 1):
+        sqrt_ratio = get_sqrt_ratio_at_tick(tick)
+        assert get_tick_at_sqrt_ratio(sqrt_ratio) == tick
+        assert get_tick_at_sqrt_ratio(sqrt_ratio + 1) == tick
+
+
+def test_compute_swap_step_known_values():
+    """Test a swap step against a vector from the Uniswap v3 SwapMath tests."""
+    sqrt_price_target = 79623317895830914510639640423
+
+    assert compute_swap_step(Q96, sqrt_price_target, 2 * 10**18, 10**18, 600) == (
+        sqrt_price_target,
+        9975124224178055,
+        9925619580021728,
+        5988667735148,
+    )
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_quote_exact_input_matches_reference_model(zero_for_one):
+    """Test quotes across many initialized ticks against an exact rational model."""
+    rng = random.Random(0 if zero_for_one else 1)
+
+    for _ in range(25):
+        tick = rng.randrange(-3000, 3000)
+        positions = [(-30000, 30000, rng.randrange(10**17, 10**19))]
+        for _ in range(rng.randrange(1, 12)):
+            tick_lower = rng.randrange(-400, 400) * MOCK_TICK_SPACING
+            width = rng.randrange(1, 100) * MOCK_TICK_SPACING
+            positions.append((tick_lower, tick_lower + width, rng.randrange(10**16, 10**19)))
+        pool, ticks = _snapshot(tick, positions)
+        amount_in = rng.randrange(10**15, 10**18)
+
+        amount_out = quote_exact_input(pool, ticks, zero_for_one, amount_in)
+        expected = _reference_exact_input(pool, ticks, zero_for_one, amount_in)
+
+        # The contract rounds every step in favour of the pool, by at most a few wei.
+        assert amount_out <= expected
+        assert expected - amount_out < 2 * len(ticks.liquidity_net) + 2
+
+
+def test_quote_exact_output_is_consistent_with_exact_input():
+    """Test that the input quoted for an output yields at least that output."""
+    pool, ticks = _snapshot(
+        120, [(-30000, 30000, 10**18), (-600, 600, 5 * 10**18), (180, 1200, 10**18)]
+    )
+
+    for zero_for_one in (True, False):
+        amount_in = quote_exact_output(pool, ticks, zero_for_one, 10**17)
+        assert quote_exact_input(pool, ticks, zero_for_one, amount_in) >= 10**17
+        assert quote_exact_input(pool, ticks, zero_for_one, amount_in - 2) < 10**17
+
+
+def test_quote_exact_input_missing_tick_data():
+    """Test that walking past the fetched bitmap words raises MissingTickDataError."""
+    pool, ticks = _snapshot(0, [(-30000, 30000, 10**12)], word_radius=0)
+
+    with pytest.raises(MissingTickDataError):
+        quote_exact_input(pool, ticks, True, 10**18)
+
+
+def test_fetch_pool_ticks(fake_chain):
+    """Test fetching the initialized ticks around the current tick with two multicalls."""
+    bitmaps = {0: 1 << 1 | 1 << 5, -1: 1 << 255}
+    fake_chain.register(
+        MOCK_POOL_ADDRESS,
+        UNISWAP_V3_ABI,
+        tickBitmap=lambda word_position: bitmaps.get(word_position, 0),
+        ticks=lambda tick: (10**18, tick * 10**12, 0, 0, 0, 0, 0, True),
+    )
+
+    ticks = fetch_pool_ticks(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, 0, MOCK_TICK_SPACING)
+
+    assert ticks == PoolTicks(
+        tick_spacing=MOCK_TICK_SPACING,
+        min_word=-2,
+        max_word=2,
+        liquidity_net={-60: -60 * 10**12, 60: 60 * 10**12, 300: 300 * 10**12},
+    )
+    assert len(fake_chain.batches) == 2
+
+
+def test_get_uniswap_quote_uses_local_quote():
+    """Test that a quote is computed locally when the tick snapshot covers the swap."""
+    pool, ticks = _snapshot(0, [(-30000, 30000, 10**20)])
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.uniswap.index.get_pool_address",
+            return_value=MOCK_POOL_ADDRESS,
+        ),
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.get_pool_info", return_value=pool),
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.fetch_pool_ticks", return_value=ticks),
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.exact_input_single") as mock_quoter,
+    ):
+        quote = get_uniswap_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "1000000", "sell")
+
+    assert quote.amount_out == quote_exact_input(pool, ticks, True, 1000000)
+    mock_quoter.assert_not_called()
+
+
+def test_get_pool_ticks_is_cached_until_the_pool_changes(token_facts_cache):
+    """Test that ticks are reused until the liquidity changes or the price leaves their range."""
+    pool, ticks = _snapshot(0, [(-30000, 30000, 10**20)])
+    far_tick = (3 << 8) * MOCK_TICK_SPACING
+
+    with patch(
+        "cdp_agentkit_core.actions.wow.uniswap.index.fetch_pool_ticks", return_value=ticks
+    ) as mock_fetch:
+        assert get_pool_ticks(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, pool) is ticks
+        assert get_pool_ticks(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, pool) is ticks
+        assert mock_fetch.call_count == 1
+
+        get_pool_ticks(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, _pool(0, 2 * 10**20))
+        assert mock_fetch.call_count == 2
+
+        get_pool_ticks(MOCK_NETWORK_ID, MOCK_POOL_ADDRESS, _pool(far_tick, 2 * 10**20))
+        assert mock_fetch.call_count == 3
+
+
+def test_get_uniswap_quote_falls_back_to_quoter():
+    """Test that the on-chain quoter is used when tick data is missing."""
+    pool, _ = _snapshot(0, [(-30000, 30000, 10**20)])
+
+    with (
+        patch(
+            "cdp_agentkit_core.actions.wow.uniswap.index.get_pool_address",
+            return_value=MOCK_POOL_ADDRESS,
+        ),
+        patch("cdp_agentkit_core.actions.wow.uniswap.index.get_pool_info", return_value=pool),
+        patch(
+            "cdp_agentkit_core.actions.wow.uniswap.index.fetch_pool_ticks",
+            side_effect=MissingTickDataError("Tick bitmap word 3 was not fetched"),
+        ),
+        patch(
+            "cdp_agentkit_core.actions.wow.uniswap.index.exact_input_single", return_value=42
+        ) as mock_quoter,
+    ):
+        quote = get_uniswap_quote(MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, "1000000", "sell")
+
+    assert quote.amount_out == 42
+    mock_quoter.assert_called_once_with(
+        MOCK_NETWORK_ID, MOCK_TOKEN_ADDRESS, MOCK_WETH_ADDRESS, 1000000, MOCK_FEE
+    )
@@ -1,7 +1,58 @@
 import os
 
+import pytest
+
+from cdp_agentkit_core.actions.asset_cache import AssetCache, set_asset_cache
+from cdp_agentkit_core.actions.nonce_manager import NonceManager, set_nonce_manager
+from cdp_agentkit_core.actions.pyth.catalog import PriceFeedCatalog, set_price_feed_catalog
+from cdp_agentkit_core.actions.transaction_tracker import (
+    start_transaction_tracker,
+    stop_transaction_tracker,
+)
+from cdp_agentkit_core.actions.wow.token_facts import TokenFactsCache, set_token_facts_cache
+
 factory_modules = [
     f[:-3] for f in os.listdir("./tests/factories") if f.endswith(".py") and f != "__init__.py"
 ]
 
 pytest_plugins = [f"tests.factories.{module_name}" for module_name in factory_modules]
+
+
+@pytest.fixture(autouse=True)
+def token_facts_cache():
+    """Isolate each test with an in-memory WOW token facts cache."""
+    cache = TokenFactsCache()
+    set_token_facts_cache(cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def price_feed_catalog():
+    """Isolate each test with an in-memory Pyth price feed catalog."""
+    catalog = PriceFeedCatalog()
+    set_price_feed_catalog(catalog)
+    return catalog
+
+
+@pytest.fixture(autouse=True)
+def asset_cache():
+    """Isolate each test with an empty asset cache."""
+    cache = AssetCache()
+    set_asset_cache(cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def nonce_manager():
+    """Isolate each test with its own nonce manager."""
+    manager = NonceManager()
+    set_nonce_manager(manager)
+    return manager
+
+
+@pytest.fixture
+def transaction_tracker():
+    """Turn on fire-and-track mode with a fast polling tracker for the test."""
+    tracker = start_transaction_tracker(poll_interval=0.01)
+    yield tracker
+    stop_transaction_tracker()
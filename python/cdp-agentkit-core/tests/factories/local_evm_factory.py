@@ -0,0 +1,47 @@
+import threading
+import time
+
+import pytest
+
+
+class LocalEvm:
+    """In-process stand-in for an EVM node's nonce rules.
+
+    A transaction with the next nonce of its sender executes, along with any queued transactions
+    it unblocks. A higher nonce is queued behind the gap and a used nonce is rejected.
+    """
+
+    def __init__(self, broadcast_delay=0.0):
+        self.broadcast_delay = broadcast_delay
+        self.nonces = {}
+        self.queued = {}
+        self.executed = []
+        self._lock = threading.Lock()
+
+    def get_transaction_count(self, network_id, address):
+        """Get the next nonce of an address."""
+        with self._lock:
+            return self.nonces.get(address.lower(), 0)
+
+    def send_transaction(self, address, nonce):
+        """Broadcast a transaction from an address with a nonce."""
+        # Time on the wire, during which other senders may read the same nonce.
+        time.sleep(self.broadcast_delay)
+        address = address.lower()
+        with self._lock:
+            next_nonce = self.nonces.get(address, 0)
+            queued = self.queued.setdefault(address, set())
+            if nonce < next_nonce or nonce in queued:
+                raise ValueError(f"nonce too low: {nonce}")
+            queued.add(nonce)
+            while next_nonce in queued:
+                queued.remove(next_nonce)
+                self.executed.append((address, next_nonce))
+                next_nonce += 1
+            self.nonces[address] = next_nonce
+
+
+@pytest.fixture
+def local_evm():
+    """Create a LocalEvm."""
+    return LocalEvm()
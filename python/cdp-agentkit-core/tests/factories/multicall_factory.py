@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+import pytest
+from eth_abi import decode, encode
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types, get_abi_output_types
+
+
+class FakeChain:
+    """In-process stand-in for Multicall3 that dispatches each call to Python handlers."""
+
+    def __init__(self):
+        self.contracts = {}
+        self.batches = []
+
+    def register(self, address, abi, **handlers):
+        """Register handlers for the methods of a contract, keyed by method name."""
+        functions = {}
+        for entry in abi:
+            if entry.get("type") == "function" and entry["name"] in handlers:
+                functions[function_abi_to_4byte_selector(entry)] = (entry, handlers[entry["name"]])
+        self.contracts.setdefault(address.lower(), {}).update(functions)
+
+    def aggregate3(self, network_id, calls):
+        """Execute an aggregate3 batch against the registered handlers."""
+        self.batches.append(calls)
+        results = []
+        for target, _allow_failure, call_data in calls:
+            function, handler = self.contracts[target.lower()][call_data[:4]]
+            args = decode(get_abi_input_types(function), call_data[4:])
+            try:
+                value = handler(*args)
+            except Exception:
+                results.append((False, b""))
+                continue
+            output_types = get_abi_output_types(function)
+            values = value if len(output_types) > 1 else (value,)
+            results.append((True, encode(output_types, values)))
+        return results
+
+
+@pytest.fixture
+def fake_chain():
+    """Create a FakeChain and route all multicall batches to it."""
+    chain = FakeChain()
+    with patch("cdp_agentkit_core.actions.multicall.cdp_aggregate3", side_effect=chain.aggregate3):
+        yield chain
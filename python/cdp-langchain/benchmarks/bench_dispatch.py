@@ -0,0 +1,64 @@
+"""Microbenchmark of the per-call overhead of dispatching a CDP Action from a tool.
+
+Compares the previous per-call path, which inspected the action signature and built a new
+args schema model on every call, with the dispatch resolved once when the toolkit is created.
+The action itself is a stub, so the timings are dispatch overhead only.
+
+Run with `poetry run python benchmarks/bench_dispatch.py`.
+"""
+
+import inspect
+import timeit
+
+from cdp import Wallet
+from cdp_agentkit_core.actions.get_balance import GetBalanceInput
+from cdp_langchain.tools import CdpTool
+from cdp_langchain.utils import ActionDispatch, CdpAgentkitWrapper
+
+ITERATIONS = 100_000
+
+
+def get_balance(wallet: Wallet, asset_id: str) -> str:
+    """Stub of the get_balance action."""
+    return asset_id
+
+
+def per_call_dispatch(wrapper: CdpAgentkitWrapper, **kwargs) -> str:
+    """Dispatch as before: validate a new model and inspect the signature on every call."""
+    parsed_input_args = GetBalanceInput(**kwargs).model_dump()
+    first_kwarg = next(iter(inspect.signature(get_balance).parameters.values()), None)
+    if first_kwarg is not None and first_kwarg.annotation is Wallet:
+        return get_balance(wrapper.wallet, **parsed_input_args)
+    return get_balance(**parsed_input_args)
+
+
+def main():
+    """Time both dispatch paths and print the per-call overhead."""
+    wrapper = CdpAgentkitWrapper.model_construct(wallet=object())
+    dispatch = ActionDispatch.for_action(get_balance, args_schema=GetBalanceInput)
+    tool = CdpTool(
+        name="get_balance",
+        description="",
+        cdp_agentkit_wrapper=wrapper,
+        args_schema=GetBalanceInput,
+        func=get_balance,
+        dispatch=dispatch,
+    )
+
+    timings = {
+        "per-call inspect.signature + model_dump": lambda: per_call_dispatch(
+            wrapper, asset_id="eth"
+        ),
+        "precomputed dispatch": lambda: wrapper.run_dispatch(
+            dispatch, dispatch.parse_args(None, asset_id="eth")
+        ),
+        "CdpTool._run": lambda: tool._run(asset_id="eth"),
+    }
+
+    for name, func in timings.items():
+        seconds = min(timeit.repeat(func, number=ITERATIONS, repeat=5))
+        print(f"{name:<42} {seconds / ITERATIONS * 1e6:6.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,10 @@
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import BaseToolkit
 
-from cdp_agentkit_core.actions import CDP_ACTIONS
+from cdp_agentkit_core.actions import get_all_cdp_actions
+from cdp_agentkit_core.actions.registry import get_action_registry
 from cdp_langchain.tools import CdpTool
-from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils import ActionDispatch, CdpAgentkitWrapper
 
 
 class CdpToolkit(BaseToolkit):
@@ -37,7 +38,7 @@ class CdpToolkit(BaseToolkit):
         .. code-block:: python
 
             from cdp_langchain.agent_toolkits import CdpToolkit
-            from cdp_langchain.utils import CdpAgentkitWrapper
+            from cdp_langchain.utils import ActionDispatch, CdpAgentkitWrapper
 
             cdp = CdpAgentkitWrapper()
             cdp_toolkit = CdpToolkit.from_cdp_agentkit_wrapper(cdp)
@@ -117,17 +118,33 @@ class CdpToolkit(BaseToolkit):
     tools: list[BaseTool] = []  # noqa: RUF012
 
     @classmethod
-    def from_cdp_agentkit_wrapper(cls, cdp_agentkit_wrapper: CdpAgentkitWrapper) -> "CdpToolkit":
+    def from_cdp_agentkit_wrapper(
+        cls, cdp_agentkit_wrapper: CdpAgentkitWrapper, lazy: bool = False
+    ) -> "CdpToolkit":
         """Create a CdpToolkit from a CdpAgentkitWrapper.
 
         Args:
             cdp_agentkit_wrapper: CdpAgentkitWrapper. The CDP Agentkit wrapper.
+            lazy: bool. Create the tools from the action manifest, with JSON args schemas, and
+                import each action on its first call.
 
         Returns:
             CdpToolkit. The CDP toolkit.
 
         """
-        actions = CDP_ACTIONS
+        if lazy:
+            tools = [
+                CdpTool(
+                    name=entry.name,
+                    description=entry.description,
+                    cdp_agentkit_wrapper=cdp_agentkit_wrapper,
+                    args_schema=entry.args_schema,
+                )
+                for entry in get_action_registry().entries
+            ]
+            return cls(tools=tools)  # type: ignore[arg-type]
+
+        actions = get_all_cdp_actions()
 
         tools = [
             CdpTool(
@@ -136,6 +153,14 @@ class CdpToolkit(BaseToolkit):
                 cdp_agentkit_wrapper=cdp_agentkit_wrapper,
                 args_schema=action.args_schema,
                 func=action.func,
+                afunc=action.afunc,
+                dispatch=ActionDispatch.for_action(
+                    action.func,
+                    action.afunc,
+                    action.args_schema,
+                    name=action.name,
+                    side_effect=action.side_effect,
+                ),
             )
             for action in actions
         ]
@@ -1,5 +1,6 @@
 """CDP Tool."""
 
 from cdp_langchain.tools.cdp_tool import CdpTool
+from cdp_langchain.tools.cdp_tool_node import CdpToolNode
 
-__all__ = ["CdpTool"]
+__all__ = ["CdpTool", "CdpToolNode"]
@@ -7,13 +7,16 @@ To use this tool, you must first set as environment variables:
 
 """
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from langchain_core.callbacks import CallbackManagerForToolRun
+from langchain_core.callbacks import AsyncCallbackManagerForToolRun, CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_WRITE
+from cdp_agentkit_core.actions.registry import get_action_registry
+from cdp_langchain.utils.action_dispatch import ActionDispatch
 from cdp_langchain.utils.cdp_agentkit_wrapper import CdpAgentkitWrapper
 
 
@@ -23,8 +26,31 @@ class CdpTool(BaseTool):  # type: ignore[override]
     cdp_agentkit_wrapper: CdpAgentkitWrapper
     name: str = ""
     description: str = ""
-    args_schema: type[BaseModel] | None = None
-    func: Callable[..., str]
+    args_schema: type[BaseModel] | dict[str, Any] | None = None
+    func: Callable[..., str] | None = None
+    afunc: Callable[..., Awaitable[str]] | None = None
+    dispatch: ActionDispatch | None = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve the dispatch of the action unless the toolkit already did.
+
+        A tool created without `func` is lazy: its action is loaded from the action registry by
+        name on the first call.
+        """
+        if self.dispatch is None and self.func is not None:
+            self.dispatch = ActionDispatch.for_action(
+                self.func, self.afunc, self.args_schema, name=self.name
+            )
+
+    @property
+    def side_effect(self) -> str:
+        """The side effect of the action, `read`, `external` or `write`, without importing it."""
+        if self.dispatch is not None:
+            return self.dispatch.side_effect
+        try:
+            return get_action_registry().get_entry(self.name).side_effect
+        except KeyError:
+            return SIDE_EFFECT_WRITE
 
     def _run(
         self,
@@ -33,12 +59,36 @@ class CdpTool(BaseTool):  # type: ignore[override]
         **kwargs: Any,
     ) -> str:
         """Use the CDP SDK to run an operation."""
-        if not instructions or instructions == "{}":
-            # Catch other forms of empty input that GPT-4 likes to send.
-            instructions = ""
-        if self.args_schema is not None:
-            validated_input_data = self.args_schema(**kwargs)
-            parsed_input_args = validated_input_data.model_dump()
-        else:
-            parsed_input_args = {"instructions": instructions}
-        return self.cdp_agentkit_wrapper.run_action(self.func, **parsed_input_args)
+        dispatch = self._get_dispatch()
+        parsed_input_args = dispatch.parse_args(instructions, **kwargs)
+        return self.cdp_agentkit_wrapper.run_dispatch(dispatch, parsed_input_args)
+
+    async def _arun(
+        self,
+        instructions: str | None = "",
+        run_manager: AsyncCallbackManagerForToolRun | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Use the CDP SDK to run an operation on the event loop.
+
+        Actions without a native async implementation fall back to running the sync
+        implementation in an executor.
+        """
+        dispatch = self._get_dispatch()
+        if dispatch.afunc is None:
+            return await super()._arun(instructions, run_manager=run_manager, **kwargs)
+
+        parsed_input_args = dispatch.parse_args(instructions, **kwargs)
+        return await self.cdp_agentkit_wrapper.arun_dispatch(dispatch, parsed_input_args)
+
+    def _get_dispatch(self) -> ActionDispatch:
+        if self.dispatch is None:
+            action = get_action_registry().load(self.name)
+            self.dispatch = ActionDispatch.for_action(
+                action.func,
+                action.afunc,
+                action.args_schema,
+                name=action.name,
+                side_effect=action.side_effect,
+            )
+        return self.dispatch
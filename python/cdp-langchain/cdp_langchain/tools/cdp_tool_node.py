@@ -0,0 +1,114 @@
+"""Tool node that runs independent CDP reads in parallel and wallet writes in order."""
+
+import asyncio
+from collections.abc import Hashable
+from typing import Any
+
+from langchain_core.messages import AnyMessage, ToolCall
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import get_config_list, get_executor_for_config
+from langgraph.prebuilt import ToolNode
+from langgraph.store.base import BaseStore
+from langgraph.types import Command
+from pydantic import BaseModel
+
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_WRITE
+from cdp_langchain.tools.cdp_tool import CdpTool
+
+# Default number of tool calls of one step run at once.
+TOOL_NODE_MAX_CONCURRENCY = 8
+
+
+class CdpToolNode(ToolNode):
+    """A drop-in `ToolNode` for CDP tools that orders writes per wallet.
+
+    The tool calls of one model step are split into lanes: every read or external call, and every
+    call of a tool that is not a CDP tool, is a lane of its own, while the write calls made through
+    the same wallet share one lane and run one at a time in the order the model emitted them. Up
+    to `max_concurrency` lanes run at once, so independent reads such as balances and prices
+    overlap their round trips without racing writes from the same address.
+
+    A wrapper with `shard_count` above one writes from that many addresses, so its writes are
+    dealt round robin into one lane per shard and only the writes within a lane keep their order.
+
+    This overrides the private `_func` and `_afunc` hooks of `ToolNode` and calls its
+    `_parse_input`, `_run_one` and `_arun_one` helpers, as of langgraph 0.2.69; the tests check
+    that their signatures still match.
+
+    Example:
+        .. code-block:: python
+
+            tools = cdp_toolkit.get_tools()
+            agent = create_react_agent(llm, tools=CdpToolNode(tools))
+
+    """
+
+    def __init__(self, *args: Any, max_concurrency: int = TOOL_NODE_MAX_CONCURRENCY, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+
+    def _func(
+        self,
+        input: list[AnyMessage] | dict[str, Any] | BaseModel,
+        config: RunnableConfig,
+        *,
+        store: BaseStore | None = None,
+    ) -> Any:
+        tool_calls, input_type = self._parse_input(input, store)
+        config_list = get_config_list(config, len(tool_calls))
+        outputs: list[Any] = [None] * len(tool_calls)
+
+        def run_lane(lane: list[int]) -> None:
+            for index in lane:
+                outputs[index] = self._run_one(tool_calls[index], input_type, config_list[index])
+
+        lanes = self._lanes(tool_calls)
+        with get_executor_for_config({**config, "max_concurrency": self.max_concurrency}) as pool:
+            list(pool.map(run_lane, lanes))
+        return self._combine_outputs(outputs, input_type)
+
+    async def _afunc(
+        self,
+        input: list[AnyMessage] | dict[str, Any] | BaseModel,
+        config: RunnableConfig,
+        *,
+        store: BaseStore | None = None,
+    ) -> Any:
+        tool_calls, input_type = self._parse_input(input, store)
+        outputs: list[Any] = [None] * len(tool_calls)
+        slots = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_lane(lane: list[int]) -> None:
+            async with slots:
+                for index in lane:
+                    outputs[index] = await self._arun_one(tool_calls[index], input_type, config)
+
+        await asyncio.gather(*(run_lane(lane) for lane in self._lanes(tool_calls)))
+        return self._combine_outputs(outputs, input_type)
+
+    def _lanes(self, tool_calls: list[ToolCall]) -> list[list[int]]:
+        lanes: dict[Hashable, list[int]] = {}
+        writes: dict[int, int] = {}
+        for index, call in enumerate(tool_calls):
+            lanes.setdefault(self._lane_key(index, call, writes), []).append(index)
+        return list(lanes.values())
+
+    def _lane_key(self, index: int, call: ToolCall, writes: dict[int, int]) -> Hashable:
+        tool = self.tools_by_name.get(call["name"])
+        if isinstance(tool, CdpTool) and tool.side_effect == SIDE_EFFECT_WRITE:
+            # One wrapper holds one wallet, so its writes share the wallet's shard addresses.
+            wrapper = tool.cdp_agentkit_wrapper
+            count = writes[id(wrapper)] = writes.get(id(wrapper), 0) + 1
+            return ("wallet", id(wrapper), (count - 1) % max(wrapper.shard_count, 1))
+        return ("call", index)
+
+    def _combine_outputs(self, outputs: list[Any], input_type: str) -> Any:
+        # Shape the outputs as ToolNode does: plain messages, or commands mixed with updates.
+        if not any(isinstance(output, Command) for output in outputs):
+            return outputs if input_type == "list" else {self.messages_key: outputs}
+        return [
+            output
+            if isinstance(output, Command)
+            else ([output] if input_type == "list" else {self.messages_key: [output]})
+            for output in outputs
+        ]
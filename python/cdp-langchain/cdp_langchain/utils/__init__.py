@@ -1,5 +1,15 @@
 """**Utilities** are the integration wrappers that LangChain uses to interact with third-party systems and packages."""
 
+from cdp_langchain.utils.action_dispatch import ActionDispatch
+from cdp_langchain.utils.cdp_agentkit_pool import CdpAgentkitPool
 from cdp_langchain.utils.cdp_agentkit_wrapper import CdpAgentkitWrapper
+from cdp_langchain.utils.result_cache import ActionResultCache
+from cdp_langchain.utils.wallet_snapshot import WalletSnapshotStore
 
-__all__ = ["CdpAgentkitWrapper"]
+__all__ = [
+    "ActionDispatch",
+    "ActionResultCache",
+    "CdpAgentkitPool",
+    "CdpAgentkitWrapper",
+    "WalletSnapshotStore",
+]
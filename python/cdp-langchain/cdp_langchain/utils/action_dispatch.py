@@ -0,0 +1,9 @@
+"""Dispatch of CDP Actions resolved once per tool rather than on every call."""
+
+from cdp_agentkit_core.actions.action_dispatch import (
+    ActionDispatch,
+    get_type_adapter,
+    takes_wallet,
+)
+
+__all__ = ["ActionDispatch", "get_type_adapter", "takes_wallet"]
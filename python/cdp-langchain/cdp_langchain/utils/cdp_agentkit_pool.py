@@ -0,0 +1,247 @@
+"""Multi-tenant CDP Agentkit wrapper serving one wallet per tenant."""
+
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any
+
+from langchain_core.runnables.config import ensure_config
+from langchain_core.utils import get_from_dict_or_env
+from pydantic import PrivateAttr, model_validator
+
+from cdp_langchain.utils.cdp_agentkit_wrapper import CdpAgentkitWrapper, _load_wallet
+from cdp_langchain.utils.wallet_snapshot import WalletSnapshotStore
+
+# Hydrated tenant wallets kept in memory; the least recently used are evicted first.
+POOL_MAX_WALLETS = 128
+
+# A wallet restored from a snapshot older than this is reconciled with the API in the background.
+POOL_SNAPSHOT_RECONCILE_SECONDS = 60 * 60
+
+
+class CdpAgentkitPool(CdpAgentkitWrapper):
+    """CDP Agentkit wrapper that serves the wallet of the tenant of each run.
+
+    One pool, and one toolkit created from it, serves every tenant: each action resolves the
+    tenant from the `tenant_key` entry of the `configurable` run config, and runs with that
+    tenant's wallet. Hydrated wallets are kept in a bounded LRU, so memory scales with the active
+    tenants. An evicted wallet is rehydrated from its encrypted snapshot without API calls when
+    `wallet_snapshot_dir` is set, or else from the wallet data of `wallet_data_provider`; one of
+    the two is required. A tenant without wallet data or a snapshot gets a new wallet the first
+    time the pool serves it, and the pool refuses to create another one for it later.
+
+    Example:
+        .. code-block:: python
+
+            pool = CdpAgentkitPool(
+                wallet_data_provider=load_tenant_wallet_data,
+                wallet_data_saver=save_tenant_wallet_data,
+                wallet_snapshot_dir="/var/cache/agent-wallets",
+            )
+            tools = CdpToolkit.from_cdp_agentkit_wrapper(pool).get_tools()
+            agent = create_react_agent(llm, tools=CdpToolNode(tools))
+            agent.invoke(inputs, {"configurable": {"tenant_id": "user-123"}})
+
+    """
+
+    max_wallets: int = POOL_MAX_WALLETS
+    tenant_key: str = "tenant_id"
+    wallet_data_provider: Any = None  #: :meta private:
+    wallet_data_saver: Any = None  #: :meta private:
+    wallet_snapshot_dir: str | None = None
+    snapshot_reconcile_seconds: float = POOL_SNAPSHOT_RECONCILE_SECONDS
+    _wallets: Any = PrivateAttr(default_factory=OrderedDict)
+    _loading: Any = PrivateAttr(default_factory=dict)
+    _served: Any = PrivateAttr(default_factory=set)
+    _pool_lock: Any = PrivateAttr(default_factory=threading.Lock)
+
+    @model_validator(mode="before")
+    @classmethod
+    def validate_environment(cls, values: dict) -> Any:
+        """Configure the CDP SDK without loading a wallet, which is loaded per tenant instead."""
+        values = super().validate_environment({**values, "lazy_wallet": True})
+        if values["shard_count"] > 1:
+            raise ValueError("CdpAgentkitPool does not support sharding.")
+
+        values["max_wallets"] = int(
+            get_from_dict_or_env(
+                values, "max_wallets", "CDP_AGENTKIT_POOL_MAX_WALLETS", str(POOL_MAX_WALLETS)
+            )
+        )
+        values["wallet_snapshot_dir"] = (
+            get_from_dict_or_env(
+                values, "wallet_snapshot_dir", "CDP_AGENTKIT_WALLET_SNAPSHOT_DIR", ""
+            )
+            or None
+        )
+        if values.get("wallet_data_provider") is None and values["wallet_snapshot_dir"] is None:
+            raise ValueError(
+                "CdpAgentkitPool requires a `wallet_data_provider` or a `wallet_snapshot_dir` to "
+                "rehydrate evicted tenant wallets."
+            )
+        values["wallet_snapshot_key"] = get_from_dict_or_env(
+            values,
+            "wallet_snapshot_key",
+            "CDP_AGENTKIT_WALLET_SNAPSHOT_KEY",
+            values["cdp_api_key_private_key"],
+        )
+
+        return values
+
+    def current_tenant(self) -> str:
+        """Get the tenant of the current run from its `configurable` config.
+
+        Returns:
+            str: The tenant.
+
+        Raises:
+            ValueError: If the run config has no tenant.
+
+        """
+        tenant = ensure_config().get("configurable", {}).get(self.tenant_key)
+        if tenant is None:
+            raise ValueError(f"The run config has no `{self.tenant_key}` in `configurable`.")
+        return str(tenant)
+
+    def get_wallet(self) -> Any:
+        """Get the wallet of the tenant of the current run.
+
+        Returns:
+            Wallet: The wallet.
+
+        """
+        return self.get_tenant_wallet(self.current_tenant())
+
+    async def aget_wallet(self) -> Any:
+        """Get the wallet of the tenant of the current run without blocking the event loop.
+
+        Returns:
+            Wallet: The wallet.
+
+        """
+        return await self.aget_tenant_wallet(self.current_tenant())
+
+    def get_tenant_wallet(self, tenant: str) -> Any:
+        """Get the wallet of a tenant, hydrating it if it is not in the pool.
+
+        Concurrent first callers for a tenant share a single hydration.
+
+        Args:
+            tenant (str): The tenant.
+
+        Returns:
+            Wallet: The wallet.
+
+        """
+        wallet, hydration, owner = self._start_tenant_hydration(tenant)
+        if wallet is not None:
+            return wallet
+        if owner:
+            self._hydrate_tenant(tenant, hydration)
+        return hydration.result()
+
+    async def aget_tenant_wallet(self, tenant: str) -> Any:
+        """Get the wallet of a tenant without blocking the event loop.
+
+        Args:
+            tenant (str): The tenant.
+
+        Returns:
+            Wallet: The wallet.
+
+        """
+        wallet, hydration, owner = self._start_tenant_hydration(tenant)
+        if wallet is not None:
+            return wallet
+        if owner:
+            await asyncio.to_thread(self._hydrate_tenant, tenant, hydration)
+        return await asyncio.wrap_future(hydration)
+
+    def evict(self, tenant: str) -> None:
+        """Drop the wallet of a tenant from the pool.
+
+        Args:
+            tenant (str): The tenant.
+
+        """
+        with self._pool_lock:
+            self._wallets.pop(tenant, None)
+
+    @property
+    def active_tenants(self) -> list[str]:
+        """The tenants with a hydrated wallet, least recently used first."""
+        with self._pool_lock:
+            return list(self._wallets)
+
+    def _start_tenant_hydration(self, tenant: str) -> tuple[Any, Future | None, bool]:
+        with self._pool_lock:
+            wallet = self._wallets.get(tenant)
+            if wallet is not None:
+                self._wallets.move_to_end(tenant)
+                return wallet, None, False
+            if tenant in self._loading:
+                return None, self._loading[tenant], False
+            hydration = self._loading[tenant] = Future()
+            return None, hydration, True
+
+    def _hydrate_tenant(self, tenant: str, hydration: Future) -> None:
+        try:
+            wallet = self._load_tenant_wallet(tenant)
+        except BaseException as e:
+            with self._pool_lock:
+                del self._loading[tenant]
+            hydration.set_exception(e)
+            return
+        with self._pool_lock:
+            self._wallets[tenant] = wallet
+            self._served.add(tenant)
+            del self._loading[tenant]
+            while len(self._wallets) > self.max_wallets:
+                self._wallets.popitem(last=False)
+        hydration.set_result(wallet)
+
+    def _load_tenant_wallet(self, tenant: str) -> Any:
+        wallet_data = self.wallet_data_provider(tenant) if self.wallet_data_provider else None
+        wallet_id = json.loads(wallet_data)["wallet_id"] if wallet_data else None
+        snapshot = self._tenant_snapshot(tenant)
+
+        if snapshot is not None:
+            wallet = snapshot.load(self.network_id, wallet_id)
+            if wallet is not None:
+                if time.time() - snapshot.saved_at > self.snapshot_reconcile_seconds:
+                    snapshot.reconcile(wallet)
+                return wallet
+
+        if wallet_data is None:
+            with self._pool_lock:
+                served = tenant in self._served
+            if served:
+                raise ValueError(
+                    f"No wallet data or snapshot for tenant {tenant!r}, whose wallet the pool "
+                    "already served; refusing to create a new wallet."
+                )
+
+        wallet = _load_wallet(wallet_data, "", self.network_id)
+        if wallet_data is None and self.wallet_data_saver is not None:
+            exported = wallet.export_data().to_dict()
+            exported["default_address_id"] = wallet.default_address.address_id
+            self.wallet_data_saver(tenant, json.dumps(exported))
+        if snapshot is not None:
+            snapshot.save(wallet)
+        return wallet
+
+    def _tenant_snapshot(self, tenant: str) -> WalletSnapshotStore | None:
+        if self.wallet_snapshot_dir is None:
+            return None
+        name = hashlib.sha256(tenant.encode()).hexdigest()
+        return WalletSnapshotStore(
+            Path(self.wallet_snapshot_dir) / f"{name}.bin", self.wallet_snapshot_key
+        )
+
+    def _result_cache_scope(self) -> str | None:
+        return f"{self.network_id}:{self.current_tenant()}"
@@ -1,16 +1,28 @@
 """Util that calls CDP."""
 
-import inspect
+import asyncio
 import json
-from collections.abc import Callable
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future
+from functools import partial
 from typing import Any
 
 from langchain_core.utils import get_from_dict_or_env
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, PrivateAttr, model_validator
 
-from cdp import MnemonicSeedPhrase, Wallet
+from cdp_agentkit_core.actions.cdp_action import (
+    CACHEABLE_SIDE_EFFECTS,
+    SIDE_EFFECT_READ,
+    SIDE_EFFECT_WRITE,
+)
+from cdp_agentkit_core.actions.registry import get_action_registry
+from cdp_agentkit_core.actions.transaction_tracker import get_transaction_tracker
 from cdp_langchain import __version__
 from cdp_langchain.constants import CDP_LANGCHAIN_DEFAULT_SOURCE
+from cdp_langchain.utils.action_dispatch import ActionDispatch
+from cdp_langchain.utils.result_cache import ActionResultCache
+from cdp_langchain.utils.wallet_snapshot import WalletSnapshotStore
 
 
 class CdpAgentkitWrapper(BaseModel):
@@ -20,6 +32,21 @@ class CdpAgentkitWrapper(BaseModel):
     cdp_api_key_name: str | None = None
     cdp_api_key_private_key: str | None = None
     network_id: str | None = None
+    shard_count: int = 1
+    shard_strategy: str = "least_pending"
+    shard_treasury_address: str | None = None
+    shard_min_balance: str | None = None
+    shard_top_up_amount: str | None = None
+    shard_pool: Any = None  #: :meta private:
+    result_cache_ttl_seconds: float = 0.0
+    result_cache: Any = None  #: :meta private:
+    lazy_wallet: bool = False
+    wallet_loader: Any = None  #: :meta private:
+    wallet_snapshot_path: str | None = None
+    wallet_snapshot_key: str | None = None
+    wallet_snapshot: Any = None  #: :meta private:
+    _hydration: Any = PrivateAttr(default=None)
+    _hydration_lock: Any = PrivateAttr(default_factory=threading.Lock)
 
     @model_validator(mode="before")
     @classmethod
@@ -34,7 +61,7 @@ class CdpAgentkitWrapper(BaseModel):
         wallet_data_json = values.get("cdp_wallet_data")
 
         try:
-            from cdp import Cdp, Wallet, WalletData
+            from cdp import Cdp
         except Exception:
             raise ImportError(
                 "CDP SDK is not installed. " "Please install it with `pip install cdp-sdk`"
@@ -47,16 +74,62 @@ class CdpAgentkitWrapper(BaseModel):
             source_version=__version__,
         )
 
-        if wallet_data_json:
-            wallet_data = WalletData.from_dict(json.loads(wallet_data_json))
-            wallet = Wallet.import_data(wallet_data)
-        elif mnemonic_phrase:
-            phrase = MnemonicSeedPhrase(mnemonic_phrase)
-            wallet = Wallet.import_wallet(phrase, network_id)
+        shard_count = int(
+            get_from_dict_or_env(values, "shard_count", "CDP_AGENTKIT_SHARD_COUNT", "1")
+        )
+        lazy_wallet = str(
+            get_from_dict_or_env(values, "lazy_wallet", "CDP_AGENTKIT_LAZY_WALLET", "false")
+        ).lower() in ("1", "true", "yes")
+        wallet_loader = partial(_load_wallet, wallet_data_json, mnemonic_phrase, network_id)
+
+        wallet_snapshot_path = get_from_dict_or_env(
+            values, "wallet_snapshot_path", "CDP_AGENTKIT_WALLET_SNAPSHOT_PATH", ""
+        )
+        if wallet_snapshot_path:
+            wallet_snapshot = WalletSnapshotStore(
+                wallet_snapshot_path,
+                get_from_dict_or_env(
+                    values,
+                    "wallet_snapshot_key",
+                    "CDP_AGENTKIT_WALLET_SNAPSHOT_KEY",
+                    cdp_api_key_private_key,
+                ),
+            )
+            wallet_id = json.loads(wallet_data_json)["wallet_id"] if wallet_data_json else None
+            wallet_loader = partial(
+                _load_wallet_from_snapshot, wallet_snapshot, wallet_loader, network_id, wallet_id
+            )
+            values["wallet_snapshot_path"] = wallet_snapshot_path
+            values["wallet_snapshot"] = wallet_snapshot
+
+        if lazy_wallet:
+            # The wallet, and the shard pool built on it, are loaded by the first action that
+            # needs them.
+            values["wallet_loader"] = wallet_loader
         else:
-            wallet = Wallet.create(network_id=network_id)
+            wallet = wallet_loader()
+            if shard_count > 1:
+                values["shard_pool"] = _create_shard_pool(
+                    wallet,
+                    shard_count,
+                    values.get("shard_strategy", "least_pending"),
+                    values.get("shard_treasury_address"),
+                    values.get("shard_min_balance"),
+                    values.get("shard_top_up_amount"),
+                )
+            values["wallet"] = wallet
+
+        result_cache_ttl_seconds = float(
+            get_from_dict_or_env(
+                values, "result_cache_ttl_seconds", "CDP_AGENTKIT_RESULT_CACHE_TTL", "0"
+            )
+        )
+        if result_cache_ttl_seconds > 0 and values.get("result_cache") is None:
+            values["result_cache"] = ActionResultCache(result_cache_ttl_seconds)
 
-        values["wallet"] = wallet
+        values["lazy_wallet"] = lazy_wallet
+        values["result_cache_ttl_seconds"] = result_cache_ttl_seconds
+        values["shard_count"] = shard_count
         values["cdp_api_key_name"] = cdp_api_key_name
         values["cdp_api_key_private_key"] = cdp_api_key_private_key
         values["mnemonic_phrase"] = mnemonic_phrase
@@ -64,6 +137,65 @@ class CdpAgentkitWrapper(BaseModel):
 
         return values
 
+    def get_wallet(self) -> Any:
+        """Get the wallet, loading it first in lazy mode.
+
+        Concurrent first callers share a single load; if it fails, they all raise its error and
+        the next call tries again.
+
+        Returns:
+            Wallet: The wallet.
+
+        """
+        if self.wallet is not None:
+            return self.wallet
+        hydration, owner = self._start_hydration()
+        if owner:
+            self._hydrate(hydration)
+        return hydration.result()
+
+    async def aget_wallet(self) -> Any:
+        """Get the wallet without blocking the event loop, loading it first in lazy mode.
+
+        Returns:
+            Wallet: The wallet.
+
+        """
+        if self.wallet is not None:
+            return self.wallet
+        hydration, owner = self._start_hydration()
+        if owner:
+            await asyncio.to_thread(self._hydrate, hydration)
+        return await asyncio.wrap_future(hydration)
+
+    def _start_hydration(self) -> tuple[Future, bool]:
+        with self._hydration_lock:
+            if self._hydration is None:
+                self._hydration = Future()
+                return self._hydration, True
+            return self._hydration, False
+
+    def _hydrate(self, hydration: Future) -> None:
+        try:
+            wallet = self.wallet_loader()
+            if self.shard_count > 1:
+                self.shard_pool = _create_shard_pool(
+                    wallet,
+                    self.shard_count,
+                    self.shard_strategy,
+                    self.shard_treasury_address,
+                    self.shard_min_balance,
+                    self.shard_top_up_amount,
+                )
+        except BaseException as e:
+            with self._hydration_lock:
+                self._hydration = None
+            hydration.set_exception(e)
+            return
+        # Set last, since callers that see the wallet skip the hydration and use the shard pool.
+        self.wallet = wallet
+        hydration.set_result(wallet)
+
     def export_wallet(self) -> dict[str, str]:
         """Export wallet data required to re-instantiate the wallet.
 
@@ -71,19 +203,155 @@ class CdpAgentkitWrapper(BaseModel):
             str: The json string of wallet data including the wallet_id and seed.
 
         """
-        wallet_data_dict = self.wallet.export_data().to_dict()
+        wallet = self.get_wallet()
+        wallet_data_dict = wallet.export_data().to_dict()
 
-        wallet_data_dict["default_address_id"] = self.wallet.default_address.address_id
+        wallet_data_dict["default_address_id"] = wallet.default_address.address_id
 
         return json.dumps(wallet_data_dict)
 
     def run_action(self, func: Callable[..., str], **kwargs) -> str:
-        """Run a CDP Action."""
-        func_signature = inspect.signature(func)
+        """Run a CDP Action, taking a wallet shard only if the action writes."""
+        return self._call_dispatch(
+            ActionDispatch.for_action(func, side_effect=_side_effect_of(func)), kwargs
+        )
 
-        first_kwarg = next(iter(func_signature.parameters.values()), None)
+    async def arun_action(self, afunc: Callable[..., Awaitable[str]], **kwargs) -> str:
+        """Run a CDP Action natively on the running event loop, like `run_action`."""
+        return await self._acall_dispatch(
+            ActionDispatch.for_action(afunc, afunc, side_effect=_side_effect_of(afunc)), kwargs
+        )
 
-        if first_kwarg and first_kwarg.annotation is Wallet:
-            return func(self.wallet, **kwargs)
-        else:
-            return func(**kwargs)
+    def run_dispatch(self, dispatch: ActionDispatch, kwargs: dict[str, Any]) -> str:
+        """Run a CDP Action through its precomputed dispatch, through the result cache if enabled."""
+        if self.result_cache is None:
+            return self._call_dispatch(dispatch, kwargs)
+
+        key, result, generation = self._cached_result(dispatch, kwargs)
+        if result is None:
+            result = self._call_dispatch(dispatch, kwargs)
+            self._cache_result(dispatch, key, generation, result)
+        return result
+
+    async def arun_dispatch(self, dispatch: ActionDispatch, kwargs: dict[str, Any]) -> str:
+        """Run a CDP Action natively on the running event loop through its precomputed dispatch."""
+        if self.result_cache is None:
+            return await self._acall_dispatch(dispatch, kwargs)
+
+        key, result, generation = self._cached_result(dispatch, kwargs)
+        if result is None:
+            result = await self._acall_dispatch(dispatch, kwargs)
+            self._cache_result(dispatch, key, generation, result)
+        return result
+
+    def _cached_result(
+        self, dispatch: ActionDispatch, kwargs: dict[str, Any]
+    ) -> tuple[Any, str | None, int]:
+        cache = self.result_cache
+        if dispatch.side_effect not in CACHEABLE_SIDE_EFFECTS or not dispatch.name:
+            return None, None, cache.generation
+        key = cache.key(dispatch.name, kwargs, self._result_cache_scope())
+        generation = cache.generation
+        return key, cache.get(key), generation
+
+    def _result_cache_scope(self) -> str | None:
+        # Cached results are shared by the calls made with the same wallet.
+        return self.network_id
+
+    def _cache_result(
+        self, dispatch: ActionDispatch, key: Any, generation: int, result: str
+    ) -> None:
+        # Failed actions neither change state nor make a result worth serving again.
+        if result.startswith("Error"):
+            return
+        if dispatch.side_effect == SIDE_EFFECT_WRITE:
+            self.result_cache.invalidate_reads()
+        elif key is not None:
+            # In fire-and-track mode a write invalidates reads when it is broadcast, so reads are
+            # not cached again until the wallet's transactions have settled.
+            if dispatch.side_effect == SIDE_EFFECT_READ and self._has_pending_transactions():
+                return
+            self.result_cache.put(key, result, dispatch.side_effect, generation)
+
+    def _has_pending_transactions(self) -> bool:
+        tracker = get_transaction_tracker()
+        if tracker is None or not tracker.pending():
+            return False
+        return bool(tracker.pending(self.get_wallet().id))
+
+    def _call_dispatch(self, dispatch: ActionDispatch, kwargs: dict[str, Any]) -> str:
+        if dispatch.func_takes_context:
+            wallet = self.get_wallet()
+            # Only writes are spread across the shards; reads see the whole wallet.
+            if self.shard_pool is None or dispatch.side_effect != SIDE_EFFECT_WRITE:
+                return dispatch.func(wallet, **kwargs)
+            with self.shard_pool.acquire() as wallet:
+                return dispatch.func(wallet, **kwargs)
+        return dispatch.func(**kwargs)
+
+    async def _acall_dispatch(self, dispatch: ActionDispatch, kwargs: dict[str, Any]) -> str:
+        if dispatch.afunc_takes_context:
+            wallet = await self.aget_wallet()
+            if self.shard_pool is None or dispatch.side_effect != SIDE_EFFECT_WRITE:
+                return await dispatch.afunc(wallet, **kwargs)
+            async with self.shard_pool.aacquire() as wallet:
+                return await dispatch.afunc(wallet, **kwargs)
+        return await dispatch.afunc(**kwargs)
+
+
+def _side_effect_of(func: Callable[..., Any]) -> str:
+    # Actions are looked up in the manifest by their module; unknown functions are writes.
+    module = getattr(func, "__module__", None)
+    for entry in get_action_registry().entries:
+        if entry.module == module:
+            return entry.side_effect
+    return SIDE_EFFECT_WRITE
+
+
+def _load_wallet(wallet_data_json: str | None, mnemonic_phrase: str, network_id: str) -> Any:
+    from cdp import MnemonicSeedPhrase, Wallet, WalletData
+
+    if wallet_data_json:
+        wallet_data = WalletData.from_dict(json.loads(wallet_data_json))
+        return Wallet.import_data(wallet_data)
+    if mnemonic_phrase:
+        return Wallet.import_wallet(MnemonicSeedPhrase(mnemonic_phrase), network_id)
+    return Wallet.create(network_id=network_id)
+
+
+def _load_wallet_from_snapshot(
+    wallet_snapshot: WalletSnapshotStore,
+    wallet_loader: Callable[[], Any],
+    network_id: str,
+    wallet_id: str | None,
+) -> Any:
+    wallet = wallet_snapshot.load(network_id, wallet_id)
+    if wallet is not None:
+        wallet_snapshot.reconcile(wallet)
+        return wallet
+    wallet = wallet_loader()
+    wallet_snapshot.save(wallet)
+    return wallet
+
+
+def _create_shard_pool(
+    wallet: Any,
+    shard_count: int,
+    strategy: str,
+    treasury_address: str | None,
+    min_balance: str | None,
+    top_up_amount: str | None,
+) -> Any:
+    from cdp_agentkit_core.actions.wallet_shards import WalletShardPool
+
+    shard_pool = WalletShardPool(
+        wallet,
+        shard_count,
+        strategy=strategy,
+        treasury_address=treasury_address,
+        min_balance=min_balance,
+        top_up_amount=top_up_amount,
+    )
+    if shard_pool.min_balance is not None:
+        shard_pool.start_top_ups()
+    return shard_pool
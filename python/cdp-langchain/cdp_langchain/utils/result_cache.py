@@ -0,0 +1,126 @@
+"""Read-through cache of CDP Action results.
+
+Agents often repeat the same read within a turn, such as `get_balance` before and after deciding
+what to do. The cache serves repeats of read and external actions from memory for a short TTL,
+keyed by the tool name, its arguments and the network. A successful write invalidates every cached
+read, since it may have changed the balances and state those reads report; external reads, such
+as Pyth price feed IDs, do not depend on the wallet and only expire. Live actions, such as Pyth
+prices and transaction status, report state that changes on its own and are never cached.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ
+
+# Seconds a cached result is served for.
+RESULT_CACHE_TTL_SECONDS = 30.0
+
+# Cached results kept; the least recently used are evicted first.
+RESULT_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass
+class _Entry:
+    value: str
+    side_effect: str
+    expires_at: float
+
+
+class ActionResultCache:
+    """TTL and LRU bounded cache of the results of read and external actions."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = RESULT_CACHE_TTL_SECONDS,
+        max_entries: int = RESULT_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(name: str, kwargs: dict[str, Any], network_id: str | None) -> Hashable:
+        """Build the cache key of an action call.
+
+        Args:
+            name (str): The tool name
+            kwargs (dict[str, Any]): The validated action arguments
+            network_id (str | None): The network of the wallet
+
+        Returns:
+            Hashable: The key, equal for calls with the same arguments in any order
+
+        """
+        return name, json.dumps(kwargs, sort_keys=True, default=str), network_id
+
+    def get(self, key: Hashable) -> str | None:
+        """Get a cached result, counting a hit or a miss.
+
+        Args:
+            key (Hashable): The key of the call
+
+        Returns:
+            str | None: The result, None if it is not cached or expired
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.value
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    @property
+    def generation(self) -> int:
+        """A counter bumped by every invalidation, to detect reads that raced a write."""
+        return self._generation
+
+    def put(self, key: Hashable, value: str, side_effect: str, generation: int) -> None:
+        """Cache a result unless a write invalidated the cache while it was being computed.
+
+        Args:
+            key (Hashable): The key of the call
+            value (str): The result
+            side_effect (str): The side effect of the action, `read` or `external`
+            generation (int): The generation read before the action ran
+
+        """
+        with self._lock:
+            if side_effect == SIDE_EFFECT_READ and generation != self._generation:
+                return
+            self._entries[key] = _Entry(value, side_effect, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_reads(self) -> None:
+        """Drop every cached read, after a write that may have changed what they report."""
+        with self._lock:
+            self._generation += 1
+            for key in [k for k, e in self._entries.items() if e.side_effect == SIDE_EFFECT_READ]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Get the hit and miss counters and the number of cached results."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
@@ -0,0 +1,176 @@
+"""Encrypted local snapshot of a hydrated CDP wallet.
+
+Importing wallet data makes the CDP SDK fetch the wallet and its addresses from the API before the
+first prompt. A snapshot keeps everything the wallet was built from: its model, with the network
+and default address, its seed, its address models and the cached asset metadata of its network.
+Restoring one builds the wallet locally without any API call, and the wallet is then reconciled
+with the API in the background.
+
+Snapshots are encrypted with AES-GCM under a key derived from a secret, by default the CDP API
+private key, and carry a format version. A snapshot that is missing, of another version, of
+another wallet or that does not decrypt is ignored and the wallet is loaded from the API.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+WALLET_SNAPSHOT_VERSION = 1
+
+_MAGIC = b"CDPWALLET"
+_NONCE_BYTES = 12
+
+logger = logging.getLogger(__name__)
+
+
+class WalletSnapshotStore:
+    """Encrypted, versioned wallet snapshot file."""
+
+    def __init__(self, path: str | Path, secret: str):
+        """Initialize the store.
+
+        Args:
+            path (str | Path): The snapshot file
+            secret (str): A high entropy secret the encryption key is derived from
+
+        """
+        self.path = Path(path)
+        self._aead = AESGCM(
+            HKDF(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=None,
+                info=b"cdp-agentkit wallet snapshot",
+            ).derive(secret.encode())
+        )
+        self.reconciliation: threading.Thread | None = None
+        self.saved_at: float | None = None
+        self._lock = threading.Lock()
+
+    def load(self, network_id: str, wallet_id: str | None = None) -> Any:
+        """Restore the wallet from the snapshot without calling the CDP API.
+
+        Args:
+            network_id (str): The network the wallet must be on
+            wallet_id (str | None): The ID the wallet must have, if known
+
+        Returns:
+            Wallet | None: The wallet, None if there is no usable snapshot
+
+        """
+        from cdp import Wallet
+        from cdp.client.models.address import Address as AddressModel
+        from cdp.client.models.wallet import Wallet as WalletModel
+        from cdp_agentkit_core.actions.asset_cache import get_asset_cache
+
+        snapshot = self._read()
+        if snapshot is None:
+            return None
+        try:
+            model = WalletModel.from_dict(snapshot["wallet"])
+            if model.network_id != network_id or wallet_id not in (None, model.id):
+                return None
+            wallet = Wallet(model, snapshot["seed"])
+            wallet._addresses = [
+                wallet._build_wallet_address(AddressModel.from_dict(address), index)
+                for index, address in enumerate(snapshot["addresses"])
+            ]
+            get_asset_cache().load(snapshot["assets"])
+            self.saved_at = snapshot["saved_at"]
+        except (KeyError, TypeError, ValueError):
+            # A malformed snapshot, or one whose seed does not derive its addresses.
+            return None
+        return wallet
+
+    def save(self, wallet: Any) -> None:
+        """Write a snapshot of the wallet, unless it has no seed to restore it from.
+
+        Args:
+            wallet (Wallet): The hydrated wallet
+
+        """
+        # Imported here so that importing the toolkit does not import the CDP SDK.
+        from cdp_agentkit_core.actions.asset_cache import get_asset_cache
+
+        try:
+            seed = wallet.export_data().seed
+        except ValueError:
+            return
+        snapshot = {
+            "saved_at": time.time(),
+            "wallet": wallet._model.to_dict(),
+            "seed": seed,
+            "addresses": [address._model.to_dict() for address in wallet.addresses],
+            "assets": get_asset_cache().export(wallet.network_id),
+        }
+        self._write(snapshot)
+        self.saved_at = snapshot["saved_at"]
+
+    def reconcile(self, wallet: Any) -> threading.Thread:
+        """Refresh a restored wallet from the CDP API in the background and save it again.
+
+        Args:
+            wallet (Wallet): The wallet restored from the snapshot
+
+        Returns:
+            threading.Thread: The started reconciliation thread
+
+        """
+        thread = threading.Thread(
+            target=self._reconcile, args=(wallet,), name="cdp-wallet-reconcile", daemon=True
+        )
+        thread.start()
+        self.reconciliation = thread
+        return thread
+
+    def clear(self) -> None:
+        """Delete the snapshot."""
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+    def _reconcile(self, wallet: Any) -> None:
+        try:
+            wallet.reload()
+            wallet._set_addresses()
+            self.save(wallet)
+        except Exception:
+            # Reconciliation is best effort; the restored wallet keeps working.
+            logger.warning("Error reconciling wallet snapshot %s", self.path, exc_info=True)
+
+    def _read(self) -> dict[str, Any] | None:
+        header = _MAGIC + bytes([WALLET_SNAPSHOT_VERSION])
+        try:
+            with self._lock:
+                data = self.path.read_bytes()
+            if not data.startswith(header):
+                return None
+            nonce = data[len(header) : len(header) + _NONCE_BYTES]
+            plaintext = self._aead.decrypt(nonce, data[len(header) + _NONCE_BYTES :], header)
+            return json.loads(plaintext)
+        except (OSError, ValueError, InvalidTag):
+            return None
+
+    def _write(self, snapshot: dict[str, Any]) -> None:
+        header = _MAGIC + bytes([WALLET_SNAPSHOT_VERSION])
+        nonce = os.urandom(_NONCE_BYTES)
+        data = header + nonce + self._aead.encrypt(nonce, json.dumps(snapshot).encode(), header)
+        try:
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".wallet_snapshot")
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.path)
+        except OSError:
+            # Persistence is best effort; the next start loads the wallet from the API.
+            pass
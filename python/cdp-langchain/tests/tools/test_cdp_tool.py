@@ -1,14 +1,18 @@
 """Tests for the CDP Tool."""
 
+import asyncio
+import inspect
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from langchain_core.callbacks import CallbackManager
 from pydantic import BaseModel
 
+from cdp import Wallet
 from cdp_langchain.tools import CdpTool
 from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils.action_dispatch import get_type_adapter
 
 
 class TestArgsSchema(BaseModel):
@@ -62,48 +66,50 @@ def test_initialization(mock_cdp_agentkit_wrapper):
 
 def test_run_with_instructions(cdp_tool):
     """Test running CDP Tool with instructions."""
-    cdp_tool.cdp_agentkit_wrapper.run_action.return_value = "success"
+    cdp_tool.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
     result = cdp_tool._run(instructions="test instructions")
 
-    cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool.func, instructions="test instructions"
+    cdp_tool.cdp_agentkit_wrapper.run_dispatch.assert_called_once_with(
+        cdp_tool.dispatch, {"instructions": "test instructions"}
     )
     assert result == "success"
 
 
 def test_run_with_empty_instructions(cdp_tool):
     """Test running CDP Tool with empty instructions."""
-    cdp_tool.cdp_agentkit_wrapper.run_action.return_value = "success"
+    cdp_tool.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
 
     # Test various empty input scenarios
     empty_inputs = ["", "{}", None]
     for empty_input in empty_inputs:
         result = cdp_tool._run(instructions=empty_input)
-        cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_with(cdp_tool.func, instructions="")
+        cdp_tool.cdp_agentkit_wrapper.run_dispatch.assert_called_with(
+            cdp_tool.dispatch, {"instructions": ""}
+        )
         assert result == "success"
 
 
 def test_run_with_schema(cdp_tool_with_schema):
     """Test running CDP Tool with args schema."""
-    cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.return_value = "success"
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
 
     result = cdp_tool_with_schema._run(test_param="test")
 
-    cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool_with_schema.func, test_param="test"
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_dispatch.assert_called_once_with(
+        cdp_tool_with_schema.dispatch, {"test_param": "test"}
     )
     assert result == "success"
 
 
 def test_run_with_callback_manager(cdp_tool):
     """Test running CDP Tool with callback manager."""
-    cdp_tool.cdp_agentkit_wrapper.run_action.return_value = "success"
+    cdp_tool.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
     callback_manager = CallbackManager([])
 
     result = cdp_tool._run(instructions="test", run_manager=callback_manager)
 
-    cdp_tool.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool.func, instructions="test"
+    cdp_tool.cdp_agentkit_wrapper.run_dispatch.assert_called_once_with(
+        cdp_tool.dispatch, {"instructions": "test"}
     )
     assert result == "success"
 
@@ -123,11 +129,96 @@ def test_run_with_invalid_schema_data(cdp_tool_with_schema):
 )
 def test_run_with_different_valid_inputs(cdp_tool_with_schema, input_data: dict[str, Any]):
     """Test running CDP Tool with different valid inputs."""
-    cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.return_value = "success"
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
 
     result = cdp_tool_with_schema._run(**input_data)
 
-    cdp_tool_with_schema.cdp_agentkit_wrapper.run_action.assert_called_once_with(
-        cdp_tool_with_schema.func, **input_data
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_dispatch.assert_called_once_with(
+        cdp_tool_with_schema.dispatch, input_data
     )
     assert result == "success"
+
+
+def test_arun_with_async_func(mock_cdp_agentkit_wrapper):
+    """Test running CDP Tool on the event loop with a native async func."""
+
+    async def afunc(test_param: str) -> str:
+        return test_param
+
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action_with_schema",
+        description="Test CDP Tool",
+        args_schema=TestArgsSchema,
+        func=lambda x: x,
+        afunc=afunc,
+    )
+    tool.cdp_agentkit_wrapper.arun_dispatch = AsyncMock(return_value="success")
+
+    result = asyncio.run(tool._arun(test_param="test"))
+
+    tool.cdp_agentkit_wrapper.arun_dispatch.assert_awaited_once_with(
+        tool.dispatch, {"test_param": "test"}
+    )
+    tool.cdp_agentkit_wrapper.run_dispatch.assert_not_called()
+    assert result == "success"
+
+
+def test_arun_without_async_func(cdp_tool_with_schema):
+    """Test running CDP Tool on the event loop falls back to the sync func."""
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
+
+    result = asyncio.run(cdp_tool_with_schema._arun(test_param="test"))
+
+    cdp_tool_with_schema.cdp_agentkit_wrapper.run_dispatch.assert_called_once_with(
+        cdp_tool_with_schema.dispatch, {"test_param": "test"}
+    )
+    assert result == "success"
+
+
+def test_dispatch_is_resolved_once(mock_cdp_agentkit_wrapper):
+    """Test that the tool resolves wallet injection and the validator at creation."""
+
+    def func(wallet: Wallet, test_param: str) -> str:
+        return test_param
+
+    func_signature = inspect.signature(func)
+    with patch(
+        "cdp_agentkit_core.actions.action_dispatch.inspect.signature", return_value=func_signature
+    ) as mock_signature:
+        tool = CdpTool(
+            cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+            name="test_action_with_schema",
+            description="Test CDP Tool",
+            args_schema=TestArgsSchema,
+            func=func,
+        )
+        for _ in range(3):
+            tool._run(test_param="test")
+
+    mock_signature.assert_called_once_with(func)
+    assert tool.dispatch.func_takes_context
+    assert tool.dispatch.validator is get_type_adapter(TestArgsSchema)
+
+
+def test_lazy_tool_loads_action_on_first_call(mock_cdp_agentkit_wrapper):
+    """Test that a tool without a func loads its action from the registry when first run."""
+    action = Mock(func=lambda test_param: test_param, afunc=None, args_schema=TestArgsSchema)
+    tool = CdpTool(
+        cdp_agentkit_wrapper=mock_cdp_agentkit_wrapper,
+        name="test_action_with_schema",
+        description="Test CDP Tool",
+        args_schema=TestArgsSchema.model_json_schema(),
+    )
+    tool.cdp_agentkit_wrapper.run_dispatch.return_value = "success"
+
+    assert tool.dispatch is None
+
+    with patch("cdp_langchain.tools.cdp_tool.get_action_registry") as mock_registry:
+        mock_registry.return_value.load.return_value = action
+        assert tool._run(test_param="test") == "success"
+        assert tool._run(test_param="test") == "success"
+
+    mock_registry.return_value.load.assert_called_once_with("test_action_with_schema")
+    assert tool.dispatch.func is action.func
+    tool.cdp_agentkit_wrapper.run_dispatch.assert_called_with(tool.dispatch, {"test_param": "test"})
@@ -0,0 +1,189 @@
+"""Tests for the CDP Tool Node."""
+
+import asyncio
+import inspect
+import threading
+import time
+from unittest.mock import Mock
+
+from langchain_core.messages import AIMessage, ToolMessage
+from langgraph.prebuilt import ToolNode
+from pydantic import BaseModel
+
+from cdp_agentkit_core.actions.cdp_action import SIDE_EFFECT_READ, SIDE_EFFECT_WRITE
+from cdp_langchain.tools import CdpTool, CdpToolNode
+from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils.action_dispatch import ActionDispatch
+
+
+class ValueInput(BaseModel):
+    """Test schema of a tool that takes a value."""
+
+    value: str
+
+
+class RecordingWrapper:
+    """Runs dispatches with a delay, recording their order and peak concurrency."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def run_dispatch(self, dispatch, kwargs):
+        """Run a dispatch, returning its name and value."""
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(f"{dispatch.name}:{kwargs['value']}")
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return f"{dispatch.name} {kwargs['value']}"
+
+
+def make_tool(wrapper, name: str, side_effect: str) -> CdpTool:
+    """Make a CDP tool that runs through the recording wrapper."""
+    tool = CdpTool(
+        cdp_agentkit_wrapper=Mock(spec=CdpAgentkitWrapper),
+        name=name,
+        description=name,
+        args_schema=ValueInput,
+        dispatch=ActionDispatch.for_action(
+            lambda value: value, args_schema=ValueInput, name=name, side_effect=side_effect
+        ),
+    )
+    tool.cdp_agentkit_wrapper.shard_count = 1
+    tool.cdp_agentkit_wrapper.run_dispatch.side_effect = wrapper.run_dispatch
+    tool.cdp_agentkit_wrapper.arun_dispatch.side_effect = lambda dispatch, kwargs: (
+        asyncio.to_thread(wrapper.run_dispatch, dispatch, kwargs)
+    )
+    return tool
+
+
+def tool_calls_message(*calls: tuple[str, str]) -> AIMessage:
+    """Make a model message with one tool call per name and value."""
+    return AIMessage(
+        content="",
+        tool_calls=[
+            {"name": name, "args": {"value": value}, "id": f"call_{index}"}
+            for index, (name, value) in enumerate(calls)
+        ],
+    )
+
+
+def test_tool_node_private_hooks_are_unchanged():
+    """Test that the private ToolNode hooks CdpToolNode relies on keep their signatures."""
+    from langgraph.types import Command  # noqa: F401
+
+    expected = {
+        "_func": ["self", "input", "config", "store"],
+        "_afunc": ["self", "input", "config", "store"],
+        "_parse_input": ["self", "input", "store"],
+        "_run_one": ["self", "call", "input_type", "config"],
+        "_arun_one": ["self", "call", "input_type", "config"],
+    }
+    for name, parameters in expected.items():
+        hook = getattr(ToolNode, name, None)
+        assert hook is not None, f"ToolNode.{name} no longer exists"
+        assert (
+            list(inspect.signature(hook).parameters) == parameters
+        ), f"ToolNode.{name} changed its signature"
+    assert inspect.iscoroutinefunction(ToolNode._afunc)
+    assert inspect.iscoroutinefunction(ToolNode._arun_one)
+
+
+def test_reads_run_concurrently():
+    """Test that read tool calls of one step run at the same time."""
+    wrapper = RecordingWrapper()
+    node = CdpToolNode([make_tool(wrapper, "get_balance", SIDE_EFFECT_READ)])
+
+    result = node.invoke(
+        {"messages": [tool_calls_message(*(("get_balance", str(i)) for i in range(4)))]}
+    )
+
+    assert wrapper.peak == 4
+    assert [message.content for message in result["messages"]] == [
+        f"get_balance {i}" for i in range(4)
+    ]
+
+
+def test_writes_run_in_order_per_wallet():
+    """Test that writes through one wallet run one at a time, in the order they were called."""
+    wrapper = RecordingWrapper()
+    transfer = make_tool(wrapper, "transfer", SIDE_EFFECT_WRITE)
+    trade = make_tool(wrapper, "trade", SIDE_EFFECT_WRITE)
+    trade.cdp_agentkit_wrapper = transfer.cdp_agentkit_wrapper
+    node = CdpToolNode([transfer, trade])
+
+    node.invoke(
+        {"messages": [tool_calls_message(("transfer", "1"), ("trade", "2"), ("transfer", "3"))]}
+    )
+
+    assert wrapper.peak == 1
+    assert wrapper.calls == ["transfer:1", "trade:2", "transfer:3"]
+
+
+def test_writes_get_one_lane_per_shard():
+    """Test that writes through a sharded wallet run one lane per shard, in order per lane."""
+    wrapper = RecordingWrapper()
+    transfer = make_tool(wrapper, "transfer", SIDE_EFFECT_WRITE)
+    transfer.cdp_agentkit_wrapper.shard_count = 2
+    node = CdpToolNode([transfer])
+
+    node.invoke({"messages": [tool_calls_message(*(("transfer", str(i)) for i in range(4)))]})
+
+    assert wrapper.peak == 2
+    assert wrapper.calls.index("transfer:0") < wrapper.calls.index("transfer:2")
+    assert wrapper.calls.index("transfer:1") < wrapper.calls.index("transfer:3")
+
+
+def test_writes_of_separate_wallets_overlap_with_reads():
+    """Test that writes of separate wallets and reads run alongside each other."""
+    wrapper = RecordingWrapper()
+    node = CdpToolNode(
+        [
+            make_tool(wrapper, "transfer", SIDE_EFFECT_WRITE),
+            make_tool(wrapper, "trade", SIDE_EFFECT_WRITE),
+            make_tool(wrapper, "get_balance", SIDE_EFFECT_READ),
+        ]
+    )
+
+    result = node.invoke(
+        [tool_calls_message(("transfer", "1"), ("trade", "2"), ("get_balance", "3"))]
+    )
+
+    assert wrapper.peak == 3
+    assert all(isinstance(message, ToolMessage) for message in result)
+    assert [message.tool_call_id for message in result] == ["call_0", "call_1", "call_2"]
+
+
+def test_max_concurrency_bounds_reads():
+    """Test that no more than `max_concurrency` calls run at once."""
+    wrapper = RecordingWrapper()
+    node = CdpToolNode([make_tool(wrapper, "get_balance", SIDE_EFFECT_READ)], max_concurrency=2)
+
+    node.invoke({"messages": [tool_calls_message(*(("get_balance", str(i)) for i in range(5)))]})
+
+    assert wrapper.peak == 2
+
+
+def test_async_writes_run_in_order_and_reads_concurrently():
+    """Test the async node keeps the same lanes."""
+    wrapper = RecordingWrapper()
+    transfer = make_tool(wrapper, "transfer", SIDE_EFFECT_WRITE)
+    node = CdpToolNode([transfer, make_tool(wrapper, "get_balance", SIDE_EFFECT_READ)])
+    message = tool_calls_message(
+        ("transfer", "1"), ("get_balance", "2"), ("transfer", "3"), ("get_balance", "4")
+    )
+
+    result = asyncio.run(node.ainvoke({"messages": [message]}))
+
+    assert wrapper.peak == 3
+    assert [call for call in wrapper.calls if call.startswith("transfer")] == [
+        "transfer:1",
+        "transfer:3",
+    ]
+    assert [m.tool_call_id for m in result["messages"]] == [f"call_{i}" for i in range(4)]
@@ -0,0 +1,228 @@
+"""Tests for the multi-tenant CDP Agentkit pool."""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+from cdp import Wallet
+from cdp_agentkit_core.actions.asset_cache import AssetCache, set_asset_cache
+from cdp_langchain.tools import CdpTool, CdpToolNode
+from cdp_langchain.utils import ActionDispatch, CdpAgentkitPool
+from tests.utils.test_wallet_snapshot import make_wallet
+
+
+@pytest.fixture(autouse=True)
+def asset_cache():
+    """Isolate each test with an empty asset cache."""
+    cache = AssetCache()
+    set_asset_cache(cache)
+    return cache
+
+
+@pytest.fixture
+def env_vars(monkeypatch: pytest.MonkeyPatch):
+    """Fixture to set environment variables."""
+    monkeypatch.setenv("CDP_API_KEY_NAME", "test-cdp-api-key-name")
+    monkeypatch.setenv("CDP_API_KEY_PRIVATE_KEY", "test-cdp-api-key-private-key")
+
+
+@pytest.fixture
+def mock_cdp_configure():
+    """Fixture for mocked CDP SDK configuration."""
+    with patch("cdp.Cdp.configure") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_wallet_import_data():
+    """Fixture for a wallet import that returns one mock wallet per wallet ID."""
+    with patch("cdp.Wallet.import_data") as mock:
+        mock.side_effect = lambda data: Mock(spec=Wallet, id=data.wallet_id)
+        yield mock
+
+
+class EmptyInput(BaseModel):
+    """Test schema of a tool without arguments."""
+
+
+def tenant_wallet_data(tenant: str) -> str:
+    """Get the exported wallet data of a tenant."""
+    return json.dumps(
+        {"wallet_id": f"wallet-{tenant}", "seed": "ab" * 64, "network_id": "base-sepolia"}
+    )
+
+
+def wallet_id_tool(pool: CdpAgentkitPool) -> CdpTool:
+    """Make a tool that returns the ID of the wallet it runs with."""
+
+    def get_wallet_id(wallet: Wallet) -> str:
+        return wallet.id
+
+    return CdpTool(
+        cdp_agentkit_wrapper=pool,
+        name="get_wallet_id",
+        description="Get the wallet ID",
+        args_schema=EmptyInput,
+        dispatch=ActionDispatch.for_action(
+            get_wallet_id, args_schema=EmptyInput, name="get_wallet_id", side_effect="read"
+        ),
+    )
+
+
+def test_tools_run_with_the_wallet_of_the_run_tenant(
+    env_vars, mock_cdp_configure, mock_wallet_import_data
+):
+    """Test that one shared tool resolves the tenant's wallet from the run config."""
+    pool = CdpAgentkitPool(wallet_data_provider=tenant_wallet_data)
+    tool = wallet_id_tool(pool)
+
+    assert pool.wallet is None
+    assert tool.invoke({}, {"configurable": {"tenant_id": "a"}}) == "wallet-a"
+    assert tool.invoke({}, {"configurable": {"tenant_id": "b"}}) == "wallet-b"
+    assert asyncio.run(tool.ainvoke({}, {"configurable": {"tenant_id": "a"}})) == "wallet-a"
+    assert mock_wallet_import_data.call_count == 2
+
+
+def test_tool_node_resolves_the_tenant(env_vars, mock_cdp_configure, mock_wallet_import_data):
+    """Test that tool calls run through a tool node see the tenant of the graph run."""
+    pool = CdpAgentkitPool(wallet_data_provider=tenant_wallet_data)
+    node = CdpToolNode([wallet_id_tool(pool)])
+    message = AIMessage(
+        content="", tool_calls=[{"name": "get_wallet_id", "args": {}, "id": "call_0"}]
+    )
+
+    result = node.invoke({"messages": [message]}, {"configurable": {"tenant_id": "c"}})
+
+    assert result["messages"][0].content == "wallet-c"
+
+
+def test_missing_tenant_raises(env_vars, mock_cdp_configure):
+    """Test that a run without a tenant does not fall back to a shared wallet."""
+    pool = CdpAgentkitPool(wallet_data_provider=tenant_wallet_data)
+
+    with pytest.raises(ValueError, match="tenant_id"):
+        pool.get_wallet()
+
+
+def test_sharding_is_rejected(env_vars, mock_cdp_configure):
+    """Test that the pool refuses a shard count."""
+    with pytest.raises(ValueError, match="sharding"):
+        CdpAgentkitPool(shard_count=2)
+
+
+def test_least_recently_used_wallets_are_evicted(
+    env_vars, mock_cdp_configure, mock_wallet_import_data
+):
+    """Test that the pool keeps at most `max_wallets` wallets, evicting the least recently used."""
+    pool = CdpAgentkitPool(wallet_data_provider=tenant_wallet_data, max_wallets=2)
+
+    pool.get_tenant_wallet("a")
+    pool.get_tenant_wallet("b")
+    pool.get_tenant_wallet("a")
+    pool.get_tenant_wallet("c")
+
+    assert pool.active_tenants == ["a", "c"]
+    pool.get_tenant_wallet("b")
+    assert mock_wallet_import_data.call_count == 4
+
+
+def test_concurrent_first_callers_share_one_hydration(
+    env_vars, mock_cdp_configure, mock_wallet_import_data
+):
+    """Test that concurrent first calls for a tenant hydrate its wallet once."""
+    release = threading.Event()
+    import_data = mock_wallet_import_data.side_effect
+
+    def slow_import_data(data):
+        release.wait(5)
+        return import_data(data)
+
+    mock_wallet_import_data.side_effect = slow_import_data
+    pool = CdpAgentkitPool(wallet_data_provider=tenant_wallet_data)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(pool.get_tenant_wallet, "a") for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        wallets = [future.result() for future in futures]
+
+    assert all(wallet is wallets[0] for wallet in wallets)
+    mock_wallet_import_data.assert_called_once()
+
+
+def test_new_tenant_wallets_are_created_and_saved(env_vars, mock_cdp_configure):
+    """Test that a tenant without wallet data gets a new wallet, handed to the saver."""
+    saved = {}
+    wallet = make_wallet(wallet_id="wallet-new")
+
+    with patch("cdp.Wallet.create", return_value=wallet) as create:
+        pool = CdpAgentkitPool(
+            wallet_data_provider=lambda tenant: None,
+            wallet_data_saver=saved.__setitem__,
+        )
+        assert pool.get_tenant_wallet("new") is wallet
+
+    create.assert_called_once_with(network_id="base-sepolia")
+    assert json.loads(saved["new"])["wallet_id"] == "wallet-new"
+    assert json.loads(saved["new"])["default_address_id"] == wallet.default_address.address_id
+
+
+def test_pool_requires_a_way_to_rehydrate_wallets(env_vars, mock_cdp_configure):
+    """Test that a pool without wallet data or snapshots is refused."""
+    with pytest.raises(ValueError, match="wallet_data_provider"):
+        CdpAgentkitPool(wallet_data_saver=lambda tenant, data: None)
+
+
+def test_served_tenants_never_get_a_new_wallet(env_vars, mock_cdp_configure):
+    """Test that an evicted tenant whose wallet data is missing is not given a new wallet."""
+    with patch("cdp.Wallet.create", return_value=make_wallet(wallet_id="wallet-new")) as create:
+        pool = CdpAgentkitPool(wallet_data_provider=lambda tenant: None)
+        pool.get_tenant_wallet("new")
+        pool.evict("new")
+
+        with pytest.raises(ValueError, match="refusing to create a new wallet"):
+            pool.get_tenant_wallet("new")
+
+    create.assert_called_once()
+
+
+def test_evicted_wallets_are_rehydrated_from_snapshots(env_vars, mock_cdp_configure, tmp_path):
+    """Test that a wallet evicted from the pool comes back from its snapshot without the API."""
+    wallets = {"a": make_wallet(wallet_id="wallet-a"), "b": make_wallet(wallet_id="wallet-b")}
+
+    with patch("cdp.Wallet.import_data", side_effect=lambda d: wallets[d.wallet_id[-1]]) as imp:
+        pool = CdpAgentkitPool(
+            wallet_data_provider=tenant_wallet_data,
+            wallet_snapshot_dir=str(tmp_path),
+            max_wallets=1,
+        )
+        pool.get_tenant_wallet("a")
+        pool.get_tenant_wallet("b")
+        assert pool.active_tenants == ["b"]
+
+        with patch("cdp.Cdp.api_clients") as api_clients:
+            restored = pool.get_tenant_wallet("a")
+
+    assert imp.call_count == 2
+    assert not api_clients.mock_calls
+    assert restored is not wallets["a"]
+    assert restored.id == "wallet-a"
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_result_cache_is_scoped_per_tenant(env_vars, mock_cdp_configure, mock_wallet_import_data):
+    """Test that cached reads of one tenant are not served to another."""
+    pool = CdpAgentkitPool(wallet_data_provider=tenant_wallet_data, result_cache_ttl_seconds=30)
+    tool = wallet_id_tool(pool)
+
+    assert tool.invoke({}, {"configurable": {"tenant_id": "a"}}) == "wallet-a"
+    assert tool.invoke({}, {"configurable": {"tenant_id": "b"}}) == "wallet-b"
+    assert tool.invoke({}, {"configurable": {"tenant_id": "a"}}) == "wallet-a"
+    assert pool.result_cache.stats()["hits"] == 1
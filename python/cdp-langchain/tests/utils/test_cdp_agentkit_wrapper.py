@@ -1,15 +1,23 @@
 """Tests for the CDP Agentkit Wrapper."""
 
+import asyncio
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 
 import pytest
 from pydantic import ValidationError
 
 from cdp import Cdp, Wallet, WalletData
+from cdp_agentkit_core.actions.transaction_tracker import (
+    TransactionTracker,
+    set_transaction_tracker,
+)
 from cdp_langchain import __version__
 from cdp_langchain.constants import CDP_LANGCHAIN_DEFAULT_SOURCE
-from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils import ActionDispatch, CdpAgentkitWrapper
 
 
 @pytest.fixture
@@ -205,6 +213,46 @@ def test_run_action_valid_modes(
     assert result is True
 
 
+def test_arun_action_valid_modes(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test async run method with and without wallet injection."""
+
+    async def is_wallet_valid(wallet: Wallet):
+        return wallet is not None
+
+    async def echo(value: str):
+        return value
+
+    wrapper = CdpAgentkitWrapper()
+    assert asyncio.run(wrapper.arun_action(is_wallet_valid)) is True
+    assert asyncio.run(wrapper.arun_action(echo, value="test")) == "test"
+
+
+def test_run_dispatch_valid_modes(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test running actions through a precomputed dispatch."""
+
+    def is_wallet_valid(wallet: Wallet):
+        return wallet is not None
+
+    async def echo(value: str):
+        return value
+
+    wrapper = CdpAgentkitWrapper()
+    dispatch = ActionDispatch.for_action(is_wallet_valid, echo)
+
+    assert dispatch.func_takes_context
+    assert not dispatch.afunc_takes_context
+    assert wrapper.run_dispatch(dispatch, {}) is True
+    assert asyncio.run(wrapper.arun_dispatch(dispatch, {"value": "test"})) == "test"
+
+
 def test_cdp_configuration_error(
     env_vars: dict[str, str], mock_cdp_configure: Mock, mock_wallet_create: Mock
 ):
@@ -215,3 +263,303 @@ def test_cdp_configuration_error(
         CdpAgentkitWrapper()
 
     assert "Configuration error" in str(exc_info.value)
+
+
+def test_run_dispatch_sharded(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that sharded wrappers run each wallet action from a shard address."""
+    wallet = mock_wallet_create.return_value
+    wallet.default_address.address_id = "0xaddress0"
+    wallet.addresses = [wallet.default_address]
+    wallet.create_address.side_effect = lambda: wallet.addresses.append(
+        Mock(address_id=f"0xaddress{len(wallet.addresses)}")
+    )
+
+    def default_address(wallet: Wallet):
+        return wallet.default_address.address_id
+
+    wrapper = CdpAgentkitWrapper(shard_count=2, shard_strategy="round_robin")
+    dispatch = ActionDispatch.for_action(default_address)
+
+    assert wrapper.shard_pool is not None
+    assert [wrapper.run_dispatch(dispatch, {}) for _ in range(3)] == [
+        "0xaddress0",
+        "0xaddress1",
+        "0xaddress0",
+    ]
+
+
+def test_run_dispatch_result_cache(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that reads are served from the result cache until a successful write."""
+    calls = []
+
+    def get_balance(wallet: Wallet, asset_id: str):
+        calls.append(asset_id)
+        return f"{len(calls)} {asset_id}"
+
+    async def aget_balance(wallet: Wallet, asset_id: str):
+        return get_balance(wallet, asset_id)
+
+    def transfer(wallet: Wallet, fail: bool):
+        return "Error transferring" if fail else "Transferred"
+
+    wrapper = CdpAgentkitWrapper(result_cache_ttl_seconds=30)
+    read = ActionDispatch.for_action(
+        get_balance, aget_balance, name="get_balance", side_effect="read"
+    )
+    write = ActionDispatch.for_action(transfer, name="transfer")
+
+    assert wrapper.run_dispatch(read, {"asset_id": "eth"}) == "1 eth"
+    assert wrapper.run_dispatch(read, {"asset_id": "eth"}) == "1 eth"
+    assert asyncio.run(wrapper.arun_dispatch(read, {"asset_id": "eth"})) == "1 eth"
+    assert wrapper.run_dispatch(read, {"asset_id": "usdc"}) == "2 usdc"
+
+    wrapper.run_dispatch(write, {"fail": True})
+    assert wrapper.run_dispatch(read, {"asset_id": "eth"}) == "1 eth"
+
+    wrapper.run_dispatch(write, {"fail": False})
+    assert wrapper.run_dispatch(read, {"asset_id": "eth"}) == "3 eth"
+
+    assert wrapper.result_cache.stats() == {"hits": 3, "misses": 3, "entries": 1}
+
+
+def test_result_cache_skips_reads_while_transactions_are_pending(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that reads are not cached between the broadcast and the settlement of a write."""
+    calls = []
+
+    def get_balance(wallet: Wallet):
+        calls.append(wallet)
+        return f"{len(calls)} eth"
+
+    mock_wallet_create.return_value.id = "wallet-id"
+    transfer = Mock(status="broadcast", transaction_hash="0xhash", transaction_link="link")
+    transfer.wallet_id = "wallet-id"
+    tracker = TransactionTracker()
+    tracker.track(transfer, "transfer of 1 eth")
+    set_transaction_tracker(tracker)
+    try:
+        wrapper = CdpAgentkitWrapper(result_cache_ttl_seconds=30)
+        read = ActionDispatch.for_action(get_balance, name="get_balance", side_effect="read")
+
+        assert wrapper.run_dispatch(read, {}) == "1 eth"
+        assert wrapper.run_dispatch(read, {}) == "2 eth"
+
+        transfer.status = "complete"
+        tracker.poll()
+
+        assert wrapper.run_dispatch(read, {}) == "3 eth"
+        assert wrapper.run_dispatch(read, {}) == "3 eth"
+    finally:
+        set_transaction_tracker(None)
+
+
+def test_result_cache_skips_live_actions(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that actions reporting state that changes on its own are never cached."""
+    statuses = iter(["pending", "confirmed"])
+
+    def get_transaction_status(wallet: Wallet):
+        return next(statuses)
+
+    wrapper = CdpAgentkitWrapper(result_cache_ttl_seconds=30)
+    live = ActionDispatch.for_action(
+        get_transaction_status, name="get_transaction_status", side_effect="live"
+    )
+
+    assert wrapper.run_dispatch(live, {}) == "pending"
+    assert wrapper.run_dispatch(live, {}) == "confirmed"
+    assert wrapper.result_cache.stats()["entries"] == 0
+
+
+def test_result_cache_disabled_by_default(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that the result cache is only enabled with a TTL."""
+    assert CdpAgentkitWrapper().result_cache is None
+
+
+def test_lazy_wallet_is_loaded_by_the_first_wallet_action(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that a lazy wrapper only loads the wallet for actions that take it."""
+
+    def get_price(feed_id: str):
+        return feed_id
+
+    def is_wallet_valid(wallet: Wallet):
+        return wallet is mock_wallet_create.return_value
+
+    wrapper = CdpAgentkitWrapper(lazy_wallet=True)
+
+    assert wrapper.wallet is None
+    mock_cdp_configure.assert_called_once()
+    assert wrapper.run_dispatch(ActionDispatch.for_action(get_price), {"feed_id": "eth"}) == "eth"
+    mock_wallet_create.assert_not_called()
+
+    assert wrapper.run_dispatch(ActionDispatch.for_action(is_wallet_valid), {}) is True
+    assert wrapper.run_action(is_wallet_valid) is True
+    mock_wallet_create.assert_called_once_with(network_id="base-sepolia")
+
+
+def test_lazy_wallet_from_env(
+    env_vars: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that lazy mode can be enabled from the environment."""
+    monkeypatch.setenv("CDP_AGENTKIT_LAZY_WALLET", "true")
+
+    wrapper = CdpAgentkitWrapper()
+
+    assert wrapper.lazy_wallet
+    mock_wallet_create.assert_not_called()
+    assert wrapper.get_wallet() is mock_wallet_create.return_value
+
+
+def test_lazy_wallet_concurrent_first_callers_share_one_load(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that threads and tasks racing for the first action load the wallet once."""
+    release = threading.Event()
+
+    def create(network_id):
+        release.wait(5)
+        return mock_wallet_create.return_value
+
+    mock_wallet_create.side_effect = create
+    wrapper = CdpAgentkitWrapper(lazy_wallet=True)
+
+    async def load_async():
+        return await asyncio.gather(*(wrapper.aget_wallet() for _ in range(4)))
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        threads = [pool.submit(wrapper.get_wallet) for _ in range(4)]
+        tasks = pool.submit(asyncio.run, load_async())
+        time.sleep(0.05)
+        release.set()
+        wallets = [thread.result() for thread in threads] + tasks.result()
+
+    assert all(wallet is mock_wallet_create.return_value for wallet in wallets)
+    mock_wallet_create.assert_called_once()
+
+
+def test_lazy_wallet_load_failure_is_retried(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that a failed load raises and the next call loads again."""
+    wallet = mock_wallet_create.return_value
+    mock_wallet_create.side_effect = [Exception("Network error"), wallet]
+    wrapper = CdpAgentkitWrapper(lazy_wallet=True)
+
+    with pytest.raises(Exception, match="Network error"):
+        wrapper.get_wallet()
+
+    assert asyncio.run(wrapper.aget_wallet()) is wallet
+    assert mock_wallet_create.call_count == 2
+
+
+def test_lazy_wallet_builds_the_shard_pool(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that a lazy sharded wrapper builds its shard pool with the wallet."""
+    wallet = mock_wallet_create.return_value
+    wallet.default_address.address_id = "0xaddress0"
+    wallet.addresses = [wallet.default_address]
+    wallet.create_address.side_effect = lambda: wallet.addresses.append(
+        Mock(address_id=f"0xaddress{len(wallet.addresses)}")
+    )
+
+    def default_address(wallet: Wallet):
+        return wallet.default_address.address_id
+
+    wrapper = CdpAgentkitWrapper(lazy_wallet=True, shard_count=2, shard_strategy="round_robin")
+
+    assert wrapper.shard_pool is None
+    dispatch = ActionDispatch.for_action(default_address)
+    assert [wrapper.run_dispatch(dispatch, {}) for _ in range(2)] == ["0xaddress0", "0xaddress1"]
+
+
+def test_only_writes_take_a_shard(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that reads run with the whole wallet and writes with a shard, sync and async."""
+    wallet = mock_wallet_create.return_value
+    wallet.default_address.address_id = "0xaddress0"
+    wallet.addresses = [wallet.default_address]
+    wallet.create_address.side_effect = lambda: wallet.addresses.append(
+        Mock(address_id=f"0xaddress{len(wallet.addresses)}")
+    )
+
+    def get_wallet(wallet: Wallet):
+        return wallet
+
+    async def aget_wallet(wallet: Wallet):
+        return wallet
+
+    wrapper = CdpAgentkitWrapper(shard_count=2)
+    read = ActionDispatch.for_action(get_wallet, aget_wallet, side_effect="read")
+    write = ActionDispatch.for_action(get_wallet, aget_wallet, side_effect="write")
+
+    assert wrapper.run_dispatch(read, {}) is wallet
+    assert asyncio.run(wrapper.arun_dispatch(read, {})) is wallet
+    assert wrapper.run_dispatch(write, {}) is not wallet
+    assert asyncio.run(wrapper.arun_dispatch(write, {})) is not wallet
+    assert set(wrapper.shard_pool.pending().values()) == {0}
+
+
+def test_run_action_only_takes_a_shard_for_writes(
+    env_vars: dict[str, str],
+    mock_cdp_configure: Mock,
+    mock_wallet_create: Mock,
+):
+    """Test that run_action resolves the side effect of an action from the manifest."""
+    wallet = mock_wallet_create.return_value
+    wallet.default_address.address_id = "0xaddress0"
+    wallet.addresses = [wallet.default_address]
+    wallet.create_address.side_effect = lambda: wallet.addresses.append(
+        Mock(address_id=f"0xaddress{len(wallet.addresses)}")
+    )
+
+    def get_balance(wallet: Wallet):
+        return wallet
+
+    async def aget_balance(wallet: Wallet):
+        return wallet
+
+    def transfer(wallet: Wallet):
+        return wallet
+
+    get_balance.__module__ = "cdp_agentkit_core.actions.get_balance"
+    aget_balance.__module__ = "cdp_agentkit_core.actions.get_balance"
+    wrapper = CdpAgentkitWrapper(shard_count=2)
+
+    assert wrapper.run_action(get_balance) is wallet
+    assert asyncio.run(wrapper.arun_action(aget_balance)) is wallet
+    assert wrapper.run_action(transfer) is not wallet
@@ -0,0 +1,66 @@
+"""Tests for the CDP Action result cache."""
+
+from unittest.mock import patch
+
+from cdp_langchain.utils.result_cache import ActionResultCache
+
+
+def test_key_ignores_argument_order():
+    """Test that calls with the same arguments in any order share a key."""
+    assert ActionResultCache.key("get_balance", {"a": 1, "b": 2}, "base-sepolia") == (
+        ActionResultCache.key("get_balance", {"b": 2, "a": 1}, "base-sepolia")
+    )
+    assert ActionResultCache.key("get_balance", {}, "base-sepolia") != (
+        ActionResultCache.key("get_balance", {}, "base-mainnet")
+    )
+
+
+def test_get_counts_hits_and_misses():
+    """Test that cached results are served and counted until they expire."""
+    cache = ActionResultCache(ttl_seconds=10)
+
+    with patch("cdp_langchain.utils.result_cache.time.monotonic", return_value=100.0):
+        assert cache.get("key") is None
+        cache.put("key", "result", "read", cache.generation)
+        assert cache.get("key") == "result"
+
+    with patch("cdp_langchain.utils.result_cache.time.monotonic", return_value=111.0):
+        assert cache.get("key") is None
+
+    assert cache.stats() == {"hits": 1, "misses": 2, "entries": 0}
+
+
+def test_put_evicts_least_recently_used():
+    """Test that the least recently used result is evicted past the maximum."""
+    cache = ActionResultCache(max_entries=2)
+    cache.put("a", "1", "read", cache.generation)
+    cache.put("b", "2", "read", cache.generation)
+    cache.get("a")
+    cache.put("c", "3", "read", cache.generation)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_invalidate_reads_keeps_external_results():
+    """Test that a write drops cached reads but not external results."""
+    cache = ActionResultCache()
+    cache.put("balance", "1 eth", "read", cache.generation)
+    cache.put("price", "3000", "external", cache.generation)
+
+    cache.invalidate_reads()
+
+    assert cache.get("balance") is None
+    assert cache.get("price") == "3000"
+
+
+def test_put_skips_reads_that_raced_a_write():
+    """Test that a read started before a write is not cached after it."""
+    cache = ActionResultCache()
+    generation = cache.generation
+
+    cache.invalidate_reads()
+    cache.put("balance", "stale", "read", generation)
+
+    assert cache.get("balance") is None
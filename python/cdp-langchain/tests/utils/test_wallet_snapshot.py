@@ -0,0 +1,215 @@
+"""Tests for the wallet snapshot."""
+
+import json
+import subprocess
+import sys
+import textwrap
+from unittest.mock import patch
+
+import pytest
+from eth_account import Account
+
+from cdp import Asset, Wallet
+from cdp.client.models.address import Address as AddressModel
+from cdp.client.models.feature_set import FeatureSet
+from cdp.client.models.wallet import Wallet as WalletModel
+from cdp_agentkit_core.actions.asset_cache import AssetCache, get_asset_cache, set_asset_cache
+from cdp_langchain.utils import CdpAgentkitWrapper
+from cdp_langchain.utils.wallet_snapshot import WalletSnapshotStore
+
+MOCK_SEED = "ab" * 64
+MOCK_WALLET_ID = "test-wallet-id"
+MOCK_NETWORK_ID = "base-sepolia"
+
+
+@pytest.fixture(autouse=True)
+def asset_cache():
+    """Isolate each test with an empty asset cache."""
+    cache = AssetCache()
+    set_asset_cache(cache)
+    return cache
+
+
+def make_wallet(
+    address_count: int = 2, wallet_id: str = MOCK_WALLET_ID, seed: str = MOCK_SEED
+) -> Wallet:
+    """Build a wallet and its addresses locally, as the CDP API would return them."""
+    wallet_model = WalletModel(
+        id=wallet_id,
+        network_id=MOCK_NETWORK_ID,
+        feature_set=FeatureSet(
+            faucet=True,
+            server_signer=False,
+            transfer=True,
+            trade=True,
+            stake=False,
+            gasless_send=True,
+        ),
+    )
+    wallet = Wallet(wallet_model, seed)
+    address_models = []
+    for index in range(address_count):
+        key = wallet._derive_key(index)
+        address_models.append(
+            AddressModel(
+                wallet_id=wallet_id,
+                network_id=MOCK_NETWORK_ID,
+                public_key=key.PublicKey().RawCompressed().ToHex(),
+                address_id=Account.from_key(key.PrivateKey().Raw().ToHex()).address,
+                index=index,
+            )
+        )
+    wallet_model.default_address = address_models[0]
+    wallet._addresses = [
+        wallet._build_wallet_address(model, index) for index, model in enumerate(address_models)
+    ]
+    return wallet
+
+
+def test_save_and_load_without_api_calls(tmp_path, asset_cache):
+    """Test that a saved wallet is restored with its addresses and assets, offline."""
+    wallet = make_wallet()
+    asset_cache.load(
+        [
+            {
+                "network_id": MOCK_NETWORK_ID,
+                "asset_id": "usdc",
+                "decimals": 6,
+                "contract_address": "0x1",
+            }
+        ]
+    )
+    store = WalletSnapshotStore(tmp_path / "wallet.bin", "secret")
+    store.save(wallet)
+    set_asset_cache(AssetCache())
+
+    with patch("cdp.Cdp.api_clients") as api_clients:
+        restored = store.load(MOCK_NETWORK_ID, MOCK_WALLET_ID)
+
+    assert not api_clients.mock_calls
+    assert restored.id == MOCK_WALLET_ID
+    assert restored.network_id == MOCK_NETWORK_ID
+    assert [a.address_id for a in restored.addresses] == [a.address_id for a in wallet.addresses]
+    assert restored.default_address.address_id == wallet.default_address.address_id
+    assert restored.can_sign
+    assert get_asset_cache().export(MOCK_NETWORK_ID)[0]["decimals"] == 6
+
+
+def test_snapshot_is_encrypted(tmp_path):
+    """Test that the seed is not readable on disk and a wrong key does not decrypt it."""
+    path = tmp_path / "wallet.bin"
+    WalletSnapshotStore(path, "secret").save(make_wallet())
+
+    assert MOCK_SEED.encode() not in path.read_bytes()
+    assert WalletSnapshotStore(path, "other secret").load(MOCK_NETWORK_ID) is None
+
+
+@pytest.mark.parametrize(
+    ("network_id", "wallet_id"),
+    [("base-mainnet", None), (MOCK_NETWORK_ID, "other-wallet-id")],
+)
+def test_snapshot_of_another_wallet_is_ignored(tmp_path, network_id, wallet_id):
+    """Test that a snapshot of another network or wallet is not restored."""
+    store = WalletSnapshotStore(tmp_path / "wallet.bin", "secret")
+    store.save(make_wallet())
+
+    assert store.load(network_id, wallet_id) is None
+
+
+def test_corrupt_or_missing_snapshot_is_ignored(tmp_path):
+    """Test that a missing, truncated or other version snapshot is not restored."""
+    path = tmp_path / "wallet.bin"
+    store = WalletSnapshotStore(path, "secret")
+    assert store.load(MOCK_NETWORK_ID) is None
+
+    store.save(make_wallet())
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])
+    assert store.load(MOCK_NETWORK_ID) is None
+
+    path.write_bytes(data[:9] + bytes([99]) + data[10:])
+    assert store.load(MOCK_NETWORK_ID) is None
+
+
+def test_reconcile_refreshes_and_saves(tmp_path):
+    """Test that reconciliation reloads the wallet from the API and saves the result."""
+    store = WalletSnapshotStore(tmp_path / "wallet.bin", "secret")
+    store.save(make_wallet(address_count=1))
+    restored = store.load(MOCK_NETWORK_ID)
+    fresh = make_wallet(address_count=2)
+
+    def set_addresses(self):
+        self._addresses = fresh._addresses
+
+    with (
+        patch.object(Wallet, "reload") as reload,
+        patch.object(Wallet, "_set_addresses", set_addresses),
+    ):
+        store.reconcile(restored).join(5)
+
+    reload.assert_called_once()
+    assert len(store.load(MOCK_NETWORK_ID).addresses) == 2
+
+
+def test_wrapper_starts_from_snapshot(tmp_path, monkeypatch):
+    """Test that a wrapper imports the wallet once, then starts from the snapshot."""
+    monkeypatch.setenv("CDP_API_KEY_NAME", "test-cdp-api-key-name")
+    monkeypatch.setenv("CDP_API_KEY_PRIVATE_KEY", "test-cdp-api-key-private-key")
+    wallet = make_wallet()
+    wallet_data = json.dumps(
+        {"wallet_id": MOCK_WALLET_ID, "seed": MOCK_SEED, "network_id": MOCK_NETWORK_ID}
+    )
+    path = str(tmp_path / "wallet.bin")
+
+    with (
+        patch("cdp.Cdp.configure"),
+        patch("cdp.Wallet.import_data", return_value=wallet) as import_data,
+        patch.object(Wallet, "reload"),
+        patch.object(Wallet, "_set_addresses"),
+    ):
+        CdpAgentkitWrapper(cdp_wallet_data=wallet_data, wallet_snapshot_path=path)
+        wrapper = CdpAgentkitWrapper(cdp_wallet_data=wallet_data, wallet_snapshot_path=path)
+        wrapper.wallet_snapshot.reconciliation.join(5)
+
+    import_data.assert_called_once()
+    assert wrapper.wallet is not wallet
+    assert wrapper.wallet.default_address.address_id == wallet.default_address.address_id
+
+
+def test_asset_from_snapshot_is_not_fetched(tmp_path, asset_cache):
+    """Test that assets restored from a snapshot are served without a fetch."""
+    asset_cache.load(
+        [
+            {
+                "network_id": MOCK_NETWORK_ID,
+                "asset_id": "eth",
+                "decimals": 18,
+                "contract_address": None,
+            }
+        ]
+    )
+    store = WalletSnapshotStore(tmp_path / "wallet.bin", "secret")
+    store.save(make_wallet())
+    set_asset_cache(AssetCache())
+    store.load(MOCK_NETWORK_ID)
+
+    with patch.object(Asset, "fetch") as fetch:
+        assert get_asset_cache().fetch(MOCK_NETWORK_ID, "eth").decimals == 18
+
+    fetch.assert_not_called()
+
+
+def test_importing_the_toolkit_does_not_import_the_cdp_sdk():
+    """Test that the snapshot store does not bring the CDP SDK back into the toolkit import."""
+    script = textwrap.dedent(
+        """
+        import sys
+
+        import cdp_langchain.agent_toolkits
+
+        assert "cdp" not in sys.modules, "cdp"
+        assert "web3" not in sys.modules, "web3"
+        """
+    )
+
+    subprocess.run([sys.executable, "-c", script], check=True)
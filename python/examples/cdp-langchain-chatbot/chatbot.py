@@ -11,6 +11,7 @@ from langgraph.prebuilt import create_react_agent
 
 # Import CDP Agentkit Langchain Extension.
 from cdp_langchain.agent_toolkits import CdpToolkit
+from cdp_langchain.tools import CdpToolNode
 from cdp_langchain.utils import CdpAgentkitWrapper
 
 # Configure a file to persist the agent's CDP MPC Wallet Data.
@@ -50,10 +51,10 @@ def initialize_agent():
     memory = MemorySaver()
     config = {"configurable": {"thread_id": "CDP Agentkit Chatbot Example!"}}
 
-    # Create ReAct Agent using the LLM and CDP Agentkit tools.
+    # Create ReAct Agent using the LLM and CDP Agentkit tools, running read tool calls in parallel.
     return create_react_agent(
         llm,
-        tools=tools,
+        tools=CdpToolNode(tools),
         checkpointer=memory,
         state_modifier=(
             "You are a helpful agent that can interact onchain using the Coinbase Developer Platform AgentKit. "
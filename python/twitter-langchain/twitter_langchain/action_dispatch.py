@@ -0,0 +1,22 @@
+"""Dispatch of Twitter Actions resolved once per tool rather than on every call."""
+
+from collections.abc import Callable
+from typing import Any
+
+import tweepy
+from cdp_agentkit_core.actions.action_dispatch import ActionDispatch as CdpActionDispatch
+from cdp_agentkit_core.actions.action_dispatch import takes_first_parameter
+
+
+class ActionDispatch(CdpActionDispatch):
+    """How to call a Twitter Action, whose context is the Twitter client."""
+
+    @staticmethod
+    def takes_context(func: Callable[..., Any]) -> bool:
+        """Whether the first parameter of an action function is the Twitter client."""
+        return takes_client(func)
+
+
+def takes_client(func: Callable[..., Any]) -> bool:
+    """Whether the first parameter of an action function is the Twitter client."""
+    return takes_first_parameter(func, tweepy.Client)
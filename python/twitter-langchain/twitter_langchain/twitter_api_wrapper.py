@@ -1,13 +1,13 @@
 """Util that calls Twitter API."""
 
-import inspect
 from collections.abc import Callable
 from typing import Any
 
-import tweepy
 from langchain_core.utils import get_from_dict_or_env
 from pydantic import BaseModel, model_validator
 
+from twitter_langchain.action_dispatch import ActionDispatch, takes_client
+
 
 class TwitterApiWrapper(BaseModel):
     """Wrapper for Twitter API."""
@@ -53,10 +53,13 @@ class TwitterApiWrapper(BaseModel):
 
     def run_action(self, func: Callable[..., str], **kwargs) -> str:
         """Run a Twitter Action."""
-        func_signature = inspect.signature(func)
-        first_kwarg = next(iter(func_signature.parameters.values()), None)
-
-        if first_kwarg and first_kwarg.annotation is tweepy.Client:
+        if takes_client(func):
             return func(self.client, **kwargs)
         else:
             return func(**kwargs)
+
+    def run_dispatch(self, dispatch: ActionDispatch, kwargs: dict[str, Any]) -> str:
+        """Run a Twitter Action through its precomputed dispatch."""
+        if dispatch.func_takes_context:
+            return dispatch.func(self.client, **kwargs)
+        return dispatch.func(**kwargs)
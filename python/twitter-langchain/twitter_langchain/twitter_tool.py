@@ -17,6 +17,7 @@ from langchain_core.callbacks import CallbackManagerForToolRun
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel
 
+from twitter_langchain.action_dispatch import ActionDispatch
 from twitter_langchain.twitter_api_wrapper import TwitterApiWrapper
 
 
@@ -28,6 +29,12 @@ class TwitterTool(BaseTool):  # type: ignore[override]
     description: str = ""
     args_schema: type[BaseModel] | None = None
     func: Callable[..., str]
+    dispatch: ActionDispatch | None = None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Resolve the dispatch of the action unless the toolkit already did."""
+        if self.dispatch is None:
+            self.dispatch = ActionDispatch.for_action(self.func, args_schema=self.args_schema)
 
     def _run(
         self,
@@ -36,12 +43,5 @@ class TwitterTool(BaseTool):  # type: ignore[override]
         **kwargs: Any,
     ) -> str:
         """Use the Twitter (X) API to run an operation."""
-        if not instructions or instructions == "{}":
-            # Catch other forms of empty input that GPT-4 likes to send.
-            instructions = ""
-        if self.args_schema is not None:
-            validated_input_data = self.args_schema(**kwargs)
-            parsed_input_args = validated_input_data.model_dump()
-        else:
-            parsed_input_args = {"instructions": instructions}
-        return self.twitter_api_wrapper.run_action(self.func, **parsed_input_args)
+        parsed_input_args = self.dispatch.parse_args(instructions, **kwargs)
+        return self.twitter_api_wrapper.run_dispatch(self.dispatch, parsed_input_args)
@@ -4,6 +4,7 @@ from cdp_agentkit_core.actions.social.twitter import TWITTER_ACTIONS
 from langchain_core.tools import BaseTool
 from langchain_core.tools.base import BaseToolkit
 
+from twitter_langchain.action_dispatch import ActionDispatch
 from twitter_langchain.twitter_api_wrapper import TwitterApiWrapper
 from twitter_langchain.twitter_tool import TwitterTool
 
@@ -129,6 +130,7 @@ class TwitterToolkit(BaseToolkit):
                 twitter_api_wrapper=twitter_api_wrapper,
                 args_schema=action.args_schema,
                 func=action.func,
+                dispatch=ActionDispatch.for_action(action.func, args_schema=action.args_schema),
             )
             for action in actions
         ]